@@ -5,6 +5,7 @@ Version 1 API endpoints.
 
 Included routers:
     - health: Health check endpoints (/health, /health/ready)
+    - metrics: Prometheus 지표 endpoint (/metrics)
     - chat: AI chat endpoints (/ai/chat/messages)
     - chat_stream: Streaming chat endpoints (/ai/chat/stream)
     - gap_suggestions: RAG Gap 보완 제안 endpoints (/ai/gap/policy-edu/suggestions)
@@ -15,26 +16,22 @@ Included routers:
     - ws_render_progress: WebSocket 렌더 진행률 endpoints (/ws/videos/*/render-progress)
     - source_sets: SourceSet 오케스트레이션 endpoints (/internal/ai/source-sets/*)
     - feedback: 피드백 수신 endpoints (/internal/ai/feedback)
+    - personalization: 개인화 캐시 무효화 endpoints (/internal/ai/personalization/*)
+    - video_progress: 교육영상 진행률 heartbeat endpoints (/internal/ai/video-progress/*)
+    - traces: 요청 단위 span 조회 endpoints (/internal/ai/traces/*)
 
 FE용 API는 모두 제거됨 (FE는 백엔드 경유).
+
+라우터 모듈은 처음 접근할 때 import합니다 (패키지 import만으로 모든 라우터와
+그 서비스 의존성을 로드하지 않도록). `from app.api.v1 import chat`은 그대로 동작합니다.
 """
 
-from app.api.v1 import (
-    chat,
-    chat_stream,
-    faq,
-    feedback,
-    gap_suggestions,
-    health,
-    internal_rag,
-    quiz_generate,
-    render_jobs,
-    source_sets,
-    ws_render_progress,
-)
+import importlib
+from typing import Any
 
 __all__ = [
     "health",
+    "metrics",
     "chat",
     "chat_stream",
     "gap_suggestions",
@@ -42,7 +39,17 @@ __all__ = [
     "faq",
     "feedback",
     "internal_rag",
+    "personalization",
     "render_jobs",
     "ws_render_progress",
     "source_sets",
+    "video_progress",
+    "traces",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """라우터 모듈을 지연 import합니다."""
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,47 @@
+"""
+지표 API (Metrics)
+
+Prometheus가 수집하는 text exposition 엔드포인트입니다.
+
+엔드포인트:
+GET /metrics : upstream latency 히스토그램, 에러/재시도/요청 카운터, 큐 길이, 캐시 적중률
+
+멀티 워커:
+- 요청을 받은 워커는 자기 지표(현재 값)와 상태 저장소에 발행된 다른 워커의 스냅샷을 합산합니다
+- 다른 워커 값은 METRICS_PUBLISH_INTERVAL_SEC 주기로 갱신됩니다
+"""
+
+import asyncio
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.metrics import collect_cluster_metrics, render_prometheus
+
+logger = get_logger(__name__)
+
+router = APIRouter(tags=["Metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Prometheus 지표",
+)
+async def get_prometheus_metrics() -> PlainTextResponse:
+    """모든 워커의 지표를 합산해 Prometheus text 형식으로 반환합니다."""
+    settings = get_settings()
+    if not settings.METRICS_ENABLED:
+        return PlainTextResponse("metrics disabled\n", status_code=404)
+
+    if settings.STATE_STORE_BACKEND.lower() == "memory":
+        snapshot = collect_cluster_metrics()
+    else:
+        # 공유 저장소 조회는 이벤트 루프 밖에서
+        snapshot = await asyncio.to_thread(collect_cluster_metrics)
+
+    return PlainTextResponse(render_prometheus(snapshot), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,135 @@
+"""
+개인화 캐시 내부 API
+
+Backend -> AI 개인화 facts 캐시 무효화 엔드포인트입니다.
+
+엔드포인트:
+POST /internal/ai/personalization/invalidate : 사용자 facts 캐시 무효화
+
+흐름:
+1. Backend: 교육 이수/연차 사용 등으로 사용자 facts 변경
+2. Backend -> AI: POST /internal/ai/personalization/invalidate
+3. AI: 해당 사용자의 캐시된 facts 삭제 (다음 질문 시 백엔드 재조회)
+
+인증:
+- X-Internal-Token 헤더 필수
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Header
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
+
+from app.clients.personalization_client import invalidate_personalization_facts
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/internal/ai", tags=["Personalization"])
+
+
+# =============================================================================
+# Request/Response Models
+# =============================================================================
+
+
+class PersonalizationInvalidateRequest(BaseModel):
+    """Backend -> AI 개인화 캐시 무효화 요청."""
+
+    userId: str = Field(
+        ...,
+        min_length=1,
+        description="facts가 변경된 사용자 ID",
+    )
+    subIntentId: Optional[str] = Field(
+        None,
+        description="특정 인텐트(Q1-Q20)만 무효화할 경우 지정 (없으면 사용자 전체)",
+    )
+
+
+class PersonalizationInvalidateResponse(BaseModel):
+    """Backend -> AI 개인화 캐시 무효화 응답."""
+
+    invalidated: int = Field(..., description="삭제된 캐시 항목 수")
+
+
+class ErrorResponse(BaseModel):
+    """에러 응답."""
+
+    error: str
+    message: str
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+def _error_response(
+    status_code: int,
+    error: str,
+    message: str,
+) -> JSONResponse:
+    """에러 응답을 생성합니다."""
+    content = {
+        "error": error,
+        "message": message,
+    }
+    return JSONResponse(status_code=status_code, content=content)
+
+
+# =============================================================================
+# Routes
+# =============================================================================
+
+
+@router.post(
+    "/personalization/invalidate",
+    response_model=PersonalizationInvalidateResponse,
+    summary="개인화 facts 캐시 무효화 (Backend -> AI)",
+    description="""
+Backend에서 호출하여 사용자의 개인화 facts 캐시를 무효화합니다.
+
+**URL**: POST /internal/ai/personalization/invalidate
+
+**호출 주체**: Spring 백엔드 (교육 이수 완료, 연차 사용 등 facts 변경 시)
+
+**인증**: X-Internal-Token 헤더 필수
+""",
+    responses={
+        200: {"description": "무효화 완료", "model": PersonalizationInvalidateResponse},
+        401: {"description": "인증 실패", "model": ErrorResponse},
+    },
+)
+async def invalidate_facts(
+    request: PersonalizationInvalidateRequest,
+    x_internal_token: Optional[str] = Header(None, alias="X-Internal-Token"),
+):
+    """사용자의 개인화 facts 캐시를 무효화합니다."""
+    # 인증 검증
+    settings = get_settings()
+    expected_token = settings.BACKEND_INTERNAL_TOKEN
+
+    if expected_token:  # 토큰이 설정된 경우만 검증
+        if not x_internal_token:
+            return _error_response(
+                status_code=401,
+                error="UNAUTHORIZED",
+                message="X-Internal-Token 헤더가 필요합니다.",
+            )
+        if x_internal_token != expected_token:
+            return _error_response(
+                status_code=401,
+                error="UNAUTHORIZED",
+                message="유효하지 않은 인증 토큰입니다.",
+            )
+    else:
+        logger.warning("BACKEND_INTERNAL_TOKEN not configured, skipping auth")
+
+    invalidated = invalidate_personalization_facts(
+        user_id=request.userId,
+        sub_intent_id=request.subIntentId,
+    )
+    return PersonalizationInvalidateResponse(invalidated=invalidated)
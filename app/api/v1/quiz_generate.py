@@ -8,6 +8,8 @@ LLM을 통해 객관식 퀴즈를 자동 생성하는 API.
 - POST /ai/quiz/generate: 퀴즈 자동 생성
 """
 
+from typing import TYPE_CHECKING
+
 from fastapi import APIRouter, HTTPException, status
 
 from app.core.logging import get_logger
@@ -15,7 +17,9 @@ from app.models.quiz_generate import (
     QuizGenerateRequest,
     QuizGenerateResponse,
 )
-from app.services.quiz_generate_service import QuizGenerateService
+
+if TYPE_CHECKING:
+    from app.services.quiz_generate_service import QuizGenerateService
 
 logger = get_logger(__name__)
 
@@ -26,13 +30,15 @@ router = APIRouter(prefix="/quiz", tags=["Quiz Generate"])
 # Quiz Generate Service 인스턴스
 # =============================================================================
 
-_quiz_generate_service: QuizGenerateService | None = None
+_quiz_generate_service: "QuizGenerateService | None" = None
 
 
-def get_quiz_generate_service() -> QuizGenerateService:
-    """QuizGenerateService 싱글톤 인스턴스를 반환합니다."""
+def get_quiz_generate_service() -> "QuizGenerateService":
+    """QuizGenerateService 싱글톤 인스턴스를 반환합니다 (서비스 모듈은 첫 호출 시 로드)."""
     global _quiz_generate_service
     if _quiz_generate_service is None:
+        from app.services.quiz_generate_service import QuizGenerateService
+
         _quiz_generate_service = QuizGenerateService()
     return _quiz_generate_service
 
@@ -38,6 +38,7 @@ from app.clients.ragflow_ingest_client import (
 )
 from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.core.state_store import get_state_store
 
 logger = get_logger(__name__)
 
@@ -57,10 +58,11 @@ DOMAIN_DATASET_MAPPING = {
 }
 
 # =============================================================================
-# Idempotency 캐시 (in-memory, 2단계 TTL + LRU)
+# Idempotency 캐시 (공유 상태 저장소, 2단계 TTL + LRU)
 # =============================================================================
-# key: (documentId, version), value: {"timestamp": float, "status": str}
-_ingest_cache: Dict[tuple, Dict[str, Any]] = {}
+# 여러 워커가 같은 캐시를 보도록 StateStore에 저장
+# key: rag_ingest:{documentId}:{version}, value: {"timestamp": float, "status": str}
+_CACHE_KEY_PREFIX = "rag_ingest:"
 
 # 2단계 TTL 설정:
 # - PROCESSING: 5분 (처리 중 요청은 짧게 유지)
@@ -71,6 +73,11 @@ _CACHE_TTL_COMPLETED_SECONDS = 86400  # 24시간
 # LRU 최대 캐시 크기 (메모리 보호)
 _CACHE_MAX_SIZE = 10000
 
+# 크기 제한 점검 주기 (초). 만료는 저장소 TTL이 처리하므로 prefix 전체 조회
+# (Redis에서는 SCAN)는 ingest마다가 아니라 이 주기에 한 번만 실행
+_CACHE_SWEEP_INTERVAL_SECONDS = 60.0
+_last_cache_sweep = 0.0
+
 
 # =============================================================================
 # Request/Response Models
@@ -219,19 +226,15 @@ def _get_ttl_for_status(status: str) -> int:
         return _CACHE_TTL_COMPLETED_SECONDS
 
 
-def _cleanup_expired_cache() -> None:
-    """만료된 캐시 항목 정리 (2단계 TTL 적용)."""
-    now = time.time()
-    expired_keys = []
+def _cache_key(document_id: str, version: int) -> str:
+    """캐시 키 생성."""
+    return f"{_CACHE_KEY_PREFIX}{document_id}:{version}"
 
-    for key, value in _ingest_cache.items():
-        status = value.get("status", "PROCESSING")
-        ttl = _get_ttl_for_status(status)
-        if now - value["timestamp"] > ttl:
-            expired_keys.append(key)
 
-    for key in expired_keys:
-        del _ingest_cache[key]
+def _is_expired(value: Dict[str, Any], now: float) -> bool:
+    """캐시 항목 만료 여부 (2단계 TTL 적용)."""
+    ttl = _get_ttl_for_status(value.get("status", "PROCESSING"))
+    return now - value["timestamp"] > ttl
 
 
 def _enforce_cache_size_limit() -> None:
@@ -239,24 +242,36 @@ def _enforce_cache_size_limit() -> None:
 
     가장 오래된 항목부터 삭제하여 최대 크기 유지.
     """
-    if len(_ingest_cache) <= _CACHE_MAX_SIZE:
+    store = get_state_store()
+    entries = store.items(_CACHE_KEY_PREFIX)
+    if len(entries) <= _CACHE_MAX_SIZE:
         return
 
     # timestamp 기준 정렬하여 오래된 항목 삭제
-    sorted_keys = sorted(
-        _ingest_cache.keys(),
-        key=lambda k: _ingest_cache[k]["timestamp"]
-    )
+    sorted_keys = sorted(entries, key=lambda k: entries[k]["timestamp"])
 
     # 초과분 삭제
-    excess_count = len(_ingest_cache) - _CACHE_MAX_SIZE
+    excess_count = len(entries) - _CACHE_MAX_SIZE
     for key in sorted_keys[:excess_count]:
-        del _ingest_cache[key]
+        store.delete(key)
 
     logger.info(f"Cache size limit enforced: removed {excess_count} oldest entries")
 
 
-def _get_cached_status(document_id: str, version: int) -> Optional[Dict[str, Any]]:
+async def _maybe_sweep_cache() -> None:
+    """주기가 지났으면 캐시 크기 제한을 적용합니다 (워커별 _CACHE_SWEEP_INTERVAL_SECONDS마다 한 번).
+
+    만료 항목은 상태별 TTL로 저장되어 저장소가 정리하므로 여기서는 크기만 점검합니다.
+    """
+    global _last_cache_sweep
+    now = time.monotonic()
+    if now - _last_cache_sweep < _CACHE_SWEEP_INTERVAL_SECONDS:
+        return
+    _last_cache_sweep = now
+    await asyncio.to_thread(_enforce_cache_size_limit)
+
+
+async def _get_cached_status(document_id: str, version: int) -> Optional[Dict[str, Any]]:
     """캐시된 상태를 반환합니다.
 
     Args:
@@ -266,12 +281,16 @@ def _get_cached_status(document_id: str, version: int) -> Optional[Dict[str, Any
     Returns:
         Optional[Dict]: 캐시 항목 또는 None
     """
-    _cleanup_expired_cache()
-    cache_key = (document_id, version)
-    return _ingest_cache.get(cache_key)
+    store = get_state_store()
+    cache_key = _cache_key(document_id, version)
+    value = await store.aget(cache_key)
+    if value is not None and _is_expired(value, time.time()):
+        await store.adelete(cache_key)
+        return None
+    return value
 
 
-def _is_duplicate_request(document_id: str, version: int) -> bool:
+async def _is_duplicate_request(document_id: str, version: int) -> bool:
     """중복 요청인지 확인.
 
     Args:
@@ -281,26 +300,34 @@ def _is_duplicate_request(document_id: str, version: int) -> bool:
     Returns:
         bool: 중복 요청 여부
     """
-    return _get_cached_status(document_id, version) is not None
+    return await _get_cached_status(document_id, version) is not None
 
 
-def _mark_request_processing(document_id: str, version: int) -> None:
+async def _mark_request_processing(document_id: str, version: int) -> bool:
     """요청을 처리 중으로 표시.
 
+    캐시 항목이 없을 때만 기록하므로 같은 요청이 여러 워커에 동시에 들어와도
+    한 워커만 처리를 맡습니다.
+
     Args:
         document_id: 문서 ID
         version: 문서 버전
+
+    Returns:
+        bool: 이 호출이 처리 중 표시를 했는지 여부 (False면 다른 요청이 선점)
     """
-    cache_key = (document_id, version)
-    _ingest_cache[cache_key] = {
-        "timestamp": time.time(),
-        "status": "PROCESSING",
-    }
-    # 항목 추가 후 크기 제한 적용 (LRU)
-    _enforce_cache_size_limit()
+    claimed = await get_state_store().aset_if_absent(
+        _cache_key(document_id, version),
+        {"timestamp": time.time(), "status": "PROCESSING"},
+        ttl_sec=_CACHE_TTL_PROCESSING_SECONDS,
+    )
+    if claimed:
+        # 크기 제한 적용 (LRU, 주기적으로)
+        await _maybe_sweep_cache()
+    return claimed
 
 
-def _mark_request_completed(document_id: str, version: int, ingest_status: str) -> None:
+async def _mark_request_completed(document_id: str, version: int, ingest_status: str) -> None:
     """요청 완료 상태로 표시.
 
     완료 상태(COMPLETED/FAILED)는 24시간 TTL로 캐시됩니다.
@@ -310,11 +337,11 @@ def _mark_request_completed(document_id: str, version: int, ingest_status: str)
         version: 문서 버전
         ingest_status: 완료 상태 (COMPLETED|FAILED)
     """
-    cache_key = (document_id, version)
-    _ingest_cache[cache_key] = {
-        "timestamp": time.time(),
-        "status": ingest_status,  # COMPLETED or FAILED
-    }
+    await get_state_store().aset(
+        _cache_key(document_id, version),
+        {"timestamp": time.time(), "status": ingest_status},  # COMPLETED or FAILED
+        ttl_sec=_CACHE_TTL_COMPLETED_SECONDS,
+    )
 
 
 def _clear_request_cache(document_id: str, version: int) -> None:
@@ -324,9 +351,12 @@ def _clear_request_cache(document_id: str, version: int) -> None:
         document_id: 문서 ID
         version: 문서 버전
     """
-    cache_key = (document_id, version)
-    if cache_key in _ingest_cache:
-        del _ingest_cache[cache_key]
+    get_state_store().delete(_cache_key(document_id, version))
+
+
+def _clear_ingest_cache() -> None:
+    """전체 ingest 캐시 삭제 (테스트용)."""
+    get_state_store().clear(_CACHE_KEY_PREFIX)
 
 
 def _get_cache_stats() -> Dict[str, Any]:
@@ -335,8 +365,9 @@ def _get_cache_stats() -> Dict[str, Any]:
     Returns:
         Dict: 캐시 통계 (total, processing, completed, failed)
     """
-    stats = {"total": len(_ingest_cache), "processing": 0, "completed": 0, "failed": 0}
-    for value in _ingest_cache.values():
+    entries = get_state_store().items(_CACHE_KEY_PREFIX)
+    stats = {"total": len(entries), "processing": 0, "completed": 0, "failed": 0}
+    for value in entries.values():
         status = value.get("status", "PROCESSING").lower()
         if status in stats:
             stats[status] += 1
@@ -427,7 +458,12 @@ async def ingest_rag_document(
         )
 
     # 멱등성 확인 (동일 documentId + version 중복 방지)
-    cached = _get_cached_status(request.documentId, request.version)
+    # 캐시에 없으면 처리 중으로 표시 (다른 워커가 먼저 표시했으면 중복 요청)
+    cached = await _get_cached_status(request.documentId, request.version)
+    if cached is None and not await _mark_request_processing(request.documentId, request.version):
+        cached = await _get_cached_status(request.documentId, request.version) or {
+            "status": "PROCESSING"
+        }
     if cached:
         cached_status = cached.get("status", "PROCESSING")
         logger.info(
@@ -457,9 +493,6 @@ async def ingest_rag_document(
                 content=response_data.model_dump(),
             )
 
-    # 처리 중으로 표시
-    _mark_request_processing(request.documentId, request.version)
-
     # RAGFlow dataset_id 매핑
     dataset_id = DOMAIN_DATASET_MAPPING.get(request.domain)
     if not dataset_id:
@@ -584,7 +617,7 @@ async def ingest_callback(
     )
 
     # 캐시에 완료 상태 저장 (멱등성: 다음 동일 요청 시 200 + COMPLETED 반환)
-    _mark_request_completed(request.docId, request.version, request.status)
+    await _mark_request_completed(request.docId, request.version, request.status)
 
     # COMPLETED 상태인 경우 Milvus에서 문서 전체 텍스트 조회
     content: Optional[str] = None
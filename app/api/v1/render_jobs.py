@@ -6,6 +6,7 @@ FE는 백엔드 경유하므로 FE용 API는 모두 제거됨.
 
 엔드포인트 (Backend → AI):
 - POST /internal/ai/render-jobs : 렌더 잡 생성/시작 (백엔드 발급 jobId 사용)
+- GET /internal/ai/render-jobs/{job_id} : 렌더 잡 상태 + 단계별 측정값 조회
 - POST /ai/video/job/{job_id}/start : 잡 시작 (레거시, 호환성)
 - POST /ai/video/job/{job_id}/retry : 잡 재시도 (레거시, 호환성)
 
@@ -19,6 +20,7 @@ FE는 백엔드 경유하므로 FE용 API는 모두 제거됨.
 - 렌더 스펙은 백엔드에서 조회
 """
 
+import asyncio
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Header, HTTPException, status
@@ -26,8 +28,7 @@ from pydantic import BaseModel, Field
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
-from app.models.video_render import RenderJobStartResponse
-from app.services.video_renderer_mvp import get_mvp_video_renderer
+from app.models.video_render import RenderJobDetailResponse, RenderJobStartResponse
 
 logger = get_logger(__name__)
 
@@ -122,6 +123,11 @@ class InternalRenderJobRequest(BaseModel):
         alias="requestId",
         description="멱등 키 (권장)",
     )
+    requested_by: Optional[str] = Field(
+        None,
+        alias="requestedBy",
+        description="렌더를 요청한 사용자 ID (워커 풀 공정 분배 기준, 권장)",
+    )
 
     class Config:
         populate_by_name = True
@@ -156,13 +162,21 @@ class InternalRenderJobResponse(BaseModel):
 # =============================================================================
 
 
+def _load_renderer():
+    from app.services.video_renderer_mvp import get_mvp_video_renderer
+
+    return get_mvp_video_renderer()
+
+
 def get_render_job_runner():
     """RenderJobRunner 의존성."""
     from app.services.render_job_runner import get_render_job_runner as _get_runner
 
     runner = _get_runner()
     if runner._renderer is None:
-        runner.set_renderer(get_mvp_video_renderer())
+        # 렌더러(TTS/영상 합성)는 잡을 실제로 실행할 때 로드
+        # (기동 시 잡 복원/조회 API만으로는 Pillow/gTTS 등을 import하지 않음)
+        runner.set_renderer_factory(_load_renderer)
     return runner
 
 
@@ -188,6 +202,7 @@ def get_render_job_runner():
 - scriptVersion: 스크립트 버전 (선택)
 - renderPolicyId: 렌더 정책 ID (선택)
 - requestId: 멱등 키 (권장)
+- requestedBy: 요청 사용자 ID (권장, 없으면 X-User-Id 헤더). 사용자별로 렌더 워커를 공정 분배
 
 **동작**:
 1. 백엔드에서 render-spec 조회 (GET /internal/scripts/{scriptId}/render-spec)
@@ -203,13 +218,17 @@ def get_render_job_runner():
 )
 async def create_internal_render_job(
     request: InternalRenderJobRequest,
+    x_user_id: Optional[str] = Header(None, alias="X-User-Id"),
 ):
     """내부 렌더 잡 생성/시작."""
     runner = get_render_job_runner()
+    # 공정 분배 기준: 요청 사용자 (미전달 시 백엔드 공용 대기열)
+    requested_by = request.requested_by or x_user_id or "backend"
 
     logger.info(
         f"Internal render job received: job_id={request.job_id}, "
-        f"video_id={request.video_id}, script_id={request.script_id}"
+        f"video_id={request.video_id}, script_id={request.script_id}, "
+        f"requested_by={requested_by}"
     )
 
     # 잡 생성 (백엔드 발급 jobId 사용)
@@ -219,6 +238,7 @@ async def create_internal_render_job(
             video_id=request.video_id,
             script_id=request.script_id,
             request_id=request.request_id,
+            created_by=requested_by,
         )
 
         # 바로 시작
@@ -242,6 +262,58 @@ async def create_internal_render_job(
         )
 
 
+@internal_router.get(
+    "/render-jobs/{job_id}",
+    response_model=RenderJobDetailResponse,
+    summary="렌더 잡 조회 (Backend → AI)",
+    description="""
+렌더 잡 상태와 단계별 렌더 측정값을 조회합니다.
+
+**인증**: X-Internal-Token 헤더 필수
+
+**metrics** (실행된 잡만):
+- stages: 단계별 wall_sec, cpu_sec, subprocess_count, bytes_written, peak_rss_mb
+- total_wall_sec, total_cpu_sec, subprocess_count, bytes_written, peak_rss_mb
+""",
+    dependencies=[Depends(verify_internal_token)],
+)
+async def get_internal_render_job(
+    job_id: str,
+):
+    """내부 렌더 잡 조회."""
+    runner = get_render_job_runner()
+
+    # 저장소 조회는 동기 SQLite 호출이므로 스레드에서 실행 (이벤트 루프 블로킹 방지)
+    job = await asyncio.to_thread(runner.get_job, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "reason_code": "JOB_NOT_FOUND",
+                "message": f"렌더 잡을 찾을 수 없습니다: {job_id}",
+            },
+        )
+
+    data = job.to_dict()
+    return RenderJobDetailResponse(
+        job_id=job.job_id,
+        video_id=job.video_id,
+        script_id=job.script_id,
+        status=job.status,
+        step=job.step,
+        progress=job.progress,
+        message=job.message,
+        error_code=job.error_code,
+        error_message=job.error_message,
+        assets=job.assets or None,
+        created_by=job.created_by,
+        created_at=data["created_at"],
+        started_at=data["started_at"],
+        finished_at=data["finished_at"],
+        metrics=job.render_metrics,
+    )
+
+
 # =============================================================================
 # Backend → AI APIs (Job Execution) - Legacy Compatibility
 # =============================================================================
@@ -27,11 +27,6 @@ from app.models.source_set import (
     SourceSetStartResponse,
     SourceSetStatus,
 )
-from app.services.source_set_orchestrator import (
-    ProcessingStatus,
-    get_source_set_orchestrator,
-)
-
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/internal/ai", tags=["SourceSet Orchestration"])
@@ -129,10 +124,15 @@ async def start_source_set(
     request: SourceSetStartRequest,
 ):
     """소스셋 처리를 시작합니다."""
+    from app.services.source_set_orchestrator import (
+        ProcessingStatus,
+        get_source_set_orchestrator,
+    )
+
     orchestrator = get_source_set_orchestrator()
 
     # 기존 작업 상태 확인 (멱등성)
-    existing_job = orchestrator.get_job_status(source_set_id)
+    existing_job = await orchestrator.get_job_status(source_set_id)
     if existing_job:
         # 이미 완료된 경우
         if existing_job.status == ProcessingStatus.COMPLETED:
@@ -146,12 +146,10 @@ async def start_source_set(
             )
         # 이미 실패한 경우
         if existing_job.status == ProcessingStatus.FAILED:
-            # 재시도 허용 - 기존 상태 초기화 후 재처리
+            # 재시도 허용 - orchestrator가 실패 기록을 CAS로 다시 선점해 재처리
             logger.info(
                 f"Retrying failed source set: source_set_id={source_set_id}"
             )
-            # 기존 작업 삭제하고 새로 시작
-            # (실제로는 orchestrator에서 처리)
 
     logger.info(
         f"Starting source set: source_set_id={source_set_id}, "
@@ -190,8 +188,13 @@ async def get_source_set_status(
     source_set_id: str,
 ):
     """소스셋 처리 상태를 조회합니다."""
+    from app.services.source_set_orchestrator import (
+        ProcessingStatus,
+        get_source_set_orchestrator,
+    )
+
     orchestrator = get_source_set_orchestrator()
-    job = orchestrator.get_job_status(source_set_id)
+    job = await orchestrator.get_job_status(source_set_id)
 
     if not job:
         raise HTTPException(
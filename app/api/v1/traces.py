@@ -0,0 +1,116 @@
+"""
+요청 추적 내부 API (Traces)
+
+프로세스 링 버퍼에 남은 span으로 느린 턴의 단계별 소요 시간을 조회합니다.
+(멀티 워커에서는 요청을 처리한 워커의 버퍼에만 있습니다)
+
+엔드포인트:
+GET /internal/ai/traces            : 최근 trace 요약 (루트 span 기준, 최신 순)
+GET /internal/ai/traces/{trace_id} : trace의 span 목록 (시작 순, 시작 오프셋/깊이 포함)
+
+인증:
+- X-Internal-Token 헤더 필수
+"""
+
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.telemetry.tracing import get_span_buffer
+
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/internal/ai", tags=["Traces"])
+
+
+# =============================================================================
+# Dependencies
+# =============================================================================
+
+
+async def verify_internal_token(
+    x_internal_token: Optional[str] = Header(None, alias="X-Internal-Token"),
+) -> None:
+    """내부 API 인증 토큰 검증.
+
+    Args:
+        x_internal_token: X-Internal-Token 헤더 값
+
+    Raises:
+        HTTPException: 인증 실패 시 401/403
+    """
+    expected_token = get_settings().BACKEND_INTERNAL_TOKEN
+
+    # 토큰이 설정되지 않은 경우 (개발 환경)
+    if not expected_token:
+        return
+
+    if not x_internal_token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={
+                "reason_code": "MISSING_TOKEN",
+                "message": "X-Internal-Token 헤더가 필요합니다.",
+            },
+        )
+
+    if x_internal_token != expected_token:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "reason_code": "INVALID_TOKEN",
+                "message": "유효하지 않은 인증 토큰입니다.",
+            },
+        )
+
+
+# =============================================================================
+# Routes
+# =============================================================================
+
+
+@router.get(
+    "/traces",
+    summary="최근 trace 요약",
+    dependencies=[Depends(verify_internal_token)],
+)
+async def list_traces(
+    limit: int = Query(50, ge=1, le=500),
+    min_duration_ms: float = Query(0.0, ge=0.0),
+) -> Dict[str, Any]:
+    """최근 끝난 루트 span 요약을 반환합니다 (min_duration_ms로 느린 턴만 조회)."""
+    traces = get_span_buffer().recent_traces(limit=limit, min_duration_ms=min_duration_ms)
+    return {"traces": traces, "count": len(traces)}
+
+
+@router.get(
+    "/traces/{trace_id}",
+    summary="trace 상세 (단계별 span)",
+    dependencies=[Depends(verify_internal_token)],
+)
+async def get_trace(trace_id: str) -> Dict[str, Any]:
+    """trace의 span을 시작 순으로 반환합니다."""
+    spans = get_span_buffer().get_trace(trace_id)
+    if not spans:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "reason_code": "TRACE_NOT_FOUND",
+                "message": "버퍼에 해당 trace가 없습니다.",
+            },
+        )
+
+    trace_start_ns = spans[0].start_ns
+    depths: Dict[str, int] = {}
+    items: List[Dict[str, Any]] = []
+    for item in spans:
+        depth = depths.get(item.parent_id, -1) + 1 if item.parent_id else 0
+        depths[item.span_id] = depth
+        data = item.to_dict()
+        data["offset_ms"] = round((item.start_ns - trace_start_ns) / 1_000_000, 2)
+        data["depth"] = depth
+        items.append(data)
+
+    return {"trace_id": trace_id, "spans": items}
@@ -0,0 +1,117 @@
+"""
+교육영상 진행률 내부 API (Video Progress)
+
+Backend가 중계하는 시청 진행률 heartbeat를 처리합니다.
+
+엔드포인트:
+POST /internal/ai/video-progress       : 진행률 업데이트 (세션 1건)
+POST /internal/ai/video-progress/batch : 진행률 일괄 업데이트 (여러 세션 heartbeat 묶음)
+
+검증 규칙(역행/급증/배속)은 VideoProgressService와 같습니다.
+거부된 업데이트도 200으로 응답하고 accepted=False, rejection_reason으로 사유를 전달합니다.
+
+인증:
+- X-Internal-Token 헤더 필수
+
+VideoProgressService는 동기 API(상태 저장소 I/O 포함)이므로 스레드에서 실행합니다.
+"""
+
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.models.video_progress import (
+    VideoProgressBatchRequest,
+    VideoProgressBatchResponse,
+    VideoProgressUpdateRequest,
+    VideoProgressUpdateResponse,
+)
+from app.services.video_progress_service import VideoProgressService
+
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/internal/ai", tags=["Video Progress"])
+
+
+# =============================================================================
+# Dependencies
+# =============================================================================
+
+
+async def verify_internal_token(
+    x_internal_token: Optional[str] = Header(None, alias="X-Internal-Token"),
+) -> None:
+    """내부 API 인증 토큰 검증.
+
+    Args:
+        x_internal_token: X-Internal-Token 헤더 값
+
+    Raises:
+        HTTPException: 인증 실패 시 401/403
+    """
+    expected_token = get_settings().BACKEND_INTERNAL_TOKEN
+
+    # 토큰이 설정되지 않은 경우 (개발 환경)
+    if not expected_token:
+        return
+
+    if not x_internal_token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={
+                "reason_code": "MISSING_TOKEN",
+                "message": "X-Internal-Token 헤더가 필요합니다.",
+            },
+        )
+
+    if x_internal_token != expected_token:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "reason_code": "INVALID_TOKEN",
+                "message": "유효하지 않은 인증 토큰입니다.",
+            },
+        )
+
+
+# =============================================================================
+# Routes
+# =============================================================================
+
+
+@router.post(
+    "/video-progress",
+    response_model=VideoProgressUpdateResponse,
+    summary="영상 진행률 업데이트 (Backend -> AI)",
+    dependencies=[Depends(verify_internal_token)],
+)
+async def update_video_progress(
+    request: VideoProgressUpdateRequest,
+) -> VideoProgressUpdateResponse:
+    """진행률 heartbeat 1건을 처리합니다."""
+    return await asyncio.to_thread(VideoProgressService().update_progress, request)
+
+
+@router.post(
+    "/video-progress/batch",
+    response_model=VideoProgressBatchResponse,
+    summary="영상 진행률 일괄 업데이트 (Backend -> AI)",
+    dependencies=[Depends(verify_internal_token)],
+)
+async def update_video_progress_batch(
+    request: VideoProgressBatchRequest,
+) -> VideoProgressBatchResponse:
+    """여러 세션의 진행률 heartbeat를 한 번에 처리합니다 (요청 순서대로 응답)."""
+    results = await asyncio.to_thread(
+        VideoProgressService().update_progress_batch, request.updates
+    )
+    accepted_count = sum(1 for result in results if result.accepted)
+
+    logger.debug(
+        f"Video progress batch: total={len(results)}, accepted={accepted_count}"
+    )
+
+    return VideoProgressBatchResponse(results=results, accepted_count=accepted_count)
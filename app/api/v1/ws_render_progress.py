@@ -16,9 +16,19 @@ WebSocket 렌더 진행률 API
     "step": "GENERATE_TTS",
     "progress": 25,
     "message": "TTS 음성 생성 중...",
+    "queue_position": null,
     "timestamp": "2025-01-15T10:30:00Z"
 }
 
+QUEUED 상태에서는 queue_position(1부터)으로 렌더 대기 순번을 전달합니다.
+
+멀티 워커 전달:
+- notify_render_progress는 이벤트를 StateStore 채널에 발행하고, WebSocket이 연결된
+  각 워커가 구독해서 자기 워커의 소켓에 전달합니다 (잡과 소켓이 다른 워커여도 전달)
+- 잡별 최신 이벤트를 저장해 두고, 새로 연결한 클라이언트에 먼저 보냅니다
+- 소켓마다 전송 태스크가 따로 돌아 느린 클라이언트가 다른 클라이언트를 막지 않습니다.
+  밀린 이벤트는 잡별 최신 것만 남기고(병합), 전송이 제한 시간을 넘기면 연결을 끊습니다
+
 사용법 (프론트엔드):
     const ws = new WebSocket("ws://localhost:8000/ws/videos/video-001/render-progress");
     ws.onmessage = (event) => {
@@ -28,14 +38,17 @@ WebSocket 렌더 진행률 API
 """
 
 import asyncio
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 
+from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.core.metrics import get_metrics
+from app.core.state_store import StateStore, get_state_store
 from app.models.video_render import RenderJobStatus, RenderStep
 
 logger = get_logger(__name__)
@@ -57,6 +70,7 @@ class RenderProgressEvent(BaseModel):
     step: Optional[str] = None
     progress: int  # 0-100
     message: str
+    queue_position: Optional[int] = None  # QUEUED 대기 순번 (1부터)
     timestamp: str
 
     @classmethod
@@ -68,6 +82,7 @@ class RenderProgressEvent(BaseModel):
         step: Optional[RenderStep] = None,
         progress: int = 0,
         message: str = "",
+        queue_position: Optional[int] = None,
     ) -> "RenderProgressEvent":
         """이벤트 생성."""
         return cls(
@@ -77,20 +92,105 @@ class RenderProgressEvent(BaseModel):
             step=step.value if step else None,
             progress=progress,
             message=message,
+            queue_position=queue_position,
             timestamp=datetime.utcnow().isoformat() + "Z",
         )
 
 
+# =============================================================================
+# Socket Sender
+# =============================================================================
+
+
+class _SocketSender:
+    """소켓 하나의 전송 대기열과 전송 태스크.
+
+    진행률 이벤트는 job_id별 최신 1건만 대기합니다 (소켓이 느리면 중간 이벤트 병합).
+    제어 메시지(pong 등)는 병합하지 않고 이벤트보다 먼저 보냅니다.
+    전송 실패/제한 시간 초과 시 소켓을 닫고 on_drop을 호출합니다.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_pending: int,
+        send_timeout_sec: float,
+        on_drop: Callable[[WebSocket], None],
+    ):
+        self._websocket = websocket
+        self._max_pending = max_pending
+        self._send_timeout_sec = send_timeout_sec
+        self._on_drop = on_drop
+        # job_id -> 최신 이벤트 (전송 순서 유지)
+        self._pending: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._control: Deque[Dict[str, Any]] = deque()
+        self._wakeup = asyncio.Event()
+        self.coalesced_count = 0
+        self._task = asyncio.create_task(self._run())
+
+    def offer(self, event_data: Dict[str, Any]) -> bool:
+        """이벤트를 대기열에 넣습니다 (대기 잡 수 상한 초과 시 False)."""
+        job_id = event_data["job_id"]
+        if job_id in self._pending:
+            del self._pending[job_id]
+            self.coalesced_count += 1
+        elif len(self._pending) >= self._max_pending:
+            return False
+        self._pending[job_id] = event_data
+        self._wakeup.set()
+        return True
+
+    def offer_control(self, data: Dict[str, Any]) -> None:
+        """제어 메시지를 대기열에 넣습니다."""
+        self._control.append(data)
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        """전송 태스크 중지."""
+        self._task.cancel()
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                while self._control or self._pending:
+                    if self._control:
+                        data = self._control.popleft()
+                    else:
+                        _, data = self._pending.popitem(last=False)
+                    await asyncio.wait_for(
+                        self._websocket.send_json(data), timeout=self._send_timeout_sec
+                    )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Dropping slow or closed websocket: {type(e).__name__}: {e}")
+            self.drop()
+
+    def drop(self) -> None:
+        """소켓을 닫고 관리자에서 제거합니다."""
+        self._on_drop(self._websocket)
+        asyncio.ensure_future(self._close_socket())
+
+    async def _close_socket(self) -> None:
+        try:
+            # 1013: Try Again Later (클라이언트 재연결 유도)
+            await self._websocket.close(code=1013)
+        except Exception:
+            pass
+
+
 # =============================================================================
 # Connection Manager
 # =============================================================================
 
 
 class RenderProgressConnectionManager:
-    """WebSocket 연결 관리자.
+    """WebSocket 연결 관리자 (워커 로컬).
 
-    video_id별로 연결을 관리하여 해당 비디오의 진행률을 구독 중인
-    모든 클라이언트에게 이벤트를 브로드캐스트합니다.
+    video_id별로 이 워커에 연결된 소켓을 관리하고, 이벤트를 소켓별 전송 대기열에
+    넣습니다. 실제 전송은 소켓마다 별도 태스크가 동시에 수행합니다.
 
     Usage:
         manager = get_connection_manager()
@@ -98,22 +198,34 @@ class RenderProgressConnectionManager:
         # 연결 등록
         await manager.connect(websocket, video_id)
 
-        # 이벤트 브로드캐스트
+        # 이벤트 브로드캐스트 (이 워커의 소켓만, 워커 간 전달은 notify_render_progress)
         await manager.broadcast(video_id, event)
 
         # 연결 해제
         manager.disconnect(websocket, video_id)
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_pending: Optional[int] = None,
+        send_timeout_sec: Optional[float] = None,
+    ):
+        settings = get_settings()
+        self._max_pending = max_pending or settings.RENDER_PROGRESS_MAX_PENDING
+        self._send_timeout_sec = send_timeout_sec or settings.RENDER_PROGRESS_SEND_TIMEOUT_SEC
         # video_id -> Set[WebSocket]
         self._connections: Dict[str, Set[WebSocket]] = defaultdict(set)
         # WebSocket -> Set[video_id] (역방향 매핑, 정리용)
         self._socket_videos: Dict[WebSocket, Set[str]] = defaultdict(set)
         # WebSocket -> job_id (필터링용, None이면 모든 이벤트 수신)
         self._socket_job_filter: Dict[WebSocket, Optional[str]] = {}
+        # WebSocket -> 전송 대기열/태스크
+        self._senders: Dict[WebSocket, _SocketSender] = {}
+        self._dropped_count = 0
         self._lock = asyncio.Lock()
 
+        get_metrics().register_gauge("render_progress_sockets", self.get_connection_count)
+
     async def connect(
         self,
         websocket: WebSocket,
@@ -129,17 +241,7 @@ class RenderProgressConnectionManager:
         """
         await websocket.accept()
 
-        async with self._lock:
-            self._connections[video_id].add(websocket)
-            self._socket_videos[websocket].add(video_id)
-            self._socket_job_filter[websocket] = job_id
-
-        logger.info(
-            f"WebSocket connected: video_id={video_id}, job_id={job_id}, "
-            f"total={len(self._connections[video_id])}"
-        )
-
-        # 연결 성공 메시지 전송
+        # 연결 성공 메시지 전송 (전송 태스크 시작 전이므로 직접 전송)
         await websocket.send_json(
             {
                 "type": "connected",
@@ -150,6 +252,23 @@ class RenderProgressConnectionManager:
             }
         )
 
+        async with self._lock:
+            self._connections[video_id].add(websocket)
+            self._socket_videos[websocket].add(video_id)
+            self._socket_job_filter[websocket] = job_id
+            if websocket not in self._senders:
+                self._senders[websocket] = _SocketSender(
+                    websocket,
+                    max_pending=self._max_pending,
+                    send_timeout_sec=self._send_timeout_sec,
+                    on_drop=self._drop,
+                )
+
+        logger.info(
+            f"WebSocket connected: video_id={video_id}, job_id={job_id}, "
+            f"total={len(self._connections[video_id])}"
+        )
+
     def disconnect(self, websocket: WebSocket, video_id: Optional[str] = None) -> None:
         """WebSocket 연결을 해제합니다."""
         # job filter 정리
@@ -164,6 +283,8 @@ class RenderProgressConnectionManager:
             # 빈 세트 정리
             if not self._connections[video_id]:
                 del self._connections[video_id]
+            if not self._socket_videos[websocket]:
+                del self._socket_videos[websocket]
         else:
             # 모든 video_id에서 해제
             for vid in list(self._socket_videos.get(websocket, [])):
@@ -174,48 +295,68 @@ class RenderProgressConnectionManager:
             if websocket in self._socket_videos:
                 del self._socket_videos[websocket]
 
+        # 구독 중인 video_id가 없으면 전송 태스크 정리
+        if websocket not in self._socket_videos:
+            sender = self._senders.pop(websocket, None)
+            if sender is not None:
+                sender.stop()
+
         logger.info(f"WebSocket disconnected: video_id={video_id}")
 
+    def _drop(self, websocket: WebSocket) -> None:
+        """느리거나 끊긴 소켓 제거."""
+        self._dropped_count += 1
+        self.disconnect(websocket)
+
+    def _matches(self, websocket: WebSocket, event_job_id: str) -> bool:
+        """job_id 필터 확인 (필터가 없으면 모든 이벤트)."""
+        filter_job_id = self._socket_job_filter.get(websocket)
+        return not filter_job_id or filter_job_id == event_job_id
+
+    def offer(self, websocket: WebSocket, event_data: Dict[str, Any]) -> bool:
+        """소켓 하나에 이벤트를 넣습니다 (대기열 상한 초과 시 연결 종료)."""
+        sender = self._senders.get(websocket)
+        if sender is None:
+            return False
+        if not sender.offer(event_data):
+            logger.warning(f"WebSocket send queue full, dropping: job_id={event_data['job_id']}")
+            sender.drop()
+            return False
+        return True
+
+    def send_control(self, websocket: WebSocket, data: Dict[str, Any]) -> None:
+        """제어 메시지(pong 등)를 소켓 전송 대기열에 넣습니다."""
+        sender = self._senders.get(websocket)
+        if sender is not None:
+            sender.offer_control(data)
+
     async def broadcast(self, video_id: str, event: RenderProgressEvent) -> int:
-        """특정 video_id에 연결된 클라이언트에게 이벤트를 전송합니다.
+        """이 워커에서 video_id를 구독 중인 클라이언트에게 이벤트를 전송합니다.
 
         job_id 필터링 지원:
         - 클라이언트가 특정 job_id를 구독한 경우, 해당 잡의 이벤트만 전송
         - job_id 필터가 None인 클라이언트는 모든 이벤트 수신
 
+        전송은 소켓별 태스크가 동시에 처리하므로 대기열에 넣고 바로 반환합니다.
+
         Args:
             video_id: 비디오 ID
             event: 전송할 이벤트
 
         Returns:
-            int: 전송 성공한 클라이언트 수
+            int: 전송 대기열에 넣은 클라이언트 수
         """
         connections = self._connections.get(video_id, set()).copy()
         if not connections:
             return 0
 
         event_data = event.model_dump()
-        event_job_id = event.job_id
         sent_count = 0
-        failed = []
-
         for websocket in connections:
-            # job_id 필터링
-            filter_job_id = self._socket_job_filter.get(websocket)
-            if filter_job_id and filter_job_id != event_job_id:
+            if not self._matches(websocket, event.job_id):
                 continue  # 다른 job_id 이벤트는 스킵
-
-            try:
-                await websocket.send_json(event_data)
+            if self.offer(websocket, event_data):
                 sent_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to send to websocket: {e}")
-                failed.append(websocket)
-
-        # 실패한 연결 정리
-        for ws in failed:
-            self.disconnect(ws, video_id)
-
         return sent_count
 
     async def broadcast_all(self, event: RenderProgressEvent) -> int:
@@ -225,7 +366,7 @@ class RenderProgressConnectionManager:
             event: 전송할 이벤트
 
         Returns:
-            int: 전송 성공한 총 클라이언트 수
+            int: 전송 대기열에 넣은 총 클라이언트 수
         """
         total_sent = 0
         for video_id in list(self._connections.keys()):
@@ -243,6 +384,117 @@ class RenderProgressConnectionManager:
         """활성 비디오 ID 목록 반환."""
         return list(self._connections.keys())
 
+    def get_stats(self) -> Dict[str, int]:
+        """전송 통계 (연결 수, 병합된 이벤트 수, 끊은 느린 소켓 수)."""
+        return {
+            "connections": self.get_connection_count(),
+            "coalesced": sum(s.coalesced_count for s in self._senders.values()),
+            "dropped": self._dropped_count,
+        }
+
+    def close(self) -> None:
+        """모든 전송 태스크 중지 (종료 시)."""
+        for sender in self._senders.values():
+            sender.stop()
+        self._senders.clear()
+
+
+# =============================================================================
+# Progress Bus (워커 간 전달)
+# =============================================================================
+
+
+class RenderProgressBus:
+    """StateStore pub/sub 기반 진행률 버스.
+
+    publish는 잡별 최신 이벤트를 저장하고 채널에 발행합니다.
+    WebSocket이 연결된 워커는 채널을 구독하고(ensure_subscribed),
+    받은 이벤트를 로컬 RenderProgressConnectionManager로 전달합니다.
+    """
+
+    CHANNEL = "render_progress"
+    LATEST_PREFIX = "render_progress:latest:"
+
+    def __init__(
+        self,
+        manager: RenderProgressConnectionManager,
+        state_store: Optional[StateStore] = None,
+        latest_ttl_sec: Optional[int] = None,
+    ):
+        self._manager = manager
+        self._state_store = state_store
+        self._latest_ttl_sec = latest_ttl_sec or get_settings().RENDER_PROGRESS_LATEST_TTL_SEC
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._unsubscribe: Optional[Callable[[], None]] = None
+
+    @property
+    def _state(self) -> StateStore:
+        """상태 저장소 (미지정 시 현재 싱글톤)."""
+        return self._state_store or get_state_store()
+
+    def _latest_key(self, video_id: str, job_id: str) -> str:
+        return f"{self.LATEST_PREFIX}{video_id}:{job_id}"
+
+    def ensure_subscribed(self) -> None:
+        """현재 이벤트 루프에서 채널 구독 (이미 구독 중이면 무시)."""
+        loop = asyncio.get_running_loop()
+        if self._unsubscribe is not None and self._loop is loop:
+            return
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+        self._loop = loop
+        self._unsubscribe = self._state.subscribe(self.CHANNEL, self._on_message)
+
+    def _on_message(self, channel: str, data: Dict[str, Any]) -> None:
+        """구독 콜백 (임의 스레드) → 이벤트 루프에서 로컬 전달."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(self._deliver, data)
+
+    def _deliver(self, data: Dict[str, Any]) -> None:
+        event = RenderProgressEvent.model_validate(data)
+        asyncio.ensure_future(self._manager.broadcast(event.video_id, event))
+
+    def _publish_sync(self, data: Dict[str, Any]) -> None:
+        self._state.set(
+            self._latest_key(data["video_id"], data["job_id"]),
+            data,
+            ttl_sec=self._latest_ttl_sec,
+        )
+        self._state.publish(self.CHANNEL, data)
+
+    async def publish(self, event: RenderProgressEvent) -> int:
+        """이벤트를 모든 워커에 발행합니다.
+
+        Returns:
+            int: 이 워커에서 해당 video_id를 구독 중인 연결 수
+        """
+        data = event.model_dump()
+        if self._state.backend == "memory":
+            self._publish_sync(data)
+        else:
+            # 공유 저장소 쓰기는 이벤트 루프 밖에서
+            await asyncio.to_thread(self._publish_sync, data)
+        return self._manager.get_connection_count(event.video_id)
+
+    async def latest_events(
+        self, video_id: str, job_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """video_id의 잡별 최신 이벤트 (늦게 연결한 클라이언트용, 시각순)."""
+        prefix = self._latest_key(video_id, job_id) if job_id else f"{self.LATEST_PREFIX}{video_id}:"
+        events = list((await self._state.aitems(prefix)).values())
+        if job_id:
+            events = [e for e in events if e["job_id"] == job_id]
+        return sorted(events, key=lambda e: e["timestamp"])
+
+    def close(self) -> None:
+        """구독 해제."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        self._loop = None
+
 
 # =============================================================================
 # Singleton Connection Manager
@@ -250,6 +502,7 @@ class RenderProgressConnectionManager:
 
 
 _connection_manager: Optional[RenderProgressConnectionManager] = None
+_progress_bus: Optional[RenderProgressBus] = None
 
 
 def get_connection_manager() -> RenderProgressConnectionManager:
@@ -260,10 +513,23 @@ def get_connection_manager() -> RenderProgressConnectionManager:
     return _connection_manager
 
 
+def get_render_progress_bus() -> RenderProgressBus:
+    """RenderProgressBus 싱글톤 인스턴스 반환."""
+    global _progress_bus
+    if _progress_bus is None:
+        _progress_bus = RenderProgressBus(get_connection_manager())
+    return _progress_bus
+
+
 def clear_connection_manager() -> None:
-    """ConnectionManager 싱글톤 초기화 (테스트용)."""
-    global _connection_manager
-    _connection_manager = None
+    """ConnectionManager/Bus 싱글톤 초기화 (종료/테스트용)."""
+    global _connection_manager, _progress_bus
+    if _progress_bus is not None:
+        _progress_bus.close()
+        _progress_bus = None
+    if _connection_manager is not None:
+        _connection_manager.close()
+        _connection_manager = None
 
 
 # =============================================================================
@@ -288,6 +554,7 @@ async def render_progress_websocket(
         job_id: (Optional) 특정 잡 ID 필터링
     """
     manager = get_connection_manager()
+    bus = get_render_progress_bus()
 
     # job_id 미지정 시 최신 활성 잡으로 자동 매핑
     active_job_id = job_id
@@ -296,15 +563,24 @@ async def render_progress_websocket(
             from app.repositories.render_job_repository import get_render_job_repository
 
             repo = get_render_job_repository()
-            active_job = repo.get_active_by_video_id(video_id)
+            # 동기 SQLite 조회는 스레드에서 실행 (연결 수락 중 이벤트 루프 블로킹 방지)
+            active_job = await asyncio.to_thread(repo.get_active_by_video_id, video_id)
             if active_job:
                 active_job_id = active_job.job_id
         except Exception:
             pass  # 저장소 오류 시 무시
 
     try:
+        bus.ensure_subscribed()
         await manager.connect(websocket, video_id, job_id=active_job_id)
 
+        # 늦게 연결한 클라이언트: 잡별 최신 이벤트 먼저 전송
+        try:
+            for event_data in await bus.latest_events(video_id, active_job_id):
+                manager.offer(websocket, event_data)
+        except Exception as e:
+            logger.warning(f"Failed to load latest render progress: video_id={video_id}, error={e}")
+
         # 연결 유지 (클라이언트가 끊을 때까지)
         while True:
             try:
@@ -313,11 +589,12 @@ async def render_progress_websocket(
 
                 # ping 처리
                 if data == "ping":
-                    await websocket.send_json(
+                    manager.send_control(
+                        websocket,
                         {
                             "type": "pong",
                             "timestamp": datetime.utcnow().isoformat() + "Z",
-                        }
+                        },
                     )
 
             except WebSocketDisconnect:
@@ -342,10 +619,12 @@ async def notify_render_progress(
     step: Optional[RenderStep] = None,
     progress: int = 0,
     message: str = "",
+    queue_position: Optional[int] = None,
 ) -> int:
     """렌더 진행률 알림을 구독자에게 전송합니다.
 
     VideoRenderService에서 호출하여 진행률을 브로드캐스트합니다.
+    이벤트는 진행률 버스로 발행되어 모든 워커의 구독자에게 전달됩니다.
 
     Args:
         job_id: 잡 ID
@@ -354,12 +633,11 @@ async def notify_render_progress(
         step: 현재 단계
         progress: 진행률 (0-100)
         message: 메시지
+        queue_position: QUEUED 대기 순번 (1부터, 선택)
 
     Returns:
-        int: 전송 성공한 클라이언트 수
+        int: 이 워커에서 해당 video_id를 구독 중인 연결 수
     """
-    manager = get_connection_manager()
-
     event = RenderProgressEvent.create(
         job_id=job_id,
         video_id=video_id,
@@ -367,9 +645,10 @@ async def notify_render_progress(
         step=step,
         progress=progress,
         message=message,
+        queue_position=queue_position,
     )
 
-    return await manager.broadcast(video_id, event)
+    return await get_render_progress_bus().publish(event)
 
 
 # 단계별 진행률 매핑
@@ -48,6 +48,7 @@ from app.clients.http_client import get_async_http_client
 from app.core.config import get_settings
 from app.core.exceptions import ErrorType, ServiceType, UpstreamServiceError
 from app.core.logging import get_logger
+from app.core.metrics import metrics
 from app.core.retry import BACKEND_RETRY_CONFIG, DEFAULT_BACKEND_TIMEOUT, retry_async_operation
 from app.models.ai_log import AILogEntry, AILogResponse, to_backend_log_payload
 
@@ -576,15 +577,16 @@ class BackendClient:
         try:
             client = get_async_http_client()
 
-            response = await retry_async_operation(
-                client.get,
-                endpoint,
-                params=params if params else None,
-                headers=self._get_bearer_headers(),
-                timeout=self._timeout,
-                config=BACKEND_RETRY_CONFIG,
-                operation_name="backend_data_request",
-            )
+            with metrics.timer("backend_api"):
+                response = await retry_async_operation(
+                    client.get,
+                    endpoint,
+                    params=params if params else None,
+                    headers=self._get_bearer_headers(),
+                    timeout=self._timeout,
+                    config=BACKEND_RETRY_CONFIG,
+                    operation_name="backend_data_request",
+                )
 
             self._last_latency_ms = int((time.perf_counter() - start_time) * 1000)
 
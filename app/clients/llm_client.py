@@ -56,12 +56,14 @@ from app.clients.http_client import get_async_http_client
 from app.core.config import get_settings
 from app.core.exceptions import ErrorType, ServiceType, UpstreamServiceError
 from app.core.logging import get_logger
+from app.core.metrics import metrics
 from app.core.retry import (
     DEFAULT_LLM_TIMEOUT,
     LLM_RETRY_CONFIG,
     retry_async_operation,
 )
 from app.telemetry.emitters import emit_security_event_once
+from app.telemetry.tracing import span
 
 logger = get_logger(__name__)
 
@@ -296,14 +298,15 @@ class LLMClient:
 
         try:
             # Phase 12: 재시도 로직으로 감싼 HTTP 요청
-            response = await retry_async_operation(
-                self._client.post,
-                url,
-                json=payload,
-                timeout=self._timeout,
-                config=LLM_RETRY_CONFIG,
-                operation_name="llm_chat_completion",
-            )
+            with metrics.timer("llm_completion"), span("llm.completion", model=actual_model):
+                response = await retry_async_operation(
+                    self._client.post,
+                    url,
+                    json=payload,
+                    timeout=self._timeout,
+                    config=LLM_RETRY_CONFIG,
+                    operation_name="llm_chat_completion",
+                )
             response.raise_for_status()
 
             data = response.json()
@@ -482,6 +485,7 @@ class LLMClient:
             response.raise_for_status()
 
             latency_ms = int((time.perf_counter() - start_time) * 1000)
+            metrics.record_latency("llm_completion", latency_ms)
             data = response.json()
 
             choices = data.get("choices", [])
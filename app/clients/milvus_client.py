@@ -31,20 +31,48 @@ Phase 49: EDUCATION allowlist를 config로 분리
 import hashlib
 import json
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import anyio
 import httpx
-from pymilvus import connections, Collection, utility
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.core.metrics import metrics
 from app.core.retrieval_context import check_retrieval_allowed, RetrievalBlockedError
 from app.models.chat import ChatSource
+from app.telemetry.tracing import span
 from app.utils.debug_log import dbg_retrieval_target, dbg_retrieval_top5
 
 logger = get_logger(__name__)
 
+if TYPE_CHECKING:
+    from pymilvus import Collection
+
+# pymilvus는 import 시 pandas/grpc까지 로드해 비용이 크므로 첫 연결 시 로드합니다.
+# (connections/Collection/utility는 _load_pymilvus 이후 모듈 전역으로 바인딩)
+_PYMILVUS_NAMES = ("connections", "Collection", "utility")
+
+
+def _load_pymilvus() -> None:
+    """pymilvus를 import해 connections/Collection/utility를 모듈 전역에 바인딩합니다.
+
+    이미 바인딩되어 있으면(테스트 patch 포함) 그대로 둡니다.
+    """
+    global connections, Collection, utility
+    namespace = globals()
+    if all(name in namespace for name in _PYMILVUS_NAMES):
+        return
+    from pymilvus import connections, Collection, utility  # noqa: F811
+
+
+def __getattr__(name: str) -> Any:
+    """모듈 속성 접근(mock.patch 등) 시 pymilvus 이름을 지연 로드합니다."""
+    if name in _PYMILVUS_NAMES:
+        _load_pymilvus()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # =============================================================================
 # 예외 클래스
@@ -181,6 +209,27 @@ def get_dataset_filter_expr(domain: Optional[str]) -> Optional[str]:
     return None
 
 
+def get_doc_id_filter_expr(doc_ids: List[str]) -> Optional[str]:
+    """
+    doc_id 목록으로 검색 범위를 제한하는 필터 표현식을 반환합니다.
+
+    소스셋 스크립트 생성 시 소스셋 문서 밖의 청크가 섞이지 않도록 사용합니다.
+
+    Args:
+        doc_ids: Milvus doc_id 목록
+
+    Returns:
+        Optional[str]: Milvus filter expression 또는 None (목록이 비어있으면)
+    """
+    unique_ids = list(dict.fromkeys(d for d in doc_ids if d))
+    if not unique_ids:
+        return None
+
+    # in 연산자 사용 (한글 && == 조합 버그 우회)
+    safe_ids = [f'"{escape_milvus_string(doc_id)}"' for doc_id in unique_ids]
+    return f'doc_id in [{", ".join(safe_ids)}]'
+
+
 def is_safe_doc_id(doc_id: str) -> bool:
     """
     doc_id가 안전한 형식인지 확인합니다.
@@ -318,7 +367,7 @@ class MilvusSearchClient:
             logger.info(f"Using vLLM server for embeddings: {self._llm_base_url}")
 
         self._connected = False
-        self._collection: Optional[Collection] = None
+        self._collection: Optional["Collection"] = None
         self._collection_dim: Optional[int] = None  # 실제 컬렉션 dim (검증용)
         self._has_dataset_id_field: Optional[bool] = None  # Phase 48: 스키마 검사 결과 캐시
 
@@ -338,6 +387,7 @@ class MilvusSearchClient:
         Raises:
             MilvusConnectionError: 연결 실패 시
         """
+        _load_pymilvus()
         if self._connected:
             return
 
@@ -368,7 +418,7 @@ class MilvusSearchClient:
         """Milvus 연결을 확인하고 필요시 연결합니다 (async wrapper)."""
         await anyio.to_thread.run_sync(self._ensure_connection_sync)
 
-    def _get_collection_sync(self) -> Collection:
+    def _get_collection_sync(self) -> "Collection":
         """
         컬렉션 객체를 반환합니다 (sync).
 
@@ -413,11 +463,11 @@ class MilvusSearchClient:
         logger.info(f"Loaded collection: {self._collection_name}")
         return self._collection
 
-    def _get_collection(self) -> Collection:
+    def _get_collection(self) -> "Collection":
         """컬렉션 객체를 반환합니다 (sync, 기존 호환성)."""
         return self._get_collection_sync()
 
-    async def _get_collection_async(self) -> Collection:
+    async def _get_collection_async(self) -> "Collection":
         """컬렉션 객체를 반환합니다 (async wrapper)."""
         return await anyio.to_thread.run_sync(self._get_collection_sync)
 
@@ -512,6 +562,65 @@ class MilvusSearchClient:
         Returns:
             List[float]: 임베딩 벡터
 
+        Raises:
+            EmbeddingError: 임베딩 생성 실패 시
+        """
+        embeddings_data = await self._request_embeddings(text)
+
+        embedding = embeddings_data[0].get("embedding", [])
+        if not embedding:
+            raise EmbeddingError("Embedding response has empty embedding")
+
+        logger.debug("Generated embedding with dimension %d", len(embedding))
+        return embedding
+
+    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        여러 텍스트의 임베딩 벡터를 1회 요청으로 생성합니다.
+
+        OpenAI 호환 /v1/embeddings의 배열 input을 사용합니다.
+
+        Args:
+            texts: 임베딩할 텍스트 리스트
+
+        Returns:
+            List[List[float]]: texts와 같은 순서의 임베딩 벡터 리스트
+
+        Raises:
+            EmbeddingError: 임베딩 생성 실패 또는 결과 수 불일치 시
+        """
+        if not texts:
+            return []
+
+        embeddings_data = await self._request_embeddings(texts)
+        if len(embeddings_data) != len(texts):
+            raise EmbeddingError(
+                f"Embedding response size mismatch: expected {len(texts)}, "
+                f"got {len(embeddings_data)}"
+            )
+
+        # 응답 순서는 index 필드 기준 (서버에 따라 순서가 보장되지 않음)
+        ordered = sorted(
+            enumerate(embeddings_data),
+            key=lambda item: item[1].get("index", item[0]),
+        )
+        embeddings = [item.get("embedding", []) for _, item in ordered]
+        if any(not embedding for embedding in embeddings):
+            raise EmbeddingError("Embedding response has empty embedding")
+
+        logger.debug("Generated %d embeddings in one request", len(embeddings))
+        return embeddings
+
+    async def _request_embeddings(self, input_data: Any) -> List[Dict[str, Any]]:
+        """
+        /v1/embeddings를 호출하고 data 목록을 반환합니다.
+
+        Args:
+            input_data: 단일 텍스트 또는 텍스트 리스트
+
+        Returns:
+            List[Dict[str, Any]]: 응답의 data 목록 (비어있지 않음)
+
         Raises:
             EmbeddingError: 임베딩 생성 실패 시
         """
@@ -521,7 +630,7 @@ class MilvusSearchClient:
         url = f"{self._llm_base_url.rstrip('/')}/v1/embeddings"
 
         payload = {
-            "input": text,
+            "input": input_data,
             "model": self._embedding_model,
         }
 
@@ -532,12 +641,13 @@ class MilvusSearchClient:
 
         try:
             async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=payload,
-                    headers=headers,
-                    timeout=self.DEFAULT_TIMEOUT,
-                )
+                with metrics.timer("embedding"), span("embedding"):
+                    response = await client.post(
+                        url,
+                        json=payload,
+                        headers=headers,
+                        timeout=self.DEFAULT_TIMEOUT,
+                    )
 
                 if response.status_code != 200:
                     raise EmbeddingError(
@@ -551,12 +661,7 @@ class MilvusSearchClient:
                 if not embeddings_data:
                     raise EmbeddingError("Embedding response has no data")
 
-                embedding = embeddings_data[0].get("embedding", [])
-                if not embedding:
-                    raise EmbeddingError("Embedding response has empty embedding")
-
-                logger.debug(f"Generated embedding with dimension {len(embedding)}")
-                return embedding
+                return embeddings_data
 
         except httpx.TimeoutException as e:
             logger.error("Embedding generation timeout")
@@ -614,30 +719,54 @@ class MilvusSearchClient:
         output = []
         for hits in results:
             for hit in hits:
-                entity = hit.entity
-
-                dataset_id = getattr(entity, "dataset_id", "")
-                content = getattr(entity, "text", "")
-                doc_id = getattr(entity, "doc_id", "")
-                chunk_id = getattr(entity, "chunk_id", None)
+                output.append(self._hit_to_result(hit))
 
-                domain_guess = self._extract_domain_from_dataset_id(dataset_id)
+        return output
 
-                output.append({
-                    "id": str(hit.id),
-                    "content": content,
-                    "title": doc_id or "unknown",
-                    "domain": domain_guess,
-                    "doc_id": doc_id,
-                    "score": hit.score,
-                    "metadata": {
-                        "dataset_id": dataset_id,
-                        "chunk_id": chunk_id,
-                    },
-                })
+    def _search_many_sync(
+        self,
+        query_embeddings: List[List[float]],
+        top_k: int,
+        expr: Optional[str] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Milvus 다중 벡터 검색 (sync). 쿼리 순서대로 결과 리스트를 반환합니다."""
+        collection = self._get_collection_sync()
+        search_params = self._search_params.copy()
 
+        results = collection.search(
+            data=query_embeddings,
+            anns_field="embedding",
+            param=search_params,
+            limit=top_k,
+            expr=expr,
+            output_fields=["text", "doc_id", "dataset_id", "chunk_id"],
+        )
 
-        return output
+        return [[self._hit_to_result(hit) for hit in hits] for hits in results]
+
+    def _hit_to_result(self, hit: Any) -> Dict[str, Any]:
+        """Milvus 검색 hit을 결과 dict로 변환합니다."""
+        entity = hit.entity
+
+        dataset_id = getattr(entity, "dataset_id", "")
+        content = getattr(entity, "text", "")
+        doc_id = getattr(entity, "doc_id", "")
+        chunk_id = getattr(entity, "chunk_id", None)
+
+        domain_guess = self._extract_domain_from_dataset_id(dataset_id)
+
+        return {
+            "id": str(hit.id),
+            "content": content,
+            "title": doc_id or "unknown",
+            "domain": domain_guess,
+            "doc_id": doc_id,
+            "score": hit.score,
+            "metadata": {
+                "dataset_id": dataset_id,
+                "chunk_id": chunk_id,
+            },
+        }
 
     async def search(
         self,
@@ -676,9 +805,11 @@ class MilvusSearchClient:
             query_embedding = await self.generate_embedding(query)
 
             # 2. Milvus 검색 (sync → async)
-            output = await anyio.to_thread.run_sync(
-                lambda: self._search_sync(query_embedding, top_k, filter_expr)
-            )
+            with metrics.timer("milvus_search"), span("milvus.search", top_k=top_k) as current:
+                output = await anyio.to_thread.run_sync(
+                    lambda: self._search_sync(query_embedding, top_k, filter_expr)
+                )
+                current.set_attribute("result_count", len(output))
 
             logger.info(f"Milvus search returned {len(output)} results")
             return output
@@ -693,6 +824,67 @@ class MilvusSearchClient:
             logger.exception("Milvus search unexpected error")
             raise MilvusSearchError(f"Search failed: {e}", original_error=e)
 
+    async def search_many(
+        self,
+        queries: List[str],
+        filter_expr: Optional[str] = None,
+        top_k: Optional[int] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        여러 쿼리를 배치 임베딩 1회 + 다중 벡터 검색 1회로 처리합니다.
+
+        씬 아웃라인처럼 쿼리가 미리 정해진 경우 N회 임베딩/검색 왕복을 2회로 줄입니다.
+
+        Args:
+            queries: 검색 쿼리 텍스트 리스트
+            filter_expr: 필터 표현식 (예: get_doc_id_filter_expr 결과)
+            top_k: 쿼리당 반환할 최대 결과 수
+
+        Returns:
+            List[List[Dict[str, Any]]]: queries와 같은 순서의 검색 결과 리스트
+
+        Raises:
+            RetrievalBlockedError: 금지질문으로 retrieval이 차단된 경우
+        """
+        check_retrieval_allowed("MilvusSearchClient.search_many")
+
+        if not queries:
+            return []
+
+        top_k = top_k or self._top_k
+
+        logger.info(
+            f"MilvusSearchClient.search_many: queries={len(queries)}, "
+            f"top_k={top_k}, filter={'yes' if filter_expr else 'no'}"
+        )
+
+        try:
+            # 1. 쿼리 임베딩 배치 생성
+            query_embeddings = await self.generate_embeddings(queries)
+
+            # 2. Milvus 다중 벡터 검색 (sync → async)
+            with metrics.timer("milvus_search"), span(
+                "milvus.search_many", top_k=top_k, query_count=len(queries)
+            ):
+                output = await anyio.to_thread.run_sync(
+                    lambda: self._search_many_sync(query_embeddings, top_k, filter_expr)
+                )
+
+            logger.info(
+                f"Milvus search_many returned {sum(len(r) for r in output)} results"
+            )
+            return output
+
+        except EmbeddingError:
+            raise MilvusSearchError("Failed to generate query embeddings")
+
+        except MilvusError:
+            raise
+
+        except Exception as e:
+            logger.exception("Milvus search_many unexpected error")
+            raise MilvusSearchError(f"Search failed: {e}", original_error=e)
+
     async def search_as_sources(
         self,
         query: str,
@@ -730,7 +922,7 @@ class MilvusSearchClient:
                 filter_expr = get_dataset_filter_expr(domain)
                 if filter_expr:
                     logger.info(
-                        f"[Phase48] Dataset filter applied: domain={domain} -> {filter_expr}"
+                        "[Phase48] Dataset filter applied: domain=%s -> %s", domain, filter_expr
                     )
 
         # Phase 41: [B] retrieval_target 디버그 로그
@@ -876,7 +1068,7 @@ class MilvusSearchClient:
                 if len(batch) < self.QUERY_BATCH_SIZE:
                     break
 
-                logger.debug(f"Fetched {len(all_chunks)} chunks so far...")
+                logger.debug("Fetched %d chunks so far...", len(all_chunks))
 
             if not all_chunks:
                 logger.warning(f"No chunks found for doc_id='{doc_id}'")
@@ -921,6 +1113,14 @@ class MilvusSearchClient:
     # Health Check
     # =========================================================================
 
+    async def warm_up(self) -> None:
+        """연결과 컬렉션 load를 미리 수행합니다 (lifespan warm-up, 첫 검색 지연 제거).
+
+        Raises:
+            MilvusConnectionError / MilvusError: 연결 실패 또는 컬렉션 없음
+        """
+        await self._get_collection_async()
+
     async def health_check(self) -> bool:
         """Milvus 서비스 상태를 확인합니다."""
         try:
@@ -945,6 +1145,7 @@ class MilvusSearchClient:
     def disconnect(self) -> None:
         """Milvus 연결을 해제합니다."""
         try:
+            _load_pymilvus()
             if self._collection is not None:
                 self._collection.release()
                 self._collection = None
@@ -6,6 +6,9 @@ facts 조회 API 호출을 담당합니다.
 
 주요 기능:
 - resolve_facts: 개인화 facts 데이터 조회 (POST /api/personalization/resolve)
+- facts 캐시: (user_id, sub_intent_id, period) 단위, period 유형별 TTL
+- 동일 키 동시 조회 합치기 (single-flight)
+- invalidate_personalization_facts: 이수 현황 변경 시 사용자 단위 캐시 무효화
 
 사용 방법:
     from app.clients.personalization_client import PersonalizationClient
@@ -14,7 +17,7 @@ facts 조회 API 호출을 담당합니다.
     facts = await client.resolve_facts("Q11", user_id="emp123", period="this-year")
 """
 
-from typing import Optional
+from typing import Dict, Optional
 
 from app.clients.http_client import get_async_http_client
 from app.core.backend_context import check_backend_allowed
@@ -29,11 +32,121 @@ from app.models.personalization import (
     PeriodType,
     PRIORITY_SUB_INTENTS,
 )
+from app.utils.cache import SingleFlight, TTLCache
 
 logger = get_logger(__name__)
 settings = get_settings()
 
 
+# =============================================================================
+# Facts 캐시
+# =============================================================================
+
+# period 유형별 facts 캐시 TTL (초)
+# 기간이 짧을수록 집계 값이 자주 바뀌므로 TTL을 짧게 둡니다.
+PERIOD_CACHE_TTL_SECONDS: Dict[str, float] = {
+    PeriodType.THIS_WEEK.value: 120,
+    PeriodType.THIS_MONTH.value: 300,
+    PeriodType.THREE_MONTHS.value: 600,
+    PeriodType.THIS_YEAR.value: 1800,
+}
+
+# 알 수 없는 period 값에 대한 기본 TTL (초)
+DEFAULT_CACHE_TTL_SECONDS: float = 120
+
+_facts_cache: Optional[TTLCache[PersonalizationFacts]] = None
+_facts_flight: SingleFlight[PersonalizationFacts] = SingleFlight()
+
+# 사용자별 무효화 세대. 조회 중에 무효화되면 세대가 바뀌므로,
+# 무효화 전 응답을 캐시에 다시 넣지 않고 진행 중 조회도 새 요청과 합치지 않습니다.
+# facts 캐시와 같은 maxsize, 가장 긴 facts TTL로 유지합니다
+# (그 이후에는 무효화 전에 캐시된 facts도 모두 만료되므로 세대를 기억할 필요가 없음).
+_facts_generations: Optional[TTLCache[int]] = None
+
+
+def get_personalization_facts_cache() -> TTLCache[PersonalizationFacts]:
+    """개인화 facts 캐시 싱글톤 인스턴스 반환."""
+    global _facts_cache
+    if _facts_cache is None:
+        _facts_cache = TTLCache(
+            maxsize=settings.PERSONALIZATION_CACHE_MAXSIZE,
+            ttl_seconds=DEFAULT_CACHE_TTL_SECONDS,
+            name="personalization_facts",
+        )
+    return _facts_cache
+
+
+def _get_facts_generations() -> TTLCache[int]:
+    """사용자별 무효화 세대 캐시 싱글톤 인스턴스 반환."""
+    global _facts_generations
+    if _facts_generations is None:
+        _facts_generations = TTLCache(
+            maxsize=settings.PERSONALIZATION_CACHE_MAXSIZE,
+            ttl_seconds=max(PERIOD_CACHE_TTL_SECONDS.values()),
+            name="personalization_facts_generations",
+        )
+    return _facts_generations
+
+
+def _facts_generation(user_id: str) -> int:
+    """사용자의 현재 무효화 세대 (기록이 없거나 만료되었으면 0)."""
+    if _facts_generations is None:
+        return 0
+    return _facts_generations.get(user_id) or 0
+
+
+def clear_personalization_facts_cache() -> None:
+    """개인화 facts 캐시 초기화 (테스트용)."""
+    global _facts_cache, _facts_generations
+    _facts_cache = None
+    _facts_generations = None
+
+
+def _facts_cache_key(
+    user_id: str,
+    sub_intent_id: Optional[str] = None,
+    period: Optional[str] = None,
+    target_dept_id: Optional[str] = None,
+) -> str:
+    """facts 캐시 키를 생성합니다.
+
+    사용자/인텐트 단위 prefix 무효화가 가능하도록 user_id부터 순서대로 이어 붙입니다.
+    sub_intent_id를 생략하면 사용자 prefix만 반환합니다.
+    """
+    if sub_intent_id is None:
+        return f"{user_id}|"
+    if period is None:
+        return f"{user_id}|{sub_intent_id}|"
+    return f"{user_id}|{sub_intent_id}|{period}|{target_dept_id or ''}"
+
+
+def invalidate_personalization_facts(
+    user_id: str,
+    sub_intent_id: Optional[str] = None,
+) -> int:
+    """
+    사용자의 캐시된 facts를 무효화합니다.
+
+    백엔드에서 교육 이수/연차 사용 등 facts가 바뀌었을 때 호출합니다.
+
+    Args:
+        user_id: 사용자 ID
+        sub_intent_id: 특정 인텐트만 무효화할 경우 지정 (None이면 사용자 전체)
+
+    Returns:
+        int: 삭제된 캐시 항목 수
+    """
+    _get_facts_generations().set(user_id, _facts_generation(user_id) + 1)
+    if _facts_cache is None:
+        return 0
+    removed = _facts_cache.delete_prefix(_facts_cache_key(user_id, sub_intent_id))
+    logger.info(
+        f"Personalization facts invalidated: user_id={user_id}, "
+        f"sub_intent_id={sub_intent_id}, removed={removed}"
+    )
+    return removed
+
+
 class PersonalizationClient:
     """
     개인화 API 클라이언트.
@@ -108,7 +221,8 @@ class PersonalizationClient:
             target_dept_id: 부서 비교 대상 ID (향후 사용 예정)
 
         Returns:
-            PersonalizationFacts: 조회된 facts 데이터 (에러 시 error 필드 포함)
+            PersonalizationFacts: 조회된 facts 데이터 (에러 시 error 필드 포함).
+                캐시 히트 시 다른 요청과 공유되는 인스턴스이므로 수정하지 않습니다.
 
         Raises:
             BackendBlockedError: Backend API가 차단된 경우 (금지질문)
@@ -136,6 +250,41 @@ class PersonalizationClient:
             logger.debug("Backend URL not configured, returning mock facts")
             return self._get_mock_facts(sub_intent_id, period)
 
+        if not settings.PERSONALIZATION_CACHE_ENABLED:
+            return await self._fetch_facts(sub_intent_id, user_id, period, target_dept_id)
+
+        cache = get_personalization_facts_cache()
+        cache_key = _facts_cache_key(user_id, sub_intent_id, period, target_dept_id)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        generation = _facts_generation(user_id)
+
+        async def _load() -> PersonalizationFacts:
+            facts = await self._fetch_facts(sub_intent_id, user_id, period, target_dept_id)
+            # 에러 응답은 캐시하지 않음 (일시 장애가 TTL 동안 고착되는 것 방지)
+            # 조회 중 무효화되었으면 이전 값일 수 있으므로 캐시하지 않음
+            if facts.error is None and _facts_generation(user_id) == generation:
+                cache.set(
+                    cache_key,
+                    facts,
+                    ttl_seconds=PERIOD_CACHE_TTL_SECONDS.get(
+                        period, DEFAULT_CACHE_TTL_SECONDS
+                    ),
+                )
+            return facts
+
+        return await _facts_flight.do(f"{cache_key}#{generation}", _load)
+
+    async def _fetch_facts(
+        self,
+        sub_intent_id: str,
+        user_id: str,
+        period: str,
+        target_dept_id: Optional[str],
+    ) -> PersonalizationFacts:
+        """백엔드 resolve API를 호출하여 facts를 조회합니다 (캐시 미적용)."""
         endpoint = f"{self._base_url}{self.RESOLVE_PATH}"
 
         try:
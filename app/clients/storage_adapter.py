@@ -190,6 +190,10 @@ class BaseStorageProvider(ABC):
         result = await self.put_file(local_path, object_key)
         return result.key
 
+    async def aclose(self) -> None:
+        """Provider가 보유한 연결 등 리소스를 정리합니다 (기본: 없음)."""
+        return None
+
 
 # =============================================================================
 # Local Storage Provider
@@ -597,6 +601,13 @@ class BackendPresignedStorageProvider(BaseStorageProvider):
     - ETag 검증 강화: 기본적으로 ETag 없으면 실패 (STORAGE_ETAG_OPTIONAL로 완화)
     - 업로드 진행상태 콜백: UPLOAD_STARTED, UPLOAD_DONE, UPLOAD_FAILED
 
+    업로드 성능:
+    - Provider별 httpx.AsyncClient를 재사용 (연결 풀, 요청마다 TLS 핸드셰이크 없음)
+    - 파일은 청크 단위로 executor에서 읽어 전송 (이벤트 루프 블로킹 없음)
+    - STORAGE_MULTIPART_THRESHOLD_MB 이상 파일은 멀티파트 presigned URL로
+      파트를 STORAGE_MULTIPART_CONCURRENCY개씩 병렬 업로드
+      (백엔드가 멀티파트 API를 제공하지 않으면 단일 PUT으로 폴백)
+
     흐름:
     1. put_object 호출 시 파일 크기 확인 (VIDEO_MAX_UPLOAD_BYTES 초과 시 에러)
     2. 백엔드 /internal/storage/presign-put 호출 → upload_url, public_url 수신 (재시도 적용)
@@ -614,8 +625,15 @@ class BackendPresignedStorageProvider(BaseStorageProvider):
     - STORAGE_UPLOAD_RETRY_MAX: 최대 재시도 횟수 (기본 3)
     - STORAGE_UPLOAD_RETRY_BASE_SEC: exponential backoff 기본 시간 (기본 1.0)
     - STORAGE_ETAG_OPTIONAL: ETag 없이도 성공 처리 (기본 False)
+    - STORAGE_UPLOAD_CHUNK_KB: 스트리밍 읽기 청크 크기
+    - STORAGE_MULTIPART_THRESHOLD_MB / PART_MB / CONCURRENCY: 멀티파트 업로드 설정
+    - BACKEND_STORAGE_MULTIPART_PRESIGN_PATH / COMPLETE_PATH / ABORT_PATH: 멀티파트 API 경로
     """
 
+    REQUEST_TIMEOUT_SEC = 30.0  # presign/complete 요청
+    UPLOAD_TIMEOUT_SEC = 300.0  # PUT 업로드
+    MIN_PART_BYTES = 5 * 1024 * 1024  # S3 멀티파트 최소 파트 크기
+
     def __init__(self):
         from app.core.config import get_settings
         settings = get_settings()
@@ -632,12 +650,68 @@ class BackendPresignedStorageProvider(BaseStorageProvider):
         self._retry_base_sec = settings.STORAGE_UPLOAD_RETRY_BASE_SEC
         self._etag_optional = settings.STORAGE_ETAG_OPTIONAL
 
+        # 스트리밍 / 멀티파트 설정
+        self._chunk_bytes = settings.STORAGE_UPLOAD_CHUNK_KB * 1024
+        self._multipart_threshold_bytes = settings.STORAGE_MULTIPART_THRESHOLD_MB * 1024 * 1024
+        self._multipart_part_bytes = max(
+            settings.STORAGE_MULTIPART_PART_MB * 1024 * 1024, self.MIN_PART_BYTES
+        )
+        self._multipart_concurrency = max(settings.STORAGE_MULTIPART_CONCURRENCY, 1)
+        self._multipart_presign_path = settings.BACKEND_STORAGE_MULTIPART_PRESIGN_PATH
+        self._multipart_complete_path = settings.BACKEND_STORAGE_MULTIPART_COMPLETE_PATH
+        self._multipart_abort_path = settings.BACKEND_STORAGE_MULTIPART_ABORT_PATH
+        # 백엔드가 멀티파트 API를 제공하지 않으면 False로 바뀌고 이후 단일 PUT 사용
+        self._multipart_supported = True
+
+        self._client = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
         if not self._backend_base_url:
             raise ValueError(
                 "Backend base URL not configured. "
                 "Set BACKEND_BASE_URL or BACKEND_BASE_URL_MOCK/REAL."
             )
 
+    def _get_client(self):
+        """재사용 httpx.AsyncClient 반환 (현재 이벤트 루프 기준 lazy 생성)."""
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            # 이벤트 루프가 바뀐 경우 (테스트 등) 이전 루프의 연결은 재사용 불가
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.UPLOAD_TIMEOUT_SEC, connect=10.0),
+                limits=httpx.Limits(
+                    max_connections=self._multipart_concurrency + 4,
+                    max_keepalive_connections=self._multipart_concurrency + 4,
+                ),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """재사용 클라이언트를 닫습니다."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+    async def _iter_file(self, file_path: Path, offset: int, length: int):
+        """파일 구간을 청크 단위로 읽는 async generator (읽기는 executor에서 실행)."""
+        loop = asyncio.get_event_loop()
+        f = await loop.run_in_executor(None, open, file_path, "rb")
+        try:
+            await loop.run_in_executor(None, f.seek, offset)
+            remaining = length
+            while remaining > 0:
+                chunk = await loop.run_in_executor(None, f.read, min(self._chunk_bytes, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            await loop.run_in_executor(None, f.close)
+
     def _get_headers(self) -> dict:
         """Internal API 요청 헤더 반환."""
         headers = {"Content-Type": "application/json"}
@@ -762,12 +836,12 @@ class BackendPresignedStorageProvider(BaseStorageProvider):
         headers: dict,
     ) -> dict:
         """Presign 요청 실행 (재시도 없음, _with_retry에서 래핑)."""
-        import httpx
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        client = self._get_client()
+        response = await client.post(
+            url, json=payload, headers=headers, timeout=self.REQUEST_TIMEOUT_SEC
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def _request_presign(
         self,
@@ -809,26 +883,27 @@ class BackendPresignedStorageProvider(BaseStorageProvider):
         upload_url: str,
         file_path: Path,
         headers: dict,
+        offset: int = 0,
+        length: Optional[int] = None,
     ) -> str:
-        """파일 업로드 실행 (스트리밍, 재시도 없음).
+        """파일(또는 파일 구간) 업로드 실행 (스트리밍, 재시도 없음).
 
         Phase 36: 파일을 메모리에 올리지 않고 스트리밍으로 업로드.
+        Content-Length를 명시해 presigned PUT이 거부하는 chunked 전송을 피합니다.
         """
-        import httpx
+        if length is None:
+            length = file_path.stat().st_size - offset
 
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            # 파일을 스트리밍으로 전송 (메모리 효율적)
-            with open(file_path, "rb") as f:
-                response = await client.put(
-                    upload_url,
-                    content=f,
-                    headers=headers,
-                )
-                response.raise_for_status()
+        client = self._get_client()
+        response = await client.put(
+            upload_url,
+            content=self._iter_file(file_path, offset, length),
+            headers={**headers, "Content-Length": str(length)},
+        )
+        response.raise_for_status()
 
-                # ETag 추출
-                etag = response.headers.get("ETag", "")
-                return etag
+        # ETag 추출
+        return response.headers.get("ETag", "")
 
     async def _do_upload_bytes(
         self,
@@ -837,16 +912,14 @@ class BackendPresignedStorageProvider(BaseStorageProvider):
         headers: dict,
     ) -> str:
         """bytes 데이터 업로드 실행 (재시도 없음)."""
-        import httpx
-
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            response = await client.put(
-                upload_url,
-                content=data,
-                headers=headers,
-            )
-            response.raise_for_status()
-            return response.headers.get("ETag", "")
+        client = self._get_client()
+        response = await client.put(
+            upload_url,
+            content=data,
+            headers=headers,
+        )
+        response.raise_for_status()
+        return response.headers.get("ETag", "")
 
     async def _upload_to_presigned_url(
         self,
@@ -898,11 +971,11 @@ class BackendPresignedStorageProvider(BaseStorageProvider):
         headers: dict,
     ) -> None:
         """Complete 요청 실행 (재시도 없음)."""
-        import httpx
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
+        client = self._get_client()
+        response = await client.post(
+            url, json=payload, headers=headers, timeout=self.REQUEST_TIMEOUT_SEC
+        )
+        response.raise_for_status()
 
     async def _notify_complete(
         self,
@@ -944,6 +1017,140 @@ class BackendPresignedStorageProvider(BaseStorageProvider):
 
         logger.info(f"Upload complete notification sent: key={object_key}")
 
+    def _use_multipart(self, file_path: Optional[Path], size_bytes: int) -> bool:
+        """멀티파트 업로드 대상 여부 (파일 입력 + 임계값 이상 + 백엔드 지원)."""
+        return (
+            file_path is not None
+            and self._multipart_supported
+            and self._multipart_threshold_bytes > 0
+            and size_bytes >= self._multipart_threshold_bytes
+        )
+
+    async def _upload_multipart(
+        self,
+        file_path: Path,
+        key: str,
+        content_type: str,
+        size_bytes: int,
+    ) -> Optional[str]:
+        """멀티파트 presigned URL로 파트를 병렬 업로드합니다.
+
+        1. 백엔드 멀티파트 presign 호출 → upload_id, 파트별 upload_url 수신
+        2. 파트를 STORAGE_MULTIPART_CONCURRENCY개씩 동시에 스트리밍 PUT (파트별 재시도)
+        3. 백엔드 멀티파트 complete 호출 (파트 ETag 목록 전달, S3 완료 + 업로드 기록)
+
+        파트 업로드나 complete가 실패(취소 포함)하면 백엔드 멀티파트 abort를 호출해
+        이미 올라간 파트를 정리합니다.
+
+        Returns:
+            public_url (백엔드가 멀티파트 API를 제공하지 않으면 None → 단일 PUT 폴백)
+
+        Raises:
+            StorageUploadError: 업로드 실패 시
+        """
+        import httpx
+
+        part_size = self._multipart_part_bytes
+        part_count = -(-size_bytes // part_size)
+
+        try:
+            presign = await self._with_retry(
+                "Multipart presign request",
+                self._do_presign_request,
+                key,
+                f"{self._backend_base_url}{self._multipart_presign_path}",
+                {
+                    "object_key": key,
+                    "content_type": content_type,
+                    "content_length": size_bytes,
+                    "part_size": part_size,
+                    "part_count": part_count,
+                },
+                self._get_headers(),
+            )
+        except StorageUploadError as e:
+            original = e.original_error
+            if (
+                isinstance(original, httpx.HTTPStatusError)
+                and original.response.status_code in (404, 405)
+            ):
+                logger.warning(
+                    "Backend multipart upload API not available, "
+                    f"using single PUT from now on: key={key}"
+                )
+                self._multipart_supported = False
+                return None
+            raise
+
+        upload_id = presign["upload_id"]
+        part_headers = presign.get("headers", {})
+        semaphore = asyncio.Semaphore(self._multipart_concurrency)
+
+        async def upload_part(part: dict) -> dict:
+            number = int(part["part_number"])
+            offset = (number - 1) * part_size
+            async with semaphore:
+                etag = await self._with_retry(
+                    f"Multipart part {number} upload",
+                    self._do_upload,
+                    key,
+                    part["upload_url"],
+                    file_path,
+                    part_headers,
+                    offset,
+                    min(part_size, size_bytes - offset),
+                )
+            self._validate_etag(etag, key)
+            return {"part_number": number, "etag": etag}
+
+        tasks = [asyncio.ensure_future(upload_part(part)) for part in presign["parts"]]
+        try:
+            try:
+                parts = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+            await self._with_retry(
+                "Multipart complete notification",
+                self._do_complete_request,
+                key,
+                f"{self._backend_base_url}{self._multipart_complete_path}",
+                {
+                    "object_key": key,
+                    "upload_id": upload_id,
+                    "parts": sorted(parts, key=lambda p: p["part_number"]),
+                    "size_bytes": size_bytes,
+                    "content_type": content_type,
+                    "public_url": presign["public_url"],
+                },
+                self._get_headers(),
+            )
+        except BaseException:
+            # 취소 중에도 abort 요청은 끝까지 보냄
+            await asyncio.shield(self._abort_multipart(key, upload_id))
+            raise
+
+        logger.info(f"Multipart upload succeeded: key={key}, parts={len(parts)}")
+        return presign["public_url"]
+
+    async def _abort_multipart(self, key: str, upload_id: str) -> None:
+        """멀티파트 업로드 중단 요청 (best-effort, 실패는 로그만 남김)."""
+        try:
+            await self._do_complete_request(
+                f"{self._backend_base_url}{self._multipart_abort_path}",
+                {"object_key": key, "upload_id": upload_id},
+                self._get_headers(),
+            )
+            logger.info(f"Multipart upload aborted: key={key}, upload_id={upload_id}")
+        except Exception as e:
+            logger.warning(
+                f"Multipart abort failed (parts expire by bucket lifecycle): "
+                f"key={key}, upload_id={upload_id}, error={e}"
+            )
+
     def _validate_etag(self, etag: str, key: str) -> None:
         """ETag 유효성 검증 (Phase 36).
 
@@ -1039,40 +1246,17 @@ class BackendPresignedStorageProvider(BaseStorageProvider):
                 content_type, _ = mimetypes.guess_type(key)
                 content_type = content_type or "application/octet-stream"
 
-            # 1. Presign 요청 (재시도 적용)
-            presign_response = await self._request_presign(
-                object_key=key,
-                content_type=content_type,
-                content_length=size_bytes,
-            )
-
-            upload_url = presign_response["upload_url"]
-            public_url = presign_response["public_url"]
-            upload_headers = presign_response.get("headers", {})
-
-            # Content-Type 헤더 추가
-            if "Content-Type" not in upload_headers:
-                upload_headers["Content-Type"] = content_type
-
-            # 2. Presigned URL로 업로드 (스트리밍, 재시도 적용)
-            etag = await self._upload_to_presigned_url(
-                upload_url=upload_url,
-                data=upload_data,
-                headers=upload_headers,
-                key=key,
-            )
-
-            # 3. ETag 검증 (Phase 36)
-            self._validate_etag(etag, key)
+            # 대용량 파일: 멀티파트 병렬 업로드 (미지원 백엔드면 None → 단일 PUT)
+            public_url = None
+            if self._use_multipart(file_path, size_bytes):
+                public_url = await self._upload_multipart(
+                    file_path, key, content_type, size_bytes
+                )
 
-            # 4. Complete 콜백 (재시도 적용)
-            await self._notify_complete(
-                object_key=key,
-                etag=etag or "",
-                size_bytes=size_bytes,
-                content_type=content_type,
-                public_url=public_url,
-            )
+            if public_url is None:
+                public_url = await self._upload_single(
+                    upload_data, key, content_type, size_bytes
+                )
 
             logger.info(
                 f"Backend presigned upload succeeded: key={key}, "
@@ -1118,6 +1302,55 @@ class BackendPresignedStorageProvider(BaseStorageProvider):
                 ))
             raise error
 
+    async def _upload_single(
+        self,
+        upload_data: Union[bytes, Path],
+        key: str,
+        content_type: str,
+        size_bytes: int,
+    ) -> str:
+        """단일 presigned PUT 업로드 (presign → PUT → ETag 검증 → complete).
+
+        Returns:
+            str: public_url
+        """
+        # 1. Presign 요청 (재시도 적용)
+        presign_response = await self._request_presign(
+            object_key=key,
+            content_type=content_type,
+            content_length=size_bytes,
+        )
+
+        upload_url = presign_response["upload_url"]
+        public_url = presign_response["public_url"]
+        upload_headers = presign_response.get("headers", {})
+
+        # Content-Type 헤더 추가
+        if "Content-Type" not in upload_headers:
+            upload_headers["Content-Type"] = content_type
+
+        # 2. Presigned URL로 업로드 (스트리밍, 재시도 적용)
+        etag = await self._upload_to_presigned_url(
+            upload_url=upload_url,
+            data=upload_data,
+            headers=upload_headers,
+            key=key,
+        )
+
+        # 3. ETag 검증 (Phase 36)
+        self._validate_etag(etag, key)
+
+        # 4. Complete 콜백 (재시도 적용)
+        await self._notify_complete(
+            object_key=key,
+            etag=etag or "",
+            size_bytes=size_bytes,
+            content_type=content_type,
+            public_url=public_url,
+        )
+
+        return public_url
+
     async def get_url(self, key: str, expires_in: int = 3600) -> str:
         """객체 URL 반환.
 
@@ -1135,21 +1368,19 @@ class BackendPresignedStorageProvider(BaseStorageProvider):
 
         TODO: 백엔드에 delete API 구현 후 연동
         """
-        import httpx
-
         delete_path = "/internal/storage/delete"
         url = f"{self._backend_base_url}{delete_path}"
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    url,
-                    json={"object_key": key},
-                    headers=self._get_headers(),
-                )
-                response.raise_for_status()
-                logger.info(f"Backend presigned storage: deleted {key}")
-                return True
+            response = await self._get_client().post(
+                url,
+                json={"object_key": key},
+                headers=self._get_headers(),
+                timeout=self.REQUEST_TIMEOUT_SEC,
+            )
+            response.raise_for_status()
+            logger.info(f"Backend presigned storage: deleted {key}")
+            return True
         except Exception as e:
             logger.error(f"Backend presigned delete failed: key={key}, error={e}")
             return False
@@ -1246,6 +1477,12 @@ def get_default_storage_provider() -> BaseStorageProvider:
     return _default_storage
 
 
+async def close_default_storage_provider() -> None:
+    """기본 Storage Provider 리소스 정리 (애플리케이션 종료 시)."""
+    if _default_storage is not None:
+        await _default_storage.aclose()
+
+
 def clear_storage_provider() -> None:
     """Storage Provider 싱글톤 초기화 (테스트용)."""
     global _default_storage
@@ -27,6 +27,7 @@ from typing import Optional, Union
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.core.metrics import metrics
 
 logger = get_logger(__name__)
 
@@ -126,7 +127,8 @@ class BaseTTSProvider(ABC):
         Returns:
             float: 오디오 길이 (초)
         """
-        result = await self.synthesize(text, voice, speed, language)
+        with metrics.timer("tts"):
+            result = await self.synthesize(text, voice, speed, language)
         Path(output_path).write_bytes(result.audio_bytes)
         return result.duration_sec
 
@@ -49,6 +49,13 @@ class Settings(BaseSettings):
     # 로깅 설정
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "json"  # "json" (ELK용) 또는 "text" (개발용)
+    # 로그 포맷/출력은 전용 writer 스레드에서 (호출 스레드는 큐에 넣기만 함)
+    LOG_ASYNC: bool = True
+    LOG_QUEUE_MAX_SIZE: int = 10000  # 큐가 가득 차면 기다리지 않고 버림 (종료 시 건수 보고)
+    # 로거별 샘플링 비율: "app.utils.cache=0.01,app.clients.milvus_client=0.1"
+    # (로거 이름 prefix 매칭, LOG_SAMPLING_MAX_LEVEL 이하 레벨에만 적용)
+    LOG_SAMPLING: str = ""
+    LOG_SAMPLING_MAX_LEVEL: str = "DEBUG"
 
     # =========================================================================
     # Phase 9: AI 환경 모드 설정 (mock / real)
@@ -153,6 +160,28 @@ class Settings(BaseSettings):
     FAQ_INTENT_CONFIDENCE_THRESHOLD: float = 0.7  # 의도 신뢰도 최소 임계값
     FAQ_LOW_RELEVANCE_BLOCK: bool = False  # LOW_RELEVANCE_CONTEXT 차단 여부 (False면 경고만)
 
+    # =========================================================================
+    # 개인화 facts 캐시 설정 (PersonalizationClient)
+    # =========================================================================
+    # (user_id, sub_intent_id, period) 단위 facts 캐시. TTL은 period 유형별로 결정
+    # (this-week < this-month < 3m < this-year). 이수 현황 변경 시 백엔드가
+    # POST /internal/ai/personalization/invalidate로 무효화합니다.
+    PERSONALIZATION_CACHE_ENABLED: bool = True
+    PERSONALIZATION_CACHE_MAXSIZE: int = 4096
+
+    # =========================================================================
+    # 백엔드 컨텍스트 캐시/프리페치 설정 (BackendHandler)
+    # =========================================================================
+    # BACKEND_API / MIXED_BACKEND_RAG 라우트의 포맷된 컨텍스트 캐시
+    # (엔드포인트별 TTL, 개인 현황은 사용자 단위 / 부서 통계는 부서 단위)
+    BACKEND_CONTEXT_CACHE_ENABLED: bool = True
+    BACKEND_CONTEXT_CACHE_MAXSIZE: int = 4096
+
+    # RuleRouter가 이 신뢰도 이상으로 BACKEND_API를 예측하면
+    # PII 마스킹과 병렬로 백엔드 컨텍스트를 미리 조회
+    BACKEND_CONTEXT_PREFETCH_ENABLED: bool = True
+    BACKEND_CONTEXT_PREFETCH_MIN_CONFIDENCE: float = 0.9
+
     # =========================================================================
     # Phase 21: Intent Router 설정
     # =========================================================================
@@ -371,6 +400,23 @@ class Settings(BaseSettings):
     # 문자 기반 토큰 근사 비율 (한국어: 약 1.5자 = 1토큰)
     KB_CHUNK_CHARS_PER_TOKEN: float = 1.5
 
+    # =========================================================================
+    # 씬 단위 스크립트 생성 병렬화 (SceneBasedScriptGenerator)
+    # =========================================================================
+    # 씬 동시 생성 수 (1 = 기존 순차 생성)
+    # 2 이상이면 전체 씬 청크를 먼저 병렬 검색한 뒤, 아웃라인 기반 흐름 정보로 씬을 동시 생성
+    SCRIPT_SCENE_CONCURRENCY: int = 1
+
+    # 병렬 생성 후 씬 도입 문장 연결 다듬기 (LLM 1회 추가 호출)
+    SCRIPT_TRANSITION_SMOOTHING_ENABLED: bool = False
+
+    # 씬 검색 결과 캐시 (소스셋 문서 범위 + 씬 쿼리 단위)
+    SCRIPT_SCENE_SEARCH_CACHE_TTL_SECONDS: float = 600
+    SCRIPT_SCENE_SEARCH_CACHE_MAXSIZE: int = 1024
+
+    # 벡터 검색 결과와 소스셋 청크 BM25 결과를 RRF로 결합 (False면 BM25는 폴백 전용)
+    SCRIPT_SCENE_HYBRID_SEARCH_ENABLED: bool = False
+
     # =========================================================================
     # Phase 39: Answer Guard 설정 (답변 품질 가드레일)
     # =========================================================================
@@ -392,12 +438,36 @@ class Settings(BaseSettings):
     # TTS 문장 최대 길이 (초과 시 분할)
     TTS_MAX_SENTENCE_LENGTH: int = 300
 
+    # 작업(전체 씬) 단위 TTS 동시 합성 수
+    TTS_SYNTHESIS_CONCURRENCY: int = 4
+
+    # 문장 TTS 오디오 디스크 캐시 (provider/voice/language/speed/문장 기준 content-addressed)
+    # 재렌더 시 변경되지 않은 문장은 재합성하지 않음. 용량 초과 시 LRU 삭제
+    TTS_AUDIO_CACHE_ENABLED: bool = True
+    TTS_AUDIO_CACHE_DIR: str = "./data/tts_cache"
+    TTS_AUDIO_CACHE_MAX_MB: int = 512
+
     # Storage Provider 선택 (local, s3, minio)
     STORAGE_PROVIDER: str = "local"
 
     # 렌더링 출력 디렉토리 (임시 파일용)
     RENDER_OUTPUT_DIR: str = "./video_output"
 
+    # 렌더 잡 동시 실행 수 (0 = CPU 수 기준 자동). 초과분은 QUEUED로 대기
+    RENDER_WORKER_CONCURRENCY: int = 0
+
+    # 서버 시작 시 QUEUED/PROCESSING 잡을 다시 큐에 적재
+    RENDER_RESUME_ON_STARTUP: bool = True
+
+    # 렌더 잡 진행률 DB 쓰기 병합 간격 (잡별로 이 간격당 최대 1회 기록)
+    RENDER_PROGRESS_FLUSH_INTERVAL_SEC: float = 1.0
+
+    # 렌더 진행률 WebSocket 전송 (StateStore pub/sub로 모든 워커에 전달)
+    # 소켓별로 잡당 최신 이벤트만 대기 (밀린 중간 이벤트는 병합)
+    RENDER_PROGRESS_MAX_PENDING: int = 16  # 소켓별 대기 잡 수 상한 (초과 시 연결 종료)
+    RENDER_PROGRESS_SEND_TIMEOUT_SEC: float = 5.0  # 1건 전송 제한 시간 (초과 시 연결 종료)
+    RENDER_PROGRESS_LATEST_TTL_SEC: int = 3600  # 늦게 연결한 클라이언트용 잡별 최신 이벤트 보관
+
     # =========================================================================
     # Phase 34: Storage Provider 설정 (영구 저장소)
     # =========================================================================
@@ -448,6 +518,19 @@ class Settings(BaseSettings):
     # True로 설정하면 ETag 없이도 업로드 성공으로 처리 (DEV 환경용)
     STORAGE_ETAG_OPTIONAL: bool = False
 
+    # 업로드 스트리밍 / 멀티파트 설정
+    # 파일은 STORAGE_UPLOAD_CHUNK_KB 단위로 이벤트 루프를 막지 않고 읽어서 전송
+    STORAGE_UPLOAD_CHUNK_KB: int = 1024
+    # 이 크기 이상 파일은 멀티파트 presigned URL로 파트를 병렬 업로드 (0 = 사용 안 함)
+    # 백엔드가 멀티파트 API를 제공하지 않으면(404/405) 단일 PUT으로 폴백
+    STORAGE_MULTIPART_THRESHOLD_MB: int = 64
+    STORAGE_MULTIPART_PART_MB: int = 16  # 파트 크기 (S3 최소 5MB)
+    STORAGE_MULTIPART_CONCURRENCY: int = 4  # 동시 업로드 파트 수
+    BACKEND_STORAGE_MULTIPART_PRESIGN_PATH: str = "/internal/storage/multipart/presign"
+    BACKEND_STORAGE_MULTIPART_COMPLETE_PATH: str = "/internal/storage/multipart/complete"
+    # 파트 업로드/complete 실패 시 호출 (S3 AbortMultipartUpload, 미완료 파트 저장 비용 방지)
+    BACKEND_STORAGE_MULTIPART_ABORT_PATH: str = "/internal/storage/multipart/abort"
+
     # =========================================================================
     # Phase 37: Video Visual Style 설정
     # =========================================================================
@@ -461,6 +544,21 @@ class Settings(BaseSettings):
     VIDEO_FADE_DURATION: float = 0.5  # 씬 전환 fade 시간 (초)
     VIDEO_KENBURNS_ZOOM: float = 1.1  # Ken Burns 줌 비율 (1.0 = 줌 없음)
 
+    # 씬 이미지 생성 프로세스 수 (0 = CPU 수 기준 자동, 1 = 프로세스 풀 미사용)
+    VIDEO_IMAGE_RENDER_WORKERS: int = 0
+
+    # 세그먼트 병렬 인코딩 (씬/구간별 클립을 동시에 인코딩 후 -c copy로 concat)
+    # 실패 시 단일 ffmpeg 프로세스 방식으로 폴백
+    VIDEO_SEGMENTED_ENCODING: bool = True
+    VIDEO_SEGMENT_WORKERS: int = 0  # 동시 ffmpeg 프로세스 수 (0 = CPU 수)
+    VIDEO_SEGMENT_MAX_SEC: float = 10.0  # 클립 최대 길이 (초)
+
+    # 씬 에셋 디스크 캐시 (씬 입력 fingerprint 기준 content-addressed)
+    # 재렌더 시 변경되지 않은 씬의 이미지/세그먼트는 다시 만들지 않음. 용량 초과 시 LRU 삭제
+    RENDER_SCENE_CACHE_ENABLED: bool = True
+    RENDER_SCENE_CACHE_DIR: str = "./data/scene_cache"
+    RENDER_SCENE_CACHE_MAX_MB: int = 2048
+
     # =========================================================================
     # Phase 38: Script Snapshot on Job Start
     # =========================================================================
@@ -486,6 +584,79 @@ class Settings(BaseSettings):
     # 씬 기본 duration (duration_sec <= 0일 때 사용)
     SCENE_DEFAULT_DURATION_SEC: float = 5.0
 
+    # =========================================================================
+    # 공유 상태 저장소 (멀티 워커)
+    # =========================================================================
+    # memory: 프로세스 내부 (단일 워커)
+    # sqlite: 같은 호스트 워커 공유 (STATE_STORE_SQLITE_PATH)
+    # redis: 여러 호스트 공유 (STATE_STORE_REDIS_URL, redis 패키지 필요)
+    STATE_STORE_BACKEND: str = "memory"
+    STATE_STORE_SQLITE_PATH: str = "./data/state_store.db"
+    STATE_STORE_REDIS_URL: Optional[str] = None
+    STATE_STORE_POLL_INTERVAL_MS: int = 50  # sqlite 구독 폴링 주기
+
+    # =========================================================================
+    # 지표 (GET /metrics)
+    # =========================================================================
+    METRICS_ENABLED: bool = True
+    # 워커 스냅샷을 상태 저장소에 발행하는 주기 (memory 백엔드면 발행하지 않음)
+    METRICS_PUBLISH_INTERVAL_SEC: float = 15.0
+    # 발행이 이 시간 이상 끊긴 워커는 종료로 보고 누적 값을 retired 스냅샷으로 옮김
+    METRICS_WORKER_TTL_SEC: float = 60.0
+
+    # =========================================================================
+    # 이벤트 루프 감시 (지연 히스토그램 / 정지 감지)
+    # =========================================================================
+    LOOP_MONITOR_ENABLED: bool = True
+    LOOP_MONITOR_INTERVAL_SEC: float = 0.5  # 지연 측정 주기 (asyncio.sleep 깨어남 지연)
+    LOOP_STALL_THRESHOLD_MS: float = 200.0  # 이 시간 이상 루프가 멈추면 정지로 기록
+    # 정지가 이어지는 동안 이 간격으로 루프 스레드 스택 샘플링 (정지당 최대 LOOP_STALL_MAX_SAMPLES)
+    LOOP_STALL_SAMPLE_INTERVAL_MS: float = 100.0
+    LOOP_STALL_MAX_SAMPLES: int = 20
+    LOOP_STALL_HISTORY_SIZE: int = 50  # 최근 정지 기록 보관 건수
+    LOOP_STALL_LOG_INTERVAL_SEC: float = 10.0  # 정지 경고 로그 최소 간격 (지표/기록은 매번)
+
+    # =========================================================================
+    # 요청 단위 span (GET /internal/ai/traces)
+    # =========================================================================
+    TRACING_ENABLED: bool = True
+    TRACE_BUFFER_SIZE: int = 5000  # 최근 span 보관 개수 (링 버퍼)
+    # 설정 시 끝난 span을 OTLP/JSON으로 {dir}/spans-YYYYMMDD.jsonl에 기록
+    TRACE_EXPORT_DIR: Optional[str] = None
+    TRACE_EXPORT_FLUSH_INTERVAL_SEC: float = 2.0
+
+    # =========================================================================
+    # 기동 warm-up (lifespan, 트래픽 수신 전)
+    # =========================================================================
+    # Milvus 연결/컬렉션 load, 금지질문 룰셋/인덱스 빌드를 동시에 미리 수행
+    # (실패해도 기동은 계속, 해당 초기화는 첫 요청에서 기존대로 수행)
+    WARMUP_ENABLED: bool = True
+    WARMUP_TIMEOUT_SEC: float = 30.0  # 단계별 제한 시간
+
+    # =========================================================================
+    # 텔레메트리 전송 (POST /internal/telemetry/events)
+    # =========================================================================
+    # 배치 크기는 MIN~MAX 범위에서 백엔드 응답 시간(TARGET_LATENCY 기준)에 따라 조절
+    TELEMETRY_BATCH_SIZE: int = 20  # 시작 배치 크기
+    TELEMETRY_BATCH_MIN_SIZE: int = 10
+    TELEMETRY_BATCH_MAX_SIZE: int = 200
+    TELEMETRY_TARGET_LATENCY_MS: float = 500.0
+    TELEMETRY_FLUSH_SEC: float = 2.0
+    TELEMETRY_MAX_QUEUE_SIZE: int = 1000
+    TELEMETRY_MAX_QUEUE_BYTES: int = 4 * 1024 * 1024  # 직렬화된 이벤트 bytes 합계 상한
+    TELEMETRY_GZIP: bool = True  # 배치 본문 gzip 압축 (Content-Encoding: gzip)
+    # 전송 실패 배치/종료 시 남은 이벤트 보관 (빈 값이면 보관하지 않음), 재시작 후 재전송
+    TELEMETRY_SPILL_DIR: Optional[str] = "./data/telemetry_spill"
+    TELEMETRY_SPILL_MAX_BYTES: int = 50 * 1024 * 1024
+
+    # =========================================================================
+    # 교육영상 진행률 (heartbeat)
+    # =========================================================================
+    # 진행률 갱신은 워커 메모리에 반영하고, 세션별로 이 주기마다 한 번만 상태 저장소에 기록
+    # (시작/완료/재시청 같은 상태 전이는 즉시 기록)
+    VIDEO_PROGRESS_FLUSH_INTERVAL_SEC: float = 10.0
+    VIDEO_PROGRESS_CACHE_MAX_SESSIONS: int = 10000  # 워커 메모리에 유지할 세션 수 상한
+
     # =========================================================================
     # Validators: 빈 문자열을 None으로 변환
     # =========================================================================
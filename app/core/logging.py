@@ -11,15 +11,36 @@ contextvars에서 RequestContext를 읽어 모든 LogRecord에 자동 주입합
 - message: 로그 메시지
 - trace_id, user_id, dept_id, conversation_id, turn_id: 요청 컨텍스트
 - exception_type, stacktrace: 예외 정보 (있을 경우)
+
+출력 경로 (LOG_ASYNC=True):
+- 호출 스레드(이벤트 루프)는 필터(샘플링, RequestContext 주입)만 거쳐 LogRecord를 큐에 넣습니다
+- 메시지 %-포맷, JSON 직렬화, stdout 쓰기는 QueueListener의 writer 스레드에서 처리합니다
+- 큐가 가득 차면 기다리지 않고 버립니다 (버린 건수는 종료 시 보고)
 """
 
+import atexit
 import io
 import json
 import logging
+import queue
 import sys
 import traceback
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import TYPE_CHECKING, Any, Callable, Optional, TextIO
+
+# orjson은 선택적 의존성 (없으면 표준 json 사용)
+try:
+    import orjson
+
+    def _dumps(data: dict[str, Any]) -> str:
+        return orjson.dumps(data, default=str).decode("utf-8")
+
+except ImportError:
+    _json_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str)
+
+    def _dumps(data: dict[str, Any]) -> str:
+        return _json_encoder.encode(data)
 
 # Windows 콘솔 UTF-8 인코딩 설정 (한글 깨짐 방지)
 if sys.platform == "win32":
@@ -43,12 +64,21 @@ class RequestContextFilter(logging.Filter):
 
     모든 로그에 trace_id, user_id, dept_id, conversation_id, turn_id가
     자동으로 추가됩니다. 값이 없으면 None으로 설정됩니다.
+
+    비동기 출력에서도 contextvars는 호출 스레드에서만 보이므로
+    이 필터는 큐에 넣기 전(QueueHandler)에 적용합니다.
     """
 
+    _get_request_context: Optional[Callable[[], Any]] = None
+
     def filter(self, record: logging.LogRecord) -> bool:
         """LogRecord에 RequestContext 필드를 주입합니다."""
-        # 지연 import (순환 참조 방지)
-        from app.telemetry.context import get_request_context
+        get_request_context = self._get_request_context
+        if get_request_context is None:
+            # 지연 import (순환 참조 방지), 첫 레코드에서 한 번만
+            from app.telemetry.context import get_request_context
+
+            self._get_request_context = get_request_context
 
         ctx = get_request_context()
 
@@ -69,6 +99,78 @@ class RequestContextFilter(logging.Filter):
         return True  # 항상 로그 통과
 
 
+# =============================================================================
+# Sampling Filter - 대량 debug 이벤트 로거별 샘플링
+# =============================================================================
+
+def parse_sampling_rates(spec: str) -> dict[str, float]:
+    """
+    LOG_SAMPLING 문자열을 {로거 prefix: 비율}로 변환합니다.
+
+    Args:
+        spec: "app.utils.cache=0.01,app.clients.milvus_client=0.1"
+
+    Returns:
+        dict[str, float]: 0~1로 보정한 비율 (형식이 잘못된 항목은 무시)
+    """
+    rates: dict[str, float] = {}
+    for item in spec.split(","):
+        name, sep, value = item.partition("=")
+        name = name.strip()
+        if not sep or not name:
+            continue
+        try:
+            rate = float(value)
+        except ValueError:
+            continue
+        rates[name] = min(max(rate, 0.0), 1.0)
+    return rates
+
+
+class LogSamplingFilter(logging.Filter):
+    """
+    로거 이름 prefix별로 일정 비율의 레코드만 통과시키는 필터.
+
+    - max_level 이하 레벨(기본 DEBUG)에만 적용, WARNING 이상은 항상 통과
+    - 가장 긴 prefix 규칙 우선 ("app.utils.cache"가 "app.utils"보다 우선)
+    - 비율 r이면 로거별 1/r건마다 1건 통과 (난수 대신 카운터, 호출 비용 최소)
+    """
+
+    def __init__(self, rates: dict[str, float], max_level: int = logging.DEBUG) -> None:
+        super().__init__()
+        self._max_level = max_level
+        # 긴 prefix 우선 매칭
+        self._rules = sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+        self._every_by_logger: dict[str, int] = {}
+        self._counters: dict[str, int] = {}
+
+    def _every(self, logger_name: str) -> int:
+        """로거별 통과 간격 (1=전부, 0=전부 버림)."""
+        every = self._every_by_logger.get(logger_name)
+        if every is None:
+            every = 1
+            for prefix, rate in self._rules:
+                if logger_name == prefix or logger_name.startswith(prefix + "."):
+                    every = 0 if rate <= 0 else max(1, round(1 / rate))
+                    break
+            self._every_by_logger[logger_name] = every
+        return every
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """샘플링 대상이면 간격에 맞는 레코드만 통과시킵니다."""
+        if record.levelno > self._max_level:
+            return True
+        every = self._every(record.name)
+        if every == 1:
+            return True
+        if every == 0:
+            return False
+        # 여러 스레드에서 경합해도 비율이 약간 흔들릴 뿐이라 락을 두지 않음
+        seen = self._counters.get(record.name, 0)
+        self._counters[record.name] = seen + 1
+        return seen % every == 0
+
+
 # =============================================================================
 # JSON Formatter - ELK 친화적 1라인 JSON 출력
 # =============================================================================
@@ -84,15 +186,28 @@ class JsonFormatter(logging.Formatter):
     {"@timestamp":"...","level":"ERROR","message":"Error occurred","exception_type":"ValueError","stacktrace":"Traceback..."}
     """
 
+    def __init__(self) -> None:
+        super().__init__()
+        # (epoch 초, "YYYY-MM-DDTHH:MM:SS.") - 같은 초의 레코드는 strftime 생략
+        self._second_prefix: tuple[int, str] = (-1, "")
+
+    def _format_timestamp(self, created: float) -> str:
+        """record.created를 ISO8601(밀리초, UTC) 문자열로 변환합니다."""
+        second = int(created)
+        cached_second, prefix = self._second_prefix
+        if second != cached_second:
+            prefix = datetime.fromtimestamp(second, tz=timezone.utc).strftime(
+                "%Y-%m-%dT%H:%M:%S."
+            )
+            self._second_prefix = (second, prefix)
+        return f"{prefix}{int((created - second) * 1000):03d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
         """LogRecord를 JSON 1라인으로 포맷팅합니다."""
-        # @timestamp: record.created 기반 (버퍼링/지연 출력에도 실제 이벤트 시간 유지)
-        event_time = datetime.fromtimestamp(record.created, tz=timezone.utc)
-        timestamp = event_time.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
-
         # 기본 필드
+        # @timestamp: record.created 기반 (버퍼링/지연 출력에도 실제 이벤트 시간 유지)
         log_data: dict[str, Any] = {
-            "@timestamp": timestamp,
+            "@timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -116,8 +231,8 @@ class JsonFormatter(logging.Formatter):
                     traceback.format_exception(exc_type, exc_value, exc_tb)
                 ).replace("\n", "\\n")
 
-        # JSON 1라인 출력 (ensure_ascii=False로 한글 유지)
-        return json.dumps(log_data, ensure_ascii=False, separators=(",", ":"))
+        # JSON 1라인 출력 (한글은 이스케이프 없이 UTF-8 유지)
+        return _dumps(log_data)
 
 
 # =============================================================================
@@ -147,34 +262,133 @@ class TextFormatter(logging.Formatter):
         return super().format(record)
 
 
+# =============================================================================
+# 비동기 출력 - QueueHandler / QueueListener
+# =============================================================================
+
+# 호출 스레드에서 포맷을 미뤄도 안전한 인자 타입 (나중에 값이 바뀌지 않음)
+_IMMUTABLE_ARG_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    LogRecord를 큐에 넣기만 하는 핸들러 (writer 스레드가 포맷/출력).
+
+    - 인자가 불변 타입이면 %-포맷을 writer 스레드로 미룸 (lazy formatting)
+    - 가변 객체 인자는 나중에 바뀔 수 있으므로 호출 시점에 메시지를 확정
+    - 큐가 가득 차면 기다리지 않고 버리고 dropped_count만 증가
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]") -> None:
+        super().__init__(log_queue)
+        self.dropped_count = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """큐에 넣기 전 레코드 준비 (포맷은 하지 않음)."""
+        args = record.args
+        if args and not (
+            isinstance(args, tuple)
+            and all(type(arg) in _IMMUTABLE_ARG_TYPES for arg in args)
+        ):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """큐에 넣습니다. 가득 찼으면 버립니다."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_count += 1
+
+
+_log_listener: Optional[QueueListener] = None
+_log_queue_handler: Optional[NonBlockingQueueHandler] = None
+_atexit_registered = False
+
+
+def get_log_queue_depth() -> int:
+    """writer 스레드가 아직 출력하지 않은 로그 건수 (동기 출력이면 0)."""
+    handler = _log_queue_handler
+    return handler.queue.qsize() if handler is not None else 0
+
+
+def shutdown_logging() -> None:
+    """
+    writer 스레드를 멈추고 큐에 남은 로그를 모두 출력합니다.
+
+    이후 로그는 호출 스레드에서 바로 출력합니다 (종료 중 로그 유실 방지).
+    """
+    global _log_listener, _log_queue_handler
+
+    listener, queue_handler = _log_listener, _log_queue_handler
+    if listener is None or queue_handler is None:
+        return
+    _log_listener = None
+    _log_queue_handler = None
+
+    listener.stop()  # 남은 레코드를 모두 처리한 뒤 반환
+
+    root_logger = logging.getLogger()
+    root_logger.removeHandler(queue_handler)
+    for handler in listener.handlers:
+        for log_filter in queue_handler.filters:
+            handler.addFilter(log_filter)
+        root_logger.addHandler(handler)
+
+    if queue_handler.dropped_count:
+        logging.getLogger(__name__).warning(
+            "Log queue overflow: dropped=%d", queue_handler.dropped_count
+        )
+
+
 # =============================================================================
 # 로깅 설정 함수
 # =============================================================================
 
-def setup_logging(settings: "Settings") -> None:
+def setup_logging(settings: "Settings", stream: Optional[TextIO] = None) -> None:
     """
     애플리케이션 로깅을 설정합니다.
 
     Args:
         settings: 애플리케이션 설정 인스턴스
+        stream: 출력 스트림 (기본: stdout)
 
     설정 내용:
         - 루트 로거에 RequestContextFilter 추가 (trace_id 등 자동 주입)
+        - LOG_SAMPLING이 있으면 로거별 샘플링 필터 추가
         - JSON 포맷터 적용 (ELK 친화적)
+        - LOG_ASYNC면 QueueHandler + writer 스레드로 출력
         - uvicorn 로거들도 동일한 포맷 적용
     """
+    global _log_listener, _log_queue_handler, _atexit_registered
+
+    # 재설정 시 이전 writer 스레드 정리
+    shutdown_logging()
+
     log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
 
     # 포맷터 선택: production → JSON, 그 외 → Text
     use_json = getattr(settings, "LOG_FORMAT", "json").lower() == "json"
     formatter: logging.Formatter = JsonFormatter() if use_json else TextFormatter()
 
-    # RequestContext 필터 생성
-    context_filter = RequestContextFilter()
+    # 필터: 샘플링(버릴 레코드는 컨텍스트 주입 전에) → RequestContext
+    log_filters: list[logging.Filter] = []
+    sampling_rates = parse_sampling_rates(getattr(settings, "LOG_SAMPLING", ""))
+    if sampling_rates:
+        sampling_max_level = getattr(
+            logging,
+            getattr(settings, "LOG_SAMPLING_MAX_LEVEL", "DEBUG").upper(),
+            logging.DEBUG,
+        )
+        log_filters.append(LogSamplingFilter(sampling_rates, max_level=sampling_max_level))
+    log_filters.append(RequestContextFilter())
 
     # 콘솔 핸들러 설정 (stdout, UTF-8 인코딩)
     # Windows에서 한글이 깨지지 않도록 UTF-8 스트림 사용
-    if sys.platform == "win32":
+    if stream is not None:
+        console_handler = logging.StreamHandler(stream)
+    elif sys.platform == "win32":
         # UTF-8 인코딩된 TextIOWrapper 사용
         stream = io.TextIOWrapper(
             sys.stdout.buffer,
@@ -188,7 +402,28 @@ def setup_logging(settings: "Settings") -> None:
 
     console_handler.setFormatter(formatter)
     console_handler.setLevel(log_level)
-    console_handler.addFilter(context_filter)
+
+    root_handler: logging.Handler
+    if getattr(settings, "LOG_ASYNC", True):
+        queue_handler = NonBlockingQueueHandler(
+            queue.Queue(maxsize=getattr(settings, "LOG_QUEUE_MAX_SIZE", 10000))
+        )
+        queue_handler.setLevel(log_level)
+        for log_filter in log_filters:
+            queue_handler.addFilter(log_filter)
+        listener = QueueListener(queue_handler.queue, console_handler, respect_handler_level=True)
+        listener.start()
+        _log_listener, _log_queue_handler = listener, queue_handler
+        root_handler = queue_handler
+
+        # lifespan을 거치지 않고 종료해도 큐에 남은 로그 출력
+        if not _atexit_registered:
+            atexit.register(shutdown_logging)
+            _atexit_registered = True
+    else:
+        for log_filter in log_filters:
+            console_handler.addFilter(log_filter)
+        root_handler = console_handler
 
     # 루트 로거 설정
     root_logger = logging.getLogger()
@@ -199,7 +434,7 @@ def setup_logging(settings: "Settings") -> None:
         root_logger.removeHandler(handler)
 
     # 새 핸들러 추가
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(root_handler)
 
     # uvicorn 로거 통일 설정
     # uvicorn 자체 핸들러 제거 후 루트 로거로 전파
@@ -218,10 +453,19 @@ def setup_logging(settings: "Settings") -> None:
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
 
+    # 로그 큐 길이 지표 (GET /metrics의 ctrlf_queue_depth{queue="log"})
+    from app.core.metrics import get_metrics
+
+    get_metrics().register_gauge("log", get_log_queue_depth)
+
     # 설정 완료 로그
     app_logger.info(
-        f"Logging configured: level={settings.LOG_LEVEL}, "
-        f"format={'json' if use_json else 'text'}, app={settings.APP_NAME}"
+        "Logging configured: level=%s, format=%s, async=%s, sampling=%s, app=%s",
+        settings.LOG_LEVEL,
+        "json" if use_json else "text",
+        getattr(settings, "LOG_ASYNC", True),
+        sampling_rates or None,
+        settings.APP_NAME,
     )
 
 
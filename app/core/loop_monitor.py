@@ -0,0 +1,343 @@
+"""
+이벤트 루프 감시 모듈 (Event Loop Monitor)
+
+이벤트 루프를 막는 동기 코드(동기 임베딩, SQLite 호출, 이미지 렌더링, 큰 JSON 직렬화 등)를
+운영 중에 찾기 위한 가벼운 감시기입니다. asyncio debug 모드처럼 모든 콜백을 재지 않고,
+아래 두 가지만 합니다.
+
+1. 지연 측정 (루프 안 태스크)
+   - LOOP_MONITOR_INTERVAL_SEC마다 asyncio.sleep이 늦게 깨어난 시간을 기록
+   - 지표: event_loop_lag 히스토그램 (GET /metrics의 ctrlf_event_loop_lag_seconds)
+
+2. 정지 감지 (별도 감시 스레드)
+   - 지연 측정 태스크가 LOOP_STALL_THRESHOLD_MS 이상 돌아오지 않으면 루프가 멈춘 것으로 판단
+   - 멈춘 동안 루프 스레드의 스택을 주기적으로 샘플링 (sys._current_frames)
+   - 실행 중인 태스크의 RequestContext로 HTTP 라우트/trace_id를 찾아 기록
+   - 지표: ctrlf_event_loop_stalls_total{route}, 최근 정지 기록은 get_recent_stalls()
+
+태스크별 RequestContext:
+- 태스크 생성 시(task factory) 태스크가 실행될 contextvars.Context를 기억해 두고,
+  감시 스레드는 정지 시점의 current_task로 그 Context에서 RequestContext를 읽습니다
+
+사용 방법:
+    monitor = get_loop_monitor()
+    await monitor.start()   # lifespan 시작
+    ...
+    monitor.stop()          # lifespan 종료
+"""
+
+import asyncio
+import contextvars
+import re
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from app.core.logging import get_logger
+from app.core.metrics import LOOP_LAG_BUCKETS_MS, get_metrics
+
+logger = get_logger(__name__)
+
+# 지연 히스토그램 이름 (metrics.RUNTIME_HISTOGRAM_FAMILIES)
+LOOP_LAG_METRIC = "event_loop_lag"
+
+# 스택 샘플에 남길 최대 프레임 수 (가장 안쪽 프레임부터)
+STACK_DEPTH = 12
+
+# 경로 세그먼트 중 ID로 보이는 값 (라벨 카디널리티 제한)
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{16,}|(?=[\w-]*\d)[\w-]{12,})$")
+
+
+def stall_route_label(route: Optional[str]) -> str:
+    """정지 카운터 라벨용 라우트 ("GET /api/videos/123" → "GET /api/videos/{id}")."""
+    if not route:
+        return "unknown"
+    method, _, path = route.partition(" ")
+    segments = ["{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")]
+    return f"{method} {'/'.join(segments)}"
+
+
+@dataclass
+class LoopStall:
+    """이벤트 루프 정지 1건.
+
+    Attributes:
+        started_at: 정지 시작 시각 (epoch 초, 근사)
+        duration_ms: 정지 시간
+        route: 정지 시점에 실행 중이던 태스크의 HTTP 요청 (없으면 None)
+        trace_id: 그 요청의 trace_id
+        stacks: 샘플링한 루프 스레드 스택 [(프레임 목록, 샘플 수)] (많이 잡힌 순)
+    """
+
+    started_at: float
+    duration_ms: float
+    route: Optional[str] = None
+    trace_id: Optional[str] = None
+    stacks: List[Tuple[Tuple[str, ...], int]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration_ms, 1),
+            "route": self.route,
+            "trace_id": self.trace_id,
+            "stacks": [{"count": count, "frames": list(frames)} for frames, count in self.stacks],
+        }
+
+
+class _StallInProgress:
+    """감시 스레드가 관찰 중인 정지 (끝나면 LoopStall로 확정)."""
+
+    __slots__ = ("expected_wake", "started_at", "route", "trace_id", "samples", "last_sample")
+
+    def __init__(self, expected_wake: float, route: Optional[str], trace_id: Optional[str]):
+        self.expected_wake = expected_wake
+        self.started_at = time.time() - (time.monotonic() - expected_wake)
+        self.route = route
+        self.trace_id = trace_id
+        self.samples: Counter = Counter()
+        self.last_sample = 0.0
+
+
+class LoopMonitor:
+    """이벤트 루프 지연 측정 + 정지 감지.
+
+    Args:
+        interval_sec: 지연 측정 주기 (None이면 LOOP_MONITOR_INTERVAL_SEC)
+        stall_threshold_ms: 정지 판정 기준 (None이면 LOOP_STALL_THRESHOLD_MS)
+        sample_interval_ms: 정지 중 스택 샘플링 간격 (None이면 LOOP_STALL_SAMPLE_INTERVAL_MS)
+        max_samples: 정지당 최대 스택 샘플 수 (None이면 LOOP_STALL_MAX_SAMPLES)
+        history_size: 최근 정지 기록 보관 건수 (None이면 LOOP_STALL_HISTORY_SIZE)
+    """
+
+    def __init__(
+        self,
+        interval_sec: Optional[float] = None,
+        stall_threshold_ms: Optional[float] = None,
+        sample_interval_ms: Optional[float] = None,
+        max_samples: Optional[int] = None,
+        history_size: Optional[int] = None,
+    ) -> None:
+        from app.core.config import get_settings
+
+        settings = get_settings()
+        self._interval_sec = (
+            interval_sec if interval_sec is not None else settings.LOOP_MONITOR_INTERVAL_SEC
+        )
+        self._stall_threshold_sec = (
+            stall_threshold_ms if stall_threshold_ms is not None else settings.LOOP_STALL_THRESHOLD_MS
+        ) / 1000
+        self._sample_interval_sec = (
+            sample_interval_ms
+            if sample_interval_ms is not None
+            else settings.LOOP_STALL_SAMPLE_INTERVAL_MS
+        ) / 1000
+        self._max_samples = (
+            max_samples if max_samples is not None else settings.LOOP_STALL_MAX_SAMPLES
+        )
+        self._log_interval_sec = settings.LOOP_STALL_LOG_INTERVAL_SEC
+        self._stalls: Deque[LoopStall] = deque(
+            maxlen=history_size if history_size is not None else settings.LOOP_STALL_HISTORY_SIZE
+        )
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._previous_factory: Optional[Callable[..., Any]] = None
+        self._task_contexts: "weakref.WeakKeyDictionary[asyncio.Task, contextvars.Context]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._sampler_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._beat = time.monotonic()  # 지연 측정 태스크가 마지막으로 실행된 시각
+        self._last_log = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._sampler_task is not None
+
+    # -------------------------------------------------------------------------
+    # 시작/종료
+    # -------------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """현재 이벤트 루프 감시를 시작합니다 (이미 실행 중이면 무시)."""
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._previous_factory = loop.get_task_factory()
+        loop.set_task_factory(self._task_factory)
+
+        self._stop_event.clear()
+        self._beat = time.monotonic()
+        self._sampler_task = loop.create_task(self._sample_lag(), name="loop-lag-sampler")
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info(
+            f"Loop monitor started: interval={self._interval_sec}s, "
+            f"stall_threshold={self._stall_threshold_sec * 1000:.0f}ms"
+        )
+
+    def stop(self) -> None:
+        """감시를 멈추고 task factory를 원래대로 돌립니다."""
+        if not self.running:
+            return
+        self._stop_event.set()
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            self._sampler_task.cancel()
+            if loop.get_task_factory() == self._task_factory:
+                loop.set_task_factory(self._previous_factory)
+        self._sampler_task = None
+        if self._watchdog is not None and self._watchdog is not threading.current_thread():
+            self._watchdog.join(timeout=1.0)
+        self._watchdog = None
+
+    # -------------------------------------------------------------------------
+    # 루프 안: task factory / 지연 측정
+    # -------------------------------------------------------------------------
+
+    def _task_factory(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        coro: Any,
+        context: Optional[contextvars.Context] = None,
+    ) -> asyncio.Task:
+        """태스크가 실행될 Context를 기억해 두는 task factory (기존 factory는 그대로 호출)."""
+        if context is None:
+            context = contextvars.copy_context()
+        if self._previous_factory is not None:
+            task = self._previous_factory(loop, coro, context=context)
+        else:
+            task = asyncio.Task(coro, loop=loop, context=context)
+        self._task_contexts[task] = context
+        return task
+
+    async def _sample_lag(self) -> None:
+        interval = self._interval_sec
+        while True:
+            scheduled = time.monotonic()
+            self._beat = scheduled
+            await asyncio.sleep(interval)
+            lag_ms = (time.monotonic() - scheduled - interval) * 1000
+            get_metrics().histogram(LOOP_LAG_METRIC, LOOP_LAG_BUCKETS_MS).observe(max(lag_ms, 0.0))
+
+    # -------------------------------------------------------------------------
+    # 감시 스레드: 정지 감지 / 스택 샘플링
+    # -------------------------------------------------------------------------
+
+    def _watch(self) -> None:
+        check_sec = max(min(self._stall_threshold_sec, self._sample_interval_sec) / 2, 0.005)
+        stall: Optional[_StallInProgress] = None
+        while not self._stop_event.wait(check_sec):
+            expected_wake = self._beat + self._interval_sec
+            now = time.monotonic()
+
+            if stall is not None and expected_wake != stall.expected_wake:
+                # 지연 측정 태스크가 다시 실행됨 → 정지 끝
+                self._finish_stall(stall, resumed_at=self._beat)
+                stall = None
+
+            if now - expected_wake < self._stall_threshold_sec:
+                continue
+
+            if stall is None:
+                route, trace_id = self._current_request()
+                stall = _StallInProgress(expected_wake, route, trace_id)
+            if (
+                len(stall.samples) < self._max_samples
+                and now - stall.last_sample >= self._sample_interval_sec
+            ):
+                frames = self._sample_stack()
+                if frames:
+                    stall.samples[frames] += 1
+                stall.last_sample = now
+
+    def _current_request(self) -> Tuple[Optional[str], Optional[str]]:
+        """루프에서 실행 중인 태스크의 RequestContext (route, trace_id)."""
+        from app.telemetry.context import get_request_context_in
+
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            return None, None
+        context = self._task_contexts.get(task) if task is not None else None
+        if context is None:
+            return None, None
+        ctx = get_request_context_in(context)
+        if ctx is None:
+            return None, None
+        return ctx.route, ctx.trace_id
+
+    def _sample_stack(self) -> Tuple[str, ...]:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return ()
+        summary = traceback.extract_stack(frame, limit=STACK_DEPTH)
+        return tuple(f"{entry.filename}:{entry.lineno} in {entry.name}" for entry in summary)
+
+    def _finish_stall(self, stall: _StallInProgress, resumed_at: float) -> None:
+        duration_ms = (resumed_at - stall.expected_wake) * 1000
+        record = LoopStall(
+            started_at=stall.started_at,
+            duration_ms=duration_ms,
+            route=stall.route,
+            trace_id=stall.trace_id,
+            stacks=stall.samples.most_common(),
+        )
+        self._stalls.append(record)
+        get_metrics().increment_loop_stall(stall_route_label(stall.route))
+
+        now = time.monotonic()
+        if now - self._last_log >= self._log_interval_sec:
+            self._last_log = now
+            top = record.stacks[0][0][-3:] if record.stacks else ()
+            logger.warning(
+                "Event loop stalled: duration_ms=%.0f, route=%s, trace_id=%s, stack=%s",
+                duration_ms,
+                stall.route,
+                stall.trace_id,
+                " <- ".join(reversed(top)),
+            )
+
+    # -------------------------------------------------------------------------
+    # 조회
+    # -------------------------------------------------------------------------
+
+    def get_recent_stalls(self) -> List[Dict[str, Any]]:
+        """최근 정지 기록 (오래된 순)."""
+        return [stall.to_dict() for stall in list(self._stalls)]
+
+
+# =============================================================================
+# 싱글톤
+# =============================================================================
+
+_loop_monitor: Optional[LoopMonitor] = None
+_loop_monitor_lock = threading.Lock()
+
+
+def get_loop_monitor() -> LoopMonitor:
+    """이벤트 루프 감시기 싱글톤 반환."""
+    global _loop_monitor
+    if _loop_monitor is None:
+        with _loop_monitor_lock:
+            if _loop_monitor is None:
+                _loop_monitor = LoopMonitor()
+    return _loop_monitor
+
+
+def clear_loop_monitor() -> None:
+    """감시기 싱글톤 정리 (종료/테스트용)."""
+    global _loop_monitor
+    with _loop_monitor_lock:
+        if _loop_monitor is not None:
+            _loop_monitor.stop()
+        _loop_monitor = None
@@ -3,10 +3,16 @@
 
 Phase 12: AI Gateway 안정성/품질 Hardening
 - 에러/타임아웃/재시도 횟수 카운터
-- 서비스별 latency 통계
+- 서비스별 latency 히스토그램 (p50/p95/p99)
+- 큐 길이/캐시 적중률 게이지
 - 로그 패턴 정의
 
-향후 Prometheus/Grafana 연동 시 이 모듈을 확장합니다.
+Prometheus 연동:
+- latency는 고정 버킷 히스토그램으로 기록합니다 (스레드별 shard, 기록 시 락 없음)
+- 각 워커는 스냅샷을 공유 상태 저장소에 발행하고(publish_worker_metrics),
+  GET /metrics는 모든 워커의 스냅샷을 합산해 text exposition 형식으로 반환합니다
+- 종료/발행이 끊긴 워커의 누적 값(카운터/히스토그램/캐시 통계)은 retired 스냅샷에
+  더해 두므로, 워커가 바뀌어도 _total/_count 값이 줄어들지 않습니다
 
 사용 방법:
     from app.core.metrics import metrics
@@ -16,15 +22,22 @@ Phase 12: AI Gateway 안정성/품질 Hardening
 
     # latency 기록
     metrics.record_latency("llm", 1500)
+    with metrics.timer("milvus_search"):
+        ...
 
     # 통계 조회
     stats = metrics.get_stats()
 """
 
+import asyncio
+import os
 import threading
+import time
+import uuid
+from bisect import bisect_left
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from app.core.logging import get_logger
 
@@ -43,6 +56,7 @@ LOG_TAG_LLM_ERROR = "LLM_ERROR"
 LOG_TAG_LLM_RETRY = "LLM_RETRY"
 LOG_TAG_BACKEND_TIMEOUT = "BACKEND_TIMEOUT"
 LOG_TAG_BACKEND_ERROR = "BACKEND_ERROR"
+LOG_TAG_TELEMETRY_DROPPED = "TELEMETRY_DROPPED"  # 큐 포화/전송 실패로 버린 텔레메트리 이벤트
 
 # Fallback 태그
 LOG_TAG_RAG_FALLBACK = "RAG_FALLBACK"
@@ -50,30 +64,190 @@ LOG_TAG_BACKEND_FALLBACK = "BACKEND_FALLBACK"
 LOG_TAG_LLM_FALLBACK = "LLM_FALLBACK"
 
 
+# =============================================================================
+# Histogram
+# =============================================================================
+
+# latency 버킷 상한 (ms). 렌더 단계(ffmpeg)까지 포함하도록 5분까지 둡니다.
+DEFAULT_LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000, 300000,
+)
+
+# 이벤트 루프 지연은 ms 이하 구간이 중요해 더 촘촘하게
+LOOP_LAG_BUCKETS_MS: Tuple[float, ...] = (
+    1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000,
+)
+
+
+class _HistogramShard:
+    """스레드 하나가 기록하는 버킷 카운트."""
+
+    __slots__ = ("counts", "sum", "min", "max")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+
 @dataclass
-class LatencyStats:
-    """Latency 통계."""
+class HistogramSnapshot:
+    """히스토그램 스냅샷 (워커 간 합산/분위수 계산용).
 
-    count: int = 0
-    total_ms: int = 0
-    min_ms: Optional[int] = None
-    max_ms: Optional[int] = None
+    Attributes:
+        buckets: 버킷 상한 목록 (마지막 +Inf 버킷은 제외)
+        counts: 버킷별 관측 수 (누적 아님, 길이 = len(buckets) + 1)
+        sum: 관측값 합계
+        max: 관측값 최댓값
+        min: 관측값 최솟값 (관측이 없으면 None)
+    """
+
+    buckets: Tuple[float, ...]
+    counts: List[int]
+    sum: float = 0.0
+    max: float = 0.0
+    min: Optional[float] = None
 
     @property
-    def avg_ms(self) -> float:
-        """평균 latency (ms)."""
-        if self.count == 0:
-            return 0.0
-        return self.total_ms / self.count
-
-    def record(self, latency_ms: int) -> None:
-        """latency를 기록합니다."""
-        self.count += 1
-        self.total_ms += latency_ms
-        if self.min_ms is None or latency_ms < self.min_ms:
-            self.min_ms = latency_ms
-        if self.max_ms is None or latency_ms > self.max_ms:
-            self.max_ms = latency_ms
+    def count(self) -> int:
+        """관측 수."""
+        return sum(self.counts)
+
+    def merge(self, other: "HistogramSnapshot") -> "HistogramSnapshot":
+        """같은 버킷의 스냅샷을 합산합니다."""
+        if tuple(other.buckets) != tuple(self.buckets):
+            raise ValueError("Histogram buckets differ")
+        return HistogramSnapshot(
+            buckets=self.buckets,
+            counts=[a + b for a, b in zip(self.counts, other.counts)],
+            sum=self.sum + other.sum,
+            max=max(self.max, other.max),
+            min=min((v for v in (self.min, other.min) if v is not None), default=None),
+        )
+
+    def quantile(self, q: float) -> Optional[float]:
+        """분위수 추정 (버킷 안에서 선형 보간, Prometheus histogram_quantile 방식).
+
+        +Inf 버킷에 걸리면 관측 최댓값을 반환합니다.
+        """
+        total = self.count
+        if total == 0:
+            return None
+        rank = q * total
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count == 0:
+                continue
+            if cumulative + bucket_count >= rank:
+                if index == len(self.buckets):
+                    return self.max
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = min(self.buckets[index], self.max)
+                if upper <= lower:
+                    return upper
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """상태 저장소 기록용 dict."""
+        return {
+            "buckets": list(self.buckets),
+            "counts": self.counts,
+            "sum": self.sum,
+            "max": self.max,
+            "min": self.min,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HistogramSnapshot":
+        """dict → HistogramSnapshot."""
+        return cls(
+            buckets=tuple(data["buckets"]),
+            counts=list(data["counts"]),
+            sum=data["sum"],
+            max=data["max"],
+            min=data.get("min"),
+        )
+
+
+class Histogram:
+    """고정 버킷 히스토그램.
+
+    스레드마다 별도 shard에 기록하므로 observe()는 락을 잡지 않습니다
+    (락은 스레드가 처음 기록할 때 shard 등록에만 사용).
+    snapshot()이 모든 shard를 합산합니다.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS) -> None:
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self._local = threading.local()
+        self._shards: List[_HistogramShard] = []
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> _HistogramShard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _HistogramShard(len(self.buckets) + 1)
+            with self._shards_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def observe(self, value: float) -> None:
+        """관측값 기록."""
+        shard = self._shard()
+        shard.counts[bisect_left(self.buckets, value)] += 1
+        shard.sum += value
+        if value > shard.max:
+            shard.max = value
+        if value < shard.min:
+            shard.min = value
+
+    def snapshot(self) -> HistogramSnapshot:
+        """모든 shard를 합산한 스냅샷."""
+        with self._shards_lock:
+            shards = list(self._shards)
+        counts = [0] * (len(self.buckets) + 1)
+        total = 0.0
+        peak = 0.0
+        low = float("inf")
+        for shard in shards:
+            for index, bucket_count in enumerate(shard.counts):
+                counts[index] += bucket_count
+            total += shard.sum
+            peak = max(peak, shard.max)
+            low = min(low, shard.min)
+        return HistogramSnapshot(
+            buckets=self.buckets,
+            counts=counts,
+            sum=total,
+            max=peak,
+            min=None if low == float("inf") else low,
+        )
+
+
+class _LatencyTimer:
+    """with 블록 실행 시간을 히스토그램에 ms로 기록 (예외로 끝나도 기록)."""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: Histogram) -> None:
+        self._histogram = histogram
+        self._start = 0.0
+
+    def __enter__(self) -> "_LatencyTimer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._histogram.observe((time.perf_counter() - self._start) * 1000)
+
+
+# =============================================================================
+# Metrics Collector
+# =============================================================================
 
 
 @dataclass
@@ -82,20 +256,23 @@ class MetricsCollector:
     간단한 in-memory 지표 수집기.
 
     스레드 안전성을 보장하며, 애플리케이션 전역에서 사용됩니다.
+    latency 히스토그램 기록은 락 없이 동작합니다.
 
     Attributes:
         error_counts: 에러 타입별 카운터
         retry_counts: 서비스별 재시도 카운터
-        latency_stats: 서비스별 latency 통계
+        histograms: 서비스별 latency 히스토그램 (ms)
         request_counts: 라우트별 요청 카운터
+        loop_stall_counts: 이벤트 루프 정지 시 처리 중이던 HTTP 라우트별 카운터
     """
 
     error_counts: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
     retry_counts: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
-    latency_stats: Dict[str, LatencyStats] = field(
-        default_factory=lambda: defaultdict(LatencyStats)
-    )
+    histograms: Dict[str, Histogram] = field(default_factory=dict)
     request_counts: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    loop_stall_counts: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    _gauges: Dict[str, Callable[[], float]] = field(default_factory=dict)
+    _caches: Dict[str, Callable[[], Dict[str, Any]]] = field(default_factory=dict)
     _lock: threading.Lock = field(default_factory=threading.Lock)
 
     def increment_error(self, error_tag: str) -> None:
@@ -109,6 +286,20 @@ class MetricsCollector:
             self.error_counts[error_tag] += 1
         logger.info(f"[METRIC] ERROR {error_tag} count={self.error_counts[error_tag]}")
 
+    def add_error_count(self, error_tag: str, n: int = 1) -> None:
+        """
+        에러 카운터를 n만큼 증가시킵니다 (로그 없음).
+
+        드롭 카운트처럼 부하가 높을 때 연달아 발생하는 에러에 사용합니다
+        (호출마다 로그를 남기면 로그 자체가 부하가 됨).
+
+        Args:
+            error_tag: 에러 태그 (예: TELEMETRY_DROPPED)
+            n: 증가량
+        """
+        with self._lock:
+            self.error_counts[error_tag] += n
+
     def increment_retry(self, service: str) -> None:
         """
         재시도 카운터를 증가시킵니다.
@@ -120,7 +311,17 @@ class MetricsCollector:
             self.retry_counts[service] += 1
         logger.info(f"[METRIC] RETRY {service} count={self.retry_counts[service]}")
 
-    def record_latency(self, service: str, latency_ms: int) -> None:
+    def histogram(
+        self, service: str, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS
+    ) -> Histogram:
+        """서비스 히스토그램 반환 (없으면 buckets로 생성)."""
+        histogram = self.histograms.get(service)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(service, Histogram(buckets))
+        return histogram
+
+    def record_latency(self, service: str, latency_ms: float) -> None:
         """
         서비스 latency를 기록합니다.
 
@@ -128,8 +329,16 @@ class MetricsCollector:
             service: 서비스 이름 (예: llm, ragflow, backend)
             latency_ms: latency (밀리초)
         """
-        with self._lock:
-            self.latency_stats[service].record(latency_ms)
+        self.histogram(service).observe(latency_ms)
+
+    def timer(self, service: str) -> _LatencyTimer:
+        """with 블록 실행 시간을 서비스 latency로 기록합니다.
+
+        Usage:
+            with metrics.timer("pii"):
+                response = await client.post(url, json=payload)
+        """
+        return _LatencyTimer(self.histogram(service))
 
     def increment_request(self, route: str) -> None:
         """
@@ -141,36 +350,114 @@ class MetricsCollector:
         with self._lock:
             self.request_counts[route] += 1
 
+    def increment_loop_stall(self, route: str) -> None:
+        """
+        이벤트 루프 정지 카운터를 증가시킵니다.
+
+        Args:
+            route: 정지 시점에 처리 중이던 HTTP 라우트 (예: "POST /ai/chat/messages")
+        """
+        with self._lock:
+            self.loop_stall_counts[route] += 1
+
+    def register_gauge(self, name: str, read: Callable[[], float]) -> None:
+        """큐 길이 등 현재 값을 조회 시점에 읽는 게이지를 등록합니다 (같은 이름은 교체).
+
+        Args:
+            name: 게이지 이름 (예: render_queued)
+            read: 현재 값을 반환하는 함수
+        """
+        self._gauges[name] = read
+
+    def register_cache(self, name: str, stats: Callable[[], Dict[str, Any]]) -> None:
+        """캐시 적중 통계를 등록합니다 (같은 이름은 교체).
+
+        Args:
+            name: 캐시 이름
+            stats: hits/misses를 포함한 dict를 반환하는 함수
+        """
+        self._caches[name] = stats
+
+    def _read_gauges(self) -> Dict[str, float]:
+        values = {}
+        for name, read in list(self._gauges.items()):
+            try:
+                values[name] = float(read())
+            except Exception as e:
+                logger.debug(f"Gauge read failed: {name}, error={e}")
+        return values
+
+    def _read_caches(self) -> Dict[str, Dict[str, int]]:
+        values = {}
+        for name, stats in list(self._caches.items()):
+            try:
+                data = stats()
+                values[name] = {"hits": int(data["hits"]), "misses": int(data["misses"])}
+            except Exception as e:
+                logger.debug(f"Cache stats read failed: {name}, error={e}")
+        return values
+
+    def snapshot(self) -> Dict[str, Any]:
+        """워커 스냅샷 (상태 저장소 발행/합산용, JSON 직렬화 가능)."""
+        with self._lock:
+            counters = {
+                "errors": dict(self.error_counts),
+                "retries": dict(self.retry_counts),
+                "requests": dict(self.request_counts),
+                "loop_stalls": dict(self.loop_stall_counts),
+            }
+            histograms = dict(self.histograms)
+        return {
+            "histograms": {
+                name: histogram.snapshot().to_dict() for name, histogram in histograms.items()
+            },
+            "counters": counters,
+            "gauges": self._read_gauges(),
+            "caches": self._read_caches(),
+        }
+
     def get_stats(self) -> Dict:
         """
         현재 지표 통계를 반환합니다.
 
         Returns:
-            Dict: 에러 카운트, 재시도 카운트, latency 통계, 요청 카운트
+            Dict: 에러 카운트, 재시도 카운트, latency 분위수, 요청 카운트, 게이지, 캐시 적중
         """
-        with self._lock:
-            return {
-                "error_counts": dict(self.error_counts),
-                "retry_counts": dict(self.retry_counts),
-                "latency_stats": {
-                    service: {
-                        "count": stats.count,
-                        "avg_ms": round(stats.avg_ms, 2),
-                        "min_ms": stats.min_ms,
-                        "max_ms": stats.max_ms,
-                    }
-                    for service, stats in self.latency_stats.items()
-                },
-                "request_counts": dict(self.request_counts),
+        snapshot = self.snapshot()
+        latency_stats = {}
+        for service, data in snapshot["histograms"].items():
+            histogram = HistogramSnapshot.from_dict(data)
+            count = histogram.count
+            latency_stats[service] = {
+                "count": count,
+                "avg_ms": round(histogram.sum / count, 2) if count else 0.0,
+                "min_ms": _round(histogram.min),
+                "p50_ms": _round(histogram.quantile(0.5)),
+                "p95_ms": _round(histogram.quantile(0.95)),
+                "p99_ms": _round(histogram.quantile(0.99)),
+                "max_ms": _round(histogram.max) if count else None,
             }
+        return {
+            "error_counts": snapshot["counters"]["errors"],
+            "retry_counts": snapshot["counters"]["retries"],
+            "latency_stats": latency_stats,
+            "request_counts": snapshot["counters"]["requests"],
+            "gauges": snapshot["gauges"],
+            "caches": snapshot["caches"],
+        }
 
     def reset(self) -> None:
-        """모든 지표를 리셋합니다 (테스트용)."""
+        """모든 지표를 리셋합니다 (테스트용, 등록된 게이지/캐시는 유지)."""
         with self._lock:
             self.error_counts.clear()
             self.retry_counts.clear()
-            self.latency_stats.clear()
+            self.histograms.clear()
             self.request_counts.clear()
+            self.loop_stall_counts.clear()
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 2)
 
 
 # 전역 싱글턴 인스턴스
@@ -195,3 +482,247 @@ def get_metrics() -> MetricsCollector:
 
 # 편의를 위한 별칭
 metrics = get_metrics()
+
+
+# =============================================================================
+# 멀티 워커 합산
+# =============================================================================
+
+WORKER_METRICS_PREFIX = "metrics:worker:"
+# 종료된 워커들의 누적 값 (카운터/히스토그램/캐시 통계, 게이지 제외)
+RETIRED_METRICS_KEY = "metrics:retired"
+
+# 컨테이너 재시작 시 PID가 재사용되므로 프로세스마다 임의 접미사를 붙임 (fork 후 재생성)
+_worker_id: Optional[Tuple[int, str]] = None
+
+
+def _worker_key() -> str:
+    global _worker_id
+    pid = os.getpid()
+    if _worker_id is None or _worker_id[0] != pid:
+        _worker_id = (pid, f"{pid}-{uuid.uuid4().hex[:8]}")
+    return f"{WORKER_METRICS_PREFIX}{_worker_id[1]}"
+
+
+def publish_worker_metrics() -> None:
+    """이 워커의 스냅샷을 공유 상태 저장소에 발행합니다.
+
+    스냅샷에는 TTL을 두지 않습니다. 발행이 METRICS_WORKER_TTL_SEC 이상 끊긴 스냅샷은
+    collect_cluster_metrics()가 retired 스냅샷으로 옮깁니다 (만료로 사라지면 누적 값이 줄어듦).
+    """
+    from app.core.state_store import get_state_store
+
+    snapshot = get_metrics().snapshot()
+    snapshot["published_at"] = time.time()
+    get_state_store().set(_worker_key(), snapshot)
+
+
+def _retire_snapshot(store: Any, key: str, snapshot: Dict[str, Any]) -> None:
+    """워커 스냅샷을 삭제하고 누적 값을 retired 스냅샷에 더합니다.
+
+    delete에 성공한 호출자만 더하므로 여러 워커가 동시에 정리해도 한 번만 반영됩니다.
+    """
+    if not store.delete(key):
+        return
+    while True:
+        current = store.get(RETIRED_METRICS_KEY)
+        merged = merge_snapshots([snapshot], retired=current)
+        merged.pop("gauges")
+        merged.pop("workers")
+        if store.compare_and_set(RETIRED_METRICS_KEY, current, merged):
+            return
+
+
+def withdraw_worker_metrics() -> None:
+    """이 워커의 최종 스냅샷을 retired 스냅샷으로 옮깁니다 (종료 시)."""
+    from app.core.state_store import get_state_store
+
+    _retire_snapshot(get_state_store(), _worker_key(), get_metrics().snapshot())
+
+
+async def run_worker_metrics_publisher(interval_sec: float) -> None:
+    """interval_sec마다 이 워커의 스냅샷을 발행합니다 (lifespan 태스크)."""
+    while True:
+        try:
+            await asyncio.to_thread(publish_worker_metrics)
+        except Exception as e:
+            logger.warning(f"Failed to publish worker metrics: {e}")
+        await asyncio.sleep(interval_sec)
+
+
+def merge_snapshots(
+    snapshots: List[Dict[str, Any]],
+    retired: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """워커 스냅샷 합산 (카운터/게이지/캐시 통계는 합계, 히스토그램은 버킷별 합계).
+
+    Args:
+        snapshots: 현재 워커 스냅샷 목록
+        retired: 종료된 워커들의 누적 스냅샷 (합계에 더하되 workers 수에는 포함하지 않음)
+    """
+    merged: Dict[str, Any] = {
+        "histograms": {},
+        "counters": {"errors": {}, "retries": {}, "requests": {}, "loop_stalls": {}},
+        "gauges": {},
+        "caches": {},
+        "workers": len(snapshots),
+    }
+    for snapshot in ([retired] if retired else []) + snapshots:
+        for name, data in snapshot.get("histograms", {}).items():
+            histogram = HistogramSnapshot.from_dict(data)
+            current = merged["histograms"].get(name)
+            if current is None or tuple(current.buckets) != histogram.buckets:
+                # 배포 사이에 버킷이 바뀌면 이전 누적 값은 버림
+                merged["histograms"][name] = histogram
+            else:
+                merged["histograms"][name] = current.merge(histogram)
+        for group, values in snapshot.get("counters", {}).items():
+            target = merged["counters"].setdefault(group, {})
+            for name, value in values.items():
+                target[name] = target.get(name, 0) + value
+        for name, value in snapshot.get("gauges", {}).items():
+            merged["gauges"][name] = merged["gauges"].get(name, 0.0) + value
+        for name, stats in snapshot.get("caches", {}).items():
+            target = merged["caches"].setdefault(name, {"hits": 0, "misses": 0})
+            target["hits"] += stats["hits"]
+            target["misses"] += stats["misses"]
+    merged["histograms"] = {
+        name: histogram.to_dict() for name, histogram in merged["histograms"].items()
+    }
+    return merged
+
+
+def collect_cluster_metrics() -> Dict[str, Any]:
+    """모든 워커의 스냅샷과 retired 누적 값을 합산합니다 (이 워커는 현재 값 사용).
+
+    발행이 METRICS_WORKER_TTL_SEC 이상 끊긴 워커(비정상 종료)는 retired로 옮긴 뒤 합산합니다.
+    """
+    from app.core.config import get_settings
+    from app.core.state_store import get_state_store
+
+    own_key = _worker_key()
+    snapshots = [get_metrics().snapshot()]
+    retired = None
+    try:
+        store = get_state_store()
+        stale_before = time.time() - get_settings().METRICS_WORKER_TTL_SEC
+        for key, snapshot in store.items(WORKER_METRICS_PREFIX).items():
+            if key == own_key:
+                continue
+            if snapshot.get("published_at", 0.0) < stale_before:
+                _retire_snapshot(store, key, snapshot)
+            else:
+                snapshots.append(snapshot)
+        retired = store.get(RETIRED_METRICS_KEY)
+    except Exception as e:
+        logger.warning(f"Failed to read worker metrics, using local only: {e}")
+    return merge_snapshots(snapshots, retired=retired)
+
+
+# =============================================================================
+# Prometheus text exposition
+# =============================================================================
+
+METRIC_NAMESPACE = "ctrlf"
+
+# upstream이 아닌 히스토그램은 별도 metric family로 노출 (이름 → (family 접미사, 설명))
+RUNTIME_HISTOGRAM_FAMILIES: Dict[str, Tuple[str, str]] = {
+    "event_loop_lag": ("event_loop_lag_seconds", "Event loop scheduling lag."),
+}
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _sample(name: str, labels: Dict[str, str], value: float) -> str:
+    if labels:
+        label_text = ",".join(f'{key}="{_escape_label(str(val))}"' for key, val in labels.items())
+        return f"{name}{{{label_text}}} {_format_value(value)}"
+    return f"{name} {_format_value(value)}"
+
+
+def _family(lines: List[str], name: str, kind: str, help_text: str) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def _histogram_samples(
+    lines: List[str], name: str, labels: Dict[str, str], histogram: HistogramSnapshot
+) -> None:
+    """누적 버킷(le는 초)/sum/count 샘플을 추가합니다."""
+    cumulative = 0
+    for upper, bucket_count in zip(histogram.buckets, histogram.counts):
+        cumulative += bucket_count
+        lines.append(
+            _sample(f"{name}_bucket", {**labels, "le": _format_value(upper / 1000)}, cumulative)
+        )
+    lines.append(_sample(f"{name}_bucket", {**labels, "le": "+Inf"}, histogram.count))
+    lines.append(_sample(f"{name}_sum", labels, histogram.sum / 1000))
+    lines.append(_sample(f"{name}_count", labels, histogram.count))
+
+
+def render_prometheus(snapshot: Dict[str, Any]) -> str:
+    """합산 스냅샷을 Prometheus text exposition 형식(0.0.4)으로 변환합니다.
+
+    latency는 Prometheus 관례에 따라 초 단위로 변환합니다.
+    """
+    ns = METRIC_NAMESPACE
+    lines: List[str] = []
+    histograms = snapshot["histograms"]
+
+    name = f"{ns}_upstream_latency_seconds"
+    _family(lines, name, "histogram", "Upstream call latency by service.")
+    for service, data in sorted(histograms.items()):
+        if service not in RUNTIME_HISTOGRAM_FAMILIES:
+            _histogram_samples(lines, name, {"upstream": service}, HistogramSnapshot.from_dict(data))
+
+    for key, (suffix, help_text) in RUNTIME_HISTOGRAM_FAMILIES.items():
+        name = f"{ns}_{suffix}"
+        _family(lines, name, "histogram", help_text)
+        if key in histograms:
+            _histogram_samples(lines, name, {}, HistogramSnapshot.from_dict(histograms[key]))
+
+    counters = snapshot["counters"]
+    for group, family, label, help_text in (
+        ("errors", "errors", "tag", "Errors by log tag."),
+        ("retries", "retries", "service", "Upstream retries by service."),
+        ("requests", "requests", "route", "Chat requests by final route."),
+        ("loop_stalls", "event_loop_stalls", "route", "Event loop stalls by active HTTP route."),
+    ):
+        name = f"{ns}_{family}_total"
+        _family(lines, name, "counter", help_text)
+        for key, value in sorted(counters.get(group, {}).items()):
+            lines.append(_sample(name, {label: key}, value))
+
+    name = f"{ns}_queue_depth"
+    _family(lines, name, "gauge", "Current queue depth or in-flight count.")
+    for key, value in sorted(snapshot["gauges"].items()):
+        lines.append(_sample(name, {"queue": key}, value))
+
+    caches = sorted(snapshot["caches"].items())
+    for field_name, help_text in (("hits", "Cache hits."), ("misses", "Cache misses.")):
+        name = f"{ns}_cache_{field_name}_total"
+        _family(lines, name, "counter", help_text)
+        for key, stats in caches:
+            lines.append(_sample(name, {"cache": key}, stats[field_name]))
+    name = f"{ns}_cache_hit_ratio"
+    _family(lines, name, "gauge", "Cumulative cache hit ratio.")
+    for key, stats in caches:
+        total = stats["hits"] + stats["misses"]
+        lines.append(_sample(name, {"cache": key}, stats["hits"] / total if total else 0.0))
+
+    name = f"{ns}_metrics_workers"
+    _family(lines, name, "gauge", "Number of workers included in this scrape.")
+    lines.append(_sample(name, {}, snapshot.get("workers", 1)))
+
+    return "\n".join(lines) + "\n"
+
@@ -0,0 +1,731 @@
+"""
+공유 상태 저장소 (StateStore)
+
+여러 uvicorn 워커가 같은 상태를 보도록 per-process dict 대신 사용하는 저장소입니다.
+pending action, in-flight 요청, 영상 시청 진행률, 교육 카탈로그, ingest 멱등성 캐시,
+소스셋 처리 상태가 이 저장소를 사용합니다.
+
+제공 연산 (모든 구현 공통):
+- get / set / delete / keys / clear
+- set_if_absent: 키가 없을 때만 저장 (원자적)
+- compare_and_set: 현재 값이 expected와 같을 때만 교체 (원자적, CAS)
+- ttl_sec: 만료 시간. 만료된 키는 없는 키로 취급
+- publish / subscribe: 채널 메시지 (모든 워커의 구독자에게 전달)
+- aget / aset / aset_if_absent / acompare_and_set / adelete / akeys / aitems / aclear / apublish:
+  위 연산의 async 버전. 백엔드 I/O(SQLite 잠금 대기, Redis 왕복)를 스레드에서 실행하므로
+  async 요청 경로에서는 이 API를 사용합니다 (이벤트 루프 블로킹 방지)
+
+값은 JSON 직렬화 가능한 값(dict/list/str/int/float/bool/None)만 저장합니다.
+저장 시 직렬화되므로 get으로 받은 값을 수정해도 저장소에는 반영되지 않습니다.
+
+구현:
+- memory: 프로세스 내부 dict (단일 워커, 테스트)
+- sqlite: 같은 호스트의 워커가 공유하는 SQLite 파일 (WAL). 구독은 메시지 테이블 폴링
+- redis: 네트워크 KV 어댑터 (여러 호스트). redis 패키지 필요
+
+환경변수:
+- STATE_STORE_BACKEND: memory | sqlite | redis (기본: memory)
+- STATE_STORE_SQLITE_PATH: SQLite 파일 경로 (기본: ./data/state_store.db)
+- STATE_STORE_REDIS_URL: Redis URL
+- STATE_STORE_POLL_INTERVAL_MS: SQLite 구독 폴링 주기
+
+Usage:
+    store = get_state_store()
+
+    if store.set_if_absent("ingest:DOC-1:1", {"status": "PROCESSING"}, ttl_sec=3600):
+        ...  # 이 워커가 처리 담당
+
+    # async 코드
+    value = await store.aget("pending_action:session-1")
+
+    unsubscribe = store.subscribe("render-progress", on_message)
+    store.publish("render-progress", {"job_id": "job-1", "progress": 40})
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+MessageCallback = Callable[[str, Any], None]
+
+
+def _encode(value: Any) -> str:
+    """값 직렬화 (같은 값은 같은 문자열 → CAS 비교에 사용)."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _decode(raw: Optional[str]) -> Any:
+    """값 역직렬화."""
+    if raw is None:
+        return None
+    return json.loads(raw)
+
+
+def _expires_at(ttl_sec: Optional[float]) -> Optional[float]:
+    """TTL → 만료 시각 (epoch 초, 워커 간 비교 가능해야 하므로 wall clock)."""
+    if ttl_sec is None:
+        return None
+    return time.time() + ttl_sec
+
+
+# =============================================================================
+# 인터페이스
+# =============================================================================
+
+
+class StateStore(ABC):
+    """공유 상태 저장소 인터페이스."""
+
+    backend: str = "base"
+
+    @abstractmethod
+    def get(self, key: str) -> Any:
+        """값 조회 (없거나 만료되면 None)."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_sec: Optional[float] = None) -> None:
+        """값 저장 (덮어쓰기)."""
+
+    @abstractmethod
+    def compare_and_set(
+        self,
+        key: str,
+        expected: Any,
+        value: Any,
+        ttl_sec: Optional[float] = None,
+    ) -> bool:
+        """현재 값이 expected일 때만 value로 교체합니다.
+
+        expected=None이면 키가 없을(또는 만료된) 때만 저장합니다.
+
+        Returns:
+            bool: 교체 여부
+        """
+
+    def set_if_absent(self, key: str, value: Any, ttl_sec: Optional[float] = None) -> bool:
+        """키가 없을 때만 저장합니다."""
+        return self.compare_and_set(key, None, value, ttl_sec)
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """키 삭제 (삭제 여부 반환)."""
+
+    @abstractmethod
+    def keys(self, prefix: str = "") -> List[str]:
+        """prefix로 시작하는 (만료되지 않은) 키 목록."""
+
+    def items(self, prefix: str = "") -> Dict[str, Any]:
+        """prefix로 시작하는 키와 값."""
+        result = {}
+        for key in self.keys(prefix):
+            value = self.get(key)
+            if value is not None:
+                result[key] = value
+        return result
+
+    @abstractmethod
+    def clear(self, prefix: str = "") -> None:
+        """prefix로 시작하는 키 삭제 (빈 prefix면 전체)."""
+
+    @abstractmethod
+    def publish(self, channel: str, message: Any) -> None:
+        """채널에 메시지 발행."""
+
+    @abstractmethod
+    def subscribe(self, channel: str, callback: MessageCallback) -> Callable[[], None]:
+        """채널 구독.
+
+        callback(channel, message)은 구현에 따라 발행 스레드 또는 별도 수신 스레드에서
+        호출됩니다. asyncio 코드에서는 loop.call_soon_threadsafe로 넘겨야 합니다.
+
+        Returns:
+            구독 해제 함수
+        """
+
+    def close(self) -> None:
+        """자원 정리."""
+
+    # -------------------------------------------------------------------------
+    # async API (백엔드 호출을 스레드에서 실행)
+    # -------------------------------------------------------------------------
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """동기 백엔드 연산을 이벤트 루프 밖(스레드)에서 실행합니다."""
+        return await asyncio.to_thread(func, *args)
+
+    async def aget(self, key: str) -> Any:
+        """get의 async 버전."""
+        return await self._run(self.get, key)
+
+    async def aset(self, key: str, value: Any, ttl_sec: Optional[float] = None) -> None:
+        """set의 async 버전."""
+        await self._run(self.set, key, value, ttl_sec)
+
+    async def acompare_and_set(
+        self,
+        key: str,
+        expected: Any,
+        value: Any,
+        ttl_sec: Optional[float] = None,
+    ) -> bool:
+        """compare_and_set의 async 버전."""
+        return await self._run(self.compare_and_set, key, expected, value, ttl_sec)
+
+    async def aset_if_absent(self, key: str, value: Any, ttl_sec: Optional[float] = None) -> bool:
+        """set_if_absent의 async 버전."""
+        return await self._run(self.set_if_absent, key, value, ttl_sec)
+
+    async def adelete(self, key: str) -> bool:
+        """delete의 async 버전."""
+        return await self._run(self.delete, key)
+
+    async def akeys(self, prefix: str = "") -> List[str]:
+        """keys의 async 버전."""
+        return await self._run(self.keys, prefix)
+
+    async def aitems(self, prefix: str = "") -> Dict[str, Any]:
+        """items의 async 버전."""
+        return await self._run(self.items, prefix)
+
+    async def aclear(self, prefix: str = "") -> None:
+        """clear의 async 버전."""
+        await self._run(self.clear, prefix)
+
+    async def apublish(self, channel: str, message: Any) -> None:
+        """publish의 async 버전."""
+        await self._run(self.publish, channel, message)
+
+
+class _SubscriberRegistry:
+    """채널별 콜백 목록 (구현 공통)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._callbacks: Dict[str, List[MessageCallback]] = {}
+
+    def add(self, channel: str, callback: MessageCallback) -> None:
+        with self._lock:
+            self._callbacks.setdefault(channel, []).append(callback)
+
+    def remove(self, channel: str, callback: MessageCallback) -> bool:
+        """콜백 제거. 채널에 남은 구독자가 없으면 True."""
+        with self._lock:
+            callbacks = self._callbacks.get(channel, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks:
+                self._callbacks.pop(channel, None)
+                return True
+            return False
+
+    def channels(self) -> List[str]:
+        with self._lock:
+            return list(self._callbacks)
+
+    def dispatch(self, channel: str, message: Any) -> None:
+        with self._lock:
+            callbacks = list(self._callbacks.get(channel, []))
+        for callback in callbacks:
+            try:
+                callback(channel, message)
+            except Exception as e:
+                logger.warning(f"State store subscriber failed: channel={channel}, error={e}")
+
+
+# =============================================================================
+# In-process 구현
+# =============================================================================
+
+
+class InMemoryStateStore(StateStore):
+    """프로세스 내부 저장소 (단일 워커용).
+
+    다른 구현과 동작을 맞추기 위해 값을 직렬화해서 보관합니다.
+    연산이 메모리 안에서 끝나므로 async API도 스레드를 거치지 않고 바로 실행합니다.
+    """
+
+    backend = "memory"
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._data: Dict[str, Tuple[str, Optional[float]]] = {}
+        self._subscribers = _SubscriberRegistry()
+
+    def _live(self, key: str) -> Optional[str]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        raw, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._data[key]
+            return None
+        return raw
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            return _decode(self._live(key))
+
+    def set(self, key: str, value: Any, ttl_sec: Optional[float] = None) -> None:
+        raw = _encode(value)
+        with self._lock:
+            self._data[key] = (raw, _expires_at(ttl_sec))
+
+    def compare_and_set(
+        self,
+        key: str,
+        expected: Any,
+        value: Any,
+        ttl_sec: Optional[float] = None,
+    ) -> bool:
+        raw = _encode(value)
+        expected_raw = None if expected is None else _encode(expected)
+        with self._lock:
+            if self._live(key) != expected_raw:
+                return False
+            self._data[key] = (raw, _expires_at(ttl_sec))
+            return True
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def keys(self, prefix: str = "") -> List[str]:
+        with self._lock:
+            return [
+                key for key in list(self._data)
+                if key.startswith(prefix) and self._live(key) is not None
+            ]
+
+    def clear(self, prefix: str = "") -> None:
+        with self._lock:
+            for key in [k for k in self._data if k.startswith(prefix)]:
+                del self._data[key]
+
+    def publish(self, channel: str, message: Any) -> None:
+        self._subscribers.dispatch(channel, _decode(_encode(message)))
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        return func(*args)
+
+    def subscribe(self, channel: str, callback: MessageCallback) -> Callable[[], None]:
+        self._subscribers.add(channel, callback)
+        return lambda: self._subscribers.remove(channel, callback)
+
+
+# =============================================================================
+# SQLite 구현 (같은 호스트 워커 공유)
+# =============================================================================
+
+
+class SQLiteStateStore(StateStore):
+    """SQLite 파일 공유 저장소.
+
+    같은 호스트(같은 볼륨)의 워커 프로세스가 한 파일을 공유합니다.
+    CAS는 조건부 UPDATE/UPSERT 한 문장으로 처리하므로 프로세스 간에도 원자적입니다.
+    publish는 메시지 테이블에 기록하고, 구독 중인 워커의 수신 스레드가
+    poll_interval_sec마다 새 메시지를 읽어 콜백을 호출합니다.
+    """
+
+    backend = "sqlite"
+
+    # 메시지 보존 시간 (초). 이보다 오래된 메시지는 주기 정리 때 삭제
+    MESSAGE_RETENTION_SEC = 60.0
+    # 만료 키/오래된 메시지 정리 주기 (초). set/publish 중 주기가 지났으면 정리
+    SWEEP_INTERVAL_SEC = 60.0
+
+    def __init__(self, db_path: str, poll_interval_sec: float = 0.05) -> None:
+        self._db_path = db_path
+        self._poll_interval_sec = poll_interval_sec
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._subscribers = _SubscriberRegistry()
+        self._poller: Optional[threading.Thread] = None
+        self._poller_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._last_sweep = 0.0
+        self._init_db()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Thread-local DB 연결 반환."""
+        if not hasattr(self._local, "connection"):
+            conn = sqlite3.connect(
+                self._db_path, timeout=5.0, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return self._local.connection
+
+    @contextmanager
+    def _transaction(self):
+        """쓰기 트랜잭션 (BEGIN IMMEDIATE로 쓰기 잠금 선점)."""
+        conn = self._get_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _init_db(self) -> None:
+        Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._get_connection()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS state_kv (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS state_messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                channel TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        logger.info(f"SQLiteStateStore initialized: {self._db_path}")
+
+    def _maybe_sweep(self, conn: sqlite3.Connection, now: float) -> None:
+        """만료 키/오래된 메시지 정리 (주기적으로 한 번)."""
+        if now - self._last_sweep < self.SWEEP_INTERVAL_SEC:
+            return
+        self._last_sweep = now
+        conn.execute("DELETE FROM state_kv WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        conn.execute(
+            "DELETE FROM state_messages WHERE created_at < ?",
+            (now - self.MESSAGE_RETENTION_SEC,),
+        )
+
+    def get(self, key: str) -> Any:
+        row = self._get_connection().execute(
+            "SELECT value FROM state_kv WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, time.time()),
+        ).fetchone()
+        return _decode(row[0]) if row else None
+
+    def set(self, key: str, value: Any, ttl_sec: Optional[float] = None) -> None:
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO state_kv (key, value, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at",
+                (key, _encode(value), _expires_at(ttl_sec)),
+            )
+            self._maybe_sweep(conn, now)
+
+    def compare_and_set(
+        self,
+        key: str,
+        expected: Any,
+        value: Any,
+        ttl_sec: Optional[float] = None,
+    ) -> bool:
+        now = time.time()
+        raw = _encode(value)
+        expires_at = _expires_at(ttl_sec)
+        with self._transaction() as conn:
+            if expected is None:
+                # 없는 키는 INSERT, 만료된 키만 UPDATE
+                cursor = conn.execute(
+                    "INSERT INTO state_kv (key, value, expires_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at "
+                    "WHERE state_kv.expires_at IS NOT NULL AND state_kv.expires_at <= ?",
+                    (key, raw, expires_at, now),
+                )
+            else:
+                cursor = conn.execute(
+                    "UPDATE state_kv SET value = ?, expires_at = ? "
+                    "WHERE key = ? AND value = ? AND (expires_at IS NULL OR expires_at > ?)",
+                    (raw, expires_at, key, _encode(expected), now),
+                )
+            return cursor.rowcount == 1
+
+    def delete(self, key: str) -> bool:
+        with self._transaction() as conn:
+            return conn.execute("DELETE FROM state_kv WHERE key = ?", (key,)).rowcount == 1
+
+    def keys(self, prefix: str = "") -> List[str]:
+        rows = self._get_connection().execute(
+            "SELECT key FROM state_kv WHERE substr(key, 1, ?) = ? "
+            "AND (expires_at IS NULL OR expires_at > ?) ORDER BY key",
+            (len(prefix), prefix, time.time()),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def items(self, prefix: str = "") -> Dict[str, Any]:
+        rows = self._get_connection().execute(
+            "SELECT key, value FROM state_kv WHERE substr(key, 1, ?) = ? "
+            "AND (expires_at IS NULL OR expires_at > ?) ORDER BY key",
+            (len(prefix), prefix, time.time()),
+        ).fetchall()
+        return {row[0]: _decode(row[1]) for row in rows}
+
+    def clear(self, prefix: str = "") -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM state_kv WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+
+    def publish(self, channel: str, message: Any) -> None:
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO state_messages (channel, payload, created_at) VALUES (?, ?, ?)",
+                (channel, _encode(message), now),
+            )
+            self._maybe_sweep(conn, now)
+
+    def subscribe(self, channel: str, callback: MessageCallback) -> Callable[[], None]:
+        self._subscribers.add(channel, callback)
+        self._ensure_poller()
+        return lambda: self._subscribers.remove(channel, callback)
+
+    def _ensure_poller(self) -> None:
+        with self._poller_lock:
+            if self._poller is None or not self._poller.is_alive():
+                # 구독 이후 발행된 메시지부터 전달 (시작 위치는 호출 스레드에서 결정)
+                row = self._get_connection().execute(
+                    "SELECT COALESCE(MAX(id), 0) FROM state_messages"
+                ).fetchone()
+                self._stop.clear()
+                self._poller = threading.Thread(
+                    target=self._poll_messages,
+                    args=(row[0],),
+                    name="state-store-poller",
+                    daemon=True,
+                )
+                self._poller.start()
+
+    def _poll_messages(self, last_id: int) -> None:
+        """구독 스레드: 마지막으로 읽은 id 이후 메시지를 읽어 콜백 호출."""
+        conn = self._get_connection()
+
+        while not self._stop.wait(self._poll_interval_sec):
+            channels = self._subscribers.channels()
+            if not channels:
+                continue
+            try:
+                placeholders = ",".join("?" * len(channels))
+                rows = conn.execute(
+                    f"SELECT id, channel, payload FROM state_messages "
+                    f"WHERE id > ? AND channel IN ({placeholders}) ORDER BY id",
+                    (last_id, *channels),
+                ).fetchall()
+            except sqlite3.Error as e:
+                logger.warning(f"State store poll failed: {e}")
+                continue
+            for message_id, channel, payload in rows:
+                last_id = message_id
+                self._subscribers.dispatch(channel, _decode(payload))
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._poller is not None:
+            self._poller.join(timeout=1.0)
+            self._poller = None
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
+
+
+# =============================================================================
+# 네트워크 KV 어댑터 (Redis)
+# =============================================================================
+
+
+# CAS 스크립트: ARGV[1]=expected 존재 여부(0/1), ARGV[2]=expected, ARGV[3]=value, ARGV[4]=ttl(ms, 0=없음)
+_REDIS_CAS_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if ARGV[1] == '0' then
+    if current then return 0 end
+elseif current ~= ARGV[2] then
+    return 0
+end
+if tonumber(ARGV[4]) > 0 then
+    redis.call('SET', KEYS[1], ARGV[3], 'PX', ARGV[4])
+else
+    redis.call('SET', KEYS[1], ARGV[3])
+end
+return 1
+"""
+
+
+class RedisStateStore(StateStore):
+    """Redis 어댑터 (여러 호스트의 워커 공유).
+
+    다른 서비스와 Redis를 같이 쓸 수 있도록 모든 키에 key_prefix를 붙입니다.
+    """
+
+    backend = "redis"
+
+    def __init__(self, url: str, key_prefix: str = "ctrlf-ai:") -> None:
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("redis not installed. Run: pip install redis")
+
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+        self._prefix = key_prefix
+        self._cas = self._client.register_script(_REDIS_CAS_SCRIPT)
+        self._subscribers = _SubscriberRegistry()
+        self._pubsub = None
+        self._pubsub_thread = None
+        self._pubsub_lock = threading.Lock()
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}{key}"
+
+    @staticmethod
+    def _ttl_ms(ttl_sec: Optional[float]) -> Optional[int]:
+        return None if ttl_sec is None else max(int(ttl_sec * 1000), 1)
+
+    def get(self, key: str) -> Any:
+        return _decode(self._client.get(self._key(key)))
+
+    def set(self, key: str, value: Any, ttl_sec: Optional[float] = None) -> None:
+        self._client.set(self._key(key), _encode(value), px=self._ttl_ms(ttl_sec))
+
+    def set_if_absent(self, key: str, value: Any, ttl_sec: Optional[float] = None) -> bool:
+        return bool(
+            self._client.set(self._key(key), _encode(value), px=self._ttl_ms(ttl_sec), nx=True)
+        )
+
+    def compare_and_set(
+        self,
+        key: str,
+        expected: Any,
+        value: Any,
+        ttl_sec: Optional[float] = None,
+    ) -> bool:
+        args = [
+            "0" if expected is None else "1",
+            "" if expected is None else _encode(expected),
+            _encode(value),
+            self._ttl_ms(ttl_sec) or 0,
+        ]
+        return bool(self._cas(keys=[self._key(key)], args=args))
+
+    def delete(self, key: str) -> bool:
+        return bool(self._client.delete(self._key(key)))
+
+    def keys(self, prefix: str = "") -> List[str]:
+        start = len(self._prefix)
+        return sorted(
+            key[start:] for key in self._client.scan_iter(match=f"{self._key(prefix)}*")
+        )
+
+    def clear(self, prefix: str = "") -> None:
+        keys = list(self._client.scan_iter(match=f"{self._key(prefix)}*"))
+        if keys:
+            self._client.delete(*keys)
+
+    def publish(self, channel: str, message: Any) -> None:
+        self._client.publish(self._key(channel), _encode(message))
+
+    def subscribe(self, channel: str, callback: MessageCallback) -> Callable[[], None]:
+        self._subscribers.add(channel, callback)
+        with self._pubsub_lock:
+            if self._pubsub is None:
+                self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(**{self._key(channel): self._on_message})
+            if self._pubsub_thread is None:
+                self._pubsub_thread = self._pubsub.run_in_thread(sleep_time=0.1, daemon=True)
+
+        def unsubscribe() -> None:
+            if self._subscribers.remove(channel, callback):
+                with self._pubsub_lock:
+                    if self._pubsub is not None:
+                        self._pubsub.unsubscribe(self._key(channel))
+
+        return unsubscribe
+
+    def _on_message(self, message: Dict[str, Any]) -> None:
+        channel = message["channel"][len(self._prefix):]
+        self._subscribers.dispatch(channel, _decode(message["data"]))
+
+    def close(self) -> None:
+        with self._pubsub_lock:
+            if self._pubsub_thread is not None:
+                self._pubsub_thread.stop()
+                self._pubsub_thread = None
+            if self._pubsub is not None:
+                self._pubsub.close()
+                self._pubsub = None
+        self._client.close()
+
+
+# =============================================================================
+# 싱글톤
+# =============================================================================
+
+
+_state_store: Optional[StateStore] = None
+_state_store_lock = threading.Lock()
+
+
+def create_state_store(backend: Optional[str] = None) -> StateStore:
+    """설정에 맞는 StateStore를 생성합니다.
+
+    Args:
+        backend: memory | sqlite | redis (None이면 STATE_STORE_BACKEND)
+    """
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    backend = (backend or settings.STATE_STORE_BACKEND).lower()
+
+    if backend == "sqlite":
+        return SQLiteStateStore(
+            settings.STATE_STORE_SQLITE_PATH,
+            poll_interval_sec=settings.STATE_STORE_POLL_INTERVAL_MS / 1000,
+        )
+    if backend == "redis":
+        if not settings.STATE_STORE_REDIS_URL:
+            raise ValueError("STATE_STORE_REDIS_URL not configured.")
+        return RedisStateStore(settings.STATE_STORE_REDIS_URL)
+    if backend != "memory":
+        logger.warning(f"Unknown STATE_STORE_BACKEND: {backend}, using memory")
+    return InMemoryStateStore()
+
+
+def get_state_store() -> StateStore:
+    """공유 상태 저장소 싱글톤 반환."""
+    global _state_store
+    if _state_store is None:
+        with _state_store_lock:
+            if _state_store is None:
+                _state_store = create_state_store()
+                logger.info(f"State store initialized: backend={_state_store.backend}")
+    return _state_store
+
+
+def clear_state_store() -> None:
+    """상태 저장소 싱글톤 정리 (종료/테스트용)."""
+    global _state_store
+    with _state_store_lock:
+        if _state_store is not None:
+            _state_store.close()
+        _state_store = None
@@ -0,0 +1,114 @@
+"""
+기동 warm-up 모듈 (Startup Warm-up)
+
+첫 채팅 요청이 내던 초기화 비용을 lifespan 시작 단계(트래픽 수신 전)에서 미리 치릅니다.
+lifespan이 끝나야 서버가 요청을 받으므로 /health/ready도 warm-up 이후에 응답합니다.
+
+단계 (설정에 따라 포함, 동시에 실행):
+- milvus: Milvus 연결 + 컬렉션 load (MILVUS_ENABLED)
+- forbidden_filter: 금지질문 룰셋 로드 + 인덱스 빌드 (FORBIDDEN_QUERY_FILTER_ENABLED)
+
+원칙:
+- 단계별 소요 시간을 로그로 남김
+- 실패/시간 초과는 경고만 남기고 기동을 막지 않음 (첫 요청에서 기존대로 지연 초기화)
+
+사용 방법:
+    results = await run_warmup(settings)   # lifespan 시작
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from app.core.config import Settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+WarmupStep = Tuple[str, Callable[[], Awaitable[None]]]
+
+
+@dataclass
+class WarmupResult:
+    """warm-up 단계 결과."""
+
+    name: str
+    ok: bool
+    duration_ms: float
+    error: Optional[str] = None
+
+
+async def _warm_milvus() -> None:
+    from app.clients.milvus_client import get_milvus_client
+
+    await get_milvus_client().warm_up()
+
+
+async def _warm_forbidden_filter() -> None:
+    from app.services.forbidden_query_filter import get_forbidden_query_filter
+
+    # 룰셋 JSON 파싱/인덱스 빌드는 동기 작업이므로 스레드에서 실행
+    await asyncio.to_thread(get_forbidden_query_filter().load)
+
+
+def build_warmup_steps(settings: Settings) -> List[WarmupStep]:
+    """설정에 따라 실행할 warm-up 단계를 반환합니다."""
+    steps: List[WarmupStep] = []
+    if settings.MILVUS_ENABLED:
+        steps.append(("milvus", _warm_milvus))
+    if settings.FORBIDDEN_QUERY_FILTER_ENABLED:
+        steps.append(("forbidden_filter", _warm_forbidden_filter))
+    return steps
+
+
+async def _run_step(name: str, step: Callable[[], Awaitable[None]], timeout_sec: float) -> WarmupResult:
+    started = time.perf_counter()
+    error: Optional[str] = None
+    try:
+        await asyncio.wait_for(step(), timeout=timeout_sec)
+    except asyncio.TimeoutError:
+        error = f"timeout after {timeout_sec}s"
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+
+    result = WarmupResult(
+        name=name,
+        ok=error is None,
+        duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        error=error,
+    )
+    if result.ok:
+        logger.info(f"Warm-up step done: {name} ({result.duration_ms}ms)")
+    else:
+        logger.warning(f"Warm-up step failed: {name} ({result.duration_ms}ms), error={error}")
+    return result
+
+
+async def run_warmup(
+    settings: Settings,
+    steps: Optional[List[WarmupStep]] = None,
+) -> List[WarmupResult]:
+    """warm-up 단계를 동시에 실행하고 결과를 반환합니다.
+
+    Args:
+        settings: 애플리케이션 설정
+        steps: 실행할 단계 (None이면 build_warmup_steps(settings))
+
+    Returns:
+        단계별 결과 (steps 순서)
+    """
+    steps = build_warmup_steps(settings) if steps is None else steps
+    if not steps:
+        return []
+
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(_run_step(name, step, settings.WARMUP_TIMEOUT_SEC) for name, step in steps)
+    )
+    failed = [r.name for r in results if not r.ok]
+    logger.info(
+        f"Warm-up finished: {(time.perf_counter() - started) * 1000:.1f}ms, "
+        f"steps={[r.name for r in results]}, failed={failed}"
+    )
+    return list(results)
@@ -10,6 +10,8 @@ FastAPI 인스턴스를 생성하고, 라우터를 등록하며, 미들웨어를
     - ctrlf-front (React): 프론트엔드 UI
 """
 
+import asyncio
+import sys
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -27,15 +29,19 @@ from app.api.v1 import (
     gap_suggestions,
     health,
     internal_rag,
+    metrics,
+    personalization,
     quiz_generate,
     rag_documents,
     render_jobs,
     source_sets,
+    traces,
+    video_progress,
     ws_render_progress,
 )
 from app.clients.http_client import close_async_http_client
 from app.core.config import get_settings
-from app.core.logging import get_logger, setup_logging
+from app.core.logging import get_logger, setup_logging, shutdown_logging
 from app.telemetry.middleware import RequestContextMiddleware
 from app.telemetry.publisher import (
     TelemetryPublisher,
@@ -57,6 +63,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     시작 시:
         - 로깅 설정
+        - warm-up (Milvus 연결/컬렉션 load, 금지질문 인덱스 빌드)
         - (향후) 데이터베이스 연결
         - (향후) 외부 서비스 클라이언트 초기화
 
@@ -99,6 +106,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             internal_token=settings.BACKEND_INTERNAL_TOKEN,
             source="ai-gateway",
             enabled=True,
+            batch_size=settings.TELEMETRY_BATCH_SIZE,
+            min_batch_size=settings.TELEMETRY_BATCH_MIN_SIZE,
+            max_batch_size=settings.TELEMETRY_BATCH_MAX_SIZE,
+            target_latency_ms=settings.TELEMETRY_TARGET_LATENCY_MS,
+            flush_sec=settings.TELEMETRY_FLUSH_SEC,
+            max_queue_size=settings.TELEMETRY_MAX_QUEUE_SIZE,
+            max_queue_bytes=settings.TELEMETRY_MAX_QUEUE_BYTES,
+            compress=settings.TELEMETRY_GZIP,
+            spill_dir=settings.TELEMETRY_SPILL_DIR or None,
+            spill_max_bytes=settings.TELEMETRY_SPILL_MAX_BYTES,
         )
         set_telemetry_publisher(publisher)
         await publisher.start()
@@ -108,19 +125,100 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             "TelemetryPublisher disabled (BACKEND_BASE_URL or BACKEND_INTERNAL_TOKEN not set)"
         )
 
+    # 이벤트 루프 지연/정지 감시
+    if settings.LOOP_MONITOR_ENABLED:
+        from app.core.loop_monitor import get_loop_monitor
+
+        await get_loop_monitor().start()
+
+    # 워커 지표 발행 (멀티 워커: GET /metrics가 모든 워커 합산)
+    metrics_publish_task = None
+    if settings.METRICS_ENABLED and settings.STATE_STORE_BACKEND.lower() != "memory":
+        from app.core.metrics import run_worker_metrics_publisher
+
+        metrics_publish_task = asyncio.create_task(
+            run_worker_metrics_publisher(settings.METRICS_PUBLISH_INTERVAL_SEC)
+        )
+
+    # 렌더 잡 큐 복원 (재시작 전 QUEUED/PROCESSING 잡 재개, 워커마다 실행되며 잡별 lease를 선점한 워커만 재개)
+    if settings.RENDER_RESUME_ON_STARTUP:
+        try:
+            from app.api.v1.render_jobs import get_render_job_runner
+
+            resumed = await get_render_job_runner().resume_pending_jobs()
+            logger.info(f"Render job queue restored: resumed={resumed}")
+        except Exception as e:
+            logger.warning(f"Failed to resume render jobs: {e}")
+
+    # 기동 warm-up: Milvus 연결/컬렉션 load, 금지질문 인덱스 빌드 (트래픽 수신 전, 동시 실행)
+    if settings.WARMUP_ENABLED:
+        from app.core.warmup import run_warmup
+
+        await run_warmup(settings)
+
     try:
         yield  # 애플리케이션 실행
     finally:
         # 종료 시 실행
+        # 렌더 워커 풀 종료 (실행 중인 잡은 PROCESSING으로 남아 다음 시작 시 재개)
+        from app.services.render_job_runner import shutdown_render_job_runner
+
+        await shutdown_render_job_runner()
+
+        # 씬 이미지 프로세스 풀 종료 (렌더를 한 번도 안 했으면 모듈도 로드하지 않음 - Pillow import 비용)
+        image_assets = sys.modules.get("app.services.image_asset_service")
+        if image_assets is not None:
+            image_assets.clear_image_asset_service()
+
         # Telemetry Publisher 종료
         publisher = get_telemetry_publisher()
         if publisher:
             await publisher.stop()
             set_telemetry_publisher(None)
 
+        from app.clients.storage_adapter import close_default_storage_provider
+
+        await close_default_storage_provider()
+
+        # 워커 지표 발행 중지 및 스냅샷 삭제 (상태 저장소보다 먼저)
+        if metrics_publish_task is not None:
+            metrics_publish_task.cancel()
+            from app.core.metrics import withdraw_worker_metrics
+
+            try:
+                withdraw_worker_metrics()
+            except Exception as e:
+                logger.warning(f"Failed to withdraw worker metrics: {e}")
+
+        # 병합 대기 중인 영상 진행률 기록 (상태 저장소보다 먼저)
+        from app.services.video_progress_service import flush_video_progress_store
+
+        flush_video_progress_store()
+
+        # 진행률 버스 구독 해제 (상태 저장소보다 먼저)
+        from app.api.v1.ws_render_progress import clear_connection_manager
+
+        clear_connection_manager()
+
+        from app.core.state_store import clear_state_store
+
+        clear_state_store()
+
         await close_async_http_client()
         logger.info(f"Shutting down {settings.APP_NAME}")
 
+        from app.core.loop_monitor import clear_loop_monitor
+
+        clear_loop_monitor()
+
+        # span 내보내기 대기분 기록
+        from app.telemetry.tracing import clear_span_buffer
+
+        clear_span_buffer()
+
+        # 로그 writer 스레드 종료 (큐에 남은 로그 출력, 마지막에)
+        shutdown_logging()
+
         # TODO: 향후 추가될 정리 작업
         # - 데이터베이스 연결 종료
         # - 캐시 연결 종료
@@ -245,3 +343,21 @@ app.include_router(rag_documents.router, tags=["RAG Documents Ingest"])
 # Feedback Internal API (A6)
 # - POST /internal/ai/feedback: Backend → AI 피드백 수신
 app.include_router(feedback.router, tags=["Feedback"])
+
+# Personalization Cache Internal API
+# - POST /internal/ai/personalization/invalidate: Backend → AI 개인화 facts 캐시 무효화
+app.include_router(personalization.router, tags=["Personalization"])
+
+# Metrics (Prometheus text exposition, 모든 워커 합산)
+# - GET /metrics: upstream latency 히스토그램, 큐 길이, 캐시 적중률
+app.include_router(metrics.router, tags=["Metrics"])
+
+# Video Progress Internal API (교육영상 시청 진행률)
+# - POST /internal/ai/video-progress: 진행률 heartbeat
+# - POST /internal/ai/video-progress/batch: 여러 세션 heartbeat 일괄 처리
+app.include_router(video_progress.router, tags=["Video Progress"])
+
+# Traces Internal API (요청 단위 span, 프로세스 링 버퍼)
+# - GET /internal/ai/traces: 최근 trace 요약
+# - GET /internal/ai/traces/{trace_id}: 단계별 span
+app.include_router(traces.router, tags=["Traces"])
@@ -21,7 +21,7 @@ Phase 22: 교육영상 진행률 모델 (Video Progress Models)
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -161,6 +161,30 @@ class VideoProgressUpdateResponse(BaseModel):
     playback_rate_enforced: bool = Field(False, description="배속 강제 조정 여부")
 
 
+class VideoProgressBatchRequest(BaseModel):
+    """영상 진행률 일괄 업데이트 요청 (여러 세션 heartbeat 묶음).
+
+    Attributes:
+        updates: 진행률 업데이트 요청 목록 (최대 100건)
+    """
+
+    updates: List[VideoProgressUpdateRequest] = Field(
+        ..., min_length=1, max_length=100, description="진행률 업데이트 요청 목록"
+    )
+
+
+class VideoProgressBatchResponse(BaseModel):
+    """영상 진행률 일괄 업데이트 응답.
+
+    Attributes:
+        results: 요청 순서대로의 업데이트 응답
+        accepted_count: 수락된 업데이트 수
+    """
+
+    results: List[VideoProgressUpdateResponse] = Field(..., description="요청별 응답")
+    accepted_count: int = Field(0, ge=0, description="수락된 업데이트 수")
+
+
 # =============================================================================
 # Video Complete Request/Response
 # =============================================================================
@@ -278,11 +278,13 @@ class RenderedAssets:
         thumbnail_path: 썸네일 이미지 경로
         subtitle_path: 자막 파일 경로
         duration_sec: 영상 길이 (초)
+        scene_fingerprints: 씬 ID → 입력 fingerprint (증분 재렌더용, 선택)
     """
     mp4_path: str
     thumbnail_path: str
     subtitle_path: str
     duration_sec: float
+    scene_fingerprints: Dict[str, str] = field(default_factory=dict)
 
 
 @dataclass
@@ -516,6 +518,10 @@ class RenderJobDetailResponse(BaseModel):
     created_at: Optional[str] = Field(None, description="생성 시각 (ISO 8601)")
     started_at: Optional[str] = Field(None, description="시작 시각 (ISO 8601)")
     finished_at: Optional[str] = Field(None, description="종료 시각 (ISO 8601)")
+    metrics: Optional[Dict[str, Any]] = Field(
+        None,
+        description="단계별 렌더 측정값 (wall/CPU 시간, 자식 프로세스 수, 쓰기량, 최대 RSS)",
+    )
 
 
 class RenderJobListResponse(BaseModel):
@@ -5,19 +5,31 @@ Phase 33: Render Job Repository
 
 SQLite 기반으로 서버 재시작 후에도 잡 상태를 유지합니다.
 
+- WAL 모드: 파이프라인 쓰기 중에도 API 조회가 막히지 않음
+- AsyncRenderJobRepository: 전용 DB 스레드에서 실행하는 async 파사드
+  (이벤트 루프 블로킹 방지, 진행률 쓰기는 잡별로 interval당 최대 1회로 병합)
+
 환경변수:
 - RENDER_JOB_DB_PATH: DB 파일 경로 (기본: ./data/render_jobs.db)
+
+설정 (Settings):
+- RENDER_PROGRESS_FLUSH_INTERVAL_SEC: 진행률 쓰기 병합 간격 (기본: 1.0초)
 """
 
+import asyncio
 import json
 import os
 import sqlite3
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.models.video_render import RenderJobStatus, RenderStep, normalize_job_status
 
@@ -44,6 +56,7 @@ class RenderJobEntity:
         error_message: 에러 메시지 (nullable)
         assets: 에셋 JSON (video_url, subtitle_url, thumbnail_url)
         render_spec_json: Phase 38 - 렌더 스펙 스냅샷 (Job 시작 시 저장)
+        render_metrics: 단계별 렌더 측정값 (RenderProfiler.to_dict())
         created_by: 생성자 ID
         created_at: 생성 시각
         updated_at: 수정 시각
@@ -69,6 +82,7 @@ class RenderJobEntity:
         updated_at: Optional[datetime] = None,
         started_at: Optional[datetime] = None,
         finished_at: Optional[datetime] = None,
+        render_metrics: Optional[Dict[str, Any]] = None,
     ):
         self.job_id = job_id
         self.video_id = video_id
@@ -90,6 +104,7 @@ class RenderJobEntity:
         self.updated_at = updated_at or datetime.utcnow()
         self.started_at = started_at
         self.finished_at = finished_at
+        self.render_metrics = render_metrics
 
     def is_active(self) -> bool:
         """활성 상태(QUEUED/PROCESSING)인지 확인."""
@@ -122,6 +137,7 @@ class RenderJobEntity:
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "render_metrics": self.render_metrics,
         }
 
     @classmethod
@@ -130,7 +146,8 @@ class RenderJobEntity:
         (
             job_id, video_id, script_id, status, step,
             progress, message, error_code, error_message, assets_json,
-            render_spec_json_str, created_by, created_at, updated_at, started_at, finished_at
+            render_spec_json_str, created_by, created_at, updated_at, started_at, finished_at,
+            render_metrics_str,
         ) = row
 
         return cls(
@@ -150,6 +167,7 @@ class RenderJobEntity:
             updated_at=datetime.fromisoformat(updated_at) if updated_at else None,
             started_at=datetime.fromisoformat(started_at) if started_at else None,
             finished_at=datetime.fromisoformat(finished_at) if finished_at else None,
+            render_metrics=json.loads(render_metrics_str) if render_metrics_str else None,
         )
 
 
@@ -191,10 +209,17 @@ class RenderJobRepository:
         self._init_db()
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Thread-local DB 연결 반환."""
+        """Thread-local DB 연결 반환.
+
+        SQL 문은 모두 상수 문자열이므로 연결별 statement cache에서
+        prepared statement로 재사용됩니다.
+        """
         if not hasattr(self._local, "connection"):
-            self._local.connection = sqlite3.connect(self._db_path)
-            self._local.connection.row_factory = sqlite3.Row
+            conn = sqlite3.connect(self._db_path, timeout=5.0, cached_statements=128)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = conn
         return self._local.connection
 
     @contextmanager
@@ -233,7 +258,8 @@ class RenderJobRepository:
             created_at TEXT NOT NULL,
             updated_at TEXT NOT NULL,
             started_at TEXT,
-            finished_at TEXT
+            finished_at TEXT,
+            render_metrics TEXT
         )
         """
 
@@ -255,6 +281,9 @@ class RenderJobRepository:
         # Phase 38: 기존 DB에 render_spec_json 컬럼 추가 (마이그레이션)
         self._migrate_add_render_spec_json()
 
+        # 단계별 렌더 측정값 컬럼 추가 (마이그레이션)
+        self._migrate_add_render_metrics()
+
         # 상태값 정규화 마이그레이션 (RUNNING → PROCESSING 등)
         self._migrate_normalize_status_values()
 
@@ -275,6 +304,20 @@ class RenderJobRepository:
         except Exception as e:
             logger.warning(f"Migration check failed (may already exist): {e}")
 
+    def _migrate_add_render_metrics(self) -> None:
+        """render_metrics 컬럼 마이그레이션."""
+        try:
+            with self._get_cursor() as cursor:
+                cursor.execute("PRAGMA table_info(render_jobs)")
+                columns = [row[1] for row in cursor.fetchall()]
+                if "render_metrics" not in columns:
+                    cursor.execute(
+                        "ALTER TABLE render_jobs ADD COLUMN render_metrics TEXT"
+                    )
+                    logger.info("Migration: Added render_metrics column to render_jobs")
+        except Exception as e:
+            logger.warning(f"Migration check failed (may already exist): {e}")
+
     def _migrate_normalize_status_values(self) -> None:
         """상태값 정규화 마이그레이션.
 
@@ -325,8 +368,9 @@ class RenderJobRepository:
         INSERT OR REPLACE INTO render_jobs (
             job_id, video_id, script_id, status, step,
             progress, message, error_code, error_message, assets,
-            render_spec_json, created_by, created_at, updated_at, started_at, finished_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            render_spec_json, created_by, created_at, updated_at, started_at, finished_at,
+            render_metrics
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
 
         with self._get_cursor() as cursor:
@@ -347,6 +391,7 @@ class RenderJobRepository:
                 job.updated_at.isoformat() if job.updated_at else None,
                 job.started_at.isoformat() if job.started_at else None,
                 job.finished_at.isoformat() if job.finished_at else None,
+                json.dumps(job.render_metrics) if job.render_metrics else None,
             ))
 
         logger.debug(f"RenderJob saved: job_id={job.job_id}, status={normalized_status}")
@@ -356,7 +401,8 @@ class RenderJobRepository:
         sql = """
         SELECT job_id, video_id, script_id, status, step,
                progress, message, error_code, error_message, assets,
-               render_spec_json, created_by, created_at, updated_at, started_at, finished_at
+               render_spec_json, created_by, created_at, updated_at, started_at, finished_at,
+               render_metrics
         FROM render_jobs
         WHERE job_id = ?
         """
@@ -378,7 +424,8 @@ class RenderJobRepository:
         sql = """
         SELECT job_id, video_id, script_id, status, step,
                progress, message, error_code, error_message, assets,
-               render_spec_json, created_by, created_at, updated_at, started_at, finished_at
+               render_spec_json, created_by, created_at, updated_at, started_at, finished_at,
+               render_metrics
         FROM render_jobs
         WHERE video_id = ?
         ORDER BY created_at DESC
@@ -397,7 +444,8 @@ class RenderJobRepository:
         sql = """
         SELECT job_id, video_id, script_id, status, step,
                progress, message, error_code, error_message, assets,
-               render_spec_json, created_by, created_at, updated_at, started_at, finished_at
+               render_spec_json, created_by, created_at, updated_at, started_at, finished_at,
+               render_metrics
         FROM render_jobs
         WHERE video_id = ? AND status IN ('QUEUED', 'PROCESSING')
         ORDER BY created_at DESC
@@ -416,7 +464,8 @@ class RenderJobRepository:
         sql = """
         SELECT job_id, video_id, script_id, status, step,
                progress, message, error_code, error_message, assets,
-               render_spec_json, created_by, created_at, updated_at, started_at, finished_at
+               render_spec_json, created_by, created_at, updated_at, started_at, finished_at,
+               render_metrics
         FROM render_jobs
         WHERE video_id = ? AND status = 'COMPLETED'
         ORDER BY finished_at DESC
@@ -435,7 +484,8 @@ class RenderJobRepository:
         sql = """
         SELECT job_id, video_id, script_id, status, step,
                progress, message, error_code, error_message, assets,
-               render_spec_json, created_by, created_at, updated_at, started_at, finished_at
+               render_spec_json, created_by, created_at, updated_at, started_at, finished_at,
+               render_metrics
         FROM render_jobs
         WHERE video_id = ? AND status = 'COMPLETED' AND assets IS NOT NULL
         ORDER BY finished_at DESC
@@ -452,6 +502,27 @@ class RenderJobRepository:
                     return job
         return None
 
+    def get_pending_jobs(self, limit: int = 1000) -> List[RenderJobEntity]:
+        """대기/실행 중(QUEUED/PROCESSING) 잡 조회 (큐 진입 순).
+
+        재시작 시 렌더 스케줄러가 큐를 복원하는 데 사용합니다.
+        QUEUED 전환 시 updated_at이 갱신되므로 updated_at 오름차순이 큐 순서입니다.
+        """
+        sql = """
+        SELECT job_id, video_id, script_id, status, step,
+               progress, message, error_code, error_message, assets,
+               render_spec_json, created_by, created_at, updated_at, started_at, finished_at,
+               render_metrics
+        FROM render_jobs
+        WHERE status IN ('QUEUED', 'PROCESSING')
+        ORDER BY updated_at ASC
+        LIMIT ?
+        """
+
+        with self._get_cursor() as cursor:
+            cursor.execute(sql, (limit,))
+            return [RenderJobEntity.from_row(tuple(row)) for row in cursor.fetchall()]
+
     def update_status(
         self,
         job_id: str,
@@ -501,6 +572,35 @@ class RenderJobRepository:
             cursor.execute(sql, params)
             return cursor.rowcount > 0
 
+    def update_progress(
+        self,
+        job_id: str,
+        step: Optional[str] = None,
+        progress: Optional[int] = None,
+        message: Optional[str] = None,
+    ) -> bool:
+        """PROCESSING 잡의 진행 정보만 업데이트.
+
+        status는 바꾸지 않으며, 이미 종료/취소된 잡에는 적용되지 않습니다
+        (지연 flush된 진행률이 종료 상태를 덮어쓰지 않도록).
+        """
+        sql = """
+        UPDATE render_jobs
+        SET step = COALESCE(?, step), progress = COALESCE(?, progress),
+            message = COALESCE(?, message), updated_at = ?
+        WHERE job_id = ? AND status = 'PROCESSING'
+        """
+
+        with self._get_cursor() as cursor:
+            cursor.execute(sql, (
+                step,
+                progress,
+                message,
+                datetime.utcnow().isoformat(),
+                job_id,
+            ))
+            return cursor.rowcount > 0
+
     def update_assets(
         self,
         job_id: str,
@@ -573,6 +673,22 @@ class RenderJobRepository:
                 logger.info(f"Render spec saved: job_id={job_id}")
             return updated
 
+    def update_metrics(
+        self,
+        job_id: str,
+        render_metrics: Dict[str, Any],
+    ) -> bool:
+        """잡의 단계별 렌더 측정값 업데이트."""
+        sql = """
+        UPDATE render_jobs
+        SET render_metrics = ?
+        WHERE job_id = ?
+        """
+
+        with self._get_cursor() as cursor:
+            cursor.execute(sql, (json.dumps(render_metrics), job_id))
+            return cursor.rowcount > 0
+
     def delete(self, job_id: str) -> bool:
         """잡 삭제."""
         sql = "DELETE FROM render_jobs WHERE job_id = ?"
@@ -596,6 +712,190 @@ class RenderJobRepository:
             del self._local.connection
 
 
+# =============================================================================
+# Async Facade
+# =============================================================================
+
+
+class AsyncRenderJobRepository:
+    """RenderJobRepository async 파사드.
+
+    모든 DB 호출을 단일 전용 스레드에서 순서대로 실행하여 이벤트 루프를
+    막지 않습니다. 단일 스레드이므로 쓰기 순서가 호출 순서와 같습니다.
+
+    진행률(update_progress)은 잡별로 interval당 최대 1회만 기록하고,
+    그 사이 값은 마지막 값으로 병합해 interval이 끝날 때 기록합니다.
+    상태 전환(update_status)은 즉시 기록하며 대기 중인 진행률은 버리고,
+    update_error는 실패 단계가 남도록 대기 중인 진행률을 먼저 기록합니다.
+
+    Usage:
+        db = AsyncRenderJobRepository(get_render_job_repository())
+
+        await db.update_status(job_id, "PROCESSING")
+        await db.update_progress(job_id, step="GENERATE_TTS", progress=10)
+        job = await db.get(job_id)
+    """
+
+    def __init__(
+        self,
+        repository: RenderJobRepository,
+        progress_interval_sec: Optional[float] = None,
+    ):
+        """파사드 초기화.
+
+        Args:
+            repository: 동기 저장소
+            progress_interval_sec: 진행률 쓰기 병합 간격 (None이면 RENDER_PROGRESS_FLUSH_INTERVAL_SEC)
+        """
+        if progress_interval_sec is None:
+            progress_interval_sec = get_settings().RENDER_PROGRESS_FLUSH_INTERVAL_SEC
+
+        self._repository = repository
+        self._progress_interval = max(0.0, progress_interval_sec)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="render-job-db")
+        self._last_progress_write: Dict[str, float] = {}
+        self._pending_progress: Dict[str, Tuple[Optional[str], Optional[int], Optional[str]]] = {}
+        self._flush_tasks: Dict[str, asyncio.Task] = {}
+
+    @property
+    def repository(self) -> RenderJobRepository:
+        """동기 저장소."""
+        return self._repository
+
+    async def _run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """DB 스레드에서 실행."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    # -------------------------------------------------------------------------
+    # 조회 / 저장
+    # -------------------------------------------------------------------------
+
+    async def get(self, job_id: str) -> Optional[RenderJobEntity]:
+        """잡 조회."""
+        return await self._run(self._repository.get, job_id)
+
+    async def get_active_by_video_id(self, video_id: str) -> Optional[RenderJobEntity]:
+        """비디오 ID로 활성 잡 조회."""
+        return await self._run(self._repository.get_active_by_video_id, video_id)
+
+    async def get_pending_jobs(self, limit: int = 1000) -> List[RenderJobEntity]:
+        """대기/실행 중 잡 조회 (큐 진입 순)."""
+        return await self._run(self._repository.get_pending_jobs, limit)
+
+    async def save(self, job: RenderJobEntity) -> None:
+        """잡 저장."""
+        self._discard_progress(job.job_id)
+        await self._run(self._repository.save, job)
+
+    async def update_status(
+        self,
+        job_id: str,
+        status: str,
+        step: Optional[str] = None,
+        progress: Optional[int] = None,
+        message: Optional[str] = None,
+    ) -> bool:
+        """잡 상태 업데이트 (즉시 기록)."""
+        self._discard_progress(job_id)
+        return await self._run(
+            self._repository.update_status,
+            job_id=job_id,
+            status=status,
+            step=step,
+            progress=progress,
+            message=message,
+        )
+
+    async def update_assets(self, job_id: str, assets: Dict[str, Any]) -> bool:
+        """잡 에셋 업데이트."""
+        return await self._run(self._repository.update_assets, job_id, assets)
+
+    async def update_error(self, job_id: str, error_code: str, error_message: str) -> bool:
+        """잡 에러 정보 업데이트 (즉시 기록).
+
+        실패 단계가 남도록 대기 중인 진행률을 먼저 기록합니다.
+        """
+        await self.flush_progress(job_id)
+        self._discard_progress(job_id)
+        return await self._run(
+            self._repository.update_error,
+            job_id=job_id,
+            error_code=error_code,
+            error_message=error_message,
+        )
+
+    async def update_render_spec(self, job_id: str, render_spec_json: Dict[str, Any]) -> bool:
+        """잡의 render_spec_json 업데이트."""
+        return await self._run(self._repository.update_render_spec, job_id, render_spec_json)
+
+    async def update_metrics(self, job_id: str, render_metrics: Dict[str, Any]) -> bool:
+        """잡의 단계별 렌더 측정값 업데이트."""
+        return await self._run(self._repository.update_metrics, job_id, render_metrics)
+
+    # -------------------------------------------------------------------------
+    # 진행률 병합
+    # -------------------------------------------------------------------------
+
+    async def update_progress(
+        self,
+        job_id: str,
+        step: Optional[str] = None,
+        progress: Optional[int] = None,
+        message: Optional[str] = None,
+    ) -> None:
+        """진행률 업데이트 (잡별 interval당 최대 1회 기록)."""
+        now = time.monotonic()
+        last = self._last_progress_write.get(job_id)
+
+        if job_id not in self._flush_tasks and (
+            last is None or now - last >= self._progress_interval
+        ):
+            self._last_progress_write[job_id] = now
+            await self._run(self._repository.update_progress, job_id, step, progress, message)
+            return
+
+        self._pending_progress[job_id] = (step, progress, message)
+        if job_id not in self._flush_tasks:
+            delay = self._progress_interval - (now - last)
+            self._flush_tasks[job_id] = asyncio.create_task(
+                self._flush_later(job_id, delay)
+            )
+
+    async def flush_progress(self, job_id: Optional[str] = None) -> None:
+        """대기 중인 진행률을 즉시 기록 (job_id 없으면 전체)."""
+        job_ids = [job_id] if job_id else list(self._pending_progress)
+        for jid in job_ids:
+            task = self._flush_tasks.pop(jid, None)
+            if task is not None:
+                task.cancel()
+            pending = self._pending_progress.pop(jid, None)
+            if pending is None:
+                continue
+            self._last_progress_write[jid] = time.monotonic()
+            await self._run(self._repository.update_progress, jid, *pending)
+
+    async def _flush_later(self, job_id: str, delay: float) -> None:
+        """interval 종료 시 마지막 진행률 기록."""
+        await asyncio.sleep(delay)
+        self._flush_tasks.pop(job_id, None)
+        await self.flush_progress(job_id)
+
+    def _discard_progress(self, job_id: str) -> None:
+        """상태 전환 시 대기 중인 진행률 폐기."""
+        self._pending_progress.pop(job_id, None)
+        self._last_progress_write.pop(job_id, None)
+        task = self._flush_tasks.pop(job_id, None)
+        if task is not None:
+            task.cancel()
+
+    async def close(self) -> None:
+        """대기 중인 진행률 기록 후 DB 스레드 종료."""
+        await self.flush_progress()
+        await self._run(self._repository.close)
+        self._executor.shutdown(wait=False)
+
+
 # =============================================================================
 # Singleton Instance
 # =============================================================================
@@ -20,6 +20,7 @@ from app.models.ai_log import AILogEntry, AILogRequest, AILogResponse, to_backen
 from app.models.chat import ChatRequest, ChatResponse
 from app.models.intent import MaskingStage, PiiMaskResult
 from app.services.pii_service import PiiService
+from app.telemetry.tracing import span
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -155,6 +156,7 @@ class AILogService:
 
         return question_result.masked_text, answer_result.masked_text
 
+    @span("ai_log.post")
     async def send_log(self, log_entry: AILogEntry) -> bool:
         """
         AI 로그를 백엔드로 전송합니다.
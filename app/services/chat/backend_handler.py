@@ -10,19 +10,68 @@ Phase 2 리팩토링:
 역할×도메인×의도 매핑:
 - BACKEND_API: 직접 백엔드 데이터만 사용
 - MIXED_BACKEND_RAG: RAG + 백엔드 데이터 조합
+
+컨텍스트 캐시:
+- 포맷된 LLM 컨텍스트를 (엔드포인트, 사용자/부서) 단위로 캐시 (엔드포인트별 TTL)
+- 부서 통계는 부서 단위로 공유되어 같은 부서 관리자끼리 재사용
+- 동일 키 동시 조회는 1회 백엔드 호출로 합침 (single-flight)
+- prefetch: 라우팅 확정 전 추측성 조회로 캐시를 미리 채움
 """
 
-from typing import Optional
+from typing import Any, Awaitable, Callable, Dict, Optional
 
-from app.clients.backend_client import BackendDataClient
+from app.clients.backend_client import BackendDataClient, BackendDataResponse
 from app.core.backend_context import check_backend_allowed
+from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.models.intent import IntentType, UserRole
 from app.services.backend_context_formatter import BackendContextFormatter
+from app.utils.cache import SingleFlight, TTLCache
 
 logger = get_logger(__name__)
 
 
+# =============================================================================
+# 백엔드 컨텍스트 캐시
+# =============================================================================
+
+# 캐시 엔드포인트 식별자
+ENDPOINT_EDU_STATUS = "edu_status"
+ENDPOINT_DEPT_EDU_STATS = "dept_edu_stats"
+ENDPOINT_INCIDENT_OVERVIEW = "incident_overview"
+ENDPOINT_REPORT_GUIDE = "report_guide"
+
+# 엔드포인트별 캐시 TTL (초)
+# 개인 현황은 짧게, 집계/안내성 데이터는 길게 유지합니다.
+ENDPOINT_CACHE_TTL_SECONDS: Dict[str, float] = {
+    ENDPOINT_EDU_STATUS: 60,
+    ENDPOINT_DEPT_EDU_STATS: 300,
+    ENDPOINT_INCIDENT_OVERVIEW: 120,
+    ENDPOINT_REPORT_GUIDE: 3600,
+}
+
+_context_cache: Optional[TTLCache[str]] = None
+_context_flight: SingleFlight[str] = SingleFlight()
+
+
+def get_backend_context_cache() -> TTLCache[str]:
+    """백엔드 컨텍스트 캐시 싱글톤 인스턴스 반환."""
+    global _context_cache
+    if _context_cache is None:
+        _context_cache = TTLCache(
+            maxsize=get_settings().BACKEND_CONTEXT_CACHE_MAXSIZE,
+            ttl_seconds=60,
+            name="backend_context",
+        )
+    return _context_cache
+
+
+def clear_backend_context_cache() -> None:
+    """백엔드 컨텍스트 캐시 초기화 (테스트용)."""
+    global _context_cache
+    _context_cache = None
+
+
 class BackendHandler:
     """
     백엔드 데이터 조회를 처리하는 핸들러 클래스.
@@ -88,27 +137,15 @@ class BackendHandler:
         try:
             # EMPLOYEE × EDU_STATUS: 본인 교육 현황
             if user_role == UserRole.EMPLOYEE and intent == IntentType.EDU_STATUS:
-                response = await self._backend_data.get_employee_edu_status(user_id)
-                if response.success:
-                    return self._context_formatter.format_edu_status_for_llm(
-                        response.data
-                    )
+                return await self._get_edu_status_context(user_id)
 
             # EMPLOYEE × INCIDENT_REPORT: 신고 안내
             elif user_role == UserRole.EMPLOYEE and intent == IntentType.INCIDENT_REPORT:
-                response = await self._backend_data.get_report_guide()
-                if response.success:
-                    return self._context_formatter.format_report_guide_for_llm(
-                        response.data
-                    )
+                return await self._get_report_guide_context()
 
             # ADMIN × EDU_STATUS: 부서 교육 통계
             elif user_role == UserRole.ADMIN and intent == IntentType.EDU_STATUS:
-                response = await self._backend_data.get_department_edu_stats(department)
-                if response.success:
-                    return self._context_formatter.format_edu_stats_for_llm(
-                        response.data
-                    )
+                return await self._get_dept_edu_stats_context(department)
 
             # 기타 조합: 데이터 없음
             logger.debug(
@@ -156,27 +193,15 @@ class BackendHandler:
         try:
             # ADMIN × INCIDENT: 사고 현황 통계
             if user_role == UserRole.ADMIN and domain == "INCIDENT":
-                response = await self._backend_data.get_incident_overview()
-                if response.success:
-                    return self._context_formatter.format_incident_overview_for_llm(
-                        response.data
-                    )
+                return await self._get_incident_overview_context()
 
             # ADMIN × EDU_STATUS: 부서 교육 통계 (MIXED에서도 사용 가능)
             elif user_role == UserRole.ADMIN and intent == IntentType.EDU_STATUS:
-                response = await self._backend_data.get_department_edu_stats(department)
-                if response.success:
-                    return self._context_formatter.format_edu_stats_for_llm(
-                        response.data
-                    )
+                return await self._get_dept_edu_stats_context(department)
 
             # INCIDENT_MANAGER × INCIDENT: 사고 현황
             elif user_role == UserRole.INCIDENT_MANAGER and domain == "INCIDENT":
-                response = await self._backend_data.get_incident_overview()
-                if response.success:
-                    return self._context_formatter.format_incident_overview_for_llm(
-                        response.data
-                    )
+                return await self._get_incident_overview_context()
 
             # 기타 조합: 데이터 없음
             logger.debug(
@@ -188,3 +213,124 @@ class BackendHandler:
         except Exception as e:
             logger.warning(f"Mixed backend data fetch failed: {e}")
             return ""
+
+    async def prefetch(
+        self,
+        user_role: UserRole,
+        domain: str,
+        user_id: str,
+        department: Optional[str] = None,
+    ) -> None:
+        """
+        라우팅 확정 전에 백엔드 컨텍스트를 추측성으로 조회하여 캐시를 채웁니다.
+
+        RuleRouter가 높은 신뢰도로 BACKEND_API를 예측한 경우 PII 마스킹과
+        겹쳐서 실행됩니다. 이후 fetch_for_api/fetch_for_mixed는 캐시 또는
+        진행 중인 조회 결과를 그대로 사용합니다. 실패는 무시합니다.
+
+        Args:
+            user_role: 사용자 역할
+            domain: RuleRouter가 예측한 도메인 (EDU, INCIDENT 등)
+            user_id: 사용자 ID
+            department: 부서 ID
+        """
+        check_backend_allowed("BackendHandler.prefetch")
+
+        try:
+            if domain == "EDU":
+                if user_role == UserRole.EMPLOYEE:
+                    await self._get_edu_status_context(user_id)
+                elif user_role == UserRole.ADMIN:
+                    await self._get_dept_edu_stats_context(department)
+            elif domain == "INCIDENT":
+                if user_role == UserRole.EMPLOYEE:
+                    await self._get_report_guide_context()
+                else:
+                    await self._get_incident_overview_context()
+        except Exception as e:
+            logger.debug(f"Backend context prefetch failed: {e}")
+
+    # =========================================================================
+    # 엔드포인트별 캐시 조회
+    # =========================================================================
+
+    async def _get_edu_status_context(self, user_id: str) -> str:
+        """직원 교육 현황 컨텍스트 (사용자 단위 캐시)."""
+        return await self._get_cached_context(
+            ENDPOINT_EDU_STATUS,
+            user_id,
+            lambda: self._backend_data.get_employee_edu_status(user_id),
+            self._context_formatter.format_edu_status_for_llm,
+        )
+
+    async def _get_dept_edu_stats_context(self, department: Optional[str]) -> str:
+        """부서 교육 통계 컨텍스트 (부서 단위 캐시)."""
+        return await self._get_cached_context(
+            ENDPOINT_DEPT_EDU_STATS,
+            department or "",
+            lambda: self._backend_data.get_department_edu_stats(department),
+            self._context_formatter.format_edu_stats_for_llm,
+        )
+
+    async def _get_incident_overview_context(self) -> str:
+        """사고 현황 컨텍스트 (전역 캐시)."""
+        return await self._get_cached_context(
+            ENDPOINT_INCIDENT_OVERVIEW,
+            "",
+            self._backend_data.get_incident_overview,
+            self._context_formatter.format_incident_overview_for_llm,
+        )
+
+    async def _get_report_guide_context(self) -> str:
+        """신고 안내 컨텍스트 (전역 캐시)."""
+        return await self._get_cached_context(
+            ENDPOINT_REPORT_GUIDE,
+            "",
+            self._backend_data.get_report_guide,
+            self._context_formatter.format_report_guide_for_llm,
+        )
+
+    async def _get_cached_context(
+        self,
+        endpoint: str,
+        subject: str,
+        fetch: Callable[[], Awaitable[BackendDataResponse]],
+        format_for_llm: Callable[[Dict[str, Any]], str],
+    ) -> str:
+        """
+        포맷된 백엔드 컨텍스트를 캐시에서 조회하거나 백엔드에서 가져옵니다.
+
+        조회 실패(success=False)는 캐시하지 않고 빈 문자열을 반환합니다.
+
+        Args:
+            endpoint: 엔드포인트 식별자 (ENDPOINT_*)
+            subject: 캐시 대상 (user_id, 부서 ID, 전역이면 빈 문자열)
+            fetch: BackendDataClient 호출 코루틴 팩토리
+            format_for_llm: 응답 데이터를 LLM 컨텍스트로 변환하는 함수
+
+        Returns:
+            str: LLM 컨텍스트용 텍스트
+        """
+        if not get_settings().BACKEND_CONTEXT_CACHE_ENABLED:
+            response = await fetch()
+            return format_for_llm(response.data) if response.success else ""
+
+        cache = get_backend_context_cache()
+        cache_key = f"{endpoint}|{subject}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        async def _load() -> str:
+            response = await fetch()
+            if not response.success:
+                return ""
+            context = format_for_llm(response.data)
+            cache.set(
+                cache_key,
+                context,
+                ttl_seconds=ENDPOINT_CACHE_TTL_SECONDS.get(endpoint),
+            )
+            return context
+
+        return await _context_flight.do(cache_key, _load)
@@ -76,6 +76,7 @@ from app.core.metrics import (
     metrics,
 )
 from app.models.chat import ChatRequest, ChatSource
+from app.telemetry.tracing import span
 from app.utils.debug_log import dbg_final_query, dbg_retrieval_top5, dbg_retrieval_target
 from app.core.retrieval_context import (
     is_retrieval_blocked,
@@ -604,11 +605,13 @@ class RagHandler:
         # Phase 48: Low-relevance Gate 적용
         # 저관련 검색 결과를 sources=[]로 강등
         if sources and not failed:
-            sources, gate_reason = apply_low_relevance_gate(
-                sources=sources,
-                query=query,  # 원본 쿼리 사용 (마스킹 토큰 포함)
-                domain=domain,
-            )
+            with span("rag.gate", source_count=len(sources)) as current:
+                sources, gate_reason = apply_low_relevance_gate(
+                    sources=sources,
+                    query=query,  # 원본 쿼리 사용 (마스킹 토큰 포함)
+                    domain=domain,
+                )
+                current.set_attributes(kept_count=len(sources), gate_reason=gate_reason or "")
             # gate_reason은 로깅용으로만 사용 (함수 내에서 이미 로깅됨)
 
         return sources, failed, retriever
@@ -142,6 +142,7 @@ from app.services.router_orchestrator import (
     OrchestrationResult,
     RouterOrchestrator,
 )
+from app.services.rule_router import RuleRouter
 from app.services.video_progress_service import VideoProgressService
 from app.services.answer_guard_service import (
     AnswerGuardService,
@@ -157,6 +158,7 @@ from app.utils.debug_log import (
     is_debug_enabled,
 )
 from app.telemetry.emitters import emit_chat_turn_once, emit_security_event_once
+from app.telemetry.tracing import span
 from app.telemetry.metrics import (
     set_rag_metrics,
     rag_metrics_to_rag_info,
@@ -171,6 +173,7 @@ from app.core.retrieval_context import (
     reset_retrieval_context,
 )
 from app.core.backend_context import (
+    is_backend_blocked,
     set_backend_blocked,
     reset_backend_context,
 )
@@ -409,6 +412,10 @@ class ChatService:
         self._personalization_client = personalization_client or PersonalizationClient()
         self._answer_generator = answer_generator or AnswerGenerator(llm_client=self._llm)
 
+        # 백엔드 컨텍스트 프리페치: 라우트 예측용 RuleRouter (키워드 기반, 로컬)
+        self._prefetch_router = RuleRouter()
+        self._prefetch_tasks: set = set()
+
         # Phase 50: 금지질문 필터 초기화
         settings = get_settings()
         if settings.FORBIDDEN_QUERY_FILTER_ENABLED:
@@ -418,6 +425,7 @@ class ChatService:
         else:
             self._forbidden_filter = None
 
+    @span("chat.turn")
     async def handle_chat(self, req: ChatRequest) -> ChatResponse:
         """
         Handle a chat request and generate a response using full pipeline.
@@ -485,7 +493,9 @@ class ChatService:
         forbidden_result: Optional[ForbiddenCheckResult] = None
 
         if self._forbidden_filter is not None:
-            forbidden_result = self._forbidden_filter.check(user_query)
+            with span("forbidden_check") as current:
+                forbidden_result = self._forbidden_filter.check(user_query)
+                current.set_attribute("is_forbidden", forbidden_result.is_forbidden)
             if forbidden_result.is_forbidden:
                 logger.warning(
                     f"Forbidden query detected: rule_id={forbidden_result.matched_rule_id}, "
@@ -625,6 +635,10 @@ class ChatService:
                 ),
             )
 
+        # 백엔드 컨텍스트 프리페치: 마스킹/차단 게이트를 모두 통과한 뒤 시작하여
+        # 라우팅(Router Orchestrator LLM 호출, 의도 분류)과 병렬로 조회
+        self._start_backend_prefetch(req, masked_query)
+
         # =====================================================================
         # Phase 22: Router Orchestrator Integration (Optional)
         # =====================================================================
@@ -995,13 +1009,15 @@ class ChatService:
         )
 
         # Answerability 체크
-        is_answerable, no_evidence_template = self._answer_guard.check_answerability(
-            intent=tier0_intent,
-            sources=sources,
-            route_type=router_route_type,
-            top_k=5,  # 기본 topK 값
-            debug_info=debug_info,
-        )
+        with span("answer_guard.answerability", source_count=len(sources)) as current:
+            is_answerable, no_evidence_template = self._answer_guard.check_answerability(
+                intent=tier0_intent,
+                sources=sources,
+                route_type=router_route_type,
+                top_k=5,  # 기본 topK 값
+                debug_info=debug_info,
+            )
+            current.set_attribute("answerable", is_answerable)
 
         if not is_answerable:
             # 답변 불가 - 고정 템플릿으로 즉시 종료
@@ -1436,6 +1452,7 @@ class ChatService:
             meta=meta,
         )
 
+    @span("ai_log.send")
     async def _send_ai_log(
         self,
         req: ChatRequest,
@@ -1518,6 +1535,7 @@ class ChatService:
             # 로그 생성/전송 실패는 메인 로직에 영향 주지 않음
             logger.warning(f"Failed to send AI log: {e}")
 
+    @span("prompt.build")
     def _build_llm_messages(
         self,
         user_query: str,
@@ -1610,6 +1628,60 @@ class ChatService:
     # Phase 11: Backend 데이터 조회 헬퍼 (BackendHandler로 위임)
     # =========================================================================
 
+    def _start_backend_prefetch(self, req: ChatRequest, user_query: str) -> None:
+        """
+        RuleRouter가 BACKEND_API를 높은 신뢰도로 예측하면 백엔드 조회를 미리 시작합니다.
+
+        개인화 Q로 매핑되면 PersonalizationClient facts를, 아니면 BackendHandler
+        컨텍스트를 조회합니다. 결과는 각 캐시에 저장되고, 본 조회는 캐시 또는
+        진행 중인 요청(single-flight)을 그대로 사용합니다. 예측/조회 실패는 무시합니다.
+
+        Args:
+            req: ChatRequest
+            user_query: 사용자 질문 (금지질문 필터/PII 마스킹/불만 빠른 경로 통과 후, 마스킹된 값)
+        """
+        try:
+            settings = get_settings()
+            if not settings.BACKEND_CONTEXT_PREFETCH_ENABLED or is_backend_blocked():
+                return
+
+            rule_result = self._prefetch_router.route(user_query)
+            if (
+                rule_result.route_type != RouterRouteType.BACKEND_API
+                or rule_result.requires_confirmation
+                or rule_result.confidence < settings.BACKEND_CONTEXT_PREFETCH_MIN_CONFIDENCE
+            ):
+                return
+
+            q = to_personalization_q(rule_result.sub_intent_id or "", user_query)
+            if q:
+                coro = self._personalization_client.resolve_facts(
+                    sub_intent_id=q,
+                    user_id=req.user_id,
+                    period=extract_period_from_query(user_query),
+                    target_dept_id=None,
+                )
+            else:
+                coro = self._backend_handler.prefetch(
+                    user_role=UserRole((req.user_role or "EMPLOYEE").upper()),
+                    domain=rule_result.domain.value if rule_result.domain else "",
+                    user_id=req.user_id,
+                    department=req.department,
+                )
+        except Exception as e:
+            logger.debug(f"Backend prefetch skipped: {e}")
+            return
+
+        task = asyncio.create_task(coro)
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._on_prefetch_done)
+
+    def _on_prefetch_done(self, task: "asyncio.Task") -> None:
+        """프리페치 태스크 정리 (예외는 소비만 하고 무시)."""
+        self._prefetch_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Backend prefetch failed: {task.exception()}")
+
     async def _fetch_backend_data_for_api(
         self,
         user_role: UserRole,
@@ -1640,6 +1712,7 @@ class ChatService:
     # Phase 11: MIXED_BACKEND_RAG용 LLM 메시지 빌더
     # =========================================================================
 
+    @span("prompt.build", kind="mixed")
     def _build_mixed_llm_messages(
         self,
         user_query: str,
@@ -1715,6 +1788,7 @@ class ChatService:
     # Phase 11: BACKEND_API용 LLM 메시지 빌더
     # =========================================================================
 
+    @span("prompt.build", kind="backend_api")
     def _build_backend_api_llm_messages(
         self,
         user_query: str,
@@ -14,14 +14,16 @@ HTTP 청크 스트리밍으로 AI 응답을 전송하는 서비스입니다.
 import asyncio
 import re
 import time
-from datetime import datetime, timedelta
-from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+from datetime import datetime
+from typing import Any, AsyncGenerator, List, Optional, Tuple
 
 import httpx
 
 from app.clients.http_client import get_async_http_client
 from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.core.metrics import metrics as app_metrics
+from app.core.state_store import StateStore, get_state_store
 from app.models.chat_stream import (
     ChatStreamRequest,
     InFlightRequest,
@@ -34,6 +36,7 @@ from app.models.chat_stream import (
 )
 from app.telemetry.emitters import emit_chat_turn_once
 from app.telemetry.metrics import set_latency_metrics
+from app.telemetry.tracing import record_span
 
 logger = get_logger(__name__)
 
@@ -47,88 +50,94 @@ class InFlightTracker:
     """
     진행 중인 요청을 추적하여 중복을 방지합니다.
 
-    메모리 기반 구현 (Redis 없이).
-    TTL 기반 자동 정리 포함.
+    공유 상태 저장소(StateStore)에 기록하므로 같은 request_id가
+    다른 워커로 들어와도 중복으로 판정됩니다.
+    요청 시작 후 CACHE_TTL_SECONDS가 지나면 저장소 TTL로 자동 정리됩니다.
     """
 
     # 캐시 TTL (초)
     CACHE_TTL_SECONDS = 600  # 10분
-    # 정리 주기 (초)
-    CLEANUP_INTERVAL_SECONDS = 60
-
-    def __init__(self) -> None:
-        self._requests: Dict[str, InFlightRequest] = {}
-        self._last_cleanup = time.time()
-
-    def _cleanup_expired(self) -> None:
-        """만료된 요청 정리."""
-        now = datetime.now()
-        cutoff = now - timedelta(seconds=self.CACHE_TTL_SECONDS)
-
-        expired_keys = [
-            key
-            for key, req in self._requests.items()
-            if req.started_at < cutoff
-        ]
 
-        for key in expired_keys:
-            del self._requests[key]
+    KEY_PREFIX = "chat_in_flight:"
 
-        if expired_keys:
-            logger.debug(f"Cleaned up {len(expired_keys)} expired in-flight requests")
+    def __init__(self, state_store: Optional[StateStore] = None) -> None:
+        self._state_store = state_store
 
-    def is_in_flight(self, request_id: str) -> bool:
-        """요청이 현재 처리 중인지 확인."""
-        # 주기적 정리
-        if time.time() - self._last_cleanup > self.CLEANUP_INTERVAL_SECONDS:
-            self._cleanup_expired()
-            self._last_cleanup = time.time()
+    @property
+    def _state(self) -> StateStore:
+        """상태 저장소 (미지정 시 현재 싱글톤)."""
+        return self._state_store or get_state_store()
 
-        if request_id not in self._requests:
-            return False
+    def _key(self, request_id: str) -> str:
+        return f"{self.KEY_PREFIX}{request_id}"
+
+    def _remaining_ttl(self, started_at: datetime) -> float:
+        """시작 시각 기준 남은 TTL (초)."""
+        elapsed = (datetime.now() - started_at).total_seconds()
+        return max(self.CACHE_TTL_SECONDS - elapsed, 1.0)
 
-        req = self._requests[request_id]
+    async def _get(self, request_id: str) -> Optional[InFlightRequest]:
+        data = await self._state.aget(self._key(request_id))
+        if data is None:
+            return None
+        return InFlightRequest.model_validate(data)
+
+    async def is_in_flight(self, request_id: str) -> bool:
+        """요청이 현재 처리 중인지 확인."""
+        req = await self._get(request_id)
         # 완료되지 않은 요청만 in-flight
-        return not req.completed
+        return req is not None and not req.completed
 
-    def start_request(self, request_id: str) -> bool:
+    async def start_request(self, request_id: str) -> bool:
         """
         요청 시작을 등록합니다.
 
         Returns:
             True if registered, False if already in-flight
         """
-        if self.is_in_flight(request_id):
-            return False
-
-        self._requests[request_id] = InFlightRequest(
+        key = self._key(request_id)
+        value = InFlightRequest(
             request_id=request_id,
             started_at=datetime.now(),
             completed=False,
+        ).model_dump(mode="json")
+
+        current = await self._state.aget(key)
+        if current is None:
+            return await self._state.aset_if_absent(key, value, ttl_sec=self.CACHE_TTL_SECONDS)
+        if not current.get("completed"):
+            return False
+        # 완료된 요청 재등록: 여러 워커가 동시에 시도해도 한 곳만 성공
+        return await self._state.acompare_and_set(
+            key, current, value, ttl_sec=self.CACHE_TTL_SECONDS
         )
-        return True
 
-    def complete_request(
+    async def complete_request(
         self,
         request_id: str,
         final_response: Optional[str] = None,
     ) -> None:
         """요청 완료 처리."""
-        if request_id in self._requests:
-            self._requests[request_id].completed = True
-            self._requests[request_id].final_response = final_response
+        req = await self._get(request_id)
+        if req is None:
+            return
+        req.completed = True
+        req.final_response = final_response
+        await self._state.aset(
+            self._key(request_id),
+            req.model_dump(mode="json"),
+            ttl_sec=self._remaining_ttl(req.started_at),
+        )
 
-    def cancel_request(self, request_id: str) -> None:
+    async def cancel_request(self, request_id: str) -> None:
         """요청 취소 (실패/중단 시)."""
-        if request_id in self._requests:
-            del self._requests[request_id]
+        await self._state.adelete(self._key(request_id))
 
-    def get_cached_response(self, request_id: str) -> Optional[str]:
+    async def get_cached_response(self, request_id: str) -> Optional[str]:
         """캐시된 응답 조회 (완료된 요청)."""
-        if request_id in self._requests:
-            req = self._requests[request_id]
-            if req.completed and req.final_response:
-                return req.final_response
+        req = await self._get(request_id)
+        if req is not None and req.completed and req.final_response:
+            return req.final_response
         return None
 
 
@@ -202,7 +211,7 @@ class ChatStreamService:
 
         try:
             # 1. 중복 체크
-            if not self._tracker.start_request(request_id):
+            if not await self._tracker.start_request(request_id):
                 # 이미 처리 중인 요청
                 logger.warning(f"Duplicate in-flight request: {request_id}")
                 error_event = StreamErrorEvent(
@@ -265,7 +274,7 @@ class ChatStreamService:
             yield done_event.to_ndjson()
 
             # 요청 완료 처리
-            self._tracker.complete_request(request_id, accumulated_response)
+            await self._tracker.complete_request(request_id, accumulated_response)
 
             # 메트릭 로깅 (PII 제외)
             self._log_metrics(metrics)
@@ -283,7 +292,7 @@ class ChatStreamService:
             logger.info(f"Stream cancelled (client disconnected): {request_id}")
             metrics.error_code = StreamErrorCode.CLIENT_DISCONNECTED.value
             metrics.total_elapsed_ms = int((time.perf_counter() - start_time) * 1000)
-            self._tracker.cancel_request(request_id)
+            await self._tracker.cancel_request(request_id)
             self._log_metrics(metrics)
 
             # A8: 텔레메트리 이벤트 발행 (취소)
@@ -310,7 +319,7 @@ class ChatStreamService:
             )
             yield error_event.to_ndjson()
 
-            self._tracker.cancel_request(request_id)
+            await self._tracker.cancel_request(request_id)
             self._log_metrics(metrics)
 
             # A8: 텔레메트리 이벤트 발행 (에러)
@@ -473,6 +482,25 @@ class ChatStreamService:
             "completed": metrics.completed,
         }
 
+        if metrics.ttfb_ms is not None:
+            app_metrics.record_latency("llm_ttft", metrics.ttfb_ms)
+        if metrics.completed and metrics.total_elapsed_ms is not None:
+            app_metrics.record_latency("llm_stream", metrics.total_elapsed_ms)
+
+        # span: 스트림은 yield를 가로지르므로 끝난 뒤 측정값으로 기록
+        end_ns = time.time_ns()
+        start_ns = end_ns - metrics.total_elapsed_ms * 1_000_000
+        stream_span = record_span(
+            "llm.stream",
+            start_ns,
+            end_ns,
+            model=metrics.model,
+            total_tokens=metrics.total_tokens,
+            error_code=metrics.error_code or "",
+        )
+        if stream_span is not None and metrics.ttfb_ms is not None:
+            record_span("llm.ttft", start_ns, start_ns + metrics.ttfb_ms * 1_000_000, parent=stream_span)
+
         if metrics.error_code:
             logger.warning(f"Stream metrics (error): {log_data}")
         else:
@@ -19,10 +19,11 @@ MVP에서는 ID prefix 규칙으로 구현합니다.
 import re
 from dataclasses import dataclass, field
 from datetime import date, datetime, time
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional
 from zoneinfo import ZoneInfo
 
 from app.core.logging import get_logger
+from app.core.state_store import StateStore, get_state_store
 
 logger = get_logger(__name__)
 
@@ -125,6 +126,39 @@ class EducationMeta:
             "video_ids": self.video_ids,
         }
 
+    def to_record(self) -> Dict[str, Any]:
+        """상태 저장소 저장 형식."""
+        return {
+            "education_id": self.education_id,
+            "year": self.year,
+            "due_date": self.due_date.isoformat(),
+            "is_mandatory_4type": self.is_mandatory_4type,
+            "title": self.title,
+            "video_asset_id": self.video_asset_id,
+            "script_text": self.script_text,
+            "subtitle_text": self.subtitle_text,
+            "video_ids": self.video_ids,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
+
+    @classmethod
+    def from_record(cls, data: Dict[str, Any]) -> "EducationMeta":
+        """상태 저장소 값에서 복원."""
+        return cls(
+            education_id=data["education_id"],
+            year=data["year"],
+            due_date=date.fromisoformat(data["due_date"]),
+            is_mandatory_4type=data["is_mandatory_4type"],
+            title=data["title"],
+            video_asset_id=data["video_asset_id"],
+            script_text=data["script_text"],
+            subtitle_text=data["subtitle_text"],
+            video_ids=data["video_ids"],
+            created_at=(
+                datetime.fromisoformat(data["created_at"]) if data["created_at"] else None
+            ),
+        )
+
 
 # =============================================================================
 # 교육 카탈로그 서비스
@@ -151,12 +185,35 @@ class EducationCatalogService:
         new_id = catalog.reissue("EDU-SEC-2024-001", 2025, date(2025, 12, 31))
     """
 
-    def __init__(self) -> None:
-        """EducationCatalogService 초기화."""
-        # 명시적으로 등록된 4대교육 ID 목록 (prefix 외 추가 등록용)
-        self._mandatory_4type_ids: Set[str] = set()
-        # 교육 메타데이터 (education_id → EducationMeta)
-        self._catalog: Dict[str, EducationMeta] = {}
+    # 상태 저장소 키 prefix
+    KEY_PREFIX = "edu_catalog:"
+    # 교육 메타데이터 (education_id → EducationMeta)
+    META_PREFIX = KEY_PREFIX + "meta:"
+    # 명시적으로 등록된 4대교육 ID 목록 (prefix 외 추가 등록용)
+    MANDATORY_PREFIX = KEY_PREFIX + "mandatory:"
+
+    def __init__(self, state_store: Optional[StateStore] = None) -> None:
+        """EducationCatalogService 초기화.
+
+        카탈로그는 공유 상태 저장소(StateStore)에 보관하므로
+        한 워커에서 등록/재발행한 교육을 다른 워커도 같이 봅니다.
+
+        Args:
+            state_store: 상태 저장소 (None이면 싱글톤 사용)
+        """
+        self._state_store = state_store
+
+    @property
+    def _state(self) -> StateStore:
+        """상태 저장소 (미지정 시 현재 싱글톤)."""
+        return self._state_store or get_state_store()
+
+    def _load(self, education_id: str) -> Optional[EducationMeta]:
+        """카탈로그에서 교육 메타데이터 조회."""
+        data = self._state.get(self.META_PREFIX + education_id)
+        if data is None:
+            return None
+        return EducationMeta.from_record(data)
 
     # =========================================================================
     # 4대교육 판정 (Phase 22 유지)
@@ -178,12 +235,12 @@ class EducationCatalogService:
             bool: 4대교육 여부
         """
         # 1. 카탈로그 메타데이터 확인
-        meta = self._catalog.get(education_id)
+        meta = self._load(education_id)
         if meta is not None:
             return meta.is_mandatory_4type
 
         # 2. 명시적 등록 확인
-        if education_id in self._mandatory_4type_ids:
+        if self._state.get(self.MANDATORY_PREFIX + education_id):
             return True
 
         # 3. Prefix 규칙 확인
@@ -199,7 +256,7 @@ class EducationCatalogService:
         Args:
             education_id: 교육 ID
         """
-        self._mandatory_4type_ids.add(education_id)
+        self._state.set(self.MANDATORY_PREFIX + education_id, True)
         logger.debug(f"Education registered as mandatory 4-type: {education_id}")
 
     def unregister_mandatory_4type(self, education_id: str) -> None:
@@ -208,7 +265,7 @@ class EducationCatalogService:
         Args:
             education_id: 교육 ID
         """
-        self._mandatory_4type_ids.discard(education_id)
+        self._state.delete(self.MANDATORY_PREFIX + education_id)
         logger.debug(f"Education unregistered from mandatory 4-type: {education_id}")
 
     # =========================================================================
@@ -232,7 +289,7 @@ class EducationCatalogService:
         Returns:
             bool: 만료 여부
         """
-        meta = self._catalog.get(education_id)
+        meta = self._load(education_id)
         if meta is None:
             # 카탈로그에 없으면 만료되지 않은 것으로 간주
             return False
@@ -247,7 +304,7 @@ class EducationCatalogService:
         Returns:
             Optional[str]: 상태 (ACTIVE/EXPIRED) 또는 None
         """
-        meta = self._catalog.get(education_id)
+        meta = self._load(education_id)
         if meta is None:
             return None
         return meta.status
@@ -303,10 +360,10 @@ class EducationCatalogService:
             created_at=datetime.now(SEOUL_TZ),
         )
 
-        self._catalog[education_id] = meta
+        self._state.set(self.META_PREFIX + education_id, meta.to_record())
 
         if is_mandatory_4type:
-            self._mandatory_4type_ids.add(education_id)
+            self._state.set(self.MANDATORY_PREFIX + education_id, True)
 
         logger.debug(f"Education registered: {education_id}, year={year}, due_date={due_date}")
         return meta
@@ -320,18 +377,19 @@ class EducationCatalogService:
         Returns:
             Optional[EducationMeta]: 교육 메타데이터
         """
-        return self._catalog.get(education_id)
+        return self._load(education_id)
 
     def exists(self, education_id: str) -> bool:
         """교육이 카탈로그에 존재하는지 확인합니다."""
-        return education_id in self._catalog
+        return self._state.get(self.META_PREFIX + education_id) is not None
 
     def list_active_educations(self) -> List[EducationMeta]:
         """활성 상태인 교육 목록을 반환합니다."""
-        return [
-            meta for meta in self._catalog.values()
-            if meta.status == EducationStatus.ACTIVE
+        metas = [
+            EducationMeta.from_record(data)
+            for data in self._state.items(self.META_PREFIX).values()
         ]
+        return [meta for meta in metas if meta.status == EducationStatus.ACTIVE]
 
     # =========================================================================
     # 재발행 (Phase 26)
@@ -363,7 +421,7 @@ class EducationCatalogService:
             ValueError: source가 없거나, target이 이미 존재하거나, due_date가 범위를 벗어남
         """
         # 1. source 존재 확인
-        source = self._catalog.get(source_education_id)
+        source = self._load(source_education_id)
         if source is None:
             raise ValueError(f"Source education not found: {source_education_id}")
 
@@ -398,10 +456,12 @@ class EducationCatalogService:
             created_at=datetime.now(SEOUL_TZ),
         )
 
-        self._catalog[new_education_id] = new_meta
+        # 다른 워커가 같은 대상을 동시에 재발행하면 한 곳만 성공
+        if not self._state.set_if_absent(self.META_PREFIX + new_education_id, new_meta.to_record()):
+            raise ValueError(f"Target education already exists: {new_education_id}")
 
         if new_meta.is_mandatory_4type:
-            self._mandatory_4type_ids.add(new_education_id)
+            self._state.set(self.MANDATORY_PREFIX + new_education_id, True)
 
         logger.info(
             f"Education reissued: {source_education_id} → {new_education_id}, "
@@ -435,8 +495,7 @@ class EducationCatalogService:
 
     def clear(self) -> None:
         """카탈로그 초기화 (테스트용)."""
-        self._mandatory_4type_ids.clear()
-        self._catalog.clear()
+        self._state.clear(self.KEY_PREFIX)
 
 
 # =============================================================================
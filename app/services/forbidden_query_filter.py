@@ -36,19 +36,14 @@ import os
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
-import numpy as np
+# numpy / rapidfuzz / embedding_matcher(faiss)는 import 비용이 커서
+# 실제로 쓰는 시점(load의 fuzzy 준비, 임베딩 인덱스 빌드, fuzzy 매칭)에 import합니다.
+if TYPE_CHECKING:
+    import numpy as np
 
-# Step 4: Fuzzy matching
-from rapidfuzz import fuzz, process
-
-# Step 5: Embedding matching
-from app.services.embedding_matcher import (
-    EmbeddingMatcher,
-    EmbeddingMatchResult,
-    SecondaryCondition,
-)
+    from app.services.embedding_matcher import EmbeddingMatcher
 
 # Step 6: PII sanitization for matching
 from app.services.pii_sanitizer import sanitize_query_for_forbidden_check
@@ -147,7 +142,7 @@ class ForbiddenQueryFilter:
     DEFAULT_RESOURCES_DIR = Path(__file__).parent.parent / "resources" / "forbidden_queries"
 
     # 임베딩 함수 타입: str -> np.ndarray (D,)
-    EmbeddingFunction = Callable[[str], np.ndarray]
+    EmbeddingFunction = Callable[[str], "np.ndarray"]
 
     def __init__(
         self,
@@ -267,6 +262,10 @@ class ForbiddenQueryFilter:
 
             self._loaded = True
 
+            # Step 4: 첫 fuzzy 매칭이 import 비용을 내지 않도록 미리 로드
+            if self._fuzzy_enabled:
+                import rapidfuzz  # noqa: F401
+
             # Step 5: 임베딩 인덱스 빌드 (활성화된 경우)
             if self._embedding_enabled and self._embedding_function is not None:
                 self._build_embedding_index()
@@ -299,6 +298,10 @@ class ForbiddenQueryFilter:
             return
 
         try:
+            import numpy as np
+
+            from app.services.embedding_matcher import EmbeddingMatcher
+
             # 모든 룰의 정규화된 질문 임베딩
             rule_texts = [r.question_norm for r in self._ruleset.rules]
             embeddings_list = []
@@ -339,6 +342,10 @@ class ForbiddenQueryFilter:
             return
 
         try:
+            import numpy as np
+
+            from app.services.embedding_matcher import EmbeddingMatcher
+
             embeddings = np.load(embeddings_path)
             rule_indices = list(range(len(self._ruleset.rules)))
 
@@ -576,6 +583,8 @@ class ForbiddenQueryFilter:
         if self._ruleset is None or not self._ruleset.rules:
             return None
 
+        from rapidfuzz import fuzz, process
+
         # 모든 룰의 정규화된 질문 목록
         choices = [r.question_norm for r in self._ruleset.rules]
 
@@ -6,14 +6,20 @@ Pillow를 사용하여 씬 이미지(1920x1080 PNG)를 생성합니다.
 기능:
 - VisualPlan에서 씬 이미지 생성
 - highlight_terms 박스/밑줄 처리
-- 그라데이션 배경
-- 한글 폰트 지원
+- 그라데이션 배경 ((크기, 색상)별 1회 생성 후 캐시)
+- 한글 폰트 지원 (크기별 폰트 객체 캐시)
+- 여러 씬 이미지를 프로세스 풀에서 병렬 생성 (VIDEO_IMAGE_RENDER_WORKERS)
 
 중간 산출물(씬 PNG)은 로컬 임시 폴더에만 저장하고 업로드하지 않습니다.
 """
 
+import asyncio
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -33,6 +39,41 @@ except ImportError:
     logger.warning("Pillow not installed. Image generation will use mock mode.")
 
 
+@lru_cache(maxsize=8)
+def _gradient_background(
+    width: int,
+    height: int,
+    start_color: Tuple[int, int, int],
+    end_color: Tuple[int, int, int],
+) -> "Image.Image":
+    """수직 그라데이션 배경을 생성합니다 ((크기, 색상)별 캐시, 호출자는 copy() 사용).
+
+    행 색상 1열(1 x height)만 계산한 뒤 가로로 늘립니다 (NEAREST라 픽셀 값 동일).
+    """
+    column = Image.new("RGB", (1, height))
+    column.putdata([
+        tuple(
+            int(start * (1 - y / height) + end * (y / height))
+            for start, end in zip(start_color, end_color)
+        )
+        for y in range(height)
+    ])
+    return column.resize((width, height), Image.NEAREST)
+
+
+@lru_cache(maxsize=32)
+def _load_font(font_path: Optional[str], size: int) -> "ImageFont.FreeTypeFont":
+    """폰트를 로드합니다 ((경로, 크기)별 캐시)."""
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except Exception as e:
+            logger.warning(f"Failed to load font {font_path}: {e}")
+
+    # 기본 폰트 사용
+    return ImageFont.load_default()
+
+
 @dataclass
 class ImageConfig:
     """이미지 생성 설정."""
@@ -63,11 +104,16 @@ class ImageAssetService:
         )
     """
 
-    def __init__(self, config: Optional[ImageConfig] = None):
+    def __init__(
+        self,
+        config: Optional[ImageConfig] = None,
+        render_workers: Optional[int] = None,
+    ):
         """서비스 초기화.
 
         Args:
             config: 이미지 생성 설정
+            render_workers: 병렬 생성 프로세스 수 (없으면 환경변수, 0이면 CPU 수 기준)
         """
         settings = get_settings()
         self.config = config or ImageConfig(
@@ -76,6 +122,13 @@ class ImageAssetService:
         )
         self._font_path = self._find_font_path()
 
+        if render_workers is None:
+            render_workers = settings.VIDEO_IMAGE_RENDER_WORKERS
+        if render_workers <= 0:
+            render_workers = min(4, os.cpu_count() or 1)
+        self._render_workers = render_workers
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+
     def _find_font_path(self) -> Optional[str]:
         """시스템에서 한글 폰트 경로 찾기."""
         # 우선순위: 환경변수 > 시스템 폰트
@@ -165,6 +218,64 @@ class ImageAssetService:
             paths.append(path)
         return paths
 
+    async def generate_all_scene_images_async(
+        self,
+        plans: List[VisualPlan],
+        output_dir: Path,
+    ) -> List[str]:
+        """여러 씬 이미지를 이벤트 루프 밖에서 병렬 생성.
+
+        프로세스 풀에서 씬별로 그리기 + PNG 저장을 병렬 실행합니다.
+        풀을 쓸 수 없으면 (워커 1개, Pillow 없음, 풀 손상) 스레드에서 순차 생성합니다.
+
+        Args:
+            plans: 시각적 계획 목록
+            output_dir: 출력 디렉토리
+
+        Returns:
+            List[str]: 생성된 이미지 파일 경로 목록 (plans 순서)
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        loop = asyncio.get_running_loop()
+
+        if PILLOW_AVAILABLE and self._render_workers > 1 and len(plans) > 1:
+            pool = self._get_process_pool()
+            try:
+                return list(await asyncio.gather(*[
+                    loop.run_in_executor(
+                        pool,
+                        _generate_scene_image_in_worker,
+                        self.config,
+                        plan,
+                        str(output_dir),
+                        i,
+                    )
+                    for i, plan in enumerate(plans)
+                ]))
+            except BrokenProcessPool as e:
+                logger.warning(f"Image process pool broken, rendering in-process: {e}")
+                self.shutdown()
+
+        return await loop.run_in_executor(
+            None, self.generate_all_scene_images, plans, output_dir
+        )
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """이미지 생성 프로세스 풀 (lazy, spawn 방식)."""
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self._render_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._process_pool
+
+    def shutdown(self) -> None:
+        """프로세스 풀 종료."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+
     def _create_image(self, plan: VisualPlan) -> "Image.Image":
         """Pillow로 이미지 생성."""
         config = self.config
@@ -221,21 +332,14 @@ class ImageAssetService:
         return image
 
     def _create_gradient_background(self) -> "Image.Image":
-        """그라데이션 배경 생성."""
+        """그라데이션 배경 생성 (캐시된 배경의 복사본)."""
         config = self.config
-        image = Image.new("RGB", (config.width, config.height))
-
-        for y in range(config.height):
-            # 수직 그라데이션
-            ratio = y / config.height
-            r = int(config.background_color[0] * (1 - ratio) + config.gradient_end_color[0] * ratio)
-            g = int(config.background_color[1] * (1 - ratio) + config.gradient_end_color[1] * ratio)
-            b = int(config.background_color[2] * (1 - ratio) + config.gradient_end_color[2] * ratio)
-
-            for x in range(config.width):
-                image.putpixel((x, y), (r, g, b))
-
-        return image
+        return _gradient_background(
+            config.width,
+            config.height,
+            tuple(config.background_color),
+            tuple(config.gradient_end_color),
+        ).copy()
 
     def _draw_body_with_highlights(
         self,
@@ -355,21 +459,33 @@ class ImageAssetService:
         return lines if lines else [text]
 
     def _get_font(self, size: int) -> "ImageFont.FreeTypeFont":
-        """폰트 로드."""
+        """폰트 로드 (크기별 캐시)."""
         if not PILLOW_AVAILABLE:
             return None
 
-        if self._font_path:
-            try:
-                return ImageFont.truetype(self._font_path, size)
-            except Exception as e:
-                logger.warning(f"Failed to load font {self._font_path}: {e}")
+        return _load_font(self._font_path, size)
 
-        # 기본 폰트 사용
-        try:
-            return ImageFont.load_default()
-        except Exception:
-            return ImageFont.load_default()
+
+# =============================================================================
+# Process Pool Worker
+# =============================================================================
+
+
+# 워커 프로세스별 서비스 (설정이 같으면 폰트 경로 탐색/캐시 재사용)
+_worker_service: Optional[ImageAssetService] = None
+
+
+def _generate_scene_image_in_worker(
+    config: ImageConfig,
+    plan: VisualPlan,
+    output_dir: str,
+    scene_index: int,
+) -> str:
+    """프로세스 풀 워커에서 씬 이미지 1개를 생성합니다."""
+    global _worker_service
+    if _worker_service is None or _worker_service.config != config:
+        _worker_service = ImageAssetService(config=config, render_workers=1)
+    return _worker_service.generate_scene_image(plan, Path(output_dir), scene_index)
 
 
 # =============================================================================
@@ -391,4 +507,6 @@ def get_image_asset_service() -> ImageAssetService:
 def clear_image_asset_service() -> None:
     """ImageAssetService 싱글톤 초기화 (테스트용)."""
     global _service
+    if _service is not None:
+        _service.shutdown()
     _service = None
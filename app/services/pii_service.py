@@ -34,7 +34,9 @@ import httpx
 from app.clients.http_client import get_async_http_client
 from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.core.metrics import metrics
 from app.models.intent import MaskingStage, PiiMaskResult, PiiTag
+from app.telemetry.tracing import span
 
 logger = get_logger(__name__)
 
@@ -172,7 +174,10 @@ class PiiService:
             return self._create_fallback_result(text)
 
         # 3. HTTP PII 서비스 호출
-        return await self._call_pii_service(text, stage)
+        with span(f"pii.{stage.value}", text_length=len(text)) as current:
+            result = await self._call_pii_service(text, stage)
+            current.set_attribute("has_pii", result.has_pii)
+        return result
 
     async def _call_pii_service(
         self,
@@ -220,7 +225,8 @@ class PiiService:
             )
 
             # HTTP POST 요청
-            response = await client.post(url, json=payload)
+            with metrics.timer("pii"):
+                response = await client.post(url, json=payload)
             response.raise_for_status()
 
             # 응답 JSON 파싱
@@ -33,6 +33,7 @@ from app.models.quiz_qc import (
     QuizQuestionQcResult,
     QuizSetQcResult,
 )
+from app.utils.keyword_index import KeywordIndex
 
 logger = get_logger(__name__)
 
@@ -145,6 +146,9 @@ class QuizQualityService:
         # 블록 ID → 블록 매핑
         block_map = {b.block_id: b for b in source_blocks}
 
+        # SOURCE 검증용 블록 인덱스 (세트 단위로 1회 생성)
+        block_index = self._build_block_index(block_map)
+
         valid_questions: List[GeneratedQuizQuestion] = []
         question_results: List[QuizQuestionQcResult] = []
 
@@ -152,6 +156,7 @@ class QuizQualityService:
             qc_result = await self._validate_single_question(
                 question=question,
                 block_map=block_map,
+                block_index=block_index,
             )
             question_results.append(qc_result)
 
@@ -179,6 +184,7 @@ class QuizQualityService:
         self,
         question: GeneratedQuizQuestion,
         block_map: Dict[str, QuizCandidateBlock],
+        block_index: Optional[KeywordIndex] = None,
     ) -> QuizQuestionQcResult:
         """
         단일 문항을 검증합니다.
@@ -191,6 +197,7 @@ class QuizQualityService:
         Args:
             question: 검증할 퀴즈 문항
             block_map: 블록 ID → 블록 매핑
+            block_index: 블록 키워드 인덱스 (None이면 block_map으로 생성)
 
         Returns:
             QuizQuestionQcResult: 문항별 QC 결과
@@ -207,7 +214,7 @@ class QuizQualityService:
             return schema_result
 
         # 2. SOURCE 검증
-        source_result = self._validate_source(question, block_map)
+        source_result = self._validate_source(question, block_map, block_index)
         if not source_result.qc_pass:
             source_result.question_id = question_id
             logger.debug(
@@ -307,6 +314,7 @@ class QuizQualityService:
         self,
         question: GeneratedQuizQuestion,
         block_map: Dict[str, QuizCandidateBlock],
+        block_index: Optional[KeywordIndex] = None,
     ) -> QuizQuestionQcResult:
         """
         원문 일치 검증.
@@ -316,32 +324,32 @@ class QuizQualityService:
         Args:
             question: 검증할 문항
             block_map: 블록 ID → 블록 매핑
+            block_index: 블록 키워드 인덱스 (None이면 block_map으로 생성)
 
         Returns:
             QuizQuestionQcResult: 검증 결과
 
         Note:
             이 Phase에서는 간단한 문자열 기반 검사만 구현.
+            블록 텍스트를 문항마다 결합/소문자 변환하지 않고 세트 단위
+            키워드 인덱스(bigram posting)로 후보 블록을 줄인 뒤 포함 여부를 확인.
             TODO: RAG/Embedding 기반 검증은 향후 추가 가능.
         """
-        # 출처 블록 텍스트 수집
-        source_texts: List[str] = []
-
-        for block_id in question.source_block_ids:
-            if block_id in block_map:
-                source_texts.append(block_map[block_id].text)
-
-        # 출처 블록이 없으면 전체 블록에서 검색
-        if not source_texts:
-            source_texts = [b.text for b in block_map.values()]
-
         # 출처 텍스트가 아예 없으면 통과 (검증 불가)
-        if not source_texts:
+        if not block_map:
             logger.warning("No source blocks available for SOURCE validation")
             return QuizQuestionQcResult(qc_pass=True)
 
-        # 전체 출처 텍스트 결합
-        combined_source = " ".join(source_texts).lower()
+        if block_index is None:
+            block_index = self._build_block_index(block_map)
+
+        # 출처 블록 ID 수집 (없으면 전체 블록에서 검색)
+        source_block_ids: Optional[List[str]] = [
+            block_id for block_id in question.source_block_ids
+            if block_id in block_map
+        ]
+        if not source_block_ids:
+            source_block_ids = None
 
         # 정답 옵션 찾기
         correct_option = None
@@ -360,11 +368,9 @@ class QuizQualityService:
 
         # 키워드가 출처에 포함되어 있는지 확인
         # 최소 하나의 키워드가 출처에 있어야 함
-        keyword_found = False
-        for keyword in keywords:
-            if keyword in combined_source:
-                keyword_found = True
-                break
+        keyword_found = any(
+            block_index.contains(keyword, source_block_ids) for keyword in keywords
+        )
 
         if not keyword_found and keywords:
             return QuizQuestionQcResult(
@@ -376,6 +382,16 @@ class QuizQualityService:
 
         return QuizQuestionQcResult(qc_pass=True)
 
+    def _build_block_index(
+        self,
+        block_map: Dict[str, QuizCandidateBlock],
+    ) -> KeywordIndex:
+        """블록 텍스트 키워드 인덱스를 생성합니다 (키: block_id)."""
+        return KeywordIndex(
+            [block.text for block in block_map.values()],
+            keys=list(block_map.keys()),
+        )
+
     def _extract_keywords(self, text: str) -> List[str]:
         """
         텍스트에서 핵심 키워드를 추출합니다.
@@ -22,14 +22,23 @@ Phase 34: Render Job Runner
 Phase 34 변경사항:
 - StorageUploadError 예외 처리 (error_code=STORAGE_UPLOAD_FAILED)
 - 업로드 실패 시 임시 파일 정리
+
+실행은 RenderScheduler 워커 풀을 거칩니다 (동시 실행 수 제한, 생성자별 공정 분배).
+서버 재시작 시 resume_pending_jobs()로 QUEUED/PROCESSING 잡을 다시 큐에 넣습니다.
+
+멀티 워커: 대기열에 넣는 워커가 공유 상태 저장소에 잡 lease를 선점하고
+실행이 끝날 때까지 갱신합니다. 다른 워커의 resume_pending_jobs()는 lease가
+있는 잡(다른 워커가 대기/실행 중)을 건너뛰므로 같은 잡이 두 번 렌더되지 않습니다.
 """
 
 import asyncio
+import os
 import shutil
 import uuid
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Set
 
 from app.api.v1.ws_render_progress import (
     RenderProgressEvent,
@@ -44,6 +53,7 @@ from app.clients.backend_client import (
 )
 from app.clients.storage_adapter import StorageUploadError
 from app.core.logging import get_logger
+from app.core.state_store import StateStore, get_state_store
 from app.models.render_spec import RenderSpec, validate_render_spec
 from app.models.video_render import (
     RenderJobStatus,
@@ -52,11 +62,17 @@ from app.models.video_render import (
     VideoScript,
 )
 from app.repositories.render_job_repository import (
+    AsyncRenderJobRepository,
     RenderJobEntity,
     get_render_job_repository,
     RenderJobRepository,
 )
-from app.services.video_render_service import VideoRenderer
+from app.services.render_profiler import RenderProfiler
+from app.services.render_scheduler import RenderScheduler
+
+if TYPE_CHECKING:
+    # 렌더러 모듈(TTS/영상 합성)은 첫 렌더 잡에서 로드
+    from app.services.video_render_service import VideoRenderer
 
 logger = get_logger(__name__)
 
@@ -137,32 +153,63 @@ class RenderJobRunner:
         jobs = runner.list_jobs("video-001", limit=20)
     """
 
+    # 공유 상태 저장소의 잡 lease 키 prefix
+    LEASE_KEY_PREFIX = "render_job_lease:"
+    # 대기/실행 중 잡의 lease (초). 선점한 워커가 1/3 주기로 갱신하므로
+    # 워커가 죽으면 이 시간 뒤 만료되어 다른 워커가 재개할 수 있음
+    JOB_LEASE_SEC = 120.0
+
     def __init__(
         self,
-        renderer: Optional[VideoRenderer] = None,
+        renderer: Optional["VideoRenderer"] = None,
         repository: Optional[RenderJobRepository] = None,
         script_client: Optional[BackendScriptClient] = None,
         output_dir: Optional[str] = None,
+        scheduler: Optional[RenderScheduler] = None,
+        state_store: Optional[StateStore] = None,
+        renderer_factory: Optional[Callable[[], "VideoRenderer"]] = None,
     ):
         """실행기 초기화.
 
         Args:
-            renderer: 렌더러 (없으면 lazy-load)
+            renderer: 렌더러 (없으면 renderer_factory로 첫 잡 실행 시 생성)
             repository: 잡 저장소 (없으면 싱글톤 사용)
             script_client: Phase 38 - 백엔드 스크립트 클라이언트
             output_dir: 렌더링 출력 디렉토리
+            scheduler: 렌더 잡 스케줄러 (없으면 RENDER_WORKER_CONCURRENCY로 생성)
+            state_store: 잡 lease용 공유 상태 저장소 (None이면 싱글톤 사용)
+            renderer_factory: 렌더러 생성 함수 (잡을 실제로 실행할 때 한 번 호출)
         """
         self._renderer = renderer
+        self._renderer_factory = renderer_factory
         self._repository = repository or get_render_job_repository()
         self._script_client = script_client or get_backend_script_client()
         self._output_dir = Path(output_dir or "./video_output")
         self._output_dir.mkdir(parents=True, exist_ok=True)
-        self._running_jobs: Dict[str, asyncio.Task] = {}
-
-    def set_renderer(self, renderer: VideoRenderer) -> None:
+        self._db = AsyncRenderJobRepository(self._repository)
+        self._scheduler = scheduler or RenderScheduler()
+        # 실행 중 취소된 잡 (단계 사이 취소 확인용, DB 폴링 대신 사용)
+        self._canceled_jobs: Set[str] = set()
+        self._state_store = state_store
+        # lease 소유자 식별값 (같은 프로세스의 다른 실행기와도 구분)
+        self._worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        # 이 워커가 보유한 잡 lease의 갱신 태스크
+        self._lease_tasks: Dict[str, asyncio.Task] = {}
+
+    def set_renderer(self, renderer: "VideoRenderer") -> None:
         """렌더러 설정."""
         self._renderer = renderer
 
+    def set_renderer_factory(self, factory: Callable[[], "VideoRenderer"]) -> None:
+        """렌더러 생성 함수 설정 (렌더러는 잡을 실제로 실행할 때 생성)."""
+        self._renderer_factory = factory
+
+    def _get_renderer(self) -> Optional["VideoRenderer"]:
+        """렌더러 반환 (없으면 factory로 생성)."""
+        if self._renderer is None and self._renderer_factory is not None:
+            self._renderer = self._renderer_factory()
+        return self._renderer
+
     # =========================================================================
     # Job Creation
     # =========================================================================
@@ -173,6 +220,7 @@ class RenderJobRunner:
         video_id: str,
         script_id: str,
         request_id: Optional[str] = None,
+        created_by: str = "backend",
     ) -> JobCreationResult:
         """백엔드 발급 jobId로 렌더 잡 생성 (idempotent).
 
@@ -184,12 +232,13 @@ class RenderJobRunner:
             video_id: 비디오 ID
             script_id: 스크립트 ID
             request_id: 멱등 키 (선택)
+            created_by: 요청 사용자 ID (워커 풀 공정 분배 기준)
 
         Returns:
             JobCreationResult: 생성 결과 (job, created, message)
         """
         # 1. 기존 잡 확인 (idempotency)
-        existing_job = self._repository.get(job_id)
+        existing_job = await self._db.get(job_id)
         if existing_job:
             logger.info(
                 f"Existing job found: job_id={job_id}, status={existing_job.status}"
@@ -208,11 +257,11 @@ class RenderJobRunner:
             status="QUEUED",
             progress=0,
             message="대기 중...",
-            created_by="backend",
+            created_by=created_by,
             created_at=datetime.utcnow(),
         )
 
-        self._repository.save(job)
+        await self._db.save(job)
         logger.info(
             f"New render job created with backend ID: job_id={job_id}, "
             f"video_id={video_id}, script_id={script_id}"
@@ -256,7 +305,7 @@ class RenderJobRunner:
             )
 
         # 2. 기존 활성 잡 확인 (idempotency)
-        existing_job = self._repository.get_active_by_video_id(video_id)
+        existing_job = await self._db.get_active_by_video_id(video_id)
         if existing_job:
             logger.info(
                 f"Existing active job found: job_id={existing_job.job_id}, "
@@ -281,12 +330,17 @@ class RenderJobRunner:
             created_at=datetime.utcnow(),
         )
 
-        self._repository.save(job)
+        await self._db.save(job)
         logger.info(f"New render job created: job_id={job_id}, video_id={video_id}")
 
-        # 4. 백그라운드에서 실행 시작
-        task = asyncio.create_task(self._execute_job(job_id, script))
-        self._running_jobs[job_id] = task
+        # 4. 워커 풀 대기열에 추가 (새 job_id이므로 lease 선점은 항상 성공)
+        await self._claim_job(job_id)
+        await self._scheduler.enqueue(
+            job_id=job_id,
+            video_id=video_id,
+            owner=created_by,
+            run=partial(self._run_leased, job_id, partial(self._execute_job, job_id, script)),
+        )
 
         return JobCreationResult(
             job=job,
@@ -314,7 +368,7 @@ class RenderJobRunner:
             JobStartResult: 시작 결과
         """
         # 1. 잡 조회
-        job = self._repository.get(job_id)
+        job = await self._db.get(job_id)
         if not job:
             logger.warning(f"Job not found: {job_id}")
             return JobStartResult(
@@ -353,7 +407,7 @@ class RenderJobRunner:
 
                 # render_spec_json으로 저장 (스냅샷)
                 spec_json = normalized_spec.model_dump()
-                self._repository.update_render_spec(job_id, spec_json)
+                await self._db.update_render_spec(job_id, spec_json)
 
                 logger.info(
                     f"Render-spec snapshot saved: job_id={job_id}, "
@@ -361,7 +415,7 @@ class RenderJobRunner:
                 )
 
                 # 메모리 상의 job 갱신
-                job = self._repository.get(job_id)
+                job = await self._db.get(job_id)
 
             except ScriptFetchError as e:
                 logger.error(
@@ -369,13 +423,13 @@ class RenderJobRunner:
                     f"script_id={job.script_id}, error={e}"
                 )
                 # FAILED 상태로 전환
-                self._repository.update_error(
+                await self._db.update_error(
                     job_id=job_id,
                     error_code=e.error_code,
                     error_message=e.message,
                 )
                 return JobStartResult(
-                    job=self._repository.get(job_id),
+                    job=await self._db.get(job_id),
                     started=False,
                     message=e.message,
                     error_code=e.error_code,
@@ -385,26 +439,30 @@ class RenderJobRunner:
                 logger.error(
                     f"Empty render-spec: job_id={job_id}, script_id={job.script_id}"
                 )
-                self._repository.update_error(
+                await self._db.update_error(
                     job_id=job_id,
                     error_code=e.error_code,
                     error_message=str(e),
                 )
                 return JobStartResult(
-                    job=self._repository.get(job_id),
+                    job=await self._db.get(job_id),
                     started=False,
                     message="Render-spec has no scenes",
                     error_code=e.error_code,
                 )
 
-        # 4. 파이프라인 시작
-        task = asyncio.create_task(self._execute_job_with_spec(job_id))
-        self._running_jobs[job_id] = task
+        # 4. 파이프라인 시작 (워커 풀 대기열)
+        if not await self._enqueue_with_spec(job):
+            return JobStartResult(
+                job=job,
+                started=False,
+                message="Job already queued on another worker",
+            )
 
         logger.info(f"Job started: job_id={job_id}")
 
         return JobStartResult(
-            job=self._repository.get(job_id),
+            job=await self._db.get(job_id),
             started=True,
             message="Job started",
         )
@@ -422,7 +480,7 @@ class RenderJobRunner:
             JobStartResult: 시작 결과
         """
         # 1. 잡 조회
-        job = self._repository.get(job_id)
+        job = await self._db.get(job_id)
         if not job:
             return JobStartResult(
                 job=None,
@@ -449,8 +507,16 @@ class RenderJobRunner:
                 message="Job is already running",
             )
 
-        # 4. 상태 초기화 및 재시작
-        self._repository.update_status(
+        # 4. 다른 워커가 대기/실행 중이면 재시도 불가
+        if not await self._claim_job(job_id):
+            return JobStartResult(
+                job=job,
+                started=False,
+                message="Job is already queued on another worker",
+            )
+
+        # 5. 상태 초기화 및 재시작
+        await self._db.update_status(
             job_id=job_id,
             status="QUEUED",
             step=None,
@@ -458,18 +524,158 @@ class RenderJobRunner:
             message="재시도 대기 중...",
         )
 
-        # 5. 파이프라인 시작 (기존 스냅샷 사용)
-        task = asyncio.create_task(self._execute_job_with_spec(job_id))
-        self._running_jobs[job_id] = task
+        # 6. 파이프라인 시작 (기존 스냅샷 사용, lease는 위에서 선점)
+        await self._enqueue_with_spec(job)
 
         logger.info(f"Job retry started (using existing snapshot): job_id={job_id}")
 
         return JobStartResult(
-            job=self._repository.get(job_id),
+            job=await self._db.get(job_id),
             started=True,
             message="Job retry started",
         )
 
+    async def resume_pending_jobs(self) -> int:
+        """서버 재시작 후 QUEUED/PROCESSING 잡을 다시 큐에 넣습니다.
+
+        - 스냅샷이 있는 잡: QUEUED로 되돌리고 처음부터 재실행
+        - 스냅샷 없는 QUEUED 잡 (start_job 대기 중인 백엔드 잡): 그대로 둠
+        - 스냅샷 없는 PROCESSING 잡 (스크립트가 메모리에만 있던 잡): FAILED (RENDER_INTERRUPTED)
+
+        모든 워커가 기동 시 호출하므로, 잡마다 lease를 먼저 선점한 워커만 처리합니다.
+        lease가 남아 있는 잡(다른 워커가 대기/실행 중)은 건너뜁니다.
+
+        Returns:
+            int: 다시 큐에 넣은 잡 수
+        """
+        resumed = 0
+        for job in await self._db.get_pending_jobs():
+            if not job.has_render_spec() and job.status == "QUEUED":
+                continue
+
+            if not await self._claim_job(job.job_id):
+                logger.info(f"Render job held by another worker, skipping: job_id={job.job_id}")
+                continue
+
+            if not job.has_render_spec():
+                await self._db.update_error(
+                    job_id=job.job_id,
+                    error_code="RENDER_INTERRUPTED",
+                    error_message="서버 재시작으로 중단됨 (render-spec 스냅샷 없음)",
+                )
+                await self._release_job(job.job_id)
+                logger.warning(f"Render job interrupted by restart: job_id={job.job_id}")
+                continue
+
+            if job.status == "PROCESSING":
+                await self._db.update_status(
+                    job_id=job.job_id,
+                    status="QUEUED",
+                    step=None,
+                    progress=0,
+                    message="재시작 후 대기 중...",
+                )
+
+            await self._enqueue_with_spec(job)
+            resumed += 1
+
+        if resumed:
+            logger.info(f"Resumed pending render jobs: count={resumed}")
+        return resumed
+
+    async def _enqueue_with_spec(self, job: RenderJobEntity) -> bool:
+        """스냅샷 기반 실행을 워커 풀 대기열에 추가.
+
+        Returns:
+            bool: 추가 여부 (False면 다른 워커가 lease 보유)
+        """
+        if not await self._claim_job(job.job_id):
+            return False
+        await self._scheduler.enqueue(
+            job_id=job.job_id,
+            video_id=job.video_id,
+            owner=job.created_by,
+            run=partial(
+                self._run_leased, job.job_id, partial(self._execute_job_with_spec, job.job_id)
+            ),
+        )
+        return True
+
+    # =========================================================================
+    # Job Lease (멀티 워커 중복 실행 방지)
+    # =========================================================================
+
+    @property
+    def _state(self) -> StateStore:
+        """공유 상태 저장소 (미지정 시 현재 싱글톤)."""
+        return self._state_store or get_state_store()
+
+    def _lease_key(self, job_id: str) -> str:
+        return f"{self.LEASE_KEY_PREFIX}{job_id}"
+
+    async def _claim_job(self, job_id: str) -> bool:
+        """잡 lease를 선점합니다 (이미 보유 중이면 True).
+
+        Returns:
+            bool: 이 워커가 lease를 보유하는지 여부
+        """
+        if job_id in self._lease_tasks:
+            return True
+        claimed = await self._state.aset_if_absent(
+            self._lease_key(job_id), self._worker_id, ttl_sec=self.JOB_LEASE_SEC
+        )
+        if claimed:
+            self._lease_tasks[job_id] = asyncio.create_task(self._renew_lease(job_id))
+        return claimed
+
+    async def _renew_lease(self, job_id: str) -> None:
+        """보유 중인 lease를 주기적으로 갱신합니다 (lease를 잃으면 중단)."""
+        key = self._lease_key(job_id)
+        while True:
+            await asyncio.sleep(self.JOB_LEASE_SEC / 3)
+            try:
+                renewed = await self._state.acompare_and_set(
+                    key, self._worker_id, self._worker_id, ttl_sec=self.JOB_LEASE_SEC
+                )
+            except Exception as e:
+                logger.warning(f"Failed to renew render job lease: job_id={job_id}, error={e}")
+                continue
+            if not renewed:
+                logger.warning(f"Render job lease lost: job_id={job_id}")
+                return
+
+    async def _release_job(self, job_id: str) -> None:
+        """lease 갱신을 멈추고, 이 워커 소유면 lease를 삭제합니다."""
+        task = self._lease_tasks.pop(job_id, None)
+        if task is None:
+            return
+        task.cancel()
+        key = self._lease_key(job_id)
+        try:
+            if await self._state.aget(key) == self._worker_id:
+                await self._state.adelete(key)
+        except Exception as e:
+            logger.warning(f"Failed to release render job lease: job_id={job_id}, error={e}")
+
+    async def _run_leased(self, job_id: str, run: Callable[[], Awaitable[None]]) -> None:
+        """잡을 실행하고 종료(성공/실패/취소) 시 lease를 반납합니다."""
+        try:
+            await run()
+        finally:
+            await self._release_job(job_id)
+
+    def get_queue_position(self, job_id: str) -> Optional[int]:
+        """렌더 대기 순번 조회 (1부터, 대기 중이 아니면 None)."""
+        return self._scheduler.get_queue_position(job_id)
+
+    async def shutdown(self) -> None:
+        """워커 풀 종료 (실행 중인 잡은 다음 시작 시 재개)."""
+        await self._scheduler.shutdown()
+        # 대기 중이던 잡의 lease도 반납 (다른 워커가 바로 재개 가능)
+        for job_id in list(self._lease_tasks):
+            await self._release_job(job_id)
+        await self._db.close()
+
     # =========================================================================
     # Job Retrieval
     # =========================================================================
@@ -534,22 +740,25 @@ class RenderJobRunner:
         Returns:
             취소된 잡 (취소 불가하면 None)
         """
-        job = self._repository.get(job_id)
+        job = await self._db.get(job_id)
         if not job or not job.is_active():
             return None
 
         # DB 상태 업데이트 (FAILED + error_code=CANCELED)
-        self._repository.update_error(
+        await self._db.update_error(
             job_id=job_id,
             error_code="CANCELED",
             error_message="사용자에 의해 취소됨",
         )
 
-        # 실행 중인 태스크 취소
-        if job_id in self._running_jobs:
-            task = self._running_jobs[job_id]
-            task.cancel()
-            del self._running_jobs[job_id]
+        # 대기열에서 제거하거나 실행 중인 태스크 취소
+        if self._scheduler.is_running(job_id):
+            self._canceled_jobs.add(job_id)
+            await self._scheduler.cancel(job_id)
+        else:
+            # 실행 전 제거된 잡은 _run_leased를 거치지 않으므로 여기서 lease 반납
+            await self._scheduler.cancel(job_id)
+            await self._release_job(job_id)
 
         # WebSocket 알림
         await notify_render_progress(
@@ -562,7 +771,7 @@ class RenderJobRunner:
 
         logger.info(f"Render job canceled: job_id={job_id}")
 
-        return self._repository.get(job_id)
+        return await self._db.get(job_id)
 
     # =========================================================================
     # Job Execution
@@ -575,7 +784,7 @@ class RenderJobRunner:
             job_id: 잡 ID
             script: 스크립트 객체
         """
-        job = self._repository.get(job_id)
+        job = await self._db.get(job_id)
         if not job:
             logger.error(f"Job not found for execution: {job_id}")
             return
@@ -586,7 +795,7 @@ class RenderJobRunner:
             return
 
         # PROCESSING 상태로 전환
-        self._repository.update_status(
+        await self._db.update_status(
             job_id=job_id,
             status="PROCESSING",
             step=RenderStep.VALIDATE_SCRIPT.value,
@@ -603,9 +812,11 @@ class RenderJobRunner:
             message="렌더링 시작...",
         )
 
+        profiler = RenderProfiler()
+
         try:
-            # 렌더러 확인
-            if not self._renderer:
+            # 렌더러 확인 (첫 잡에서 로드)
+            if not self._get_renderer():
                 raise RuntimeError("Renderer not configured")
 
             # 파이프라인 단계별 실행
@@ -620,19 +831,17 @@ class RenderJobRunner:
             ]
 
             for step in steps:
-                # 취소 확인 (FAILED + error_code=CANCELED)
-                job = self._repository.get(job_id)
-                if job and job.status == "FAILED" and job.error_code == "CANCELED":
+                # 취소 확인 (cancel_job이 설정한 메모리 플래그, DB 조회 없음)
+                if job_id in self._canceled_jobs:
                     logger.info(f"Job canceled during pipeline: {job_id}")
                     return
 
                 # 진행률 계산
                 progress, message = get_step_progress(step, 0.0)
 
-                # DB 업데이트
-                self._repository.update_status(
+                # DB 업데이트 (잡별 interval당 최대 1회로 병합)
+                await self._db.update_progress(
                     job_id=job_id,
-                    status="PROCESSING",
                     step=step.value,
                     progress=progress,
                     message=message,
@@ -650,8 +859,9 @@ class RenderJobRunner:
 
                 logger.info(f"Render step: job_id={job_id}, step={step.value}")
 
-                # 실제 렌더링 수행
-                await self._renderer.execute_step(step, script.raw_json, job_id)
+                # 실제 렌더링 수행 (단계별 자원 사용량 측정)
+                with profiler.stage(step.value):
+                    await self._renderer.execute_step(step, script.raw_json, job_id)
 
             # 에셋 조회
             rendered = await self._renderer.get_rendered_assets(job_id)
@@ -663,10 +873,13 @@ class RenderJobRunner:
                 "thumbnail_url": rendered.thumbnail_path,
                 "duration_sec": rendered.duration_sec,
             }
-            self._repository.update_assets(job_id, assets)
+            # 씬별 입력 fingerprint (다음 재렌더에서 변경 씬 판별용)
+            if rendered.scene_fingerprints:
+                assets["scene_fingerprints"] = rendered.scene_fingerprints
+            await self._db.update_assets(job_id, assets)
 
             # 성공 상태로 전환
-            self._repository.update_status(
+            await self._db.update_status(
                 job_id=job_id,
                 status="COMPLETED",
                 step=RenderStep.FINALIZE.value,
@@ -705,14 +918,14 @@ class RenderJobRunner:
             error_code = "STORAGE_UPLOAD_FAILED"
             error_message = f"Storage upload failed for key '{e.key}': {e.message}"[:500]
 
-            self._repository.update_error(
+            await self._db.update_error(
                 job_id=job_id,
                 error_code=error_code,
                 error_message=error_message,
             )
 
             # WebSocket 알림
-            job = self._repository.get(job_id)
+            job = await self._db.get(job_id)
             if job:
                 await notify_render_progress(
                     job_id=job_id,
@@ -733,14 +946,14 @@ class RenderJobRunner:
             error_code = type(e).__name__
             error_message = str(e)[:500]  # 메시지 길이 제한
 
-            self._repository.update_error(
+            await self._db.update_error(
                 job_id=job_id,
                 error_code=error_code,
                 error_message=error_message,
             )
 
             # WebSocket 알림
-            job = self._repository.get(job_id)
+            job = await self._db.get(job_id)
             if job:
                 await notify_render_progress(
                     job_id=job_id,
@@ -757,9 +970,8 @@ class RenderJobRunner:
             await self._cleanup_job_files(job_id)
 
         finally:
-            # 실행 중인 잡 목록에서 제거
-            if job_id in self._running_jobs:
-                del self._running_jobs[job_id]
+            self._canceled_jobs.discard(job_id)
+            await self._save_render_metrics(job_id, profiler)
 
     async def _execute_job_with_spec(self, job_id: str) -> None:
         """Phase 38: 스냅샷 기반 잡 실행 (백그라운드).
@@ -769,7 +981,7 @@ class RenderJobRunner:
         Args:
             job_id: 잡 ID
         """
-        job = self._repository.get(job_id)
+        job = await self._db.get(job_id)
         if not job:
             logger.error(f"Job not found for execution: {job_id}")
             return
@@ -777,7 +989,7 @@ class RenderJobRunner:
         # render_spec_json이 없으면 실행 불가
         if not job.has_render_spec():
             logger.error(f"No render_spec_json for job: {job_id}")
-            self._repository.update_error(
+            await self._db.update_error(
                 job_id=job_id,
                 error_code="NO_RENDER_SPEC",
                 error_message="No render-spec snapshot found",
@@ -795,7 +1007,7 @@ class RenderJobRunner:
         raw_json = render_spec.to_raw_json()
 
         # PROCESSING 상태로 전환
-        self._repository.update_status(
+        await self._db.update_status(
             job_id=job_id,
             status="PROCESSING",
             step=RenderStep.VALIDATE_SCRIPT.value,
@@ -812,9 +1024,11 @@ class RenderJobRunner:
             message="렌더링 시작...",
         )
 
+        profiler = RenderProfiler()
+
         try:
-            # 렌더러 확인
-            if not self._renderer:
+            # 렌더러 확인 (첫 잡에서 로드)
+            if not self._get_renderer():
                 raise RuntimeError("Renderer not configured")
 
             # 파이프라인 단계별 실행
@@ -829,19 +1043,17 @@ class RenderJobRunner:
             ]
 
             for step in steps:
-                # 취소 확인 (FAILED + error_code=CANCELED)
-                job = self._repository.get(job_id)
-                if job and job.status == "FAILED" and job.error_code == "CANCELED":
+                # 취소 확인 (cancel_job이 설정한 메모리 플래그, DB 조회 없음)
+                if job_id in self._canceled_jobs:
                     logger.info(f"Job canceled during pipeline: {job_id}")
                     return
 
                 # 진행률 계산
                 progress, message = get_step_progress(step, 0.0)
 
-                # DB 업데이트
-                self._repository.update_status(
+                # DB 업데이트 (잡별 interval당 최대 1회로 병합)
+                await self._db.update_progress(
                     job_id=job_id,
-                    status="PROCESSING",
                     step=step.value,
                     progress=progress,
                     message=message,
@@ -859,8 +1071,9 @@ class RenderJobRunner:
 
                 logger.info(f"Render step: job_id={job_id}, step={step.value}")
 
-                # 실제 렌더링 수행 (스냅샷 기반 raw_json 사용)
-                await self._renderer.execute_step(step, raw_json, job_id)
+                # 실제 렌더링 수행 (스냅샷 기반 raw_json 사용, 단계별 자원 사용량 측정)
+                with profiler.stage(step.value):
+                    await self._renderer.execute_step(step, raw_json, job_id)
 
             # 에셋 조회
             rendered = await self._renderer.get_rendered_assets(job_id)
@@ -872,10 +1085,13 @@ class RenderJobRunner:
                 "thumbnail_url": rendered.thumbnail_path,
                 "duration_sec": rendered.duration_sec,
             }
-            self._repository.update_assets(job_id, assets)
+            # 씬별 입력 fingerprint (다음 재렌더에서 변경 씬 판별용)
+            if rendered.scene_fingerprints:
+                assets["scene_fingerprints"] = rendered.scene_fingerprints
+            await self._db.update_assets(job_id, assets)
 
             # 성공 상태로 전환
-            self._repository.update_status(
+            await self._db.update_status(
                 job_id=job_id,
                 status="COMPLETED",
                 step=RenderStep.FINALIZE.value,
@@ -912,13 +1128,13 @@ class RenderJobRunner:
             error_code = "STORAGE_UPLOAD_FAILED"
             error_message = f"Storage upload failed for key '{e.key}': {e.message}"[:500]
 
-            self._repository.update_error(
+            await self._db.update_error(
                 job_id=job_id,
                 error_code=error_code,
                 error_message=error_message,
             )
 
-            job = self._repository.get(job_id)
+            job = await self._db.get(job_id)
             if job:
                 await notify_render_progress(
                     job_id=job_id,
@@ -939,13 +1155,13 @@ class RenderJobRunner:
             error_code = type(e).__name__
             error_message = str(e)[:500]
 
-            self._repository.update_error(
+            await self._db.update_error(
                 job_id=job_id,
                 error_code=error_code,
                 error_message=error_message,
             )
 
-            job = self._repository.get(job_id)
+            job = await self._db.get(job_id)
             if job:
                 await notify_render_progress(
                     job_id=job_id,
@@ -960,8 +1176,8 @@ class RenderJobRunner:
             await self._cleanup_job_files(job_id)
 
         finally:
-            if job_id in self._running_jobs:
-                del self._running_jobs[job_id]
+            self._canceled_jobs.discard(job_id)
+            await self._save_render_metrics(job_id, profiler)
 
     async def _notify_job_complete(
         self,
@@ -993,6 +1209,21 @@ class RenderJobRunner:
                 f"job_id={job_id}, error={e}"
             )
 
+    async def _save_render_metrics(self, job_id: str, profiler: RenderProfiler) -> None:
+        """단계별 렌더 측정값 저장 (실패해도 잡 결과에 영향 없음)."""
+        if not profiler.stages:
+            return
+
+        metrics = profiler.to_dict()
+        logger.info(
+            f"Render metrics: job_id={job_id}, total_wall={metrics['total_wall_sec']}s, "
+            + ", ".join(f"{name}={m['wall_sec']}s" for name, m in metrics["stages"].items())
+        )
+        try:
+            await self._db.update_metrics(job_id, metrics)
+        except Exception as e:
+            logger.warning(f"Failed to save render metrics: job_id={job_id}, error={e}")
+
     async def _cleanup_job_files(self, job_id: str) -> None:
         """잡 임시 파일 정리.
 
@@ -1028,3 +1259,9 @@ def clear_render_job_runner() -> None:
     """RenderJobRunner 싱글톤 초기화 (테스트용)."""
     global _runner
     _runner = None
+
+
+async def shutdown_render_job_runner() -> None:
+    """생성된 RenderJobRunner가 있으면 워커 풀을 종료합니다 (앱 종료 시)."""
+    if _runner is not None:
+        await _runner.shutdown()
@@ -0,0 +1,278 @@
+"""
+렌더 단계별 프로파일러
+
+렌더 파이프라인 단계(VALIDATE_SCRIPT, GENERATE_TTS, RENDER_SLIDES, COMPOSE_VIDEO,
+UPLOAD_ASSETS 등)마다 자원 사용량을 측정합니다. 결과는 RenderJobEntity.render_metrics에
+저장되어 GET /internal/ai/render-jobs/{job_id} 응답에 포함되고,
+scripts/benchmark_render.py가 같은 측정으로 단계별 표를 출력합니다.
+
+측정 항목 (단계별):
+- wall_sec: 경과 시간
+- cpu_sec: CPU 시간 (이 프로세스 + 종료된 자식 프로세스(ffmpeg 등))
+- subprocess_count: 시작한 자식 프로세스 수 (subprocess.Popen audit 이벤트)
+- bytes_written: 디스크 쓰기량 (rusage 출력 블록 × 512, 자식 프로세스 포함)
+- peak_rss_mb: 단계 실행 중 샘플링한 최대 RSS (이 프로세스 + 자식 프로세스 합계)
+
+주의:
+- CPU/쓰기량/프로세스 수는 프로세스 단위 카운터의 차이이므로 같은 Pod에서 여러 잡이
+  동시에 실행되면 다른 잡의 사용량도 섞입니다 (RENDER_WORKER_CONCURRENCY=1이면 정확)
+- peak_rss_mb는 /proc에서 RSS_SAMPLE_INTERVAL_SEC마다 읽으므로 그보다 짧은 최대치는 놓칠 수 있음.
+  /proc이 없는 플랫폼(macOS)에서는 프로세스 수명 전체의 최대 RSS(ru_maxrss)로 대신하므로
+  단계별 값이 아니라 프로세스 단위 최대치임
+- resource 모듈이 없는 플랫폼(Windows)에서는 wall_sec/subprocess_count만 측정
+
+Usage:
+    profiler = RenderProfiler()
+
+    with profiler.stage("COMPOSE_VIDEO"):
+        await renderer.execute_step(step, raw_json, job_id)
+
+    metrics = profiler.to_dict()
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+
+# =============================================================================
+# 자식 프로세스 카운터 (audit hook)
+# =============================================================================
+
+
+_subprocess_count = 0
+_hook_lock = threading.Lock()
+_hook_installed = False
+
+
+def _audit_hook(event: str, args: Any) -> None:
+    """subprocess.Popen 이벤트마다 카운터 증가."""
+    global _subprocess_count
+    if event == "subprocess.Popen":
+        _subprocess_count += 1
+
+
+def _ensure_audit_hook() -> None:
+    """audit hook을 한 번만 등록합니다 (등록한 hook은 해제할 수 없음)."""
+    global _hook_installed
+    with _hook_lock:
+        if not _hook_installed:
+            sys.addaudithook(_audit_hook)
+            _hook_installed = True
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+
+@dataclass
+class StageMetrics:
+    """단계 측정값 (같은 단계가 여러 번 실행되면 누적)."""
+
+    wall_sec: float = 0.0
+    cpu_sec: float = 0.0
+    subprocess_count: int = 0
+    bytes_written: int = 0
+    peak_rss_mb: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화 (소수점 정리)."""
+        data = asdict(self)
+        data["wall_sec"] = round(self.wall_sec, 3)
+        data["cpu_sec"] = round(self.cpu_sec, 3)
+        data["peak_rss_mb"] = round(self.peak_rss_mb, 1)
+        return data
+
+
+class _Snapshot(NamedTuple):
+    wall: float
+    cpu: float
+    subprocesses: int
+    out_blocks: int
+
+
+def _lifetime_peak_rss_mb() -> float:
+    """프로세스 수명 전체의 최대 RSS (MB, 프로세스/종료된 자식 중 큰 값).
+
+    /proc이 없는 플랫폼용 대체값입니다 (단계별 최대치가 아님).
+    """
+    if resource is None:
+        return 0.0
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # Linux는 KB, macOS는 bytes 단위
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return peak / divisor
+
+
+_PROC_SELF = "/proc/self"
+_PAGE_BYTES = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _rss_pages(pid: str) -> int:
+    with open(f"/proc/{pid}/statm") as f:
+        return int(f.read().split()[1])
+
+
+def _child_pids() -> List[str]:
+    """이 프로세스의 직계 자식 PID (모든 스레드가 시작한 자식 포함)."""
+    pids: List[str] = []
+    for task in os.listdir(f"{_PROC_SELF}/task"):
+        try:
+            with open(f"{_PROC_SELF}/task/{task}/children") as f:
+                pids.extend(f.read().split())
+        except OSError:
+            continue
+    return pids
+
+
+def _current_rss_mb() -> Optional[float]:
+    """현재 RSS (MB, 이 프로세스 + 살아 있는 자식 합계). /proc이 없으면 None."""
+    try:
+        pages = _rss_pages("self")
+    except (OSError, ValueError, IndexError):
+        return None
+    try:
+        children = _child_pids()
+    except OSError:
+        children = []
+    for pid in children:
+        try:
+            pages += _rss_pages(pid)
+        except (OSError, ValueError, IndexError):
+            continue  # 이미 종료된 자식
+    return pages * _PAGE_BYTES / (1024 * 1024)
+
+
+class _RssSampler:
+    """단계 실행 중 RSS를 주기적으로 읽어 최대치를 기록하는 백그라운드 스레드."""
+
+    def __init__(self, interval_sec: float):
+        self._interval_sec = interval_sec
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.peak_mb: Optional[float] = None
+
+    def _sample(self) -> bool:
+        rss = _current_rss_mb()
+        if rss is None:
+            return False
+        self.peak_mb = rss if self.peak_mb is None else max(self.peak_mb, rss)
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_sec):
+            self._sample()
+
+    def start(self) -> None:
+        if self._sample():
+            self._thread = threading.Thread(target=self._run, name="render-rss-sampler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> float:
+        """샘플링을 멈추고 단계 최대 RSS(MB)를 반환합니다."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        if not self._sample():
+            return _lifetime_peak_rss_mb()
+        return self.peak_mb
+
+
+def _snapshot() -> _Snapshot:
+    """현재 카운터 값."""
+    wall = time.perf_counter()
+    if resource is None:
+        return _Snapshot(wall, time.process_time(), _subprocess_count, 0)
+
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return _Snapshot(
+        wall=wall,
+        cpu=own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime,
+        subprocesses=_subprocess_count,
+        out_blocks=own.ru_oublock + children.ru_oublock,
+    )
+
+
+# =============================================================================
+# Profiler
+# =============================================================================
+
+
+class RenderProfiler:
+    """렌더 잡 하나의 단계별 측정값을 모읍니다."""
+
+    BLOCK_BYTES = 512
+    RSS_SAMPLE_INTERVAL_SEC = 0.1
+
+    def __init__(self):
+        _ensure_audit_hook()
+        self._stages: Dict[str, StageMetrics] = {}
+
+    @property
+    def stages(self) -> Dict[str, StageMetrics]:
+        """단계명 → 측정값 (실행 순서)."""
+        return self._stages
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageMetrics]:
+        """단계 실행 구간을 측정합니다 (예외로 끝나도 기록)."""
+        metrics = self._stages.setdefault(name, StageMetrics())
+        sampler = _RssSampler(self.RSS_SAMPLE_INTERVAL_SEC)
+        sampler.start()
+        before = _snapshot()
+        try:
+            yield metrics
+        finally:
+            after = _snapshot()
+            peak_rss_mb = sampler.stop()
+            metrics.wall_sec += after.wall - before.wall
+            metrics.cpu_sec += max(after.cpu - before.cpu, 0.0)
+            metrics.subprocess_count += after.subprocesses - before.subprocesses
+            metrics.bytes_written += max(after.out_blocks - before.out_blocks, 0) * self.BLOCK_BYTES
+            metrics.peak_rss_mb = max(metrics.peak_rss_mb, peak_rss_mb)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """RenderJobEntity.render_metrics 저장 형식."""
+        stages = list(self._stages.values())
+        return {
+            "stages": {name: m.to_dict() for name, m in self._stages.items()},
+            "total_wall_sec": round(sum(m.wall_sec for m in stages), 3),
+            "total_cpu_sec": round(sum(m.cpu_sec for m in stages), 3),
+            "subprocess_count": sum(m.subprocess_count for m in stages),
+            "bytes_written": sum(m.bytes_written for m in stages),
+            "peak_rss_mb": round(max((m.peak_rss_mb for m in stages), default=0.0), 1),
+        }
+
+    def format_table(self) -> str:
+        """단계별 표 문자열 (벤치마크 출력용)."""
+        total_wall = sum(m.wall_sec for m in self._stages.values()) or 1.0
+        lines = [
+            f"{'STAGE':<20}{'WALL(s)':>10}{'%':>7}{'CPU(s)':>10}{'PROCS':>7}{'WRITTEN(MB)':>13}{'PEAK RSS(MB)':>14}"
+        ]
+        for name, m in self._stages.items():
+            lines.append(
+                f"{name:<20}{m.wall_sec:>10.3f}{m.wall_sec / total_wall * 100:>6.1f}%"
+                f"{m.cpu_sec:>10.3f}{m.subprocess_count:>7}"
+                f"{m.bytes_written / (1024 * 1024):>13.2f}{m.peak_rss_mb:>14.1f}"
+            )
+        summary = self.to_dict()
+        lines.append(
+            f"{'TOTAL':<20}{summary['total_wall_sec']:>10.3f}{100.0:>6.1f}%"
+            f"{summary['total_cpu_sec']:>10.3f}{summary['subprocess_count']:>7}"
+            f"{summary['bytes_written'] / (1024 * 1024):>13.2f}{summary['peak_rss_mb']:>14.1f}"
+        )
+        return "\n".join(lines)
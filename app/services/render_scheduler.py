@@ -0,0 +1,281 @@
+"""
+렌더 잡 스케줄러
+
+렌더 잡을 고정 크기 워커 풀에서 실행합니다.
+잡마다 asyncio.create_task로 바로 실행하면 동시 요청 수만큼 ffmpeg 인코딩/TTS/
+이미지 생성이 한 Pod에서 겹쳐 CPU를 소모하므로, 동시 실행 수를 제한하고
+초과분은 QUEUED 상태로 대기시킵니다.
+
+정책:
+- 동시 실행 수: RENDER_WORKER_CONCURRENCY (0 = CPU 수)
+- 생성자(created_by)별 대기열을 라운드로빈으로 선택 (한 생성자가 큐를 독점하지 않음)
+- 대기 순번이 바뀌면 ws_render_progress로 queue_position 전송
+- 영속 큐는 SQLite의 QUEUED 행이며, 메모리 큐는 재시작 시
+  RenderJobRunner.resume_pending_jobs()가 복원
+
+Usage:
+    scheduler = RenderScheduler(max_workers=2)
+
+    position = await scheduler.enqueue(
+        job_id="job-001",
+        video_id="video-001",
+        owner="user-001",
+        run=lambda: runner._execute_job_with_spec("job-001"),
+    )
+
+    await scheduler.cancel("job-001")
+"""
+
+import asyncio
+import os
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from app.api.v1.ws_render_progress import notify_render_progress
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.metrics import get_metrics
+from app.models.video_render import RenderJobStatus
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ScheduledJob:
+    """스케줄러 대기열 항목.
+
+    Attributes:
+        job_id: 잡 ID
+        video_id: 비디오 ID (진행률 브로드캐스트 대상)
+        owner: 공정 분배 기준 (created_by)
+        run: 잡 실행 코루틴 팩토리
+    """
+
+    job_id: str
+    video_id: str
+    owner: str
+    run: Callable[[], Awaitable[None]]
+
+
+class RenderScheduler:
+    """렌더 잡 워커 풀 + 생성자별 공정 대기열.
+
+    워커는 첫 enqueue 시 현재 이벤트 루프에서 시작됩니다.
+    실행 중인 잡은 워커와 분리된 Task로 돌기 때문에 cancel()로 잡만 취소해도
+    워커는 다음 잡을 계속 처리합니다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """스케줄러 초기화.
+
+        Args:
+            max_workers: 동시 실행 수 (None이면 설정값, 0 이하이면 CPU 수)
+        """
+        if max_workers is None:
+            max_workers = get_settings().RENDER_WORKER_CONCURRENCY
+        if max_workers <= 0:
+            max_workers = os.cpu_count() or 1
+
+        self._max_workers = max_workers
+        # owner -> 대기열 (순서 = 다음 라운드로빈 차례)
+        self._lanes: "OrderedDict[str, Deque[ScheduledJob]]" = OrderedDict()
+        self._queued: Dict[str, ScheduledJob] = {}
+        self._running: Dict[str, asyncio.Task] = {}
+        self._last_positions: Dict[str, int] = {}
+        self._workers: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        get_metrics().register_gauge("render_running", lambda: len(self._running))
+        get_metrics().register_gauge("render_queued", lambda: len(self._queued))
+
+    @property
+    def max_workers(self) -> int:
+        """동시 실행 수."""
+        return self._max_workers
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    async def enqueue(
+        self,
+        job_id: str,
+        video_id: str,
+        owner: str,
+        run: Callable[[], Awaitable[None]],
+    ) -> int:
+        """잡을 대기열에 추가합니다.
+
+        이미 대기/실행 중인 job_id는 중복 추가하지 않습니다.
+
+        Args:
+            job_id: 잡 ID
+            video_id: 비디오 ID
+            owner: 공정 분배 기준 (created_by)
+            run: 잡 실행 코루틴 팩토리
+
+        Returns:
+            int: 대기 순번 (1부터, 실행 중이면 0)
+        """
+        self._ensure_workers()
+
+        if job_id not in self._queued and job_id not in self._running:
+            job = ScheduledJob(job_id=job_id, video_id=video_id, owner=owner or "", run=run)
+            self._lanes.setdefault(job.owner, deque()).append(job)
+            self._queued[job_id] = job
+            self._wakeup.set()
+            logger.info(
+                f"Render job enqueued: job_id={job_id}, owner={job.owner}, "
+                f"queued={len(self._queued)}, running={len(self._running)}"
+            )
+
+        # 워커가 바로 가져갈 수 있으면 순번 알림 전에 양보
+        await asyncio.sleep(0)
+        await self._broadcast_positions()
+
+        return self.get_queue_position(job_id) or 0
+
+    async def cancel(self, job_id: str) -> bool:
+        """대기 중이면 대기열에서 제거하고, 실행 중이면 Task를 취소합니다.
+
+        Returns:
+            bool: 대기/실행 중인 잡이었는지 여부
+        """
+        job = self._queued.pop(job_id, None)
+        if job is not None:
+            lane = self._lanes.get(job.owner)
+            if lane is not None:
+                lane.remove(job)
+                if not lane:
+                    del self._lanes[job.owner]
+            self._last_positions.pop(job_id, None)
+            await self._broadcast_positions()
+            return True
+
+        task = self._running.get(job_id)
+        if task is not None:
+            task.cancel()
+            return True
+
+        return False
+
+    def get_queue_position(self, job_id: str) -> Optional[int]:
+        """대기 순번 조회 (1부터, 대기 중이 아니면 None)."""
+        if job_id not in self._queued:
+            return None
+        for position, job in enumerate(self._queue_order(), start=1):
+            if job.job_id == job_id:
+                return position
+        return None
+
+    def is_running(self, job_id: str) -> bool:
+        """실행 중 여부."""
+        return job_id in self._running
+
+    def stats(self) -> Dict[str, Any]:
+        """스케줄러 상태."""
+        return {
+            "max_workers": self._max_workers,
+            "running": len(self._running),
+            "queued": len(self._queued),
+            "owners": len(self._lanes),
+        }
+
+    async def shutdown(self) -> None:
+        """워커와 실행 중인 잡을 종료합니다.
+
+        취소된 잡은 DB에 PROCESSING으로 남아 다음 시작 시 재개됩니다.
+        """
+        tasks = list(self._workers) + list(self._running.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._workers = []
+        self._running.clear()
+        self._loop = None
+        self._wakeup = None
+
+    # =========================================================================
+    # Internal
+    # =========================================================================
+
+    def _ensure_workers(self) -> None:
+        """현재 이벤트 루프에 워커를 max_workers개 유지합니다."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 이벤트 루프가 바뀐 경우 (테스트 등) 이전 루프의 워커는 버림
+            self._loop = loop
+            self._workers = []
+            self._wakeup = asyncio.Event()
+
+        self._workers = [w for w in self._workers if not w.done()]
+        while len(self._workers) < self._max_workers:
+            self._workers.append(loop.create_task(self._worker()))
+
+    def _pop_next(self) -> Optional[ScheduledJob]:
+        """라운드로빈으로 다음 잡을 꺼냅니다."""
+        if not self._lanes:
+            return None
+
+        owner, lane = next(iter(self._lanes.items()))
+        job = lane.popleft()
+        if lane:
+            self._lanes.move_to_end(owner)
+        else:
+            del self._lanes[owner]
+
+        self._queued.pop(job.job_id, None)
+        self._last_positions.pop(job.job_id, None)
+        return job
+
+    def _queue_order(self) -> List[ScheduledJob]:
+        """새 잡이 없을 때 _pop_next가 꺼낼 순서."""
+        lanes = list(self._lanes.values())
+        depth = max((len(lane) for lane in lanes), default=0)
+        return [lane[i] for i in range(depth) for lane in lanes if i < len(lane)]
+
+    async def _worker(self) -> None:
+        """대기열에서 잡을 꺼내 실행하는 워커 루프."""
+        while True:
+            job = self._pop_next()
+            if job is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            task = asyncio.create_task(job.run())
+            self._running[job.job_id] = task
+            await self._broadcast_positions()
+
+            try:
+                # 잡 취소가 워커로 전파되지 않도록 wait 사용
+                await asyncio.wait({task})
+            finally:
+                self._running.pop(job.job_id, None)
+
+            if not task.cancelled() and task.exception() is not None:
+                logger.error(
+                    f"Render job raised: job_id={job.job_id}, error={task.exception()}"
+                )
+
+    async def _broadcast_positions(self) -> None:
+        """순번이 바뀐 대기 잡에만 queue_position을 전송합니다."""
+        for position, job in enumerate(self._queue_order(), start=1):
+            if self._last_positions.get(job.job_id) == position:
+                continue
+            self._last_positions[job.job_id] = position
+            try:
+                await notify_render_progress(
+                    job_id=job.job_id,
+                    video_id=job.video_id,
+                    status=RenderJobStatus.QUEUED,
+                    progress=0,
+                    message=f"대기 중... ({position}번째)",
+                    queue_position=position,
+                )
+            except Exception as e:
+                logger.warning(f"Queue position notify failed: job_id={job.job_id}, error={e}")
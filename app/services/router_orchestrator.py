@@ -50,11 +50,12 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 from app.clients.llm_client import LLMClient
 from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.core.state_store import StateStore, get_state_store
 from app.models.router_types import (
     CRITICAL_ACTION_SUB_INTENTS,
     RouterDebugInfo,
@@ -65,6 +66,7 @@ from app.models.router_types import (
 )
 from app.services.llm_router import LLMRouter
 from app.services.rule_router import RuleRouter
+from app.telemetry.tracing import span
 
 logger = get_logger(__name__)
 
@@ -184,6 +186,44 @@ class PendingAction:
     clarify_group: ClarifyGroup = ClarifyGroup.UNKNOWN
     user_id: str = ""
 
+    def to_dict(self) -> Dict[str, Any]:
+        """상태 저장소 저장 형식."""
+        return {
+            "action_type": self.action_type.value,
+            "trace_id": self.trace_id,
+            "pending_intent": self.pending_intent.value,
+            "sub_intent_id": self.sub_intent_id,
+            "router_result": (
+                self.router_result.model_dump(mode="json") if self.router_result else None
+            ),
+            "created_at": self.created_at.isoformat(),
+            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
+            "original_query": self.original_query,
+            "clarify_group": self.clarify_group.value,
+            "user_id": self.user_id,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PendingAction":
+        """상태 저장소 값에서 복원."""
+        return cls(
+            action_type=PendingActionType(data["action_type"]),
+            trace_id=data["trace_id"],
+            pending_intent=Tier0Intent(data["pending_intent"]),
+            sub_intent_id=data["sub_intent_id"],
+            router_result=(
+                RouterResult.model_validate(data["router_result"])
+                if data["router_result"] else None
+            ),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            expires_at=(
+                datetime.fromisoformat(data["expires_at"]) if data["expires_at"] else None
+            ),
+            original_query=data["original_query"],
+            clarify_group=ClarifyGroup(data["clarify_group"]),
+            user_id=data["user_id"],
+        )
+
 
 # =============================================================================
 # Orchestration Result
@@ -212,47 +252,73 @@ class OrchestrationResult:
 
 
 # =============================================================================
-# In-Memory Pending Action Store
+# Pending Action Store
 # =============================================================================
 
 
 class PendingActionStore:
-    """대기 중인 액션 저장소 (인메모리).
+    """대기 중인 액션 저장소.
+
+    세션별 pending action을 공유 상태 저장소(StateStore)에 보관하므로
+    되묻기/확인 응답이 다른 워커로 들어와도 이어서 처리됩니다.
+    expires_at이 있으면 저장소 TTL로도 만료됩니다.
 
-    세션별 pending action을 추적합니다.
-    실제 운영에서는 Redis 등 외부 저장소로 교체 권장.
+    async 요청 경로에서 호출되므로 저장소 async API를 사용합니다.
 
     Usage:
         store = PendingActionStore()
-        store.set("session-123", pending_action)
-        action = store.get("session-123")
-        store.delete("session-123")
+        await store.set("session-123", pending_action)
+        action = await store.get("session-123")
+        await store.delete("session-123")
     """
 
-    def __init__(self) -> None:
-        """PendingActionStore 초기화."""
-        self._store: Dict[str, PendingAction] = {}
+    KEY_PREFIX = "pending_action:"
 
-    def set(self, session_id: str, action: PendingAction) -> None:
-        """대기 액션을 저장합니다."""
-        self._store[session_id] = action
+    def __init__(self, state_store: Optional[StateStore] = None) -> None:
+        """PendingActionStore 초기화.
 
-    def get(self, session_id: str) -> Optional[PendingAction]:
+        Args:
+            state_store: 상태 저장소 (None이면 싱글톤 사용)
+        """
+        self._state_store = state_store
+
+    @property
+    def _state(self) -> StateStore:
+        """상태 저장소 (미지정 시 현재 싱글톤)."""
+        return self._state_store or get_state_store()
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.KEY_PREFIX}{session_id}"
+
+    async def set(self, session_id: str, action: PendingAction) -> None:
+        """대기 액션을 저장합니다."""
+        ttl_sec = None
+        if action.expires_at:
+            ttl_sec = (action.expires_at - datetime.now(timezone.utc)).total_seconds()
+            # 이미 만료된 액션은 get()에서 삭제되도록 TTL 없이 저장
+            if ttl_sec <= 0:
+                ttl_sec = None
+        await self._state.aset(self._key(session_id), action.to_dict(), ttl_sec=ttl_sec)
+
+    async def get(self, session_id: str) -> Optional[PendingAction]:
         """대기 액션을 조회합니다."""
-        action = self._store.get(session_id)
-        if action and action.expires_at:
+        data = await self._state.aget(self._key(session_id))
+        if data is None:
+            return None
+        action = PendingAction.from_dict(data)
+        if action.expires_at:
             if datetime.now(timezone.utc) > action.expires_at:
-                self.delete(session_id)
+                await self.delete(session_id)
                 return None
         return action
 
-    def delete(self, session_id: str) -> None:
+    async def delete(self, session_id: str) -> None:
         """대기 액션을 삭제합니다."""
-        self._store.pop(session_id, None)
+        await self._state.adelete(self._key(session_id))
 
     def clear(self) -> None:
         """모든 대기 액션을 삭제합니다."""
-        self._store.clear()
+        self._state.clear(self.KEY_PREFIX)
 
 
 # 전역 pending action 저장소
@@ -360,7 +426,7 @@ class RouterOrchestrator:
         """
         # Step 0: 대기 중인 액션 체크 (확인/되묻기 응답인지)
         if not skip_pending_check:
-            pending = self._pending_store.get(session_id)
+            pending = await self._pending_store.get(session_id)
             if pending:
                 return await self._handle_pending_response(
                     user_query=user_query,
@@ -369,7 +435,11 @@ class RouterOrchestrator:
                 )
 
         # Step 1: Rule Router로 1차 분류
-        rule_result = self._rule_router.route(user_query)
+        with span("route.rule") as current:
+            rule_result = self._rule_router.route(user_query)
+            current.set_attributes(
+                intent=rule_result.tier0_intent.value, confidence=rule_result.confidence
+            )
 
         logger.info(
             f"Orchestrator: rule_router result - "
@@ -380,7 +450,7 @@ class RouterOrchestrator:
 
         # Step 2: 되묻기 필요하면 즉시 반환
         if rule_result.needs_clarify:
-            return self._create_clarify_result(
+            return await self._create_clarify_result(
                 router_result=rule_result,
                 session_id=session_id,
                 user_id=user_id,
@@ -401,14 +471,19 @@ class RouterOrchestrator:
                     f"Orchestrator: Low confidence ({rule_result.confidence}), "
                     "calling LLM router"
                 )
-                final_result = await self._llm_router.route(
-                    user_query=user_query,
-                    rule_router_result=rule_result,
-                )
+                with span("route.llm") as current:
+                    final_result = await self._llm_router.route(
+                        user_query=user_query,
+                        rule_router_result=rule_result,
+                    )
+                    current.set_attributes(
+                        intent=final_result.tier0_intent.value,
+                        confidence=final_result.confidence,
+                    )
 
                 # LLM 결과에서도 되묻기 필요하면 반환
                 if final_result.needs_clarify:
-                    return self._create_clarify_result(
+                    return await self._create_clarify_result(
                         router_result=final_result,
                         session_id=session_id,
                         user_id=user_id,
@@ -419,7 +494,7 @@ class RouterOrchestrator:
 
         # Step 5: 확인 게이트 필요하면 반환
         if final_result.requires_confirmation:
-            return self._create_confirmation_result(
+            return await self._create_confirmation_result(
                 router_result=final_result,
                 session_id=session_id,
             )
@@ -445,7 +520,7 @@ class RouterOrchestrator:
         Returns:
             OrchestrationResult: 처리 결과
         """
-        pending = self._pending_store.get(session_id)
+        pending = await self._pending_store.get(session_id)
         if not pending:
             logger.warning(f"No pending action found for session: {session_id}")
             return OrchestrationResult(
@@ -459,7 +534,7 @@ class RouterOrchestrator:
             )
 
         # 대기 액션 삭제
-        self._pending_store.delete(session_id)
+        await self._pending_store.delete(session_id)
 
         if not confirmed:
             logger.info(f"User declined action: {pending.sub_intent_id}")
@@ -541,7 +616,7 @@ class RouterOrchestrator:
         # 되묻기 응답 - Phase 23: ClarifyAnswerHandler 로직
         elif pending.action_type == PendingActionType.CLARIFY:
             # one-shot: 처리 후 pending 삭제
-            self._pending_store.delete(session_id)
+            await self._pending_store.delete(session_id)
 
             # Phase 23: 응답 길이 체크
             response_length = len(user_query.strip())
@@ -592,7 +667,7 @@ class RouterOrchestrator:
             )
 
         # 알 수 없는 액션 타입
-        self._pending_store.delete(session_id)
+        await self._pending_store.delete(session_id)
         return await self.route(
             user_query=user_query,
             session_id=session_id,
@@ -660,7 +735,7 @@ class RouterOrchestrator:
 
         return None
 
-    def _create_clarify_result(
+    async def _create_clarify_result(
         self,
         router_result: RouterResult,
         session_id: str,
@@ -704,7 +779,7 @@ class RouterOrchestrator:
             clarify_group=clarify_group,
             user_id=user_id,
         )
-        self._pending_store.set(session_id, pending)
+        await self._pending_store.set(session_id, pending)
 
         logger.info(
             f"Clarify pending created: session={session_id}, "
@@ -740,7 +815,7 @@ class RouterOrchestrator:
         }
         return intent_to_group.get(tier0_intent, ClarifyGroup.UNKNOWN)
 
-    def _create_confirmation_result(
+    async def _create_confirmation_result(
         self,
         router_result: RouterResult,
         session_id: str,
@@ -763,7 +838,7 @@ class RouterOrchestrator:
             sub_intent_id=router_result.sub_intent_id,
             router_result=router_result,
         )
-        self._pending_store.set(session_id, pending)
+        await self._pending_store.set(session_id, pending)
 
         return OrchestrationResult(
             router_result=router_result,
@@ -773,10 +848,10 @@ class RouterOrchestrator:
             can_execute=False,
         )
 
-    def clear_pending(self, session_id: str) -> None:
+    async def clear_pending(self, session_id: str) -> None:
         """세션의 대기 상태를 클리어합니다.
 
         Args:
             session_id: 세션 ID
         """
-        self._pending_store.delete(session_id)
+        await self._pending_store.delete(session_id)
@@ -0,0 +1,225 @@
+"""
+씬 에셋 디스크 캐시 (Content-addressed)
+
+씬 단위 렌더 결과물(씬 이미지, 인코딩된 씬 세그먼트 등)을 입력 fingerprint로
+디스크에 저장합니다. 스크립트 편집 후 재렌더할 때 입력이 같은 씬은 이전 잡의
+결과 파일을 그대로 재사용하고, 바뀐 씬만 다시 생성합니다.
+
+Fingerprint:
+- scene_fingerprint(*parts): 입력 값 전체를 정렬된 JSON으로 직렬화한 SHA256
+- 렌더 설정(해상도, 스타일 등)도 parts에 포함해야 설정 변경 시 캐시가 무효화됨
+
+저장 형식:
+- {key}{suffix}: 에셋 파일 (예: {key}.png, {key}.mp4)
+
+용량 관리:
+- 전체 용량이 max_bytes를 넘으면 가장 오래 사용하지 않은 파일부터 삭제 (LRU)
+- 프로세스 시작 후 첫 접근 시 디렉토리를 스캔하여 mtime 순으로 LRU 순서 복원
+
+환경변수:
+- RENDER_SCENE_CACHE_ENABLED: 캐시 활성화 여부
+- RENDER_SCENE_CACHE_DIR: 캐시 디렉토리
+- RENDER_SCENE_CACHE_MAX_MB: 최대 용량 (MB)
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.metrics import get_metrics
+
+logger = get_logger(__name__)
+
+
+def scene_fingerprint(*parts: Any) -> str:
+    """입력 값들의 fingerprint를 생성합니다 (정렬된 JSON의 SHA256).
+
+    dataclass는 호출자가 asdict()로 변환해서 전달합니다.
+    """
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SceneAssetCache:
+    """씬 에셋 디스크 캐시 (size-bounded LRU).
+
+    Attributes:
+        _cache_dir: 캐시 디렉토리
+        _max_bytes: 최대 용량 (바이트)
+        _entries: 파일명 → 크기 (LRU 순서, 마지막이 최근)
+    """
+
+    TMP_SUFFIX = ".tmp"
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        """캐시 초기화.
+
+        Args:
+            cache_dir: 캐시 디렉토리 (없으면 생성)
+            max_bytes: 최대 용량 (바이트)
+        """
+        self._cache_dir = Path(cache_dir)
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        get_metrics().register_cache("scene_asset", self.stats)
+
+    def get(self, key: str, suffix: str) -> Optional[Path]:
+        """캐시된 에셋 경로를 반환합니다.
+
+        Args:
+            key: scene_fingerprint()로 생성한 키
+            suffix: 파일 확장자 (예: ".png")
+
+        Returns:
+            캐시 파일 경로 또는 None
+        """
+        name = f"{key}{suffix}"
+        with self._lock:
+            self._ensure_loaded()
+            path = self._cache_dir / name
+            if name not in self._entries:
+                self._misses += 1
+                return None
+
+            try:
+                os.utime(path)  # LRU 순서 유지 (재시작 후 복원용)
+            except OSError as e:
+                logger.warning(f"Scene cache entry missing, dropping: {name[:16]}, error={e}")
+                self._remove(name)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(name)
+            self._hits += 1
+            return path
+
+    def put_file(self, key: str, source: Union[str, Path], suffix: str) -> Optional[Path]:
+        """에셋 파일을 캐시에 복사하고 필요 시 오래된 항목을 삭제합니다.
+
+        임시 파일에 복사한 뒤 rename하므로 동시 렌더 잡이 반쯤 쓰인 파일을 읽지 않습니다.
+
+        Args:
+            key: scene_fingerprint()로 생성한 키
+            source: 원본 파일 경로
+            suffix: 파일 확장자
+
+        Returns:
+            캐시 파일 경로 (저장 실패 시 None)
+        """
+        name = f"{key}{suffix}"
+        with self._lock:
+            self._ensure_loaded()
+            if name in self._entries:
+                self._remove(name)
+
+            path = self._cache_dir / name
+            tmp_path = self._cache_dir / f"{name}{self.TMP_SUFFIX}"
+            try:
+                shutil.copyfile(source, tmp_path)
+                os.replace(tmp_path, path)
+                size = path.stat().st_size
+            except OSError as e:
+                logger.warning(f"Scene cache write failed: {name[:16]}, error={e}")
+                tmp_path.unlink(missing_ok=True)
+                return None
+
+            self._entries[name] = size
+            self._total_bytes += size
+            self._evict()
+            return path if name in self._entries else None
+
+    def stats(self) -> dict:
+        """캐시 통계를 반환합니다."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "total_bytes": self._total_bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    # =========================================================================
+    # Internal (호출자가 _lock 보유)
+    # =========================================================================
+
+    def _ensure_loaded(self) -> None:
+        """디렉토리를 스캔하여 LRU 인덱스를 복원합니다 (최초 1회)."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        found = []
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            for path in self._cache_dir.iterdir():
+                if path.suffix == self.TMP_SUFFIX:
+                    path.unlink(missing_ok=True)
+                    continue
+                stat = path.stat()
+                found.append((stat.st_mtime, path.name, stat.st_size))
+        except OSError as e:
+            logger.warning(f"Scene cache dir unavailable: dir={self._cache_dir}, error={e}")
+            return
+
+        for _, name, size in sorted(found):
+            self._entries[name] = size
+            self._total_bytes += size
+
+        if found:
+            logger.info(
+                f"Scene asset cache loaded: entries={len(found)}, "
+                f"size={self._total_bytes / (1024 * 1024):.1f}MB"
+            )
+        self._evict()
+
+    def _evict(self) -> None:
+        """용량 초과 시 가장 오래된 항목부터 삭제합니다."""
+        while self._total_bytes > self._max_bytes and self._entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def _remove(self, name: str) -> None:
+        """항목 파일과 인덱스를 삭제합니다."""
+        self._total_bytes -= self._entries.pop(name, 0)
+        (self._cache_dir / name).unlink(missing_ok=True)
+
+
+# =============================================================================
+# Singleton
+# =============================================================================
+
+
+_scene_asset_cache: Optional[SceneAssetCache] = None
+
+
+def get_scene_asset_cache() -> Optional[SceneAssetCache]:
+    """SceneAssetCache 싱글톤 인스턴스 반환 (비활성화 시 None)."""
+    global _scene_asset_cache
+    settings = get_settings()
+    if not settings.RENDER_SCENE_CACHE_ENABLED:
+        return None
+    if _scene_asset_cache is None:
+        _scene_asset_cache = SceneAssetCache(
+            cache_dir=Path(settings.RENDER_SCENE_CACHE_DIR),
+            max_bytes=settings.RENDER_SCENE_CACHE_MAX_MB * 1024 * 1024,
+        )
+    return _scene_asset_cache
+
+
+def clear_scene_asset_cache() -> None:
+    """SceneAssetCache 싱글톤 초기화 (테스트용, 디스크 파일은 유지)."""
+    global _scene_asset_cache
+    _scene_asset_cache = None
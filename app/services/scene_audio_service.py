@@ -7,6 +7,8 @@ Phase 40: Scene Audio Service
 1. 문장별 TTS 생성 + Concatenation
 2. 오디오 길이 기반 씬 duration 확정
 3. 캡션 타임라인(JSON/SRT) 생성
+4. 작업 단위 문장 TTS 동시 합성 (TTS_SYNTHESIS_CONCURRENCY) + 디스크 캐시 재사용
+5. 전체 오디오 타임라인 단일 패스 조립 (문장 오디오 + 무음 패딩 → 최종 트랙 1회 concat)
 
 Usage:
     service = SceneAudioService()
@@ -29,7 +31,8 @@ import subprocess
 import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.clients.tts_provider import (
     BaseTTSProvider,
@@ -39,6 +42,13 @@ from app.clients.tts_provider import (
 )
 from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.services.tts_audio_cache import TTSAudioCache, get_tts_audio_cache
+from app.utils.audio_duration import (
+    get_audio_duration_from_bytes,
+    get_audio_duration_from_file,
+    get_audio_stream_info,
+)
 from app.utils.text_splitter import split_sentences
 
 logger = get_logger(__name__)
@@ -106,6 +116,24 @@ class SceneAudioResult:
         return [c.to_dict() for c in self.captions]
 
 
+@dataclass
+class AudioTimelineResult:
+    """전체 오디오 타임라인 생성 결과 (단일 패스)."""
+
+    audio_path: str  # 최종 오디오 트랙 경로
+    duration_sec: float  # 패딩 포함 전체 duration
+    scene_results: List[SceneAudioResult] = field(default_factory=list)
+    captions: List[CaptionEntry] = field(default_factory=list)
+
+    def get_captions_json(self) -> List[Dict[str, Any]]:
+        """캡션 JSON 리스트 반환."""
+        return [c.to_dict() for c in self.captions]
+
+    def get_srt(self) -> str:
+        """SRT 형식 자막 반환."""
+        return generate_srt(self.captions)
+
+
 # =============================================================================
 # Scene Audio Service
 # =============================================================================
@@ -124,12 +152,16 @@ class SceneAudioService:
         self,
         tts_provider: Optional[BaseTTSProvider] = None,
         silence_padding_sec: Optional[float] = None,
+        tts_concurrency: Optional[int] = None,
+        audio_cache: Optional[TTSAudioCache] = None,
     ):
         """서비스 초기화.
 
         Args:
             tts_provider: TTS Provider (없으면 환경변수 기반 생성)
             silence_padding_sec: 씬 끝 패딩 시간 (없으면 환경변수 사용)
+            tts_concurrency: 문장 TTS 동시 합성 수 (없으면 환경변수 사용)
+            audio_cache: TTS 오디오 캐시 (없으면 싱글톤, 비활성화 시 캐시 미사용)
         """
         self._tts = tts_provider or get_tts_provider()
         settings = get_settings()
@@ -141,6 +173,14 @@ class SceneAudioService:
                 settings, "SCENE_SILENCE_PADDING_SEC", 0.5
             )
 
+        # 문장 TTS 동시 합성 수 (작업 전체 기준)
+        self._tts_concurrency = max(
+            1, tts_concurrency or settings.TTS_SYNTHESIS_CONCURRENCY
+        )
+
+        # 문장 TTS 오디오 캐시
+        self._audio_cache = audio_cache or get_tts_audio_cache()
+
         # FFmpeg 사용 가능 여부
         self._has_ffmpeg = self._check_ffmpeg()
 
@@ -214,66 +254,67 @@ class SceneAudioService:
             output_dir=output_dir,
         )
 
-        # Step 4: 캡션 타임라인 생성
-        captions = self._generate_caption_timeline(
+        # Step 4-5: 캡션 타임라인 + duration 계산
+        return self._make_scene_result(
+            scene_id=scene_id,
             sentence_results=sentence_results,
+            concat_path=concat_path,
+            total_audio_duration=total_audio_duration,
             scene_offset_sec=scene_offset_sec,
         )
 
-        # Step 5: duration 계산 (+ 패딩)
-        final_duration = total_audio_duration + self._silence_padding_sec
-
-        # 실패 문장 수 계산
-        failed_count = sum(1 for r in sentence_results if not r.success)
-
-        result = SceneAudioResult(
-            scene_id=scene_id,
-            audio_path=str(concat_path),
-            duration_sec=final_duration,
-            audio_duration_sec=total_audio_duration,
-            captions=captions,
-            sentence_count=len(sentences),
-            failed_sentences=failed_count,
-        )
-
-        logger.info(
-            f"Scene {scene_id} audio generated: "
-            f"duration={final_duration:.2f}s, "
-            f"captions={len(captions)}, "
-            f"failed={failed_count}/{len(sentences)}"
-        )
-
-        return result
-
     async def generate_scene_audios(
         self,
         scenes: List[Dict[str, Any]],
         output_dir: Path,
     ) -> List[SceneAudioResult]:
-        """여러 씬의 오디오를 순차적으로 생성합니다.
+        """여러 씬의 오디오를 생성합니다.
 
-        전체 영상 타임라인에서 씬 오프셋을 누적하며 캡션을 생성합니다.
+        1. 모든 씬의 문장을 하나의 세마포어로 묶어 동시 TTS 합성
+        2. 씬별 concat (동시 실행)
+        3. 씬 순서대로 오프셋을 누적하며 캡션 생성
 
         Args:
             scenes: 씬 정보 리스트 [{"scene_id": "...", "narration": "..."}, ...]
             output_dir: 출력 디렉토리
 
         Returns:
-            List[SceneAudioResult]: 씬별 오디오 결과 리스트
+            List[SceneAudioResult]: 씬별 오디오 결과 리스트 (입력 순서)
         """
-        results = []
-        current_offset = 0.0
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-        for scene in scenes:
-            scene_id = scene.get("scene_id", f"scene-{len(results)}")
-            narration = scene.get("narration", "")
+        # Step 1: 작업 전체 문장 동시 TTS
+        scene_ids, all_sentence_results = await self._synthesize_scenes(scenes, output_dir)
 
-            result = await self.generate_scene_audio(
-                scene_id=scene_id,
-                narration=narration,
+        # Step 2: 씬별 concat
+        concat_indices = [i for i, results in enumerate(all_sentence_results) if results]
+        concat_outputs = await asyncio.gather(*[
+            self._concat_audios(
+                scene_id=scene_ids[i],
+                sentence_results=all_sentence_results[i],
                 output_dir=output_dir,
-                scene_offset_sec=current_offset,
             )
+            for i in concat_indices
+        ])
+        concat_by_index = dict(zip(concat_indices, concat_outputs))
+
+        # Step 3: 씬 순서대로 오프셋 누적 + 캡션 생성
+        results = []
+        current_offset = 0.0
+
+        for i, scene_id in enumerate(scene_ids):
+            if i in concat_by_index:
+                concat_path, total_audio_duration = concat_by_index[i]
+                result = self._make_scene_result(
+                    scene_id=scene_id,
+                    sentence_results=all_sentence_results[i],
+                    concat_path=concat_path,
+                    total_audio_duration=total_audio_duration,
+                    scene_offset_sec=current_offset,
+                )
+            else:
+                result = self._create_silent_result(scene_id, output_dir, current_offset)
 
             results.append(result)
 
@@ -287,17 +328,168 @@ class SceneAudioService:
 
         return results
 
+    async def generate_audio_timeline(
+        self,
+        scenes: List[Dict[str, Any]],
+        output_dir: Path,
+        output_path: Optional[Path] = None,
+        keep_scene_audio: bool = False,
+    ) -> AudioTimelineResult:
+        """전체 영상 오디오 트랙과 캡션 타임라인을 한 번에 생성합니다.
+
+        문장 오디오와 씬 끝 무음 패딩을 순서대로 나열한 concat 목록으로
+        FFmpeg를 1회만 실행합니다. 씬 duration과 캡션은 문장 duration 합으로 계산하므로
+        씬별 중간 파일 생성/재측정이 없습니다.
+
+        Args:
+            scenes: 씬 정보 리스트 [{"scene_id": "...", "narration": "..."}, ...]
+            output_dir: 출력 디렉토리 (문장 오디오 저장)
+            output_path: 최종 오디오 경로 (없으면 output_dir/audio_full.mp3)
+            keep_scene_audio: 씬별 오디오 파일도 생성할지 여부 (부분 재렌더용)
+
+        Returns:
+            AudioTimelineResult: 최종 트랙, 씬별 결과, 전체 캡션
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = Path(output_path) if output_path else output_dir / "audio_full.mp3"
+
+        # Step 1: 작업 전체 문장 동시 TTS
+        scene_ids, all_sentence_results = await self._synthesize_scenes(scenes, output_dir)
+
+        # (선택) 씬별 오디오 파일
+        scene_audio_paths: Dict[int, Path] = {}
+        if keep_scene_audio:
+            concat_indices = [i for i, results in enumerate(all_sentence_results) if results]
+            concat_outputs = await asyncio.gather(*[
+                self._concat_audios(
+                    scene_id=scene_ids[i],
+                    sentence_results=all_sentence_results[i],
+                    output_dir=output_dir,
+                )
+                for i in concat_indices
+            ])
+            scene_audio_paths = {
+                i: concat_path for i, (concat_path, _) in zip(concat_indices, concat_outputs)
+            }
+
+        # Step 2: 입력 포맷 확인 (모두 같은 MP3 포맷이면 재인코딩 없이 concat)
+        sentence_paths = [
+            r.audio_path for results in all_sentence_results for r in results if r.audio_path
+        ]
+        loop = asyncio.get_event_loop()
+        formats = await loop.run_in_executor(
+            None, lambda: [self._read_stream_format(p) for p in sentence_paths]
+        )
+        mp3_formats = [f[1:] for f in formats if f and f[0] == "mp3"]
+        sample_rate, channels = (
+            Counter(mp3_formats).most_common(1)[0][0] if mp3_formats else (22050, 1)
+        )
+
+        padding_path: Optional[Path] = None
+        if self._silence_padding_sec > 0:
+            padding_path = await self._create_silence_audio(
+                output_path=output_dir / "_padding_silence.mp3",
+                duration_sec=self._silence_padding_sec,
+                sample_rate=sample_rate,
+                channels=channels,
+            )
+
+        # Step 3: 씬 순서대로 concat 목록 + 오프셋 + 캡션
+        entries: List[str] = []
+        scene_results: List[SceneAudioResult] = []
+        current_offset = 0.0
+
+        for i, scene_id in enumerate(scene_ids):
+            sentence_results = all_sentence_results[i]
+            entries.extend(r.audio_path for r in sentence_results if r.audio_path)
+            if padding_path is not None:
+                entries.append(str(padding_path))
+
+            result = self._make_scene_result(
+                scene_id=scene_id,
+                sentence_results=sentence_results,
+                concat_path=scene_audio_paths.get(i),
+                total_audio_duration=sum(r.duration_sec for r in sentence_results),
+                scene_offset_sec=current_offset,
+            )
+            scene_results.append(result)
+            current_offset += result.duration_sec
+
+        # Step 4: 최종 트랙 (FFmpeg 1회)
+        copy_codec = bool(formats) and all(
+            f is not None and f == ("mp3", sample_rate, channels) for f in formats
+        )
+        await self._assemble_track(entries, output_path, copy_codec=copy_codec)
+
+        captions = [c for result in scene_results for c in result.captions]
+
+        logger.info(
+            f"Audio timeline generated: scenes={len(scene_results)}, "
+            f"entries={len(entries)}, duration={current_offset:.2f}s, "
+            f"captions={len(captions)}, copy_codec={copy_codec}"
+        )
+
+        return AudioTimelineResult(
+            audio_path=str(output_path),
+            duration_sec=current_offset,
+            scene_results=scene_results,
+            captions=captions,
+        )
+
     # =========================================================================
     # TTS Generation
     # =========================================================================
 
+    async def _synthesize_scenes(
+        self,
+        scenes: List[Dict[str, Any]],
+        output_dir: Path,
+    ) -> Tuple[List[str], List[List[SentenceAudioResult]]]:
+        """모든 씬의 문장을 하나의 세마포어로 묶어 동시에 TTS 합성합니다.
+
+        Args:
+            scenes: 씬 정보 리스트
+            output_dir: 출력 디렉토리
+
+        Returns:
+            (씬 ID 리스트, 씬별 문장 오디오 결과 리스트) - 입력 순서
+        """
+        scene_ids: List[str] = []
+        scene_sentences: List[List[str]] = []
+        for i, scene in enumerate(scenes):
+            scene_id = scene.get("scene_id", f"scene-{i}")
+            narration = scene.get("narration", "")
+            if not narration or not narration.strip():
+                logger.warning(f"Empty narration for scene: {scene_id}")
+                sentences = []
+            else:
+                sentences = split_sentences(narration)
+            scene_ids.append(scene_id)
+            scene_sentences.append(sentences)
+
+        # 동시 호출 수는 작업 전체 기준으로 제한
+        semaphore = asyncio.Semaphore(self._tts_concurrency)
+        all_sentence_results = await asyncio.gather(*[
+            self._generate_sentence_audios(
+                scene_id=scene_id,
+                sentences=sentences,
+                output_dir=output_dir,
+                semaphore=semaphore,
+            )
+            for scene_id, sentences in zip(scene_ids, scene_sentences)
+        ])
+
+        return scene_ids, list(all_sentence_results)
+
     async def _generate_sentence_audios(
         self,
         scene_id: str,
         sentences: List[str],
         output_dir: Path,
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> List[SentenceAudioResult]:
-        """각 문장에 대해 TTS 오디오를 생성합니다.
+        """각 문장에 대해 TTS 오디오를 동시에 생성합니다.
 
         실패 시 무음으로 대체합니다 (Job 전체 실패 금지).
 
@@ -305,67 +497,133 @@ class SceneAudioService:
             scene_id: 씬 ID
             sentences: 문장 리스트
             output_dir: 출력 디렉토리
+            semaphore: TTS 동시 호출 제한 (없으면 씬 단위로 새로 생성)
 
         Returns:
-            List[SentenceAudioResult]: 문장별 오디오 결과
+            List[SentenceAudioResult]: 문장별 오디오 결과 (문장 순서)
         """
-        results = []
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._tts_concurrency)
 
-        for i, sentence in enumerate(sentences):
-            audio_path = output_dir / f"{scene_id}_sent_{i:03d}.mp3"
+        return list(await asyncio.gather(*[
+            self._generate_sentence_audio(
+                scene_id=scene_id,
+                index=i,
+                sentence=sentence,
+                output_dir=output_dir,
+                semaphore=semaphore,
+            )
+            for i, sentence in enumerate(sentences)
+        ]))
 
-            try:
-                # TTS 생성
-                tts_result = await self._tts.synthesize(
-                    text=sentence,
-                    language="ko",
+    async def _generate_sentence_audio(
+        self,
+        scene_id: str,
+        index: int,
+        sentence: str,
+        output_dir: Path,
+        semaphore: asyncio.Semaphore,
+    ) -> SentenceAudioResult:
+        """한 문장의 TTS 오디오를 생성합니다 (캐시 hit 시 합성/길이 측정 생략).
+
+        Args:
+            scene_id: 씬 ID
+            index: 씬 내 문장 순번
+            sentence: 문장
+            output_dir: 출력 디렉토리
+            semaphore: TTS 동시 호출 제한
+
+        Returns:
+            SentenceAudioResult: 문장 오디오 결과
+        """
+        audio_path = output_dir / f"{scene_id}_sent_{index:03d}.mp3"
+        cache_key = self._make_cache_key(sentence)
+
+        try:
+            cached = await self._audio_cache.aget(cache_key) if self._audio_cache else None
+            if cached is not None and cached.duration_sec > 0:
+                audio_path.write_bytes(cached.audio_bytes)
+                logger.debug(
+                    f"TTS cache hit: scene={scene_id}, sent={index}, "
+                    f"duration={cached.duration_sec:.2f}s"
+                )
+                return SentenceAudioResult(
+                    sentence=sentence,
+                    audio_path=str(audio_path),
+                    duration_sec=cached.duration_sec,
+                    success=True,
                 )
 
-                # 파일 저장
-                audio_path.write_bytes(tts_result.audio_bytes)
+            # TTS 생성 (원격 호출만 동시 수 제한)
+            async with semaphore:
+                with metrics.timer("tts"):
+                    tts_result = await self._tts.synthesize(
+                        text=sentence,
+                        language="ko",
+                    )
 
-                # duration 계산 (실제 파일에서 읽거나 TTS 결과 사용)
-                duration = await self._get_audio_duration(str(audio_path))
-                if duration <= 0:
-                    duration = tts_result.duration_sec
+            # 파일 저장
+            audio_path.write_bytes(tts_result.audio_bytes)
 
-                results.append(
-                    SentenceAudioResult(
-                        sentence=sentence,
-                        audio_path=str(audio_path),
+            # duration 계산 (메모리의 오디오 바이트에서 읽거나 TTS 결과 사용)
+            duration = await self._get_audio_duration(
+                str(audio_path), audio_bytes=tts_result.audio_bytes
+            )
+            if duration <= 0:
+                duration = tts_result.duration_sec
+
+            if self._audio_cache and duration > 0:
+                await self._audio_cache.aput(
+                    cache_key,
+                    TTSResult(
+                        audio_bytes=tts_result.audio_bytes,
                         duration_sec=duration,
-                        success=True,
-                    )
+                        format=tts_result.format,
+                        sample_rate=tts_result.sample_rate,
+                    ),
                 )
 
-                logger.debug(
-                    f"TTS generated: scene={scene_id}, sent={i}, "
-                    f"duration={duration:.2f}s"
-                )
+            logger.debug(
+                f"TTS generated: scene={scene_id}, sent={index}, "
+                f"duration={duration:.2f}s"
+            )
 
-            except Exception as e:
-                # 실패 시 무음으로 대체
-                logger.warning(
-                    f"TTS failed for sentence {i}: {e}, using silence"
-                )
+            return SentenceAudioResult(
+                sentence=sentence,
+                audio_path=str(audio_path),
+                duration_sec=duration,
+                success=True,
+            )
 
-                # 무음 파일 생성
-                silence_path = await self._create_silence_audio(
-                    output_path=audio_path,
-                    duration_sec=self.SILENCE_DURATION_SEC,
-                )
+        except Exception as e:
+            # 실패 시 무음으로 대체
+            logger.warning(
+                f"TTS failed for sentence {index}: {e}, using silence"
+            )
 
-                results.append(
-                    SentenceAudioResult(
-                        sentence=sentence,
-                        audio_path=str(silence_path),
-                        duration_sec=self.SILENCE_DURATION_SEC,
-                        success=False,
-                        error=str(e),
-                    )
-                )
+            # 무음 파일 생성
+            silence_path = await self._create_silence_audio(
+                output_path=audio_path,
+                duration_sec=self.SILENCE_DURATION_SEC,
+            )
 
-        return results
+            return SentenceAudioResult(
+                sentence=sentence,
+                audio_path=str(silence_path),
+                duration_sec=self.SILENCE_DURATION_SEC,
+                success=False,
+                error=str(e),
+            )
+
+    def _make_cache_key(self, sentence: str) -> str:
+        """문장 TTS 캐시 키 (synthesize 호출 인자와 동일한 voice/language/speed 기준)."""
+        return TTSAudioCache.make_key(
+            provider=type(self._tts).__name__,
+            voice=None,
+            language="ko",
+            speed=1.0,
+            text=sentence,
+        )
 
     # =========================================================================
     # Audio Concatenation
@@ -430,12 +688,14 @@ class SceneAudioService:
         self,
         audio_paths: List[str],
         output_path: Path,
+        copy_codec: bool = True,
     ) -> bool:
         """FFmpeg를 사용해 오디오 파일들을 합칩니다.
 
         Args:
             audio_paths: 입력 오디오 파일 경로들
             output_path: 출력 파일 경로
+            copy_codec: True면 재인코딩 없이 복사, False면 MP3로 1회 인코딩
 
         Returns:
             bool: 성공 여부
@@ -458,7 +718,11 @@ class SceneAudioService:
                 "-f", "concat",
                 "-safe", "0",
                 "-i", list_file,
-                "-c", "copy",  # 재인코딩 없이 복사
+                *(
+                    ["-c", "copy"]  # 재인코딩 없이 복사
+                    if copy_codec
+                    else ["-c:a", "libmp3lame", "-q:a", "4"]
+                ),
                 str(output_path),
             ]
 
@@ -468,7 +732,7 @@ class SceneAudioService:
                 lambda: subprocess.run(
                     cmd,
                     capture_output=True,
-                    timeout=60,
+                    timeout=max(60, len(audio_paths)),
                 ),
             )
 
@@ -485,10 +749,102 @@ class SceneAudioService:
             logger.error(f"FFmpeg concat error: {e}")
             return False
 
+    async def _assemble_track(
+        self,
+        entries: List[str],
+        output_path: Path,
+        copy_codec: bool,
+    ) -> None:
+        """concat 목록을 최종 오디오 트랙 하나로 합칩니다.
+
+        FFmpeg가 없거나 실패하면 파일 바이트를 순서대로 이어 붙입니다
+        (MP3는 프레임 단위로 독립적이라 재생은 가능).
+
+        Args:
+            entries: 입력 파일 경로 (재생 순서)
+            output_path: 최종 오디오 경로
+            copy_codec: 재인코딩 없이 복사할지 여부
+        """
+        if self._has_ffmpeg and entries:
+            if await self._ffmpeg_concat(entries, output_path, copy_codec=copy_codec):
+                return
+            logger.warning("FFmpeg timeline concat failed, falling back to byte concat")
+
+        def _byte_concat():
+            with open(output_path, "wb") as out:
+                for path in entries:
+                    out.write(Path(path).read_bytes())
+
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, _byte_concat)
+
+    @staticmethod
+    def _read_stream_format(audio_path: str) -> Optional[Tuple[str, int, int]]:
+        """(컨테이너, 샘플레이트, 채널 수)를 반환합니다 (파일 앞부분만 읽음)."""
+        try:
+            with open(audio_path, "rb") as f:
+                head = f.read(64 * 1024)
+        except OSError:
+            return None
+        info = get_audio_stream_info(head)
+        if info is None:
+            return None
+        container = "wav" if head[:4] == b"RIFF" else "mp3"
+        return (container, *info)
+
     # =========================================================================
     # Caption Timeline
     # =========================================================================
 
+    def _make_scene_result(
+        self,
+        scene_id: str,
+        sentence_results: List[SentenceAudioResult],
+        concat_path: Optional[Path],
+        total_audio_duration: float,
+        scene_offset_sec: float,
+    ) -> SceneAudioResult:
+        """캡션 타임라인과 최종 duration(+ 패딩)으로 씬 결과를 만듭니다.
+
+        Args:
+            scene_id: 씬 ID
+            sentence_results: 문장별 오디오 결과
+            concat_path: 씬 오디오 파일 경로 (없으면 빈 문자열로 기록)
+            total_audio_duration: 순수 오디오 duration
+            scene_offset_sec: 씬 시작 오프셋 (전체 영상 기준)
+
+        Returns:
+            SceneAudioResult: 씬 오디오 생성 결과
+        """
+        captions = self._generate_caption_timeline(
+            sentence_results=sentence_results,
+            scene_offset_sec=scene_offset_sec,
+        )
+
+        final_duration = total_audio_duration + self._silence_padding_sec
+
+        # 실패 문장 수 계산
+        failed_count = sum(1 for r in sentence_results if not r.success)
+
+        result = SceneAudioResult(
+            scene_id=scene_id,
+            audio_path=str(concat_path) if concat_path else "",
+            duration_sec=final_duration,
+            audio_duration_sec=total_audio_duration,
+            captions=captions,
+            sentence_count=len(sentence_results),
+            failed_sentences=failed_count,
+        )
+
+        logger.info(
+            f"Scene {scene_id} audio generated: "
+            f"duration={final_duration:.2f}s, "
+            f"captions={len(captions)}, "
+            f"failed={failed_count}/{len(sentence_results)}"
+        )
+
+        return result
+
     def _generate_caption_timeline(
         self,
         sentence_results: List[SentenceAudioResult],
@@ -526,15 +882,32 @@ class SceneAudioService:
     # Helper Methods
     # =========================================================================
 
-    async def _get_audio_duration(self, audio_path: str) -> float:
+    async def _get_audio_duration(
+        self,
+        audio_path: str,
+        audio_bytes: Optional[bytes] = None,
+    ) -> float:
         """오디오 파일의 재생 시간을 반환합니다.
 
+        MP3/WAV 헤더를 프로세스 내에서 파싱하고, 알 수 없는 형식만 ffprobe로 폴백합니다.
+
         Args:
             audio_path: 오디오 파일 경로
+            audio_bytes: 이미 메모리에 있는 오디오 바이트 (있으면 파일을 다시 읽지 않음)
 
         Returns:
             float: 재생 시간 (초), 실패 시 0
         """
+        if audio_bytes is not None:
+            duration = get_audio_duration_from_bytes(audio_bytes)
+        else:
+            loop = asyncio.get_event_loop()
+            duration = await loop.run_in_executor(
+                None, get_audio_duration_from_file, audio_path
+            )
+        if duration is not None:
+            return duration
+
         if not self._has_ffmpeg:
             return 0.0
 
@@ -570,12 +943,16 @@ class SceneAudioService:
         self,
         output_path: Path,
         duration_sec: float,
+        sample_rate: int = 22050,
+        channels: int = 1,
     ) -> Path:
         """무음 오디오 파일을 생성합니다.
 
         Args:
             output_path: 출력 파일 경로
             duration_sec: 재생 시간 (초)
+            sample_rate: 샘플레이트 (이어 붙일 오디오와 맞춤)
+            channels: 채널 수
 
         Returns:
             Path: 생성된 파일 경로
@@ -588,7 +965,9 @@ class SceneAudioService:
                     "ffmpeg",
                     "-y",
                     "-f", "lavfi",
-                    "-i", f"anullsrc=r=22050:cl=mono:d={duration_sec}",
+                    "-i",
+                    f"anullsrc=r={sample_rate}:"
+                    f"cl={'mono' if channels == 1 else 'stereo'}:d={duration_sec}",
                     "-c:a", "libmp3lame",
                     "-q:a", "9",
                     str(output_path),
@@ -9,12 +9,27 @@
 2. 씬별 RAG 검색 + 생성: 각 씬 키워드로 Top-K 검색 후 씬 스크립트 생성 (N회 LLM)
 3. 일관성 다듬기: 씬 요약들로 톤/문체 통일 (1회 LLM, Optional)
 
+병렬 모드 (SCRIPT_SCENE_CONCURRENCY > 1):
+- 전체 씬의 청크를 먼저 병렬 검색한 뒤, 세마포어로 동시 생성 수를 제한하여 씬 생성
+- 씬 간 연결은 이전 씬 출력 대신 아웃라인(이전/다음 씬 제목)으로 전달
+- 콜백은 아웃라인 순서대로 호출 (앞선 씬이 모두 끝난 씬부터 순서대로)
+- SCRIPT_TRANSITION_SMOOTHING_ENABLED: 마지막에 씬 도입 문장만 1회 LLM으로 다듬기
+
+씬 검색:
+- 전체 씬 쿼리를 search_many로 배치 임베딩 1회 + 다중 벡터 검색 1회 처리
+- 검색 범위는 소스셋 문서의 doc_id로 제한
+- 결과는 (문서 범위, 씬 쿼리) 단위로 캐시
+- 소스셋 청크 BM25 인덱스(문자 bigram)를 작업당 1회 생성하여 폴백/하이브리드(RRF)에 사용
+
 장점:
 - 문서 길이에 관계없이 컨텍스트 8K 이내 유지
 - 각 씬에 사용된 청크 출처 추적 가능 (source_refs)
 - FAQ/채팅에서 사용 중인 Top-K RAG 패턴 재활용
 """
 
+import asyncio
+import hashlib
+import json
 import re
 import time
 import uuid
@@ -23,7 +38,11 @@ from enum import Enum
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from app.clients.llm_client import LLMClient
-from app.clients.milvus_client import MilvusSearchClient, get_milvus_client
+from app.clients.milvus_client import (
+    MilvusSearchClient,
+    get_doc_id_filter_expr,
+    get_milvus_client,
+)
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.models.source_set import (
@@ -32,6 +51,8 @@ from app.models.source_set import (
     GeneratedScript,
     SourceRef,
 )
+from app.utils.cache import TTLCache
+from app.utils.keyword_index import KeywordIndex, reciprocal_rank_fusion
 
 logger = get_logger(__name__)
 
@@ -48,6 +69,32 @@ SceneCallback = Callable[
 ]
 
 
+# =============================================================================
+# 씬 검색 결과 캐시
+# =============================================================================
+
+_scene_search_cache: Optional[TTLCache[List[Dict[str, Any]]]] = None
+
+
+def get_scene_search_cache() -> TTLCache[List[Dict[str, Any]]]:
+    """씬 검색 결과 캐시 싱글톤 인스턴스 반환."""
+    global _scene_search_cache
+    if _scene_search_cache is None:
+        settings = get_settings()
+        _scene_search_cache = TTLCache(
+            maxsize=settings.SCRIPT_SCENE_SEARCH_CACHE_MAXSIZE,
+            ttl_seconds=settings.SCRIPT_SCENE_SEARCH_CACHE_TTL_SECONDS,
+            name="scene_search",
+        )
+    return _scene_search_cache
+
+
+def clear_scene_search_cache() -> None:
+    """씬 검색 결과 캐시 초기화 (테스트용)."""
+    global _scene_search_cache
+    _scene_search_cache = None
+
+
 # =============================================================================
 # Phase 55: 한국어 출력 검증 및 강제
 # =============================================================================
@@ -102,6 +149,14 @@ def _has_english_start(text: str) -> bool:
     return any(text_lower.startswith(e.lower()) for e in english_starts)
 
 
+def _split_first_sentence(text: str) -> Tuple[str, str]:
+    """텍스트를 첫 문장과 나머지로 나눕니다."""
+    parts = re.split(r'(?<=[.!?。])\s+', text.strip(), maxsplit=1)
+    if len(parts) == 1:
+        return parts[0], ""
+    return parts[0], parts[1]
+
+
 # 강화된 한국어 강제 지침 (프롬프트 끝에 추가)
 KOREAN_ENFORCEMENT = """
 
@@ -186,6 +241,9 @@ class GenerationState:
     tone: str = "친근하고 전문적인"
     key_terms: List[str] = field(default_factory=list)
     last_narration_ending: str = ""
+    # 병렬 모드: 이전 씬 결과 대신 아웃라인 기반 흐름 정보
+    previous_scene_title: str = ""
+    next_scene_title: str = ""
 
 
 # =============================================================================
@@ -201,6 +259,9 @@ class SceneBasedScriptGenerator:
         _milvus_client: Milvus 검색 클라이언트
         _model: 사용할 LLM 모델
         _top_k: RAG 검색 시 가져올 청크 수
+        _scene_concurrency: 씬 동시 생성 수 (1이면 순차 생성)
+        _transition_smoothing: 병렬 생성 후 씬 연결 다듬기 여부
+        _hybrid_search: 벡터 검색 + BM25 RRF 결합 여부
     """
 
     # LLM 호출 설정
@@ -217,6 +278,9 @@ class SceneBasedScriptGenerator:
         milvus_client: Optional[MilvusSearchClient] = None,
         model: Optional[str] = None,
         top_k: int = DEFAULT_TOP_K,
+        scene_concurrency: Optional[int] = None,
+        transition_smoothing: Optional[bool] = None,
+        hybrid_search: Optional[bool] = None,
     ):
         """초기화.
 
@@ -225,6 +289,11 @@ class SceneBasedScriptGenerator:
             milvus_client: Milvus 클라이언트 (None이면 싱글톤 사용)
             model: 사용할 LLM 모델 (None이면 환경변수에서 읽음)
             top_k: 씬당 검색할 청크 수
+            scene_concurrency: 씬 동시 생성 수 (None이면 SCRIPT_SCENE_CONCURRENCY)
+            transition_smoothing: 씬 연결 다듬기 여부
+                (None이면 SCRIPT_TRANSITION_SMOOTHING_ENABLED)
+            hybrid_search: 벡터 검색 + BM25 RRF 결합 여부
+                (None이면 SCRIPT_SCENE_HYBRID_SEARCH_ENABLED)
         """
         settings = get_settings()
         self._llm_client = llm_client or LLMClient()
@@ -232,9 +301,23 @@ class SceneBasedScriptGenerator:
         # 우선순위: 직접 지정 > SCRIPT_LLM_MODEL > LLM_MODEL_NAME
         self._model = model or settings.SCRIPT_LLM_MODEL or settings.LLM_MODEL_NAME
         self._top_k = top_k
+        self._scene_concurrency = max(
+            1,
+            scene_concurrency if scene_concurrency is not None
+            else settings.SCRIPT_SCENE_CONCURRENCY,
+        )
+        self._transition_smoothing = (
+            transition_smoothing if transition_smoothing is not None
+            else settings.SCRIPT_TRANSITION_SMOOTHING_ENABLED
+        )
+        self._hybrid_search = (
+            hybrid_search if hybrid_search is not None
+            else settings.SCRIPT_SCENE_HYBRID_SEARCH_ENABLED
+        )
 
         logger.info(
-            f"SceneBasedScriptGenerator initialized: model={self._model}, top_k={self._top_k}"
+            f"SceneBasedScriptGenerator initialized: model={self._model}, top_k={self._top_k}, "
+            f"scene_concurrency={self._scene_concurrency}"
         )
 
     # =========================================================================
@@ -282,6 +365,9 @@ class SceneBasedScriptGenerator:
         # 전체 청크 텍스트 준비 (검색용 인덱스)
         all_chunks = self._prepare_chunk_index(document_chunks)
 
+        # 씬 검색 범위: 소스셋 문서의 Milvus doc_id
+        search_doc_ids = self._collect_search_doc_ids(document_chunks, doc_ids)
+
         try:
             # 1단계: 아웃라인 생성
             logger.info("Step 1: Generating outline...")
@@ -305,12 +391,23 @@ class SceneBasedScriptGenerator:
             )
 
             # 2단계: 씬별 스크립트 생성 (콜백 전달)
-            logger.info("Step 2: Generating scenes with RAG...")
-            chapters, scene_metrics = await self._generate_scenes_with_rag_metrics(
-                outline, all_chunks, doc_ids,
-                script_id=script_id,
-                on_scene_generated=on_scene_generated,
-            )
+            if self._scene_concurrency > 1:
+                logger.info(
+                    f"Step 2: Generating scenes with RAG "
+                    f"(parallel, concurrency={self._scene_concurrency})..."
+                )
+                chapters, scene_metrics = await self._generate_scenes_parallel_with_metrics(
+                    outline, all_chunks, search_doc_ids,
+                    script_id=script_id,
+                    on_scene_generated=on_scene_generated,
+                )
+            else:
+                logger.info("Step 2: Generating scenes with RAG...")
+                chapters, scene_metrics = await self._generate_scenes_with_rag_metrics(
+                    outline, all_chunks, search_doc_ids,
+                    script_id=script_id,
+                    on_scene_generated=on_scene_generated,
+                )
 
             # 메트릭 병합
             metrics.total_retrieve_ms = scene_metrics.total_retrieve_ms
@@ -333,6 +430,10 @@ class SceneBasedScriptGenerator:
             # 3단계: 일관성 다듬기 (Optional - 현재는 스킵)
             # chapters = await self._polish_script(chapters)
 
+            # 병렬 모드: 씬 도입 문장 연결 다듬기 (Optional)
+            if self._scene_concurrency > 1 and self._transition_smoothing:
+                await self._smooth_transitions(chapters, outline.title)
+
             # 최종 스크립트 조립
             total_duration = sum(ch.duration_sec for ch in chapters)
             metrics.total_ms = (time.perf_counter() - start_time) * 1000
@@ -580,7 +681,7 @@ JSON 아웃라인:"""
         Args:
             outline: 씬 아웃라인
             all_chunks: 전체 청크 리스트
-            doc_ids: 문서 ID 리스트
+            doc_ids: 검색 범위 Milvus doc_id 리스트 (비어있으면 전체 컬렉션)
             script_id: 스크립트 ID (콜백용)
             on_scene_generated: 씬 생성 콜백 (씬이 생성될 때마다 호출)
 
@@ -593,24 +694,23 @@ JSON 아웃라인:"""
         global_scene_index = 0
         current_scene_number = 0  # 1-based 진행률 표시용
 
+        # 전체 씬 청크 배치 검색
+        retrieve_start = time.perf_counter()
+        chunk_lists = await self._search_chunks_for_scenes(
+            [sc for ch in outline.chapters for sc in ch.scenes], all_chunks, doc_ids
+        )
+        metrics.total_retrieve_ms = (time.perf_counter() - retrieve_start) * 1000
+
         for ch_outline in outline.chapters:
             scenes = []
             chapter_duration = 0
 
             for sc_outline in ch_outline.scenes:
-                # 씬 키워드로 관련 청크 검색
-                retrieve_start = time.perf_counter()
-                relevant_chunks = await self._search_chunks_for_scene(
-                    sc_outline, all_chunks
-                )
-                retrieve_ms = (time.perf_counter() - retrieve_start) * 1000
-                metrics.total_retrieve_ms += retrieve_ms
+                relevant_chunks = chunk_lists[global_scene_index]
 
                 if not relevant_chunks:
                     metrics.fail_reasons.append(FailReason.RETRIEVE_EMPTY.value)
-                    logger.warning(
-                        f"Scene '{sc_outline.title}': RETRIEVE_EMPTY, retrieve_ms={retrieve_ms:.0f}"
-                    )
+                    logger.warning(f"Scene '{sc_outline.title}': RETRIEVE_EMPTY")
 
                 # 씬 스크립트 생성
                 scene_start = time.perf_counter()
@@ -644,28 +744,15 @@ JSON 아웃라인:"""
 
                     logger.debug(
                         f"Scene '{sc_outline.title}' generated: "
-                        f"retrieve_ms={retrieve_ms:.0f}, llm_ms={scene_llm_ms:.0f}, "
+                        f"llm_ms={scene_llm_ms:.0f}, "
                         f"chunks={len(relevant_chunks)}, narration_len={len(scene.narration)}"
                     )
 
                     # 씬 생성 콜백 호출 (부분 저장)
-                    if on_scene_generated and script_id:
-                        try:
-                            await on_scene_generated(
-                                script_id,
-                                ch_outline.chapter_index,
-                                ch_outline.title,
-                                sc_outline.scene_index,
-                                scene,
-                                current_scene_number,
-                                outline.total_scenes,
-                            )
-                        except Exception as e:
-                            # 콜백 실패는 경고로 처리 (씬 생성은 계속)
-                            logger.warning(
-                                f"Scene callback failed: chapter={ch_outline.chapter_index}, "
-                                f"scene={sc_outline.scene_index}, error={e}"
-                            )
+                    await self._notify_scene_generated(
+                        on_scene_generated, script_id, ch_outline, sc_outline,
+                        scene, current_scene_number, outline.total_scenes,
+                    )
                 else:
                     metrics.failed_scene_count += 1
                     if scene_fail_reason:
@@ -684,6 +771,157 @@ JSON 아웃라인:"""
 
         return chapters, metrics
 
+    async def _generate_scenes_parallel_with_metrics(
+        self,
+        outline: ScriptOutline,
+        all_chunks: List[Dict[str, Any]],
+        doc_ids: List[str],
+        script_id: Optional[str] = None,
+        on_scene_generated: Optional[SceneCallback] = None,
+    ) -> Tuple[List[GeneratedChapter], GenerationMetrics]:
+        """씬을 병렬로 생성합니다 (SCRIPT_SCENE_CONCURRENCY > 1).
+
+        1. 전체 씬의 청크를 배치 검색 (search_many)
+        2. 세마포어로 동시 생성 수를 제한하여 씬 생성
+           (연결 정보는 이전 씬 결과가 아닌 아웃라인의 이전/다음 씬 제목)
+        3. 콜백은 앞선 씬이 모두 끝난 씬부터 아웃라인 순서대로 호출
+
+        Args/Returns: _generate_scenes_with_rag_metrics와 동일
+        """
+        metrics = GenerationMetrics()
+        flat = [
+            (ch_outline, sc_outline)
+            for ch_outline in outline.chapters
+            for sc_outline in ch_outline.scenes
+        ]
+        if not flat:
+            return [], metrics
+
+        # 1) 전체 씬 청크 배치 검색
+        retrieve_start = time.perf_counter()
+        chunk_lists = await self._search_chunks_for_scenes(
+            [sc_outline for _, sc_outline in flat], all_chunks, doc_ids
+        )
+        metrics.total_retrieve_ms = (time.perf_counter() - retrieve_start) * 1000
+
+        for (_, sc_outline), relevant_chunks in zip(flat, chunk_lists):
+            if not relevant_chunks:
+                metrics.fail_reasons.append(FailReason.RETRIEVE_EMPTY.value)
+                logger.warning(f"Scene '{sc_outline.title}': RETRIEVE_EMPTY")
+
+        # 2) 씬 병렬 생성 + 순서 보장 콜백
+        semaphore = asyncio.Semaphore(self._scene_concurrency)
+        emit_lock = asyncio.Lock()
+        # 씬별 (_generate_single_scene_with_metrics 결과, llm_ms)
+        results: List[Optional[Tuple[Tuple, float]]] = [None] * len(flat)
+        next_emit = 0
+        current_scene_number = 0
+
+        async def _emit_ready() -> None:
+            nonlocal next_emit, current_scene_number
+            async with emit_lock:
+                while next_emit < len(flat) and results[next_emit] is not None:
+                    ch_outline, sc_outline = flat[next_emit]
+                    scene = results[next_emit][0][0]
+                    if scene:
+                        current_scene_number += 1
+                        await self._notify_scene_generated(
+                            on_scene_generated, script_id, ch_outline, sc_outline,
+                            scene, current_scene_number, outline.total_scenes,
+                        )
+                    next_emit += 1
+
+        async def _generate(i: int) -> None:
+            ch_outline, sc_outline = flat[i]
+            state = GenerationState(
+                current_scene_index=i,
+                previous_scene_title=flat[i - 1][1].title if i > 0 else "",
+                next_scene_title=flat[i + 1][1].title if i + 1 < len(flat) else "",
+            )
+            async with semaphore:
+                scene_start = time.perf_counter()
+                result = await self._generate_single_scene_with_metrics(
+                    sc_outline,
+                    chunk_lists[i],
+                    state,
+                    outline.title,
+                    ch_outline.title,
+                )
+                scene_llm_ms = (time.perf_counter() - scene_start) * 1000
+            results[i] = (result, scene_llm_ms)
+            await _emit_ready()
+
+        await asyncio.gather(*[_generate(i) for i in range(len(flat))])
+
+        # 3) 아웃라인 순서대로 챕터 조립 + 메트릭 집계
+        chapters = []
+        position = 0
+        for ch_outline in outline.chapters:
+            scenes = []
+            chapter_duration = 0
+
+            for sc_outline in ch_outline.scenes:
+                (scene, scene_fail_reason, retries, korean_passed), scene_llm_ms = results[position]
+                position += 1
+
+                metrics.total_scene_llm_ms += scene_llm_ms
+                metrics.scene_count += 1
+                metrics.retry_count += retries
+
+                if korean_passed:
+                    metrics.korean_validation_pass += 1
+                else:
+                    metrics.korean_validation_fail += 1
+
+                if scene:
+                    scenes.append(scene)
+                    chapter_duration += scene.duration_sec
+                else:
+                    metrics.failed_scene_count += 1
+                    if scene_fail_reason:
+                        metrics.fail_reasons.append(scene_fail_reason)
+
+            if scenes:
+                chapters.append(GeneratedChapter(
+                    chapter_index=ch_outline.chapter_index,
+                    title=ch_outline.title,
+                    duration_sec=chapter_duration,
+                    scenes=scenes,
+                ))
+
+        return chapters, metrics
+
+    async def _notify_scene_generated(
+        self,
+        on_scene_generated: Optional[SceneCallback],
+        script_id: Optional[str],
+        ch_outline: ChapterOutline,
+        sc_outline: SceneOutline,
+        scene: GeneratedScene,
+        current_scene_number: int,
+        total_scenes: int,
+    ) -> None:
+        """씬 생성 콜백을 호출합니다 (실패는 경고로 처리)."""
+        if not on_scene_generated or not script_id:
+            return
+
+        try:
+            await on_scene_generated(
+                script_id,
+                ch_outline.chapter_index,
+                ch_outline.title,
+                sc_outline.scene_index,
+                scene,
+                current_scene_number,
+                total_scenes,
+            )
+        except Exception as e:
+            # 콜백 실패는 경고로 처리 (씬 생성은 계속)
+            logger.warning(
+                f"Scene callback failed: chapter={ch_outline.chapter_index}, "
+                f"scene={sc_outline.scene_index}, error={e}"
+            )
+
     async def _generate_single_scene_with_metrics(
         self,
         scene_outline: SceneOutline,
@@ -724,8 +962,7 @@ JSON 아웃라인:"""
         Returns:
             관련 청크 리스트
         """
-        # 검색 쿼리 구성: 씬 제목 + 키워드
-        query = f"{scene.title} {' '.join(scene.keywords)}"
+        query = self._scene_query(scene)
 
         try:
             # Milvus 벡터 검색
@@ -738,15 +975,7 @@ JSON 아웃라인:"""
                 logger.debug(
                     f"RAG search for scene '{scene.title}': {len(results)} chunks found"
                 )
-                return [
-                    {
-                        "doc_id": r.get("doc_id", ""),
-                        "chunk_index": r.get("metadata", {}).get("chunk_id", 0),
-                        "text": r.get("content", ""),
-                        "score": r.get("score", 0),
-                    }
-                    for r in results
-                ]
+                return self._to_scene_chunks(results)
 
         except Exception as e:
             logger.warning(f"Milvus search failed, using keyword fallback: {e}")
@@ -754,24 +983,143 @@ JSON 아웃라인:"""
         # 폴백: 키워드 기반 텍스트 매칭
         return self._keyword_search_fallback(scene.keywords, all_chunks)
 
+    async def _search_chunks_for_scenes(
+        self,
+        scenes: List[SceneOutline],
+        all_chunks: List[Dict[str, Any]],
+        doc_ids: List[str],
+    ) -> List[List[Dict[str, Any]]]:
+        """전체 씬의 관련 청크를 한 번에 검색합니다.
+
+        캐시에 없는 씬 쿼리만 모아 search_many 1회로 검색하며, 검색 범위는
+        doc_ids로 제한합니다. 결과가 없거나 검색이 실패한 씬은 BM25 키워드 폴백을
+        사용하고, 하이브리드 모드에서는 벡터 결과와 BM25 결과를 RRF로 결합합니다.
+
+        Args:
+            scenes: 씬 아웃라인 리스트
+            all_chunks: 전체 청크 리스트 (폴백용)
+            doc_ids: 검색 범위 Milvus doc_id 리스트 (비어있으면 전체 컬렉션)
+
+        Returns:
+            scenes와 같은 순서의 관련 청크 리스트
+        """
+        filter_expr = get_doc_id_filter_expr(doc_ids)
+        scope = hashlib.md5((filter_expr or "").encode("utf-8")).hexdigest()[:16]
+        cache = get_scene_search_cache()
+
+        queries = [self._scene_query(scene) for scene in scenes]
+        cache_keys = [f"{scope}|{self._top_k}|{query}" for query in queries]
+        found: Dict[str, List[Dict[str, Any]]] = {}
+        for key in cache_keys:
+            cached = cache.get(key)
+            if cached is not None:
+                found[key] = cached
+
+        # 캐시 미스 쿼리만 배치 검색 (중복 쿼리는 1회)
+        missing = list(dict.fromkeys(
+            (key, query) for key, query in zip(cache_keys, queries) if key not in found
+        ))
+        if missing:
+            try:
+                results = await self._milvus_client.search_many(
+                    [query for _, query in missing],
+                    filter_expr=filter_expr,
+                    top_k=self._top_k,
+                )
+                for (key, _), hits in zip(missing, results):
+                    if hits:
+                        found[key] = self._to_scene_chunks(hits)
+                        cache.set(key, found[key])
+            except Exception as e:
+                logger.warning(f"Milvus batch search failed, using keyword fallback: {e}")
+
+        logger.debug(
+            f"Scene batch search: scenes={len(scenes)}, searched={len(missing)}, "
+            f"cache_hits={len(scenes) - len(missing)}"
+        )
+
+        # BM25 인덱스는 씬 전체에 대해 1회만 생성
+        keyword_index = self._build_keyword_index(all_chunks)
+
+        scene_chunks = []
+        for key, scene in zip(cache_keys, scenes):
+            vector_chunks = found.get(key)
+            if vector_chunks and not self._hybrid_search:
+                scene_chunks.append(vector_chunks)
+                continue
+
+            keyword_chunks = self._keyword_search_fallback(
+                scene.keywords, all_chunks, keyword_index
+            )
+            if vector_chunks:
+                scene_chunks.append(self._fuse_scene_chunks(vector_chunks, keyword_chunks))
+            else:
+                # 폴백: BM25 키워드 검색
+                scene_chunks.append(keyword_chunks)
+
+        return scene_chunks
+
+    def _fuse_scene_chunks(
+        self,
+        vector_chunks: List[Dict[str, Any]],
+        keyword_chunks: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """벡터 검색 결과와 BM25 결과를 RRF로 결합합니다.
+
+        두 결과의 청크 식별자가 다르므로(Milvus chunk_id vs 로컬 chunk_index)
+        청크 텍스트 앞부분으로 동일 청크를 판단하며, 중복 시 벡터 결과를 유지합니다.
+        """
+        by_key: Dict[str, Dict[str, Any]] = {}
+        rankings = []
+        for chunks in (vector_chunks, keyword_chunks):
+            ranking = []
+            for chunk in chunks:
+                chunk_key = chunk.get("text", "").strip()[:200]
+                by_key.setdefault(chunk_key, chunk)
+                ranking.append(chunk_key)
+            rankings.append(ranking)
+
+        fused = reciprocal_rank_fusion(rankings)
+        return [by_key[chunk_key] for chunk_key, _ in fused[:self._top_k]]
+
+    def _scene_query(self, scene: SceneOutline) -> str:
+        """씬 검색 쿼리를 구성합니다 (씬 제목 + 키워드)."""
+        return f"{scene.title} {' '.join(scene.keywords)}"
+
+    def _to_scene_chunks(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Milvus 검색 결과를 씬 청크 형식으로 변환합니다."""
+        return [
+            {
+                "doc_id": r.get("doc_id", ""),
+                "chunk_index": r.get("metadata", {}).get("chunk_id", 0),
+                "text": r.get("content", ""),
+                "score": r.get("score", 0),
+            }
+            for r in results
+        ]
+
     def _keyword_search_fallback(
         self,
         keywords: List[str],
         all_chunks: List[Dict[str, Any]],
+        keyword_index: Optional[KeywordIndex] = None,
     ) -> List[Dict[str, Any]]:
-        """키워드 기반 폴백 검색."""
-        scored_chunks = []
+        """키워드 기반 폴백 검색 (BM25).
 
-        for chunk in all_chunks:
-            text = chunk.get("text", "").lower()
-            score = sum(1 for kw in keywords if kw.lower() in text)
-            if score > 0:
-                scored_chunks.append((score, chunk))
+        Args:
+            keywords: 씬 키워드
+            all_chunks: 전체 청크 리스트
+            keyword_index: all_chunks로 만든 인덱스 (None이면 새로 생성)
+        """
+        if keyword_index is None:
+            keyword_index = self._build_keyword_index(all_chunks)
 
-        # 점수 높은 순으로 정렬
-        scored_chunks.sort(key=lambda x: x[0], reverse=True)
+        hits = keyword_index.search(" ".join(keywords), top_k=self._top_k)
+        return [all_chunks[position] for position, _ in hits]
 
-        return [chunk for _, chunk in scored_chunks[:self._top_k]]
+    def _build_keyword_index(self, all_chunks: List[Dict[str, Any]]) -> KeywordIndex:
+        """청크 리스트의 BM25 인덱스를 생성합니다 (키: 리스트 위치)."""
+        return KeywordIndex([chunk.get("text", "") for chunk in all_chunks])
 
     async def _generate_single_scene(
         self,
@@ -851,11 +1199,20 @@ JSON 아웃라인:"""
 5. 반드시 유효한 JSON만 출력
 """ + KOREAN_ENFORCEMENT
 
+        # 병렬 모드: 아웃라인 기반 흐름 정보 (이전/다음 씬)
+        flow_info = ""
+        if state.previous_scene_title or state.next_scene_title:
+            flow_info = (
+                f"- 이전 씬: {state.previous_scene_title or '(없음 - 첫 씬)'}\n"
+                f"- 다음 씬: {state.next_scene_title or '(없음 - 마지막 씬)'}\n"
+                f"- 이전/다음 씬 내용은 반복하지 말고 이 씬 주제만 다룰 것\n"
+            )
+
         user_prompt = f"""씬 정보:
 - 제목: {scene_outline.title}
 - 목적: {scene_outline.purpose}
 - 목표 길이: {scene_outline.target_duration_sec}초
-
+{flow_info}
 근거 자료:
 {chunk_context if chunk_context else "(근거 자료 없음 - 일반적인 내용으로 작성)"}
 
@@ -931,6 +1288,92 @@ JSON 스크립트:"""
         )
         return None
 
+    # =========================================================================
+    # 3단계: 씬 연결 다듬기 (병렬 모드)
+    # =========================================================================
+
+    async def _smooth_transitions(
+        self,
+        chapters: List[GeneratedChapter],
+        script_title: str,
+    ) -> None:
+        """병렬 생성된 씬들의 도입 문장을 1회 LLM 호출로 다듬습니다.
+
+        각 씬의 첫 문장만 앞 씬 마지막 문장과 자연스럽게 이어지도록 바꾸며,
+        한국어 검증을 통과한 문장만 반영합니다 (in-place). 실패 시 원본 유지.
+
+        Args:
+            chapters: 생성된 챕터 리스트
+            script_title: 스크립트 제목
+        """
+        scenes = [scene for ch in chapters for scene in ch.scenes]
+        if len(scenes) < 2:
+            return
+
+        boundaries = []
+        for i in range(1, len(scenes)):
+            boundaries.append(json.dumps(
+                {
+                    "index": i,
+                    "prev_ending": scenes[i - 1].narration[-50:],
+                    "opening": _split_first_sentence(scenes[i].narration)[0],
+                },
+                ensure_ascii=False,
+            ))
+
+        system_prompt = """당신은 교육 영상 스크립트 편집자입니다.
+각 씬의 첫 문장(opening)을 앞 씬의 마지막 부분(prev_ending)과 자연스럽게 이어지도록 다듬어주세요.
+
+규칙:
+1. 첫 문장의 의미와 길이는 유지하고 연결 표현만 조정
+2. 이미 자연스러운 씬은 결과에서 생략
+3. 반드시 유효한 JSON만 출력: {"openings": [{"index": 1, "opening": "..."}]}
+""" + KOREAN_ENFORCEMENT
+
+        user_prompt = f"""스크립트: {script_title}
+
+씬 경계 목록:
+{chr(10).join(boundaries)}
+
+JSON:"""
+
+        try:
+            response = await self._llm_client.generate_chat_completion(
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                model=self._model,
+                temperature=0.2,
+                max_tokens=self.MAX_TOKENS_POLISH,
+            )
+        except Exception as e:
+            logger.warning(f"Transition smoothing failed, keeping original: {e}")
+            return
+
+        data = self._parse_json(response) or {}
+        applied = 0
+        for item in data.get("openings", []) or []:
+            try:
+                index = int(item.get("index", -1))
+                new_opening = str(item.get("opening", "")).strip()
+            except (AttributeError, TypeError, ValueError):
+                continue
+            if not 1 <= index < len(scenes) or not new_opening:
+                continue
+
+            old_opening, rest = _split_first_sentence(scenes[index].narration)
+            # 길이가 크게 달라지거나 한국어 검증 실패 시 무시
+            if len(new_opening) > len(old_opening) * 2 + 20:
+                continue
+            if not _is_korean_output(new_opening) or _has_english_start(new_opening):
+                continue
+
+            scenes[index].narration = f"{new_opening} {rest}".strip()
+            applied += 1
+
+        logger.info(f"Transition smoothing applied: {applied}/{len(scenes) - 1} boundaries")
+
     # =========================================================================
     # 유틸리티
     # =========================================================================
@@ -952,6 +1395,24 @@ JSON 스크립트:"""
 
         return all_chunks
 
+    def _collect_search_doc_ids(
+        self,
+        document_chunks: Dict[str, List[Dict[str, Any]]],
+        doc_ids: List[str],
+    ) -> List[str]:
+        """씬 검색 범위로 사용할 Milvus doc_id 목록을 구성합니다.
+
+        Milvus에서 가져온 청크는 chunk_meta.milvus_doc_id(파일명)를 사용하고,
+        그 외에는 소스셋 문서 ID를 그대로 사용합니다.
+        """
+        milvus_doc_ids = [
+            (chunk.get("chunk_meta") or {}).get("milvus_doc_id")
+            for chunks in document_chunks.values()
+            for chunk in chunks
+        ]
+        scoped = [d for d in milvus_doc_ids if d]
+        return list(dict.fromkeys(scoped or [d for d in doc_ids if d]))
+
     def _parse_json(self, response: str) -> Optional[Dict[str, Any]]:
         """LLM 응답에서 JSON을 파싱합니다."""
         import json
@@ -50,6 +50,7 @@ from app.clients.ragflow_client import (
 )
 from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.core.state_store import StateStore, get_state_store
 from app.models.source_set import (
     ChunkBulkUpsertRequest,
     ChunkItem,
@@ -85,6 +86,10 @@ class ProcessingStatus(str, Enum):
     FAILED = "FAILED"
 
 
+# 재시작 선점을 허용하는 종료 상태
+_TERMINAL_STATUSES = frozenset({ProcessingStatus.COMPLETED.value, ProcessingStatus.FAILED.value})
+
+
 @dataclass
 class ProcessingJob:
     """소스셋 처리 작업 상태."""
@@ -104,6 +109,57 @@ class ProcessingJob:
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
 
+    def to_record(self) -> Dict[str, Any]:
+        """상태 저장소 저장 형식."""
+        return {
+            "source_set_id": self.source_set_id,
+            "video_id": self.video_id,
+            "education_id": self.education_id,
+            "request_id": self.request_id,
+            "trace_id": self.trace_id,
+            "script_policy_id": self.script_policy_id,
+            "llm_model_hint": self.llm_model_hint,
+            "status": self.status.value,
+            "documents": [d.model_dump(mode="json", by_alias=True) for d in self.documents],
+            "document_results": [
+                r.model_dump(mode="json", by_alias=True) for r in self.document_results
+            ],
+            "generated_script": (
+                self.generated_script.model_dump(mode="json", by_alias=True)
+                if self.generated_script else None
+            ),
+            "error_code": self.error_code,
+            "error_message": self.error_message,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
+
+    @classmethod
+    def from_record(cls, data: Dict[str, Any]) -> "ProcessingJob":
+        """상태 저장소 값에서 복원."""
+        return cls(
+            source_set_id=data["source_set_id"],
+            video_id=data["video_id"],
+            education_id=data["education_id"],
+            request_id=data["request_id"],
+            trace_id=data["trace_id"],
+            script_policy_id=data["script_policy_id"],
+            llm_model_hint=data["llm_model_hint"],
+            status=ProcessingStatus(data["status"]),
+            documents=[SourceSetDocument.model_validate(d) for d in data["documents"]],
+            document_results=[
+                DocumentResult.model_validate(r) for r in data["document_results"]
+            ],
+            generated_script=(
+                GeneratedScript.model_validate(data["generated_script"])
+                if data["generated_script"] else None
+            ),
+            error_code=data["error_code"],
+            error_message=data["error_message"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+        )
+
 
 @dataclass
 class DocumentProcessingResult:
@@ -129,16 +185,26 @@ class SourceSetOrchestrator:
 
     Attributes:
         _backend_client: 백엔드 API 클라이언트
-        _processing_jobs: 진행 중인 작업 상태 (in-memory)
+        _processing_jobs: 이 워커가 처리 중인 작업 상태 (in-memory)
+        _state_store: 워커 간 공유 작업 상태 (중복 시작 방지, 상태 조회)
         _running_tasks: 비동기 태스크 관리
         _ragflow_client: RAGFlow API 클라이언트 (Phase 51 복구)
     """
 
+    # 공유 상태 저장소 키 prefix
+    JOB_KEY_PREFIX = "source_set_job:"
+    # 처리 중 작업의 선점 lease (초). 처리 워커가 1/3 주기로 갱신하므로
+    # 워커가 죽으면 이 시간 뒤 키가 만료되어 다른 워커가 다시 시작할 수 있음
+    JOB_LEASE_SEC = 300.0
+    # 완료/실패 기록 보존 시간 (초). 상태 조회용이며 재시작 선점은 막지 않음
+    JOB_RETENTION_SEC = 86400.0
+
     def __init__(
         self,
         backend_client: Optional[BackendClient] = None,
         milvus_client: Optional[MilvusSearchClient] = None,
         ragflow_client: Optional[RagflowClient] = None,
+        state_store: Optional[StateStore] = None,
     ):
         """초기화.
 
@@ -146,10 +212,14 @@ class SourceSetOrchestrator:
             backend_client: 백엔드 클라이언트 (None이면 싱글톤 사용)
             milvus_client: Milvus 클라이언트 (None이면 싱글톤 사용, Option 3)
             ragflow_client: RAGFlow 클라이언트 (None이면 싱글톤 사용, Phase 51)
+            state_store: 공유 상태 저장소 (None이면 싱글톤 사용)
         """
         self._backend_client = backend_client or get_backend_client()
+        self._state_store = state_store
         self._processing_jobs: Dict[str, ProcessingJob] = {}
         self._running_tasks: Dict[str, asyncio.Task] = {}
+        # 이 워커가 마지막으로 저장한 작업 기록 (lease 갱신/최종 저장 CAS 기준값)
+        self._job_records: Dict[str, Dict[str, Any]] = {}
 
         # Option 3: Milvus 클라이언트 (SCRIPT_RETRIEVER_BACKEND=milvus 시 사용)
         self._settings = get_settings()
@@ -201,22 +271,10 @@ class SourceSetOrchestrator:
 
         Note:
             - 멱등성: 이미 처리 중이면 기존 상태 반환
+            - 완료/실패한 작업이나 lease가 만료된 작업은 다시 선점해 재처리
             - 비동기: 즉시 202 반환 후 백그라운드에서 처리
         """
-        # 1. 멱등성 체크: 이미 처리 중인 경우
-        if source_set_id in self._processing_jobs:
-            job = self._processing_jobs[source_set_id]
-            logger.info(
-                f"SourceSet already processing: source_set_id={source_set_id}, "
-                f"status={job.status}"
-            )
-            return SourceSetStartResponse(
-                received=True,
-                source_set_id=source_set_id,
-                status=SourceSetStatus.LOCKED,
-            )
-
-        # 2. 작업 생성
+        # 1. 작업 생성
         job = ProcessingJob(
             source_set_id=source_set_id,
             video_id=request.video_id,
@@ -227,6 +285,19 @@ class SourceSetOrchestrator:
             llm_model_hint=request.llm_model_hint,
             status=ProcessingStatus.PROCESSING,
         )
+
+        # 2. 멱등성 체크: 이미 처리 중인 경우 (다른 워커에서 시작한 작업 포함)
+        if not await self._claim_job(job):
+            existing = await self.get_job_status(source_set_id)
+            logger.info(
+                f"SourceSet already processing: source_set_id={source_set_id}, "
+                f"status={existing.status if existing else None}"
+            )
+            return SourceSetStartResponse(
+                received=True,
+                source_set_id=source_set_id,
+                status=SourceSetStatus.LOCKED,
+            )
         self._processing_jobs[source_set_id] = job
 
         logger.info(
@@ -245,7 +316,7 @@ class SourceSetOrchestrator:
             status=SourceSetStatus.LOCKED,
         )
 
-    def get_job_status(self, source_set_id: str) -> Optional[ProcessingJob]:
+    async def get_job_status(self, source_set_id: str) -> Optional[ProcessingJob]:
         """작업 상태를 조회합니다.
 
         Args:
@@ -254,7 +325,100 @@ class SourceSetOrchestrator:
         Returns:
             ProcessingJob 또는 None
         """
-        return self._processing_jobs.get(source_set_id)
+        job = self._processing_jobs.get(source_set_id)
+        if job is not None:
+            return job
+        # 다른 워커가 처리 중이거나 처리를 마친 작업
+        data = await self._state.aget(self._job_key(source_set_id))
+        if data is None:
+            return None
+        return ProcessingJob.from_record(data)
+
+    # =========================================================================
+    # Shared State
+    # =========================================================================
+
+    @property
+    def _state(self) -> StateStore:
+        """공유 상태 저장소 (미지정 시 현재 싱글톤)."""
+        return self._state_store or get_state_store()
+
+    def _job_key(self, source_set_id: str) -> str:
+        return f"{self.JOB_KEY_PREFIX}{source_set_id}"
+
+    async def _claim_job(self, job: ProcessingJob) -> bool:
+        """작업을 선점합니다 (lease TTL로 기록).
+
+        - 기록이 없거나 lease가 만료됨: set_if_absent로 선점
+        - 완료/실패 기록: 그 기록을 기대값으로 CAS 선점 (동시 재시작 중 한 워커만 성공)
+        - 처리 중 기록: 선점 실패
+
+        Returns:
+            bool: 이 워커가 선점했는지 여부
+        """
+        key = self._job_key(job.source_set_id)
+        record = job.to_record()
+
+        current = await self._state.aget(key)
+        if current is None:
+            claimed = await self._state.aset_if_absent(key, record, ttl_sec=self.JOB_LEASE_SEC)
+        elif current.get("status") in _TERMINAL_STATUSES:
+            claimed = await self._state.acompare_and_set(
+                key, current, record, ttl_sec=self.JOB_LEASE_SEC
+            )
+        else:
+            claimed = False
+
+        if claimed:
+            self._job_records[job.source_set_id] = record
+        return claimed
+
+    async def _save_job_state(self, job: ProcessingJob) -> bool:
+        """작업 상태를 공유 저장소에 반영합니다 (다른 워커의 상태 조회용).
+
+        이 워커가 마지막으로 저장한 기록을 기대값으로 CAS하므로, lease를 잃은 뒤
+        다른 워커가 다시 선점한 기록을 덮어쓰지 않습니다.
+        처리 중이면 lease TTL, 완료/실패면 보존 TTL로 저장합니다.
+
+        Returns:
+            bool: 저장 여부 (False면 lease를 잃었거나 저장소 오류)
+        """
+        source_set_id = job.source_set_id
+        record = job.to_record()
+        ttl_sec = (
+            self.JOB_RETENTION_SEC
+            if job.status.value in _TERMINAL_STATUSES
+            else self.JOB_LEASE_SEC
+        )
+        try:
+            saved = await self._state.acompare_and_set(
+                self._job_key(source_set_id),
+                self._job_records.get(source_set_id),
+                record,
+                ttl_sec=ttl_sec,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to save source set job state: "
+                f"source_set_id={source_set_id}, error={e}"
+            )
+            return False
+
+        if saved:
+            self._job_records[source_set_id] = record
+        else:
+            logger.warning(
+                f"Source set job lease lost: source_set_id={source_set_id}, "
+                f"status={job.status.value}"
+            )
+        return saved
+
+    async def _renew_lease(self, job: ProcessingJob) -> None:
+        """처리 중 lease를 주기적으로 갱신합니다 (lease를 잃으면 중단)."""
+        while True:
+            await asyncio.sleep(self.JOB_LEASE_SEC / 3)
+            if not await self._save_job_state(job):
+                return
 
     # =========================================================================
     # Background Processing
@@ -273,6 +437,8 @@ class SourceSetOrchestrator:
             logger.error(f"Job not found: source_set_id={source_set_id}")
             return
 
+        lease_task = asyncio.create_task(self._renew_lease(job))
+
         try:
             # 1. 문서 목록 조회
             logger.info(f"Fetching documents: source_set_id={source_set_id}")
@@ -391,6 +557,13 @@ class SourceSetOrchestrator:
             )
 
         finally:
+            lease_task.cancel()
+
+            # 최종 상태 공유 (완료/실패는 보존 TTL, 이후 상태 조회는 저장소 기준)
+            await self._save_job_state(job)
+            self._processing_jobs.pop(source_set_id, None)
+            self._job_records.pop(source_set_id, None)
+
             # 태스크 정리
             if source_set_id in self._running_tasks:
                 del self._running_tasks[source_set_id]
@@ -0,0 +1,263 @@
+"""
+TTS 오디오 디스크 캐시 (Content-addressed)
+
+문장 단위 TTS 결과를 (provider, voice, language, speed, 문장 텍스트) 해시 키로
+디스크에 저장합니다. 스크립트 일부만 수정한 뒤 재렌더할 때 변경되지 않은 문장은
+원격 TTS 호출 없이 재사용합니다.
+
+저장 형식:
+- {key}.{format}: 오디오 바이트
+- {key}.json: 메타데이터 (duration_sec, format, sample_rate)
+
+용량 관리:
+- 전체 용량이 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+- 프로세스 시작 후 첫 접근 시 디렉토리를 스캔하여 파일 mtime 순으로 LRU 순서 복원
+- 조회 hit 시 mtime을 갱신하여 재시작 후에도 사용 순서 유지
+
+async 호출부는 aget()/aput()를 사용합니다 (파일 읽기/쓰기와 첫 접근 시 디렉토리 스캔을
+스레드에서 실행하여 렌더 중 이벤트 루프를 막지 않음).
+
+환경변수:
+- TTS_AUDIO_CACHE_ENABLED: 캐시 활성화 여부
+- TTS_AUDIO_CACHE_DIR: 캐시 디렉토리
+- TTS_AUDIO_CACHE_MAX_MB: 최대 용량 (MB)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+from app.clients.tts_provider import TTSResult
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.metrics import get_metrics
+
+logger = get_logger(__name__)
+
+
+class TTSAudioCache:
+    """TTS 오디오 디스크 캐시 (size-bounded LRU).
+
+    Attributes:
+        _cache_dir: 캐시 디렉토리
+        _max_bytes: 최대 용량 (바이트)
+        _entries: 키 → (항목 크기, 오디오 포맷) (LRU 순서, 마지막이 최근)
+    """
+
+    META_SUFFIX = ".json"
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        """캐시 초기화.
+
+        Args:
+            cache_dir: 캐시 디렉토리 (없으면 생성)
+            max_bytes: 최대 용량 (바이트)
+        """
+        self._cache_dir = Path(cache_dir)
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[str, tuple[int, str]]" = OrderedDict()
+        self._total_bytes = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        get_metrics().register_cache("tts_audio", self.stats)
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        voice: Optional[str],
+        language: str,
+        speed: float,
+        text: str,
+    ) -> str:
+        """캐시 키를 생성합니다 (입력 전체의 SHA256)."""
+        raw = json.dumps(
+            [provider, voice or "", language, round(speed, 3), text],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[TTSResult]:
+        """캐시된 TTS 결과를 반환합니다.
+
+        Args:
+            key: make_key()로 생성한 키
+
+        Returns:
+            TTSResult 또는 None (없거나 손상된 경우)
+        """
+        with self._lock:
+            self._ensure_loaded()
+            if key not in self._entries:
+                self._misses += 1
+                return None
+
+            try:
+                meta = json.loads(self._meta_path(key).read_text(encoding="utf-8"))
+                audio_path = self._audio_path(key, self._entries[key][1])
+                audio_bytes = audio_path.read_bytes()
+                os.utime(audio_path)  # LRU 순서 유지 (재시작 후 복원용)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"TTS cache entry unreadable, dropping: key={key[:12]}, error={e}")
+                self._remove(key)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+        return TTSResult(
+            audio_bytes=audio_bytes,
+            duration_sec=meta.get("duration_sec", 0.0),
+            format=meta.get("format", "mp3"),
+            sample_rate=meta.get("sample_rate", 22050),
+        )
+
+    def put(self, key: str, result: TTSResult) -> None:
+        """TTS 결과를 저장하고 필요 시 오래된 항목을 삭제합니다.
+
+        Args:
+            key: make_key()로 생성한 키
+            result: 저장할 TTS 결과 (duration_sec는 실제 측정값 권장)
+        """
+        meta = json.dumps({
+            "duration_sec": result.duration_sec,
+            "format": result.format,
+            "sample_rate": result.sample_rate,
+        })
+
+        with self._lock:
+            self._ensure_loaded()
+            if key in self._entries:
+                self._remove(key)
+
+            try:
+                self._audio_path(key, result.format).write_bytes(result.audio_bytes)
+                self._meta_path(key).write_text(meta, encoding="utf-8")
+            except OSError as e:
+                logger.warning(f"TTS cache write failed: key={key[:12]}, error={e}")
+                self._audio_path(key, result.format).unlink(missing_ok=True)
+                self._meta_path(key).unlink(missing_ok=True)
+                return
+
+            size = len(result.audio_bytes) + len(meta)
+            self._entries[key] = (size, result.format)
+            self._total_bytes += size
+            self._evict()
+
+    async def aget(self, key: str) -> Optional[TTSResult]:
+        """get()을 스레드에서 실행합니다 (async 호출부용)."""
+        return await asyncio.to_thread(self.get, key)
+
+    async def aput(self, key: str, result: TTSResult) -> None:
+        """put()을 스레드에서 실행합니다 (async 호출부용)."""
+        await asyncio.to_thread(self.put, key, result)
+
+    def stats(self) -> dict:
+        """캐시 통계를 반환합니다."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "total_bytes": self._total_bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    # =========================================================================
+    # Internal (호출자가 _lock 보유)
+    # =========================================================================
+
+    def _ensure_loaded(self) -> None:
+        """디렉토리를 스캔하여 LRU 인덱스를 복원합니다 (최초 1회)."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        metas: Dict[str, Path] = {}
+        audios: Dict[str, Path] = {}
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            for path in self._cache_dir.iterdir():
+                if path.suffix == self.META_SUFFIX:
+                    metas[path.stem] = path
+                elif path.suffix:
+                    audios[path.stem] = path
+        except OSError as e:
+            logger.warning(f"TTS cache dir unavailable: dir={self._cache_dir}, error={e}")
+            return
+
+        found = []
+        for key, meta_path in metas.items():
+            audio_path = audios.get(key)
+            if audio_path is None:
+                meta_path.unlink(missing_ok=True)
+                continue
+            audio_stat = audio_path.stat()
+            size = audio_stat.st_size + meta_path.stat().st_size
+            found.append((audio_stat.st_mtime, key, size, audio_path.suffix[1:]))
+
+        for _, key, size, audio_format in sorted(found):
+            self._entries[key] = (size, audio_format)
+            self._total_bytes += size
+
+        if found:
+            logger.info(
+                f"TTS audio cache loaded: entries={len(found)}, "
+                f"size={self._total_bytes / (1024 * 1024):.1f}MB"
+            )
+        self._evict()
+
+    def _evict(self) -> None:
+        """용량 초과 시 가장 오래된 항목부터 삭제합니다."""
+        while self._total_bytes > self._max_bytes and self._entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def _remove(self, key: str) -> None:
+        """항목 파일과 인덱스를 삭제합니다."""
+        size, audio_format = self._entries.pop(key, (0, None))
+        self._total_bytes -= size
+        if audio_format:
+            self._audio_path(key, audio_format).unlink(missing_ok=True)
+        self._meta_path(key).unlink(missing_ok=True)
+
+    def _audio_path(self, key: str, audio_format: str) -> Path:
+        return self._cache_dir / f"{key}.{audio_format}"
+
+    def _meta_path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}{self.META_SUFFIX}"
+
+
+# =============================================================================
+# Singleton
+# =============================================================================
+
+
+_tts_audio_cache: Optional[TTSAudioCache] = None
+
+
+def get_tts_audio_cache() -> Optional[TTSAudioCache]:
+    """TTSAudioCache 싱글톤 인스턴스 반환 (비활성화 시 None)."""
+    global _tts_audio_cache
+    settings = get_settings()
+    if not settings.TTS_AUDIO_CACHE_ENABLED:
+        return None
+    if _tts_audio_cache is None:
+        _tts_audio_cache = TTSAudioCache(
+            cache_dir=Path(settings.TTS_AUDIO_CACHE_DIR),
+            max_bytes=settings.TTS_AUDIO_CACHE_MAX_MB * 1024 * 1024,
+        )
+    return _tts_audio_cache
+
+
+def clear_tts_audio_cache() -> None:
+    """TTSAudioCache 싱글톤 초기화 (테스트용, 디스크 파일은 유지)."""
+    global _tts_audio_cache
+    _tts_audio_cache = None
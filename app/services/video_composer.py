@@ -7,11 +7,19 @@ FFmpeg를 사용한 영상 합성 서비스.
 - 씬별 이미지 + 오디오 → MP4 합성
 - SRT 자막 파일 생성
 - 썸네일 추출
+- 씬 오디오 이어 붙이기 (concat demuxer, ffmpeg 없으면 MPEG 프레임 단위)
 
 Phase 37 추가 기능:
 - animated 모드: Ken Burns(zoompan) + fade 전환 효과
 - 씬 이미지 기반 영상 합성
 
+세그먼트 인코딩 (segmented=True):
+- 씬(또는 segment_max_sec 이하 구간)마다 독립 클립을 같은 코덱 파라미터로 병렬 인코딩
+- fade 전환은 겹치는 구간(fade_duration)만 별도 클립으로 인코딩
+- concat demuxer + -c copy로 이어 붙이고 오디오는 한 번만 mux
+- 클립은 입력(필터, 이미지 내용, 코덱 설정) fingerprint로 씬 에셋 캐시에 재사용
+- 실패 시 단일 ffmpeg 프로세스 방식으로 폴백
+
 의존성:
 - ffmpeg: 시스템에 설치 필요 (Docker에서는 기본 포함)
 - ffprobe: 오디오/비디오 정보 조회
@@ -23,16 +31,29 @@ Phase 37 추가 기능:
 """
 
 import asyncio
+import hashlib
 import json
 import os
 import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.services.scene_asset_cache import (
+    SceneAssetCache,
+    get_scene_asset_cache,
+    scene_fingerprint,
+)
+from app.utils.audio_duration import (
+    extract_mp3_frames,
+    get_audio_duration_from_file,
+    get_audio_stream_info,
+)
 
 logger = get_logger(__name__)
 
@@ -65,6 +86,11 @@ class ComposerConfig:
     fade_duration: float = 0.5  # 씬 전환 fade 시간 (초)
     kenburns_zoom: float = 1.1  # Ken Burns 줌 비율 (1.0 = 줌 없음)
 
+    # 세그먼트 병렬 인코딩 설정
+    segmented: bool = False  # True면 씬/구간별 클립 병렬 인코딩 후 -c copy concat
+    segment_workers: int = 0  # 동시 ffmpeg 프로세스 수 (0 = CPU 수)
+    segment_max_sec: float = 10.0  # 클립 최대 길이 (긴 씬은 나눠서 병렬화)
+
 
 @dataclass
 class SceneInfo:
@@ -78,6 +104,22 @@ class SceneInfo:
     image_path: Optional[str] = None
 
 
+@dataclass
+class SegmentSpec:
+    """세그먼트 클립 인코딩 명세.
+
+    Attributes:
+        input_args: ffmpeg 입력 인자 (-i 포함)
+        filter_complex: [vout]을 출력하는 필터 그래프
+        frames: 출력 프레임 수
+        content_files: 캐시 키에 내용 해시를 포함할 입력 파일
+    """
+    input_args: List[str]
+    filter_complex: str
+    frames: int
+    content_files: List[str] = field(default_factory=list)
+
+
 @dataclass
 class ComposedVideo:
     """합성된 비디오 결과."""
@@ -107,14 +149,29 @@ class VideoComposer:
         )
     """
 
-    def __init__(self, config: Optional[ComposerConfig] = None):
+    def __init__(
+        self,
+        config: Optional[ComposerConfig] = None,
+        asset_cache: Optional[SceneAssetCache] = None,
+    ):
         self.config = config or ComposerConfig()
+        # 세그먼트 클립 캐시 (주입하지 않으면 사용 시점에 싱글톤 조회)
+        self._injected_asset_cache = asset_cache
         self._ffmpeg = os.getenv("FFMPEG_PATH", self.config.ffmpeg_path)
         self._ffprobe = os.getenv("FFPROBE_PATH", self.config.ffprobe_path)
 
         # FFmpeg 사용 가능 여부 확인
         self._ffmpeg_available = self._check_ffmpeg()
 
+    @property
+    def _asset_cache(self) -> Optional[SceneAssetCache]:
+        """세그먼트 클립 캐시 (비활성화 시 None)."""
+        return self._injected_asset_cache or get_scene_asset_cache()
+
+    def _frame_count(self, seconds: float) -> int:
+        """초 → 프레임 수 (모든 프레임 경계에 같은 반올림 규칙 사용)."""
+        return int(round(seconds * self.config.fps))
+
     def _check_ffmpeg(self) -> bool:
         """FFmpeg 설치 여부 확인."""
         try:
@@ -138,6 +195,58 @@ class VideoComposer:
         """FFmpeg 사용 가능 여부."""
         return self._ffmpeg_available
 
+    def concat_audio(self, audio_paths: List[str], output_path: Path) -> None:
+        """씬 오디오(MP3)를 순서대로 이어 붙입니다 (동기, 없는 파일은 건너뜀).
+
+        ffmpeg concat demuxer로 다시 mux하므로 결과 파일의 헤더/길이 정보는 하나입니다.
+        샘플레이트/채널이 섞여 있으면 -c copy 대신 1회 인코딩합니다.
+        ffmpeg가 없거나 실패하면 파일별 ID3 태그와 Xing/Info 헤더 프레임을 떼고
+        MPEG 프레임만 이어 붙입니다 (바이트를 그대로 붙이면 첫 파일의 길이 정보가 남음).
+
+        Args:
+            audio_paths: 입력 오디오 경로 (재생 순서)
+            output_path: 출력 MP3 경로
+        """
+        paths = [Path(path) for path in audio_paths if path and Path(path).exists()]
+
+        if self._ffmpeg_available and paths:
+            list_path = output_path.with_suffix(".concat.txt")
+            list_path.write_text(
+                "".join(
+                    "file '{}'\n".format(str(path.resolve()).replace("'", "'\\''"))
+                    for path in paths
+                ),
+                encoding="utf-8",
+            )
+            formats = set()
+            for path in paths:
+                with open(path, "rb") as f:
+                    formats.add(get_audio_stream_info(f.read(64 * 1024)))
+            codec_args = (
+                ["-c", "copy"]
+                if len(formats) == 1 and None not in formats
+                else ["-c:a", "libmp3lame", "-b:a", self.config.audio_bitrate]
+            )
+            try:
+                self._run_ffmpeg(
+                    [
+                        self._ffmpeg, "-y",
+                        "-f", "concat", "-safe", "0", "-i", str(list_path),
+                        *codec_args,
+                        str(output_path),
+                    ],
+                    timeout=120,
+                )
+                return
+            except (RuntimeError, subprocess.TimeoutExpired) as e:
+                logger.warning(f"Audio concat with ffmpeg failed, joining frames: {e}")
+            finally:
+                list_path.unlink(missing_ok=True)
+
+        with open(output_path, "wb") as out:
+            for path in paths:
+                out.write(extract_mp3_frames(path.read_bytes()))
+
     async def compose(
         self,
         scenes: List[SceneInfo],
@@ -178,9 +287,25 @@ class VideoComposer:
 
         if self._ffmpeg_available:
             # Phase 37: visual_style에 따라 합성 방식 선택
-            if self.config.visual_style == "animated" and self._has_scene_images(scenes):
+            animated = self.config.visual_style == "animated" and self._has_scene_images(scenes)
+
+            composed = False
+            if self.config.segmented:
+                try:
+                    composed = await self._compose_segmented(
+                        scenes,
+                        audio_path,
+                        video_path,
+                        duration_sec,
+                        animated,
+                        output_path / f"{job_id}_segments",
+                    )
+                except Exception as e:
+                    logger.warning(f"Segmented encoding failed, falling back to single pass: {e}")
+
+            if not composed and animated:
                 await self._compose_animated(scenes, audio_path, video_path, duration_sec)
-            else:
+            elif not composed:
                 await self._compose_with_ffmpeg(scenes, audio_path, video_path, duration_sec)
         else:
             # Mock 모드: 빈 파일 생성
@@ -208,7 +333,17 @@ class VideoComposer:
         return True
 
     async def get_audio_duration(self, audio_path: str) -> float:
-        """오디오 파일의 길이를 반환합니다."""
+        """오디오 파일의 길이를 반환합니다.
+
+        MP3/WAV는 헤더를 프로세스 내에서 파싱하고, 그 외 형식만 ffprobe를 사용합니다.
+        """
+        loop = asyncio.get_event_loop()
+        duration = await loop.run_in_executor(
+            None, get_audio_duration_from_file, audio_path
+        )
+        if duration is not None:
+            return duration
+
         if not self._ffmpeg_available:
             # Mock: 파일 크기로 대략 추정
             try:
@@ -219,8 +354,6 @@ class VideoComposer:
                 return 10.0
 
         try:
-            loop = asyncio.get_event_loop()
-
             def _probe():
                 result = subprocess.run(
                     [
@@ -319,18 +452,12 @@ class VideoComposer:
             for scene in scenes:
                 text = scene.on_screen_text or scene.caption or ""
                 if text:
-                    # 특수문자 이스케이프
-                    safe_text = text.replace("'", "\\'").replace(":", "\\:")
-
                     # 씬별 텍스트 표시
                     start = current_time
                     end = current_time + (scene.duration_sec or 5.0)
 
                     filter_str = (
-                        f"drawtext=text='{safe_text}':"
-                        f"fontsize={self.config.font_size}:"
-                        f"fontcolor={self.config.text_color}:"
-                        f"x=(w-text_w)/2:y=(h-text_h)/2:"
+                        f"{self._drawtext_filter(text)}:"
                         f"enable='between(t,{start:.2f},{end:.2f})'"
                     )
                     drawtext_filters.append(filter_str)
@@ -368,12 +495,13 @@ class VideoComposer:
 
             logger.debug(f"FFmpeg command: {' '.join(cmd)}")
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5분 타임아웃
-            )
+            with metrics.timer("ffmpeg"):
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=300,  # 5분 타임아웃
+                )
 
             if result.returncode != 0:
                 logger.error(f"FFmpeg error: {result.stderr}")
@@ -420,12 +548,13 @@ class VideoComposer:
 
         logger.debug(f"FFmpeg animated command: {' '.join(cmd)}")
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600,  # 10분 타임아웃
-        )
+        with metrics.timer("ffmpeg"):
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=600,  # 10분 타임아웃
+            )
 
         if result.returncode != 0:
             logger.error(f"FFmpeg animated error: {result.stderr}")
@@ -448,11 +577,7 @@ class VideoComposer:
             List[str]: FFmpeg 명령 인자 목록
         """
         config = self.config
-        fps = config.fps
-        zoom = config.kenburns_zoom
         fade_dur = config.fade_duration
-        width = config.video_width
-        height = config.video_height
 
         # 입력 파일 목록
         cmd = [self._ffmpeg, "-y"]
@@ -469,31 +594,10 @@ class VideoComposer:
         n_scenes = len(scenes)
 
         for i, scene in enumerate(scenes):
-            scene_dur = scene.duration_sec or 5.0
-            total_frames = int(scene_dur * fps)
+            total_frames = self._frame_count(scene.duration_sec or 5.0)
 
             # Ken Burns (zoompan) 필터
-            # 줌 인: 시작 1.0 → 끝 zoom
-            # 랜덤하게 줌 방향 결정 (짝수 씬: 줌인, 홀수 씬: 줌아웃)
-            if i % 2 == 0:
-                # Zoom in: 1.0 → zoom
-                zoom_expr = f"'min(zoom+{(zoom-1)/total_frames:.6f},pzoom*{zoom})'"
-            else:
-                # Zoom out: zoom → 1.0
-                zoom_expr = f"'if(eq(on,1),{zoom},max(zoom-{(zoom-1)/total_frames:.6f},1))'"
-
-            # 줌 중심점 약간 이동 (동적인 느낌)
-            x_expr = "'iw/2-(iw/zoom/2)'"
-            y_expr = "'ih/2-(ih/zoom/2)'"
-
-            # zoompan 필터
-            zoompan_filter = (
-                f"[{i}:v]scale={width*2}:{height*2},"
-                f"zoompan=z={zoom_expr}:x={x_expr}:y={y_expr}:"
-                f"d={total_frames}:s={width}x{height}:fps={fps}"
-                f"[v{i}]"
-            )
-            filter_parts.append(zoompan_filter)
+            filter_parts.append(f"[{i}:v]{self._kenburns_filter(i, total_frames)}[v{i}]")
 
         # Fade 전환 (xfade) 적용
         if n_scenes == 1:
@@ -539,6 +643,328 @@ class VideoComposer:
 
         return cmd
 
+    def _kenburns_filter(
+        self,
+        index: int,
+        total_frames: int,
+        start_frame: int = 0,
+        frames: Optional[int] = None,
+    ) -> str:
+        """씬 하나의 Ken Burns(zoompan) 필터 (입력/출력 라벨 제외).
+
+        줌 값은 씬 내 프레임 번호(on + start_frame)의 함수이므로, 씬 일부 구간만
+        출력해도(세그먼트 클립) 단일 패스의 같은 프레임과 줌이 일치합니다.
+
+        Args:
+            index: 씬 순번 (짝수 씬: 줌인, 홀수 씬: 줌아웃)
+            total_frames: 씬 프레임 수 (줌 진행 속도 기준)
+            start_frame: 출력할 구간의 씬 내 시작 프레임
+            frames: 출력 프레임 수 (None이면 total_frames)
+        """
+        config = self.config
+        zoom = config.kenburns_zoom
+        width = config.video_width
+        height = config.video_height
+        step = (zoom - 1) / total_frames
+        frame = f"(on+{start_frame})" if start_frame else "on"
+
+        if index % 2 == 0:
+            # Zoom in: 1.0 → zoom
+            zoom_expr = f"'min(1+{step:.6f}*{frame},{zoom})'"
+        else:
+            # Zoom out: zoom → 1.0
+            zoom_expr = f"'max({zoom}-{step:.6f}*{frame},1)'"
+
+        # 줌 중심점 약간 이동 (동적인 느낌)
+        x_expr = "'iw/2-(iw/zoom/2)'"
+        y_expr = "'ih/2-(ih/zoom/2)'"
+
+        return (
+            f"scale={width*2}:{height*2},"
+            f"zoompan=z={zoom_expr}:x={x_expr}:y={y_expr}:"
+            f"d={total_frames if frames is None else frames}:s={width}x{height}:fps={config.fps}"
+        )
+
+    def _drawtext_filter(self, text: str) -> str:
+        """화면 중앙 텍스트 drawtext 필터 (enable 조건 제외)."""
+        # 특수문자 이스케이프
+        safe_text = text.replace("'", "\\'").replace(":", "\\:")
+        return (
+            f"drawtext=text='{safe_text}':"
+            f"fontsize={self.config.font_size}:"
+            f"fontcolor={self.config.text_color}:"
+            f"x=(w-text_w)/2:y=(h-text_h)/2"
+        )
+
+    # =========================================================================
+    # 세그먼트 병렬 인코딩
+    # =========================================================================
+
+    async def _compose_segmented(
+        self,
+        scenes: List[SceneInfo],
+        audio_path: str,
+        output_path: Path,
+        duration: float,
+        animated: bool,
+        work_dir: Path,
+    ) -> bool:
+        """씬/구간별 클립을 병렬 인코딩한 뒤 stream copy로 이어 붙입니다.
+
+        Args:
+            scenes: 씬 정보 목록 (duration_sec 계산 완료)
+            audio_path: 오디오 파일 경로
+            output_path: 출력 비디오 경로
+            duration: 전체 비디오 길이 (오디오 기준)
+            animated: animated 모드 여부 (씬 이미지 사용)
+            work_dir: 클립 임시 디렉토리 (완료 후 삭제)
+
+        Returns:
+            bool: 세그먼트 방식으로 합성했는지 여부 (False면 단일 패스로 진행)
+        """
+        if animated:
+            specs = self._build_animated_segment_specs(scenes)
+        else:
+            specs = self._build_basic_segment_specs(scenes, duration)
+
+        if not specs:
+            return False
+
+        loop = asyncio.get_event_loop()
+        try:
+            await loop.run_in_executor(
+                None, self._compose_segmented_sync, specs, audio_path, output_path, work_dir
+            )
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        return True
+
+    def _compose_segmented_sync(
+        self,
+        specs: List[SegmentSpec],
+        audio_path: str,
+        output_path: Path,
+        work_dir: Path,
+    ) -> None:
+        """세그먼트 합성 동기 버전 (클립 병렬 인코딩 + concat)."""
+        work_dir.mkdir(parents=True, exist_ok=True)
+        clip_paths = [work_dir / f"seg_{i:04d}.mp4" for i in range(len(specs))]
+
+        # 각 클립은 별도 ffmpeg 프로세스이므로 스레드는 프로세스 대기만 담당
+        workers = self.config.segment_workers or os.cpu_count() or 1
+        workers = max(1, min(workers, len(specs)))
+        threads = max(1, (os.cpu_count() or 1) // workers)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="segment-encode") as pool:
+            reused = sum(pool.map(
+                lambda item: self._encode_segment(item[0], item[1], threads),
+                zip(specs, clip_paths),
+            ))
+
+        list_path = work_dir / "concat.txt"
+        list_path.write_text(
+            "".join(
+                "file '{}'\n".format(str(path.resolve()).replace("'", "'\\''"))
+                for path in clip_paths
+            ),
+            encoding="utf-8",
+        )
+
+        self._run_ffmpeg(self._build_concat_command(list_path, audio_path, output_path), timeout=300)
+        logger.info(
+            f"Segmented video composed: {output_path}, clips={len(specs)}, "
+            f"reused={reused}, workers={workers}"
+        )
+
+    def _encode_segment(self, spec: SegmentSpec, clip_path: Path, threads: int) -> bool:
+        """클립 하나를 인코딩합니다 (캐시에 있으면 복사).
+
+        Returns:
+            bool: 캐시 재사용 여부
+        """
+        cache_key = self._segment_cache_key(spec) if self._asset_cache else None
+        if cache_key:
+            cached = self._asset_cache.get(cache_key, ".mp4")
+            if cached is not None:
+                try:
+                    shutil.copyfile(cached, clip_path)
+                    return True
+                except OSError as e:
+                    logger.warning(f"Cached segment copy failed, re-encoding: {e}")
+
+        self._run_ffmpeg(self._build_segment_command(spec, clip_path, threads), timeout=300)
+
+        if cache_key:
+            self._asset_cache.put_file(cache_key, clip_path, ".mp4")
+        return False
+
+    def _segment_cache_key(self, spec: SegmentSpec) -> str:
+        """클립 캐시 키 (필터 + 입력 파일 내용 + 코덱 설정)."""
+        content_hashes = {}
+        for path in spec.content_files:
+            with open(path, "rb") as f:
+                content_hashes[path] = hashlib.sha256(f.read()).hexdigest()
+
+        config = self.config
+        return scene_fingerprint(
+            "segment",
+            [content_hashes.get(arg, arg) for arg in spec.input_args],
+            spec.filter_complex,
+            spec.frames,
+            config.video_codec,
+            config.preset,
+            config.video_bitrate,
+            config.fps,
+        )
+
+    def _build_segment_command(self, spec: SegmentSpec, clip_path: Path, threads: int) -> List[str]:
+        """클립 인코딩 명령 (모든 클립이 같은 코덱 파라미터를 써야 -c copy concat 가능)."""
+        config = self.config
+        return [
+            self._ffmpeg,
+            "-y",
+            *spec.input_args,
+            "-filter_complex", spec.filter_complex,
+            "-map", "[vout]",
+            "-frames:v", str(spec.frames),
+            "-an",
+            "-c:v", config.video_codec,
+            "-preset", config.preset,
+            "-b:v", config.video_bitrate,
+            "-pix_fmt", "yuv420p",
+            "-r", str(config.fps),
+            "-video_track_timescale", "90000",
+            "-threads", str(threads),
+            str(clip_path),
+        ]
+
+    def _build_concat_command(self, list_path: Path, audio_path: str, output_path: Path) -> List[str]:
+        """클립 concat + 오디오 mux 명령 (비디오는 재인코딩하지 않음)."""
+        config = self.config
+        return [
+            self._ffmpeg,
+            "-y",
+            "-f", "concat",
+            "-safe", "0",
+            "-i", str(list_path),
+            "-i", audio_path,
+            "-map", "0:v",
+            "-map", "1:a",
+            "-c:v", "copy",
+            "-c:a", config.audio_codec,
+            "-b:a", config.audio_bitrate,
+            "-shortest",
+            "-movflags", "+faststart",
+            str(output_path),
+        ]
+
+    def _run_ffmpeg(self, cmd: List[str], timeout: int) -> None:
+        """ffmpeg 실행 (실패 시 RuntimeError)."""
+        logger.debug(f"FFmpeg command: {' '.join(cmd)}")
+        with metrics.timer("ffmpeg"):
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        if result.returncode != 0:
+            logger.error(f"FFmpeg error: {result.stderr}")
+            raise RuntimeError(f"FFmpeg failed: {result.stderr[:500]}")
+
+    def _split_frames(self, start: int, end: int) -> List[tuple]:
+        """[start, end) 프레임 구간을 segment_max_sec 이하 조각으로 나눕니다."""
+        max_frames = max(1, self._frame_count(self.config.segment_max_sec))
+        return [(s, min(s + max_frames, end)) for s in range(start, end, max_frames)]
+
+    def _build_animated_segment_specs(self, scenes: List[SceneInfo]) -> Optional[List[SegmentSpec]]:
+        """Animated 모드 클립 명세.
+
+        단일 패스의 xfade 체인과 같은 프레임 구성을 만듭니다:
+        씬 i의 단독 구간 [F, T_i - F) 클립과, 씬 i-1 끝 F 프레임 + 씬 i 처음 F 프레임을
+        xfade한 전환 클립을 번갈아 배치합니다 (F = fade 프레임 수).
+        클립마다 zoompan을 구간 시작 프레임만큼 오프셋해 해당 구간 프레임만 만듭니다
+        (줌 진행은 단일 패스와 같음).
+
+        Returns:
+            클립 명세 목록 (fade보다 짧은 씬이 있으면 None → 단일 패스)
+        """
+        fade_frames = self._frame_count(self.config.fade_duration) if len(scenes) > 1 else 0
+        totals = [self._frame_count(scene.duration_sec or 5.0) for scene in scenes]
+        last = len(scenes) - 1
+
+        for i, total in enumerate(totals):
+            edges = (1 if i > 0 else 0) + (1 if i < last else 0)
+            if total <= 0 or total < fade_frames * edges:
+                return None
+
+        def image_input(scene: SceneInfo) -> List[str]:
+            # 단일 프레임 입력 → zoompan이 정확히 d 프레임 출력
+            return ["-i", scene.image_path]
+
+        specs: List[SegmentSpec] = []
+        for i, scene in enumerate(scenes):
+            if i > 0 and fade_frames:
+                prev = scenes[i - 1]
+                prev_tail = self._kenburns_filter(
+                    i - 1, totals[i - 1], start_frame=totals[i - 1] - fade_frames, frames=fade_frames
+                )
+                head = self._kenburns_filter(i, totals[i], frames=fade_frames)
+                specs.append(SegmentSpec(
+                    input_args=image_input(prev) + image_input(scene),
+                    filter_complex=(
+                        f"[0:v]{prev_tail},setpts=PTS-STARTPTS[a];"
+                        f"[1:v]{head},setpts=PTS-STARTPTS[b];"
+                        f"[a][b]xfade=transition=fade:duration={self.config.fade_duration}:offset=0,"
+                        f"format=yuv420p[vout]"
+                    ),
+                    frames=fade_frames,
+                    content_files=[prev.image_path, scene.image_path],
+                ))
+
+            start = fade_frames if i > 0 else 0
+            end = totals[i] - fade_frames if i < last else totals[i]
+            for chunk_start, chunk_end in self._split_frames(start, end):
+                specs.append(SegmentSpec(
+                    input_args=image_input(scene),
+                    filter_complex=(
+                        f"[0:v]{self._kenburns_filter(i, totals[i], chunk_start, chunk_end - chunk_start)},"
+                        f"setpts=PTS-STARTPTS,format=yuv420p[vout]"
+                    ),
+                    frames=chunk_end - chunk_start,
+                    content_files=[scene.image_path],
+                ))
+
+        return specs
+
+    def _build_basic_segment_specs(self, scenes: List[SceneInfo], duration: float) -> List[SegmentSpec]:
+        """Basic 모드 클립 명세 (단색 배경 + 씬 텍스트, 씬 합이 오디오보다 짧으면 배경으로 채움)."""
+        config = self.config
+        fps = config.fps
+        color_input = [
+            "-f", "lavfi",
+            "-i", f"color=c={config.background_color}:s={config.video_width}x{config.video_height}:r={fps}",
+        ]
+
+        specs: List[SegmentSpec] = []
+        used_frames = 0
+        for scene in scenes:
+            frames = self._frame_count(scene.duration_sec or 5.0)
+            text = scene.on_screen_text or scene.caption or ""
+            text_filter = f"{self._drawtext_filter(text)}," if text else ""
+            for chunk_start, chunk_end in self._split_frames(0, frames):
+                specs.append(SegmentSpec(
+                    input_args=color_input,
+                    filter_complex=f"[0:v]{text_filter}format=yuv420p[vout]",
+                    frames=chunk_end - chunk_start,
+                ))
+            used_frames += frames
+
+        tail_frames = self._frame_count(duration) - used_frames
+        for chunk_start, chunk_end in self._split_frames(0, max(tail_frames, 0)):
+            specs.append(SegmentSpec(
+                input_args=color_input,
+                filter_complex="[0:v]format=yuv420p[vout]",
+                frames=chunk_end - chunk_start,
+            ))
+
+        return specs
+
     def get_animated_ffmpeg_command_preview(
         self,
         scenes: List[SceneInfo],
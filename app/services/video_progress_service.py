@@ -21,14 +21,28 @@ API:
 - POST /api/video/progress: 진행률 업데이트
 - POST /api/video/complete: 완료 요청
 - GET /api/video/status: 상태 조회
+- POST /internal/ai/video-progress(/batch): Backend 중계 heartbeat (단건/일괄)
+
+저장:
+- 진행률 heartbeat는 워커 메모리의 세션 레코드(VideoSession)만 갱신하고,
+  상태 저장소 기록은 세션별로 VIDEO_PROGRESS_FLUSH_INTERVAL_SEC마다 한 번으로 병합합니다
+- 시작/완료/재시청 같은 상태 전이는 즉시 기록합니다
+- 종료 시 flush_video_progress_store()로 남은 변경을 기록합니다
+- 기록마다 리비전(rev)을 새로 붙이고, 공유 저장소(sqlite/redis)에서는 메모리 세션을
+  읽을 때마다 저장된 rev와 비교해 다른 워커가 그 사이 기록했으면 저장된 레코드로 교체합니다
+  (heartbeat 병합 기록도 마지막으로 본 rev가 그대로일 때만 CAS로 기록)
 """
 
+import threading
 import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.core.state_store import StateStore, get_state_store
 from app.models.video_progress import (
     VideoCompleteRequest,
     VideoCompleteResponse,
@@ -67,47 +81,284 @@ MAX_PLAYBACK_RATE_MANDATORY_FIRST_WATCH = 1.0  # 4대교육 최초 시청 시 
 
 
 # =============================================================================
-# In-Memory Storage (추후 DB/Redis로 교체)
+# Session Record
+# =============================================================================
+
+_RECORD_FIELDS = tuple(VideoProgressRecord.model_fields)
+
+
+class VideoSession:
+    """워커 메모리에 유지하는 시청 세션 레코드.
+
+    VideoProgressRecord와 같은 필드를 __slots__ 속성으로 보관하여
+    heartbeat마다 Pydantic 검증/복사를 거치지 않습니다.
+
+    Attributes:
+        dirty: 상태 저장소에 기록되지 않은 변경이 있는지
+        persisted_at: 마지막 기록 시각 (time.monotonic)
+        rev: 마지막으로 읽거나 기록한 상태 저장소 레코드의 리비전
+    """
+
+    __slots__ = _RECORD_FIELDS + ("dirty", "persisted_at", "rev")
+
+    def __init__(self, **fields: Any) -> None:
+        for name in _RECORD_FIELDS:
+            setattr(self, name, fields[name])
+        self.dirty = False
+        self.persisted_at = 0.0
+        self.rev: Optional[str] = None
+
+    @classmethod
+    def from_record(cls, record: VideoProgressRecord) -> "VideoSession":
+        """VideoProgressRecord → VideoSession."""
+        return cls(**{name: getattr(record, name) for name in _RECORD_FIELDS})
+
+    def to_record(self) -> VideoProgressRecord:
+        """VideoSession → VideoProgressRecord (검증된 복사본)."""
+        return VideoProgressRecord(**{name: getattr(self, name) for name in _RECORD_FIELDS})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """상태 저장소 기록용 dict (rev 포함)."""
+        data = {name: getattr(self, name) for name in _RECORD_FIELDS}
+        data["state"] = self.state.value
+        data["rev"] = self.rev
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VideoSession":
+        """상태 저장소 레코드 → VideoSession (rev 유지)."""
+        fields = {name: value for name, value in data.items() if name != "rev"}
+        session = cls.from_record(VideoProgressRecord.model_validate(fields))
+        session.rev = data.get("rev")
+        return session
+
+
+# =============================================================================
+# Storage
 # =============================================================================
 
 
 class VideoProgressStore:
-    """영상 진행률 저장소 (인메모리).
+    """영상 진행률 저장소.
 
-    실제 운영에서는 Redis 또는 DB로 교체 권장.
+    레코드를 공유 상태 저장소(StateStore)에 보관하므로 진행률 요청이
+    여러 워커로 나뉘어 들어와도 같은 레코드를 검증/갱신합니다.
+
+    heartbeat 경로(get_session/save_session)는 워커 메모리의 VideoSession을 갱신하고,
+    상태 저장소 기록은 세션별 flush 주기마다 한 번으로 병합합니다.
+    set()은 즉시 기록합니다 (상태 전이용).
+
+    공유 저장소에서는 get_session이 매번 저장된 rev를 확인하므로(읽기 1회) 다른 워커의
+    기록을 놓치지 않고, 병합 기록은 rev가 바뀌었으면 버리고 저장된 레코드를 따릅니다.
+    라우트가 스레드에서 호출하므로 `session_lock()`(세션 키별 분할 락)으로 같은 세션의
+    조회-검증-갱신을 묶고, 다른 세션 요청은 서로 기다리지 않습니다. 전역 락은 메모리
+    세션 사전만 보호하며 상태 저장소 입출력 동안에는 잡지 않습니다.
 
     Usage:
         store = VideoProgressStore()
         store.set("user-123", "training-456", record)
         record = store.get("user-123", "training-456")
+
+        session = store.get_session("user-123", "training-456")
+        session.watched_seconds = 120
+        store.save_session(session)
     """
 
-    def __init__(self) -> None:
-        """VideoProgressStore 초기화."""
-        self._store: Dict[str, VideoProgressRecord] = {}
+    KEY_PREFIX = "video_progress:"
+    # 세션 락 분할 수 (세션 수와 무관하게 락 개수 고정)
+    LOCK_STRIPES = 64
+
+    def __init__(
+        self,
+        state_store: Optional[StateStore] = None,
+        flush_interval_sec: Optional[float] = None,
+        max_cached_sessions: Optional[int] = None,
+    ) -> None:
+        """VideoProgressStore 초기화.
+
+        Args:
+            state_store: 상태 저장소 (None이면 싱글톤 사용)
+            flush_interval_sec: 세션별 기록 주기 (None이면 설정값)
+            max_cached_sessions: 메모리에 유지할 세션 수 상한 (None이면 설정값)
+        """
+        settings = get_settings()
+        self._state_store = state_store
+        self._flush_interval_sec = (
+            flush_interval_sec
+            if flush_interval_sec is not None
+            else settings.VIDEO_PROGRESS_FLUSH_INTERVAL_SEC
+        )
+        self._max_cached_sessions = (
+            max_cached_sessions or settings.VIDEO_PROGRESS_CACHE_MAX_SESSIONS
+        )
+        # key -> VideoSession (LRU 순서)
+        self._sessions: "OrderedDict[str, VideoSession]" = OrderedDict()
+        # 메모리 세션 사전 보호 (상태 저장소 입출력은 이 락 밖에서 수행)
+        self._cache_lock = threading.Lock()
+        # 세션별 조회-검증-갱신 보호 (서비스가 구간 전체를 잡을 수 있도록 재진입 가능)
+        self._session_locks = [threading.RLock() for _ in range(self.LOCK_STRIPES)]
+
+    @property
+    def _state(self) -> StateStore:
+        """상태 저장소 (미지정 시 현재 싱글톤)."""
+        return self._state_store or get_state_store()
 
     def _make_key(self, user_id: str, training_id: str) -> str:
         """저장소 키 생성."""
-        return f"{user_id}:{training_id}"
+        return f"{self.KEY_PREFIX}{user_id}:{training_id}"
+
+    def _lock_for(self, key: str) -> threading.RLock:
+        """세션 키에 해당하는 분할 락."""
+        return self._session_locks[hash(key) % self.LOCK_STRIPES]
+
+    def session_lock(self, user_id: str, training_id: str) -> threading.RLock:
+        """세션 조회-검증-갱신 구간을 묶는 락 (같은 세션 요청끼리만 직렬화)."""
+        return self._lock_for(self._make_key(user_id, training_id))
+
+    @property
+    def _shared(self) -> bool:
+        """다른 워커와 공유하는 저장소인지 (memory는 워커 전용)."""
+        return self._state.backend != "memory"
+
+    def _cache(self, key: str, session: VideoSession) -> None:
+        """세션을 메모리에 보관 (상한 초과 시 오래된 세션부터 제거 후 기록)."""
+        evicted = []
+        with self._cache_lock:
+            self._sessions[key] = session
+            self._sessions.move_to_end(key)
+            while len(self._sessions) > self._max_cached_sessions:
+                evicted.append(self._sessions.popitem(last=False))
+        for old_key, old_session in evicted:
+            if old_session.dirty:
+                self._persist_if_current(old_key, old_session, time.monotonic())
+
+    def _cached(self, key: str) -> Optional[VideoSession]:
+        """메모리 세션 조회 (있으면 LRU 갱신)."""
+        with self._cache_lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions.move_to_end(key)
+            return session
+
+    def _uncache(self, key: str) -> None:
+        """메모리 세션 제거."""
+        with self._cache_lock:
+            self._sessions.pop(key, None)
+
+    def _load(self, key: str, data: Dict[str, Any], now: float) -> VideoSession:
+        """상태 저장소 레코드로 메모리 세션을 교체."""
+        session = VideoSession.from_dict(data)
+        session.persisted_at = now
+        self._cache(key, session)
+        return session
+
+    def _persist(self, key: str, session: VideoSession, now: float) -> None:
+        """세션을 상태 저장소에 기록 (새 rev, 무조건 기록)."""
+        session.rev = uuid.uuid4().hex[:12]
+        self._state.set(key, session.to_dict())
+        session.dirty = False
+        session.persisted_at = now
+
+    def _persist_if_current(self, key: str, session: VideoSession, now: float) -> bool:
+        """heartbeat 병합 기록 (다른 워커가 그 사이 기록하지 않았을 때만).
+
+        Returns:
+            bool: 기록 여부 (False면 메모리 세션을 저장된 레코드로 교체)
+        """
+        if not self._shared:
+            self._persist(key, session, now)
+            return True
+
+        stored = self._state.get(key)
+        if stored is not None and stored.get("rev") == session.rev:
+            previous_rev = session.rev
+            session.rev = uuid.uuid4().hex[:12]
+            if self._state.compare_and_set(key, stored, session.to_dict()):
+                session.dirty = False
+                session.persisted_at = now
+                return True
+            session.rev = previous_rev
+            stored = self._state.get(key)
+
+        # 다른 워커가 더 최신 상태를 기록함 (완료/재시작 등) → 저장된 레코드를 따름
+        if stored is None:
+            self._uncache(key)
+        elif self._sessions.get(key) is session:
+            self._load(key, stored, now)
+        return False
+
+    def get_session(self, user_id: str, training_id: str) -> Optional[VideoSession]:
+        """세션 조회 (메모리 우선, 없으면 상태 저장소에서 로드).
+
+        공유 저장소에서는 메모리 세션의 rev가 저장된 rev와 다르면 저장된 레코드로 교체합니다.
+        """
+        key = self._make_key(user_id, training_id)
+        with self._lock_for(key):
+            session = self._cached(key)
+            if session is not None and not self._shared:
+                return session
+
+            data = self._state.get(key)
+            if data is None:
+                self._uncache(key)
+                return None
+            if session is not None and session.rev == data.get("rev"):
+                return session
+            return self._load(key, data, time.monotonic())
+
+    def save_session(self, session: VideoSession) -> None:
+        """세션 변경 반영 (상태 저장소 기록은 flush 주기마다)."""
+        key = self._make_key(session.user_id, session.training_id)
+        with self._lock_for(key):
+            session.dirty = True
+            now = time.monotonic()
+            if now - session.persisted_at < self._flush_interval_sec:
+                return
+            self._persist_if_current(key, session, now)
+
+    def flush(self) -> int:
+        """기록되지 않은 세션 변경을 모두 기록합니다.
+
+        Returns:
+            int: 기록한 세션 수
+        """
+        now = time.monotonic()
+        flushed = 0
+        with self._cache_lock:
+            pending = list(self._sessions.items())
+        for key, session in pending:
+            with self._lock_for(key):
+                if session.dirty and self._persist_if_current(key, session, now):
+                    flushed += 1
+        return flushed
 
     def set(self, user_id: str, training_id: str, record: VideoProgressRecord) -> None:
-        """레코드 저장."""
+        """레코드 저장 (즉시 기록)."""
         key = self._make_key(user_id, training_id)
-        self._store[key] = record
+        session = VideoSession.from_record(record)
+        with self._lock_for(key):
+            self._persist(key, session, time.monotonic())
+            self._cache(key, session)
 
     def get(self, user_id: str, training_id: str) -> Optional[VideoProgressRecord]:
         """레코드 조회."""
-        key = self._make_key(user_id, training_id)
-        return self._store.get(key)
+        session = self.get_session(user_id, training_id)
+        if session is None:
+            return None
+        return session.to_record()
 
     def delete(self, user_id: str, training_id: str) -> None:
         """레코드 삭제."""
         key = self._make_key(user_id, training_id)
-        self._store.pop(key, None)
+        with self._lock_for(key):
+            self._uncache(key)
+            self._state.delete(key)
 
     def clear(self) -> None:
         """모든 레코드 삭제."""
-        self._store.clear()
+        with self._cache_lock:
+            self._sessions.clear()
+        self._state.clear(self.KEY_PREFIX)
 
 
 # 전역 저장소 인스턴스
@@ -122,6 +373,16 @@ def get_video_progress_store() -> VideoProgressStore:
     return _video_progress_store
 
 
+def flush_video_progress_store() -> int:
+    """남은 진행률 변경 기록 (종료 시)."""
+    if _video_progress_store is None:
+        return 0
+    flushed = _video_progress_store.flush()
+    if flushed:
+        logger.info(f"Video progress flushed: sessions={flushed}")
+    return flushed
+
+
 def clear_video_progress_store() -> None:
     """저장소 초기화 (테스트용)."""
     global _video_progress_store
@@ -194,6 +455,11 @@ class VideoProgressService:
         Raises:
             HTTPException: 4대교육 최초 시청 시 배속이 1.0 초과인 경우 400 반환
         """
+        with self._store.session_lock(request.user_id, request.training_id):
+            return self._start_video(request)
+
+    def _start_video(self, request: VideoPlayStartRequest) -> VideoPlayStartResponse:
+        """start_video 본문 (세션 락 보유 상태에서 호출)."""
         from fastapi import HTTPException
 
         now = datetime.now(timezone.utc)
@@ -317,18 +583,27 @@ class VideoProgressService:
         서버 검증 룰을 적용하여 비정상 요청을 거부합니다.
         배속 검증: 4대교육 최초 시청 시 1.0 초과 배속 거부
 
+        heartbeat 경로이므로 메모리 세션만 갱신하고, 상태 저장소 기록은
+        VideoProgressStore의 flush 주기에 맡깁니다.
+
         Args:
             request: 진행률 업데이트 요청
 
         Returns:
             VideoProgressUpdateResponse: 업데이트 응답
         """
-        now = datetime.now(timezone.utc)
+        with self._store.session_lock(request.user_id, request.training_id):
+            return self._update_progress(request)
+
+    def _update_progress(
+        self, request: VideoProgressUpdateRequest
+    ) -> VideoProgressUpdateResponse:
+        """update_progress 본문 (세션 락 보유 상태에서 호출)."""
         current_timestamp = time.time()
 
         # 1. 세션 존재 여부 확인
-        record = self._store.get(request.user_id, request.training_id)
-        if not record:
+        session = self._store.get_session(request.user_id, request.training_id)
+        if session is None:
             logger.warning(
                 f"Session not found: user_id={request.user_id}, "
                 f"training_id={request.training_id}"
@@ -341,121 +616,88 @@ class VideoProgressService:
                 last_position=0,
                 seek_allowed=False,
                 state=VideoProgressState.NOT_STARTED,
-                updated_at=now.isoformat(),
+                updated_at=datetime.now(timezone.utc).isoformat(),
                 accepted=False,
                 rejection_reason=VideoRejectionReason.SESSION_NOT_FOUND.value,
             )
 
         # 배속 제한 계산
-        max_rate = self._get_max_playback_rate(record.is_mandatory_edu, record.first_watch)
+        max_rate = self._get_max_playback_rate(session.is_mandatory_edu, session.first_watch)
 
         # 2. 이미 완료된 경우 - 업데이트 no-op (accepted=True, 상태 불변)
-        if record.state == VideoProgressState.COMPLETED:
+        if session.state == VideoProgressState.COMPLETED:
             logger.debug(
                 f"Already completed (no-op): user_id={request.user_id}, "
                 f"training_id={request.training_id}"
             )
-            return VideoProgressUpdateResponse(
-                user_id=request.user_id,
-                training_id=request.training_id,
-                progress_percent=record.progress_percent,
-                watched_seconds=record.watched_seconds,
-                last_position=record.last_position,
-                seek_allowed=record.seek_allowed,
-                state=record.state,
-                updated_at=record.updated_at,
+            return self._progress_response(
+                session,
                 accepted=True,
-                rejection_reason=None,
                 message="이미 완료된 영상입니다.",
                 max_playback_rate=MAX_PLAYBACK_RATE_ALLOWED,  # 완료 후는 배속 허용
-                playback_rate_enforced=False,
             )
 
         # 3. 배속 검증: 4대교육 최초 시청 시 1.0 초과 배속 거부
-        if record.is_mandatory_edu and record.first_watch and request.playback_rate > 1.0:
+        if session.is_mandatory_edu and session.first_watch and request.playback_rate > 1.0:
             logger.warning(
                 f"Playback rate not allowed during progress: user_id={request.user_id}, "
                 f"training_id={request.training_id}, "
                 f"playback_rate={request.playback_rate}, max_allowed={max_rate}"
             )
-            return VideoProgressUpdateResponse(
-                user_id=request.user_id,
-                training_id=request.training_id,
-                progress_percent=record.progress_percent,
-                watched_seconds=record.watched_seconds,
-                last_position=record.last_position,
-                seek_allowed=record.seek_allowed,
-                state=record.state,
-                updated_at=record.updated_at,
+            return self._progress_response(
+                session,
                 accepted=False,
                 rejection_reason=VideoRejectionReason.PLAYBACK_RATE_NOT_ALLOWED.value,
                 message="4대교육 최초 시청 시 배속(1.0x 초과)은 허용되지 않습니다.",
                 max_playback_rate=max_rate,
-                playback_rate_enforced=False,
             )
 
         # 4. 새로운 진행률 계산
         new_progress = self._calculate_progress(
-            request.watched_seconds, record.total_duration
+            request.watched_seconds, session.total_duration
         )
 
         # 5. 역행 검증 (진행률 감소 거부)
-        if new_progress < record.progress_percent:
+        if new_progress < session.progress_percent:
             logger.warning(
                 f"Progress regression detected: user_id={request.user_id}, "
-                f"old={record.progress_percent:.1f}%, new={new_progress:.1f}%"
+                f"old={session.progress_percent:.1f}%, new={new_progress:.1f}%"
             )
-            return VideoProgressUpdateResponse(
-                user_id=request.user_id,
-                training_id=request.training_id,
-                progress_percent=record.progress_percent,
-                watched_seconds=record.watched_seconds,
-                last_position=record.last_position,
-                seek_allowed=record.seek_allowed,
-                state=record.state,
-                updated_at=record.updated_at,
+            return self._progress_response(
+                session,
                 accepted=False,
                 rejection_reason=VideoRejectionReason.PROGRESS_REGRESSION.value,
                 max_playback_rate=max_rate,
-                playback_rate_enforced=False,
             )
 
         # 6. 급증 검증 (시간-위치 기반: delta_position <= elapsed + grace)
         is_surge, surge_reason = self._check_progress_surge(
-            old_position_seconds=record.last_position,
+            old_position_seconds=session.last_position,
             new_position_seconds=request.current_position,
-            old_timestamp=record.last_update_timestamp,
+            old_timestamp=session.last_update_timestamp,
             new_timestamp=current_timestamp,
         )
         if is_surge:
             logger.warning(
                 f"Progress surge detected: user_id={request.user_id}, "
-                f"old_pos={record.last_position}s, new_pos={request.current_position}s, "
+                f"old_pos={session.last_position}s, new_pos={request.current_position}s, "
                 f"reason={surge_reason}"
             )
-            return VideoProgressUpdateResponse(
-                user_id=request.user_id,
-                training_id=request.training_id,
-                progress_percent=record.progress_percent,
-                watched_seconds=record.watched_seconds,
-                last_position=record.last_position,
-                seek_allowed=record.seek_allowed,
-                state=record.state,
-                updated_at=record.updated_at,
+            return self._progress_response(
+                session,
                 accepted=False,
                 rejection_reason=VideoRejectionReason.PROGRESS_SURGE.value,
                 max_playback_rate=max_rate,
-                playback_rate_enforced=False,
             )
 
-        # 7. 레코드 업데이트
-        record.watched_seconds = request.watched_seconds
-        record.progress_percent = new_progress
-        record.last_position = request.current_position
-        record.updated_at = now.isoformat()
-        record.last_update_timestamp = current_timestamp
+        # 7. 세션 업데이트 (상태 저장소 기록은 flush 주기마다)
+        session.watched_seconds = request.watched_seconds
+        session.progress_percent = new_progress
+        session.last_position = request.current_position
+        session.updated_at = datetime.fromtimestamp(current_timestamp, timezone.utc).isoformat()
+        session.last_update_timestamp = current_timestamp
 
-        self._store.set(request.user_id, request.training_id, record)
+        self._store.save_session(session)
 
         logger.debug(
             f"Progress updated: user_id={request.user_id}, "
@@ -463,20 +705,20 @@ class VideoProgressService:
             f"progress={new_progress:.1f}%"
         )
 
-        return VideoProgressUpdateResponse(
-            user_id=request.user_id,
-            training_id=request.training_id,
-            progress_percent=record.progress_percent,
-            watched_seconds=record.watched_seconds,
-            last_position=record.last_position,
-            seek_allowed=record.seek_allowed,
-            state=record.state,
-            updated_at=record.updated_at,
-            accepted=True,
-            rejection_reason=None,
-            max_playback_rate=max_rate,
-            playback_rate_enforced=False,
-        )
+        return self._progress_response(session, accepted=True, max_playback_rate=max_rate)
+
+    def update_progress_batch(
+        self, requests: List[VideoProgressUpdateRequest]
+    ) -> List[VideoProgressUpdateResponse]:
+        """여러 세션의 진행률을 한 번에 업데이트합니다 (요청 순서대로 응답).
+
+        Args:
+            requests: 진행률 업데이트 요청 목록
+
+        Returns:
+            List[VideoProgressUpdateResponse]: 요청별 응답
+        """
+        return [self.update_progress(request) for request in requests]
 
     # =========================================================================
     # 완료 요청 (VIDEO_COMPLETE)
@@ -490,12 +732,20 @@ class VideoProgressService:
         완료 조건:
         - 누적 시청률 >= 100% (100%면 완료)
 
+        완료 판정은 요청의 누적 시청 시간 기준이며, 레코드는 저장된 rev로 재검증한 값을
+        쓰므로 다른 워커의 heartbeat 기록 지연(flush 주기)으로 거부되지 않습니다.
+
         Args:
             request: 완료 요청
 
         Returns:
             VideoCompleteResponse: 완료 응답
         """
+        with self._store.session_lock(request.user_id, request.training_id):
+            return self._complete_video(request)
+
+    def _complete_video(self, request: VideoCompleteRequest) -> VideoCompleteResponse:
+        """complete_video 본문 (세션 락 보유 상태에서 호출)."""
         now = datetime.now(timezone.utc)
 
         # 1. 세션 존재 여부 확인
@@ -667,6 +917,34 @@ class VideoProgressService:
     # 내부 헬퍼 메서드
     # =========================================================================
 
+    def _progress_response(
+        self,
+        session: VideoSession,
+        accepted: bool,
+        max_playback_rate: float,
+        rejection_reason: Optional[str] = None,
+        message: Optional[str] = None,
+    ) -> VideoProgressUpdateResponse:
+        """세션 상태로 진행률 응답 생성.
+
+        세션 값은 저장 시 이미 검증되었으므로 model_construct로 재검증을 생략합니다.
+        """
+        return VideoProgressUpdateResponse.model_construct(
+            user_id=session.user_id,
+            training_id=session.training_id,
+            progress_percent=session.progress_percent,
+            watched_seconds=session.watched_seconds,
+            last_position=session.last_position,
+            seek_allowed=session.seek_allowed,
+            state=session.state,
+            updated_at=session.updated_at,
+            accepted=accepted,
+            rejection_reason=rejection_reason,
+            message=message,
+            max_playback_rate=max_playback_rate,
+            playback_rate_enforced=False,
+        )
+
     def _calculate_progress(
         self, watched_seconds: int, total_duration: int
     ) -> float:
@@ -17,7 +17,6 @@ MVP 요구사항:
 의존성이 없으면 Mock 모드로 동작 (테스트용).
 """
 
-import asyncio
 import os
 import uuid
 from dataclasses import dataclass
@@ -28,6 +27,7 @@ from typing import Any, Dict, List, Optional
 from app.core.logging import get_logger
 from app.models.video_render import RenderedAssets, RenderStep
 from app.services.video_render_service import VideoRenderer
+from app.utils.audio_duration import get_audio_duration_from_file
 from app.services.scene_audio_service import (
     SceneAudioService,
     SceneAudioResult,
@@ -239,7 +239,7 @@ class MVPVideoRenderer(VideoRenderer):
         """TTS 음성 생성.
 
         Phase 40 업데이트:
-        - 씬별로 문장 단위 TTS 생성 + concat
+        - 작업 전체 문장 단위 TTS 생성 + 최종 트랙 단일 패스 concat
         - 오디오 길이 기반 씬 duration 확정 + 패딩
         - 캡션 타임라인 생성 (JSON)
         """
@@ -261,96 +261,27 @@ class MVPVideoRenderer(VideoRenderer):
                 # caption 또는 text를 narration으로 사용
                 scene["narration"] = scene.get("caption", scene.get("text", ""))
 
-        # Phase 40: SceneAudioService로 씬별 오디오 생성
-        scene_audio_results = await self._scene_audio.generate_scene_audios(
+        # Phase 40: SceneAudioService로 전체 오디오 타임라인 생성
+        # (문장 오디오 + 씬 패딩을 FFmpeg 1회로 최종 트랙에 합성, 씬별 중간 파일 없음)
+        timeline = await self._scene_audio.generate_audio_timeline(
             scenes=scenes,
             output_dir=ctx.output_dir,
+            output_path=ctx.output_dir / "audio_full.mp3",
         )
 
         # 결과 저장
-        ctx.scene_audio_results = scene_audio_results
-
-        # 총 duration 계산
-        total_duration = sum(r.duration_sec for r in scene_audio_results)
-        ctx.duration_sec = total_duration
-
-        # 전체 캡션 타임라인 생성
-        all_captions = []
-        for result in scene_audio_results:
-            all_captions.extend([c.to_dict() for c in result.captions])
-        ctx.captions_json = all_captions
-
-        # 전체 오디오 concat (씬별 오디오 → 하나의 파일)
-        # 씬이 1개면 그 파일을 사용, 여러 개면 concat
-        if len(scene_audio_results) == 1:
-            ctx.tts_audio_path = scene_audio_results[0].audio_path
-        else:
-            # FFmpeg로 전체 씬 오디오 concat
-            scene_audio_paths = [r.audio_path for r in scene_audio_results]
-            concat_path = ctx.output_dir / "audio_full.mp3"
-            success = await self._concat_scene_audios(scene_audio_paths, concat_path)
-            if success:
-                ctx.tts_audio_path = str(concat_path)
-            else:
-                # 실패 시 첫 번째 파일 사용
-                ctx.tts_audio_path = scene_audio_results[0].audio_path
+        ctx.scene_audio_results = timeline.scene_results
+        ctx.duration_sec = timeline.duration_sec
+        ctx.captions_json = timeline.get_captions_json()
+        ctx.tts_audio_path = timeline.audio_path
 
         logger.info(
             f"TTS generated (Phase 40): job={ctx.job_id}, "
-            f"scenes={len(scene_audio_results)}, "
-            f"total_duration={total_duration:.2f}s, "
-            f"captions={len(all_captions)}"
+            f"scenes={len(timeline.scene_results)}, "
+            f"total_duration={timeline.duration_sec:.2f}s, "
+            f"captions={len(ctx.captions_json)}"
         )
 
-    async def _concat_scene_audios(
-        self, audio_paths: List[str], output_path: Path
-    ) -> bool:
-        """씬 오디오들을 하나로 합칩니다 (Phase 40).
-
-        Args:
-            audio_paths: 씬 오디오 파일 경로들
-            output_path: 출력 파일 경로
-
-        Returns:
-            bool: 성공 여부
-        """
-        import subprocess
-        import tempfile
-
-        try:
-            # concat list 파일 생성
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".txt", delete=False
-            ) as f:
-                for path in audio_paths:
-                    if Path(path).exists():
-                        escaped_path = str(path).replace("'", "'\\''")
-                        f.write(f"file '{escaped_path}'\n")
-                list_file = f.name
-
-            # FFmpeg concat
-            cmd = [
-                "ffmpeg", "-y",
-                "-f", "concat",
-                "-safe", "0",
-                "-i", list_file,
-                "-c", "copy",
-                str(output_path),
-            ]
-
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: subprocess.run(cmd, capture_output=True, timeout=120),
-            )
-
-            os.unlink(list_file)
-
-            return result.returncode == 0
-
-        except Exception as e:
-            logger.warning(f"Scene audio concat failed: {e}")
-            return False
-
     async def _generate_subtitle(self, ctx: RenderJobContext) -> None:
         """자막 파일 생성 (SRT + JSON 포맷).
 
@@ -636,7 +567,11 @@ class MVPVideoRenderer(VideoRenderer):
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
     async def _get_audio_duration(self, audio_path: str) -> float:
-        """오디오 파일 길이 반환."""
+        """오디오 파일 길이 반환 (MP3/WAV 헤더 파싱, 그 외 형식은 moviepy)."""
+        duration = get_audio_duration_from_file(audio_path)
+        if duration is not None:
+            return duration
+
         try:
             from moviepy.editor import AudioFileClip
             clip = AudioFileClip(audio_path)
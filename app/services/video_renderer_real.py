@@ -23,15 +23,21 @@ Phase 37 변경사항:
 - VIDEO_VISUAL_STYLE 환경변수 지원
 - animated 모드: 씬 이미지 생성 + Ken Burns + fade 전환
 - VisualPlanExtractor, ImageAssetService 통합
+
+증분 재렌더:
+- TTS는 씬 단위로 합성 후 이어 붙임 (나레이션이 같은 씬은 TTS 오디오 캐시 재사용)
+- 씬 이미지는 VisualPlan + 이미지 설정 fingerprint로 씬 에셋 캐시에서 재사용
+- 씬별 fingerprint(나레이션, 화면 텍스트, 시각 계획, 렌더 설정)를 에셋에 함께 기록
 """
 
 import asyncio
 import os
+import shutil
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, is_dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.api.v1.ws_render_progress import (
     RenderProgressEvent,
@@ -43,11 +49,18 @@ from app.clients.storage_adapter import (
     StorageUploadError,
     get_default_storage_provider,
 )
-from app.clients.tts_provider import BaseTTSProvider, get_default_tts_provider
+from app.clients.tts_provider import BaseTTSProvider, TTSResult, get_default_tts_provider
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.models.video_render import RenderedAssets, RenderJobStatus, RenderStep
 from app.services.image_asset_service import ImageAssetService, get_image_asset_service
+from app.services.scene_asset_cache import (
+    SceneAssetCache,
+    get_scene_asset_cache,
+    scene_fingerprint,
+)
+from app.services.tts_audio_cache import TTSAudioCache, get_tts_audio_cache
+from app.utils.audio_duration import get_audio_duration_from_file
 from app.services.video_composer import SceneInfo, VideoComposer, get_video_composer
 from app.services.video_render_service import VideoRenderer
 from app.services.visual_plan import VisualPlanExtractor, get_visual_plan_extractor
@@ -108,6 +121,13 @@ class RealRenderJobContext:
     # 메타데이터
     duration_sec: float = 0.0
 
+    # 증분 재렌더: 씬 ID → 입력 fingerprint
+    audio_fingerprints: Dict[int, str] = field(default_factory=dict)
+    image_fingerprints: Dict[int, str] = field(default_factory=dict)
+    scene_fingerprints: Dict[str, str] = field(default_factory=dict)
+    reused_audio_count: int = 0
+    reused_image_count: int = 0
+
 
 # =============================================================================
 # Real Video Renderer
@@ -133,6 +153,8 @@ class RealVideoRenderer(VideoRenderer):
         video_composer: Optional[VideoComposer] = None,
         image_service: Optional[ImageAssetService] = None,
         plan_extractor: Optional[VisualPlanExtractor] = None,
+        audio_cache: Optional[TTSAudioCache] = None,
+        asset_cache: Optional[SceneAssetCache] = None,
     ):
         """렌더러 초기화.
 
@@ -143,6 +165,8 @@ class RealVideoRenderer(VideoRenderer):
             video_composer: Video Composer (테스트용 mock 주입)
             image_service: ImageAssetService (테스트용 mock 주입, Phase 37)
             plan_extractor: VisualPlanExtractor (테스트용 mock 주입, Phase 37)
+            audio_cache: 씬 TTS 오디오 캐시 (없으면 싱글톤, 비활성화 시 미사용)
+            asset_cache: 씬 에셋 캐시 (없으면 싱글톤, 비활성화 시 미사용)
         """
         settings = get_settings()
         self.config = config or RealRendererConfig(
@@ -154,6 +178,8 @@ class RealVideoRenderer(VideoRenderer):
         self._composer = video_composer
         self._image_service = image_service
         self._plan_extractor = plan_extractor
+        self._audio_cache = audio_cache or get_tts_audio_cache()
+        self._asset_cache = asset_cache or get_scene_asset_cache()
         self._contexts: Dict[str, RealRenderJobContext] = {}
 
         # 출력 디렉토리 생성
@@ -187,8 +213,11 @@ class RealVideoRenderer(VideoRenderer):
                 video_width=settings.VIDEO_WIDTH,
                 video_height=settings.VIDEO_HEIGHT,
                 fps=settings.VIDEO_FPS,
+                segmented=settings.VIDEO_SEGMENTED_ENCODING,
+                segment_workers=settings.VIDEO_SEGMENT_WORKERS,
+                segment_max_sec=settings.VIDEO_SEGMENT_MAX_SEC,
             )
-            self._composer = VideoComposer(config=config)
+            self._composer = VideoComposer(config=config, asset_cache=self._asset_cache)
         return self._composer
 
     def _get_image_service(self) -> ImageAssetService:
@@ -303,6 +332,7 @@ class RealVideoRenderer(VideoRenderer):
             thumbnail_path=ctx.thumbnail_url or ctx.thumbnail_path or "",
             subtitle_path=ctx.subtitle_url or ctx.subtitle_path or "",
             duration_sec=ctx.duration_sec,
+            scene_fingerprints=dict(ctx.scene_fingerprints),
         )
 
     # =========================================================================
@@ -330,29 +360,101 @@ class RealVideoRenderer(VideoRenderer):
         logger.info(f"Script validated: {len(ctx.scenes)} scenes found")
 
     async def _generate_tts(self, ctx: RealRenderJobContext) -> None:
-        """TTS 음성 생성."""
+        """TTS 음성 생성 (씬 단위).
+
+        씬별로 합성한 뒤 하나의 오디오로 이어 붙입니다.
+        나레이션이 바뀌지 않은 씬은 TTS 오디오 캐시에서 재사용하므로
+        한 씬만 수정한 재렌더는 그 씬만 다시 합성합니다.
+        """
         logger.info(f"Generating TTS for job: {ctx.job_id}")
 
         tts = self._get_tts()
+        audio_path = ctx.output_dir / "audio.mp3"
 
-        # 전체 나레이션 텍스트 추출
-        full_text = " ".join(scene.narration for scene in ctx.scenes if scene.narration)
-
-        if not full_text.strip():
-            full_text = "영상 콘텐츠입니다."
+        narrated = [scene for scene in ctx.scenes if scene.narration and scene.narration.strip()]
+        if not narrated:
+            duration = await tts.synthesize_to_file(
+                text="영상 콘텐츠입니다.",
+                output_path=audio_path,
+                language=self.config.tts_language,
+            )
+            ctx.tts_audio_path = str(audio_path)
+            ctx.duration_sec = duration
+            logger.info(f"TTS generated (no narration): {audio_path}, duration={duration:.2f}s")
+            return
 
-        # TTS 합성
-        audio_path = ctx.output_dir / "audio.mp3"
-        duration = await tts.synthesize_to_file(
-            text=full_text,
-            output_path=audio_path,
-            language=self.config.tts_language,
+        scene_audio_dir = ctx.output_dir / "scene_audio"
+        scene_audio_dir.mkdir(parents=True, exist_ok=True)
+        semaphore = asyncio.Semaphore(max(1, get_settings().TTS_SYNTHESIS_CONCURRENCY))
+
+        durations = await asyncio.gather(*[
+            self._synthesize_scene_audio(ctx, tts, scene, scene_audio_dir, semaphore)
+            for scene in narrated
+        ])
+
+        # 씬 오디오 이어 붙이기 (concat demuxer, 길이는 씬별 길이 합)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None,
+            self._get_composer().concat_audio,
+            [scene.audio_path for scene in narrated],
+            audio_path,
         )
 
         ctx.tts_audio_path = str(audio_path)
-        ctx.duration_sec = duration
+        ctx.duration_sec = sum(durations)
 
-        logger.info(f"TTS generated: {audio_path}, duration={duration:.2f}s")
+        logger.info(
+            f"TTS generated: {audio_path}, duration={ctx.duration_sec:.2f}s, "
+            f"scenes={len(narrated)}, reused={ctx.reused_audio_count}"
+        )
+
+    async def _synthesize_scene_audio(
+        self,
+        ctx: RealRenderJobContext,
+        tts: BaseTTSProvider,
+        scene: SceneInfo,
+        output_dir: Path,
+        semaphore: asyncio.Semaphore,
+    ) -> float:
+        """씬 나레이션 합성 (캐시 hit 시 재사용).
+
+        scene.audio_path를 설정하고, 스크립트에 길이가 없으면
+        scene.duration_sec를 오디오 길이로 설정합니다.
+
+        Returns:
+            float: 씬 오디오 길이 (초)
+        """
+        key = TTSAudioCache.make_key(
+            type(tts).__name__, None, self.config.tts_language, 1.0, scene.narration
+        )
+        ctx.audio_fingerprints[scene.scene_id] = key
+        path = output_dir / f"scene_{scene.scene_id}.mp3"
+
+        cached = await self._audio_cache.aget(key) if self._audio_cache else None
+        if cached is not None and cached.duration_sec > 0:
+            await asyncio.to_thread(path.write_bytes, cached.audio_bytes)
+            duration = cached.duration_sec
+            ctx.reused_audio_count += 1
+        else:
+            async with semaphore:
+                duration = await tts.synthesize_to_file(
+                    text=scene.narration,
+                    output_path=path,
+                    language=self.config.tts_language,
+                )
+            duration = await asyncio.to_thread(get_audio_duration_from_file, path) or duration
+            if self._audio_cache and duration > 0 and path.exists():
+                audio_bytes = await asyncio.to_thread(path.read_bytes)
+                await self._audio_cache.aput(
+                    key,
+                    TTSResult(audio_bytes=audio_bytes, duration_sec=duration, format="mp3"),
+                )
+
+        scene.audio_path = str(path)
+        if scene.duration_sec is None:
+            scene.duration_sec = duration
+        return duration
 
     async def _generate_subtitle(self, ctx: RealRenderJobContext) -> None:
         """자막 생성 (Composer에서 처리)."""
@@ -380,29 +482,71 @@ class RealVideoRenderer(VideoRenderer):
         image_dir = ctx.output_dir / "scene_images"
         image_dir.mkdir(parents=True, exist_ok=True)
 
-        # 각 씬에 대해 VisualPlan 생성 → 이미지 생성
-        for i, scene in enumerate(ctx.scenes):
-            # VisualPlan 추출
-            plan = extractor.extract(scene)
-
-            # 이미지 생성
-            image_path = image_service.generate_scene_image(
-                plan=plan,
+        # 각 씬에 대해 VisualPlan 생성 → 캐시 조회 → 없는 씬만 병렬 생성 (이벤트 루프 밖)
+        plans = [extractor.extract(scene) for scene in ctx.scenes]
+        image_config = asdict(image_service.config) if is_dataclass(image_service.config) else {}
+
+        image_paths: List[Optional[str]] = [None] * len(plans)
+        keys: List[str] = []
+        missing: List[int] = []
+        for i, (scene, plan) in enumerate(zip(ctx.scenes, plans)):
+            plan_fields = asdict(plan)
+            plan_fields.pop("duration_sec", None)  # 이미지에 그려지지 않음
+            key = scene_fingerprint("scene_image", image_config, plan_fields)
+            keys.append(key)
+            ctx.image_fingerprints[scene.scene_id] = key
+
+            local_path = image_dir / f"scene_{scene.scene_id}_cached.png"
+            if await asyncio.to_thread(self._restore_cached_image, key, local_path):
+                # 캐시 파일은 LRU로 지워질 수 있으므로 잡 작업 디렉토리로 옮긴 경로 사용
+                image_paths[i] = str(local_path)
+                ctx.reused_image_count += 1
+            else:
+                missing.append(i)
+
+        if missing:
+            generated = await image_service.generate_all_scene_images_async(
+                plans=[plans[i] for i in missing],
                 output_dir=image_dir,
-                scene_index=i,
             )
-
-            # 씬에 이미지 경로 설정
+            for i, image_path in zip(missing, generated):
+                image_paths[i] = image_path
+            if self._asset_cache:
+                await asyncio.to_thread(
+                    self._store_scene_images, [(keys[i], image_paths[i]) for i in missing]
+                )
+
+        # 씬에 이미지 경로 설정
+        for scene, image_path in zip(ctx.scenes, image_paths):
             scene.image_path = image_path
-            logger.debug(f"Scene {scene.scene_id} image generated: {image_path}")
+            logger.debug(f"Scene {scene.scene_id} image ready: {image_path}")
+
+        logger.info(
+            f"Scene images ready for job: {ctx.job_id}, "
+            f"generated={len(missing)}, reused={ctx.reused_image_count}"
+        )
+
+    def _restore_cached_image(self, key: str, local_path: Path) -> bool:
+        """캐시된 씬 이미지를 잡 디렉토리로 가져옵니다 (동기, 스레드에서 호출).
 
-        logger.info(f"Generated {len(ctx.scenes)} scene images for job: {ctx.job_id}")
+        Returns:
+            bool: 캐시 hit 후 local_path에 준비되었는지 여부
+        """
+        cached = self._asset_cache.get(key, ".png") if self._asset_cache else None
+        return cached is not None and _link_or_copy(cached, local_path)
+
+    def _store_scene_images(self, items: List[Tuple[str, Optional[str]]]) -> None:
+        """생성한 씬 이미지를 캐시에 저장합니다 (동기, 스레드에서 호출)."""
+        for key, image_path in items:
+            if image_path and Path(image_path).exists():
+                self._asset_cache.put_file(key, image_path, ".png")
 
     async def _compose_video(self, ctx: RealRenderJobContext) -> None:
         """영상 합성."""
         logger.info(f"Composing video for job: {ctx.job_id}")
 
         composer = self._get_composer()
+        ctx.scene_fingerprints = self._compute_scene_fingerprints(ctx, composer)
 
         # 영상 합성
         result = await composer.compose(
@@ -426,6 +570,10 @@ class RealVideoRenderer(VideoRenderer):
         - videos/{video_id}/{script_id}/{job_id}/video.mp4
         - videos/{video_id}/{script_id}/{job_id}/subtitles.srt
         - videos/{video_id}/{script_id}/{job_id}/thumb.jpg
+
+        비디오/자막/썸네일은 서로 독립적이므로 동시에 업로드합니다
+        (작은 자막/썸네일이 비디오 업로드 뒤에 줄 서지 않음).
+        하나가 실패하면 나머지 업로드는 취소하고 그 예외(StorageUploadError)를 그대로 전달합니다.
         """
         logger.info(f"Uploading assets for job: {ctx.job_id}")
 
@@ -434,35 +582,26 @@ class RealVideoRenderer(VideoRenderer):
         # Phase 34: object_key 기본 경로
         base_key = f"videos/{ctx.video_id}/{ctx.script_id}/{ctx.job_id}"
 
-        # 비디오 업로드
-        if ctx.video_path and Path(ctx.video_path).exists():
-            result = await storage.put_file(
-                ctx.video_path,
-                f"{base_key}/video.mp4",
-                "video/mp4",
-            )
-            ctx.video_url = result.url
-            logger.info(f"Video uploaded: {ctx.video_url}")
-
-        # 자막 업로드
-        if ctx.subtitle_path and Path(ctx.subtitle_path).exists():
-            result = await storage.put_file(
-                ctx.subtitle_path,
-                f"{base_key}/subtitles.srt",
-                "text/plain",
-            )
-            ctx.subtitle_url = result.url
-            logger.info(f"Subtitle uploaded: {ctx.subtitle_url}")
-
-        # 썸네일 업로드
-        if ctx.thumbnail_path and Path(ctx.thumbnail_path).exists():
-            result = await storage.put_file(
-                ctx.thumbnail_path,
-                f"{base_key}/thumb.jpg",
-                "image/jpeg",
-            )
-            ctx.thumbnail_url = result.url
-            logger.info(f"Thumbnail uploaded: {ctx.thumbnail_url}")
+        # (로컬 경로, object_key 파일명, content_type, 결과 URL을 저장할 ctx 필드)
+        assets = [
+            (ctx.video_path, "video.mp4", "video/mp4", "video_url"),
+            (ctx.subtitle_path, "subtitles.srt", "text/plain", "subtitle_url"),
+            (ctx.thumbnail_path, "thumb.jpg", "image/jpeg", "thumbnail_url"),
+        ]
+        pending = [asset for asset in assets if asset[0] and Path(asset[0]).exists()]
+
+        async def upload(local_path: str, name: str, content_type: str, field_name: str) -> None:
+            result = await storage.put_file(local_path, f"{base_key}/{name}", content_type)
+            setattr(ctx, field_name, result.url)
+            logger.info(f"Asset uploaded: {name} -> {result.url}")
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for asset in pending:
+                    group.create_task(upload(*asset))
+        except BaseExceptionGroup as eg:
+            # 호출부는 StorageUploadError로 실패를 구분하므로 첫 실패 예외를 풀어서 전달
+            raise eg.exceptions[0]
 
     async def _finalize(self, ctx: RealRenderJobContext) -> None:
         """최종화."""
@@ -487,6 +626,35 @@ class RealVideoRenderer(VideoRenderer):
     # Helper Methods
     # =========================================================================
 
+    def _compute_scene_fingerprints(
+        self,
+        ctx: RealRenderJobContext,
+        composer: VideoComposer,
+    ) -> Dict[str, str]:
+        """씬별 입력 fingerprint (나레이션/화면 텍스트/시각 계획/렌더 설정).
+
+        이전 잡의 fingerprint와 비교하면 어떤 씬이 바뀌었는지 알 수 있습니다.
+        """
+        composer_config = getattr(composer, "config", None)
+        render_config = {
+            "visual_style": self.config.visual_style,
+            "tts_language": self.config.tts_language,
+            "composer": asdict(composer_config) if is_dataclass(composer_config) else {},
+        }
+
+        return {
+            str(scene.scene_id): scene_fingerprint(
+                "scene",
+                render_config,
+                ctx.audio_fingerprints.get(scene.scene_id),
+                ctx.image_fingerprints.get(scene.scene_id),
+                scene.caption,
+                scene.on_screen_text,
+                scene.duration_sec,
+            )
+            for scene in ctx.scenes
+        }
+
     def _extract_scenes(self, script: dict) -> List[SceneInfo]:
         """스크립트에서 SceneInfo 목록 추출."""
         scenes = []
@@ -526,6 +694,26 @@ class RealVideoRenderer(VideoRenderer):
         return scenes
 
 
+def _link_or_copy(source: Path, target: Path) -> bool:
+    """캐시 파일을 하드링크(다른 파일시스템이면 복사)로 가져옵니다.
+
+    Returns:
+        bool: 성공 여부 (캐시 파일이 그 사이 제거되었으면 False)
+    """
+    try:
+        target.unlink(missing_ok=True)
+        os.link(source, target)
+        return True
+    except OSError:
+        pass
+    try:
+        shutil.copyfile(source, target)
+        return True
+    except OSError as e:
+        logger.warning(f"Cached scene image unavailable, regenerating: {source}, error={e}")
+        return False
+
+
 # =============================================================================
 # Singleton Instance
 # =============================================================================
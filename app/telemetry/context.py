@@ -17,7 +17,7 @@ Request Context Module - v1 Telemetry Context Propagation
     print(ctx.trace_id)
 """
 
-from contextvars import ContextVar
+from contextvars import Context, ContextVar
 from dataclasses import dataclass
 from typing import Optional
 
@@ -35,6 +35,7 @@ class RequestContext:
         dept_id: 부서 ID (X-Dept-Id)
         conversation_id: 대화 세션 ID (X-Conversation-Id)
         turn_id: 턴 ID (X-Turn-Id, 정수)
+        route: 처리 중인 HTTP 요청 ("POST /ai/chat/messages", 루프 정지 원인 추적용)
     """
 
     trace_id: Optional[str] = None
@@ -42,6 +43,7 @@ class RequestContext:
     dept_id: Optional[str] = None
     conversation_id: Optional[str] = None
     turn_id: Optional[int] = None
+    route: Optional[str] = None
 
 
 # 전역 ContextVar - 요청별로 독립적인 컨텍스트 제공
@@ -85,3 +87,17 @@ def reset_request_context() -> None:
     요청 단위로 자동 격리되므로 호출할 필요가 없습니다.
     """
     _request_context_var.set(None)
+
+
+def get_request_context_in(context: Context) -> Optional[RequestContext]:
+    """다른 태스크의 contextvars 스냅샷에서 요청 컨텍스트를 읽습니다.
+
+    루프 감시 스레드가 정지 시점에 실행 중인 태스크의 요청을 찾을 때 사용합니다.
+
+    Args:
+        context: 태스크가 실행되는 contextvars.Context
+
+    Returns:
+        설정된 RequestContext 또는 None
+    """
+    return context.get(_request_context_var)
@@ -17,7 +17,14 @@ A7 업데이트:
 
 A8 업데이트:
     - StreamingResponse의 경우 스트림 완료 후 cleanup 실행
-    - body_iterator 래핑으로 스트림 전송 중 contextvars 유지 보장
+
+순수 ASGI 전환:
+    - BaseHTTPMiddleware는 요청마다 call_next용 태스크/메모리 스트림을 만들고
+      StreamingResponse의 body_iterator를 다시 감싸므로 NDJSON 스트림의
+      청크마다 비용이 붙습니다.
+    - 순수 ASGI에서는 하위 앱 호출(스트림 전송 포함)이 같은 태스크의
+      `await self.app(...)` 한 번으로 끝나므로, 그 뒤의 finally가 곧
+      "스트림 완료 후 cleanup"입니다. body 래핑이 필요 없습니다.
 
 사용법:
     from fastapi import FastAPI
@@ -27,11 +34,9 @@ A8 업데이트:
     app.add_middleware(RequestContextMiddleware)
 """
 
-from typing import AsyncIterator, Optional
+from typing import Dict, Optional
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response, StreamingResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.telemetry.context import RequestContext, set_request_context, reset_request_context
 from app.telemetry.emitters import (
@@ -45,42 +50,32 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# ASGI scope의 헤더 이름(소문자 bytes) → RequestContext 필드
+_CONTEXT_HEADERS: Dict[bytes, str] = {
+    b"x-trace-id": "trace_id",
+    b"x-user-id": "user_id",
+    b"x-dept-id": "dept_id",
+    b"x-conversation-id": "conversation_id",
+    b"x-turn-id": "turn_id",
+}
 
-def _cleanup_telemetry_context() -> None:
-    """모든 telemetry contextvars를 리셋합니다."""
-    reset_request_context()
+
+def _reset_telemetry_state() -> None:
+    """요청 컨텍스트를 제외한 telemetry contextvars(메트릭, 발행 상태)를 리셋합니다."""
     reset_all_metrics()
     reset_chat_turn_emitted()
     reset_security_emitted()
     reset_feedback_emitted()
 
 
-async def _wrap_streaming_body(
-    body_iterator: AsyncIterator[bytes],
-) -> AsyncIterator[bytes]:
-    """
-    StreamingResponse의 body_iterator를 래핑하여 스트림 완료 후 cleanup을 실행합니다.
-
-    A8: 스트림 전송 중에는 contextvars가 유지되고,
-    스트림이 완료(정상/예외)된 후에 cleanup이 실행됩니다.
-
-    Args:
-        body_iterator: 원본 body iterator
-
-    Yields:
-        bytes: 스트리밍 청크
-    """
-    try:
-        async for chunk in body_iterator:
-            yield chunk
-    finally:
-        # 스트림 완료 후 cleanup
-        logger.debug("Streaming body completed, cleaning up telemetry context")
-        _cleanup_telemetry_context()
+def _cleanup_telemetry_context() -> None:
+    """모든 telemetry contextvars를 리셋합니다."""
+    reset_request_context()
+    _reset_telemetry_state()
 
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
-    """요청 컨텍스트 미들웨어.
+class RequestContextMiddleware:
+    """요청 컨텍스트 미들웨어 (순수 ASGI).
 
     요청 헤더에서 텔레메트리 관련 정보를 추출하여
     RequestContext에 저장합니다.
@@ -88,75 +83,66 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
     A7: 요청 단위로 모든 telemetry contextvars를 리셋하여
     요청 간 상태 누적을 방지합니다.
 
-    A8: StreamingResponse의 경우 스트림 완료 후 cleanup을 실행하여
-    스트림 전송 중 contextvars가 유지됩니다.
+    A8: 하위 앱 호출은 응답 body 전송(스트리밍 포함)이 끝나야 반환되므로
+    cleanup은 항상 스트림 완료 후에 실행되고, 전송 중에는 contextvars가 유지됩니다.
 
+    http 이외의 scope(websocket, lifespan)는 그대로 통과시킵니다.
     헤더 파싱 실패 시에도 예외를 발생시키지 않고
     해당 값을 None으로 처리합니다.
     """
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        """요청 처리 전 헤더를 파싱하여 컨텍스트에 저장합니다.
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        A7: 요청 시작 시 모든 contextvars 리셋.
-        A8: StreamingResponse면 스트림 완료 후 cleanup, 아니면 즉시 cleanup.
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """헤더를 컨텍스트에 저장하고 하위 앱을 호출한 뒤 cleanup합니다.
 
         Args:
-            request: FastAPI/Starlette 요청 객체
-            call_next: 다음 미들웨어/라우터 핸들러
-
-        Returns:
-            Response 객체
+            scope: ASGI scope
+            receive: ASGI receive 채널
+            send: ASGI send 채널
         """
-        # 헤더에서 값 추출 (없으면 None)
-        trace_id = request.headers.get("X-Trace-Id")
-        user_id = request.headers.get("X-User-Id")
-        dept_id = request.headers.get("X-Dept-Id")
-        conversation_id = request.headers.get("X-Conversation-Id")
-        turn_id = self._parse_turn_id(request.headers.get("X-Turn-Id"))
-
-        # RequestContext 생성 및 저장
-        ctx = RequestContext(
-            trace_id=trace_id,
-            user_id=user_id,
-            dept_id=dept_id,
-            conversation_id=conversation_id,
-            turn_id=turn_id,
-        )
-        set_request_context(ctx)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # A7: 요청 시작 시 모든 telemetry contextvars 리셋 (clean slate 보장)
-        reset_all_metrics()
-        reset_chat_turn_emitted()
-        reset_security_emitted()
-        reset_feedback_emitted()
-
-        is_streaming = False
+        set_request_context(self._build_context(scope))
+        _reset_telemetry_state()
 
         try:
-            # 다음 핸들러 호출
-            response = await call_next(request)
+            await self.app(scope, receive, send)
+        finally:
+            # A8: 스트리밍 응답도 여기 도달하면 전송이 끝난 상태
+            _cleanup_telemetry_context()
 
-            # A8: StreamingResponse 여부 확인
-            if isinstance(response, StreamingResponse):
-                is_streaming = True
-                # body_iterator를 래핑하여 스트림 완료 후 cleanup 실행
-                response.body_iterator = _wrap_streaming_body(response.body_iterator)
-                logger.debug(f"Streaming response detected, deferring cleanup: path={request.url.path}")
+    @classmethod
+    def _build_context(cls, scope: Scope) -> RequestContext:
+        """ASGI scope의 원시 헤더에서 RequestContext를 만듭니다.
 
-            return response
+        Headers 객체를 만들지 않고 필요한 5개 헤더만 한 번 순회로 찾습니다.
+        같은 헤더가 여러 번 오면 첫 값을 사용합니다 (Headers.get과 동일).
 
-        except Exception:
-            # 예외 발생 시에는 즉시 cleanup
-            _cleanup_telemetry_context()
-            raise
+        Args:
+            scope: ASGI http scope
 
-        finally:
-            # A8: StreamingResponse가 아닌 경우에만 즉시 cleanup
-            if not is_streaming:
-                _cleanup_telemetry_context()
+        Returns:
+            RequestContext (route는 "METHOD path")
+        """
+        values: Dict[str, str] = {}
+        for name, value in scope.get("headers", ()):
+            field = _CONTEXT_HEADERS.get(name)
+            if field is not None and field not in values:
+                values[field] = value.decode("latin-1")
+
+        return RequestContext(
+            trace_id=values.get("trace_id"),
+            user_id=values.get("user_id"),
+            dept_id=values.get("dept_id"),
+            conversation_id=values.get("conversation_id"),
+            turn_id=cls._parse_turn_id(values.get("turn_id")),
+            route=f"{scope.get('method', '')} {scope.get('path', '')}",
+        )
 
     @staticmethod
     def _parse_turn_id(value: Optional[str]) -> Optional[int]:
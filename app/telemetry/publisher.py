@@ -8,7 +8,19 @@ v1 Telemetry 이벤트를 백엔드로 전송하는 비동기 Publisher입니다
 - enqueue는 절대 네트워크 호출/await를 하지 않음 (동기 I/O 금지)
 - 배치 전송(events[]) + 주기 flush + 큐 포화 시 drop
 - 전송 실패해도 예외를 밖으로 던지지 않음
-- retry_once=True면 1회만 재시도 후 drop
+- retry_once=True면 1회만 재시도 후 drop (spill_dir 설정 시 디스크에 보관)
+
+메모리/전송 비용:
+- 이벤트는 enqueue 시점에 한 번만 JSON bytes로 직렬화해 큐에 보관
+  (큐는 건수와 bytes 합계로 상한)
+- 배치 본문은 직렬화된 이벤트를 이어 붙여 만들고 gzip으로 압축해 전송
+- 배치 크기는 min~max 범위에서 백엔드 응답 시간에 따라 조절
+  (목표 지연의 절반보다 빠르면 2배, 목표보다 느리거나 실패하면 절반)
+- 큐 포화 drop은 건별 로그 대신 dropped_count로 세고, flush 주기마다 합계만 경고
+
+디스크 spill:
+- 재시도 후에도 실패한 배치와 종료 시 남은 이벤트를 spill_dir에 기록
+- 재시작 후 flush 주기마다 오래된 파일부터 재전송 (성공 시 삭제)
 
 사용법:
     from app.telemetry.publisher import get_telemetry_publisher
@@ -18,20 +30,136 @@ v1 Telemetry 이벤트를 백엔드로 전송하는 비동기 Publisher입니다
 """
 
 import asyncio
+import gzip
+import json
+import os
+import time
 from collections import deque
 from datetime import datetime
-from typing import Deque, Optional
+from pathlib import Path
+from typing import Deque, List, Optional
 
 import httpx
 
 from app.core.logging import get_logger
-from app.telemetry.models import TelemetryEnvelope, TelemetryEvent
+from app.core.metrics import LOG_TAG_TELEMETRY_DROPPED, get_metrics
+from app.telemetry.models import TelemetryEvent
 
 logger = get_logger(__name__)
 
 # 전역 싱글톤 인스턴스
 _publisher: Optional["TelemetryPublisher"] = None
 
+# 배치 본문 압축 수준 (이벤트 루프에서 실행되므로 기본 9보다 낮게)
+GZIP_COMPRESS_LEVEL = 5
+
+# flush 주기 1회에 재전송하는 spill 파일 수 상한
+SPILL_REPLAY_PER_TICK = 5
+
+# 전송 중(claim) 표시가 이 시간보다 오래된 spill 파일은 비정상 종료로 보고 되돌림
+SPILL_STALE_CLAIM_SEC = 300.0
+
+
+class TelemetrySpillStore:
+    """전송하지 못한 배치를 디스크에 보관하는 저장소.
+
+    배치 1개 = 파일 1개 (직렬화된 이벤트를 줄 단위로 이어 gzip 압축).
+    파일명이 기록 시각 순이라 오래된 배치부터 재전송합니다.
+    여러 워커가 같은 디렉터리를 써도 rename으로 파일을 선점(claim)하므로
+    같은 파일을 동시에 보내지 않습니다.
+
+    모든 메서드는 블로킹 파일 I/O이므로 asyncio.to_thread로 호출합니다.
+    """
+
+    SUFFIX = ".ndjson.gz"
+    CLAIM_SUFFIX = ".sending"
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        """TelemetrySpillStore 초기화.
+
+        Args:
+            directory: spill 디렉터리 (없으면 생성)
+            max_bytes: 디렉터리 전체 크기 상한 (초과 시 새 배치는 버림)
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._seq = 0
+
+    def write(self, lines: List[bytes]) -> bool:
+        """배치를 파일로 기록합니다 (임시 파일에 쓴 뒤 rename).
+
+        Returns:
+            True: 기록됨, False: 용량 초과로 버림
+        """
+        data = gzip.compress(b"\n".join(lines), compresslevel=GZIP_COMPRESS_LEVEL, mtime=0)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if self._used_bytes() + len(data) > self.max_bytes:
+            return False
+
+        self._seq += 1
+        name = f"telemetry-{time.time_ns():020d}-{os.getpid()}-{self._seq}{self.SUFFIX}"
+        tmp_path = self.directory / f"{name}.tmp"
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, self.directory / name)
+        return True
+
+    def pending(self) -> List[str]:
+        """재전송 대기 중인 파일명 (오래된 순)."""
+        if not self.directory.is_dir():
+            return []
+        return sorted(p.name for p in self.directory.glob(f"*{self.SUFFIX}"))
+
+    def claim(self, name: str) -> Optional[List[bytes]]:
+        """파일을 선점하고 배치 내용을 읽습니다.
+
+        Returns:
+            직렬화된 이벤트 목록, 다른 워커가 먼저 선점했으면 None
+        """
+        path = self.directory / name
+        claimed = self.directory / f"{name}{self.CLAIM_SUFFIX}"
+        try:
+            os.rename(path, claimed)
+        except FileNotFoundError:
+            return None
+        os.utime(claimed)  # 선점 시각 (비정상 종료 판정용)
+        return [line for line in gzip.decompress(claimed.read_bytes()).split(b"\n") if line]
+
+    def release(self, name: str) -> None:
+        """전송 실패 시 선점을 풀어 다음 주기에 다시 시도하게 합니다."""
+        os.replace(self.directory / f"{name}{self.CLAIM_SUFFIX}", self.directory / name)
+
+    def remove(self, name: str) -> None:
+        """전송 성공한 파일을 삭제합니다."""
+        (self.directory / f"{name}{self.CLAIM_SUFFIX}").unlink(missing_ok=True)
+
+    def restore_stale_claims(self) -> int:
+        """전송 도중 종료되어 남은 선점 파일을 대기 상태로 되돌립니다.
+
+        Returns:
+            되돌린 파일 수
+        """
+        if not self.directory.is_dir():
+            return 0
+        restored = 0
+        deadline = time.time() - SPILL_STALE_CLAIM_SEC
+        for path in self.directory.glob(f"*{self.SUFFIX}{self.CLAIM_SUFFIX}"):
+            try:
+                if path.stat().st_mtime < deadline:
+                    os.replace(path, path.with_name(path.name[: -len(self.CLAIM_SUFFIX)]))
+                    restored += 1
+            except FileNotFoundError:
+                continue
+        return restored
+
+    def _used_bytes(self) -> int:
+        total = 0
+        for path in self.directory.iterdir():
+            try:
+                total += path.stat().st_size
+            except FileNotFoundError:
+                continue
+        return total
+
 
 class TelemetryPublisher:
     """텔레메트리 이벤트 비동기 Publisher.
@@ -51,6 +179,13 @@ class TelemetryPublisher:
         timeout_sec: float = 3.0,
         retry_once: bool = True,
         http_client: Optional[httpx.AsyncClient] = None,
+        min_batch_size: Optional[int] = None,
+        max_batch_size: Optional[int] = None,
+        target_latency_ms: float = 500.0,
+        max_queue_bytes: int = 4 * 1024 * 1024,
+        compress: bool = True,
+        spill_dir: Optional[str] = None,
+        spill_max_bytes: int = 50 * 1024 * 1024,
     ):
         """TelemetryPublisher 초기화.
 
@@ -59,35 +194,55 @@ class TelemetryPublisher:
             internal_token: X-Internal-Token 헤더 값
             source: 이벤트 소스 식별자
             enabled: 활성화 여부 (False면 enqueue 무시)
-            batch_size: 배치 전송 크기
+            batch_size: 시작 배치 크기
             flush_sec: flush 주기 (초)
             max_queue_size: 최대 큐 크기 (초과 시 drop)
             timeout_sec: HTTP 요청 타임아웃
             retry_once: 실패 시 1회 재시도 여부
             http_client: 외부 주입 httpx.AsyncClient (테스트용)
+            min_batch_size: 배치 크기 하한 (None이면 batch_size, 조절 안 함)
+            max_batch_size: 배치 크기 상한 (None이면 batch_size, 조절 안 함)
+            target_latency_ms: 배치 크기 조절 기준 백엔드 응답 시간
+            max_queue_bytes: 큐에 보관하는 직렬화 bytes 합계 상한 (초과 시 drop)
+            compress: 배치 본문 gzip 압축 여부
+            spill_dir: 전송 실패 배치 보관 디렉터리 (None이면 보관하지 않음)
+            spill_max_bytes: spill 디렉터리 크기 상한
         """
         self.backend_base_url = backend_base_url.rstrip("/")
         self.internal_token = internal_token
         self.source = source
         self.enabled = enabled
         self.batch_size = batch_size
+        self.min_batch_size = min(min_batch_size or batch_size, batch_size)
+        self.max_batch_size = max(max_batch_size or batch_size, batch_size)
+        self.target_latency_ms = target_latency_ms
         self.flush_sec = flush_sec
         self.max_queue_size = max_queue_size
+        self.max_queue_bytes = max_queue_bytes
         self.timeout_sec = timeout_sec
         self.retry_once = retry_once
+        self.compress = compress
+        self.dropped_count = 0
 
         # 내부 상태
-        self._queue: Deque[TelemetryEvent] = deque(maxlen=max_queue_size)
+        self._queue: Deque[bytes] = deque(maxlen=max_queue_size)
+        self._queue_bytes = 0
+        self._dropped_reported = 0
+        self._spill = TelemetrySpillStore(spill_dir, spill_max_bytes) if spill_dir else None
+        self._envelope_prefix = b'{"source":' + json.dumps(source).encode() + b',"sentAt":"'
         self._http_client = http_client
         self._owns_client = http_client is None
         self._flush_task: Optional[asyncio.Task] = None
         self._stop_event = asyncio.Event()
         self._started = False
 
+        get_metrics().register_gauge("telemetry_events", lambda: len(self._queue))
+
     def enqueue(self, event: TelemetryEvent) -> bool:
-        """이벤트를 큐에 추가합니다.
+        """이벤트를 직렬화해 큐에 추가합니다.
 
         절대 await/네트워크 호출을 하지 않습니다.
+        큐 포화 시 로그 없이 dropped_count만 증가합니다.
         예외 발생 시에도 False를 반환하고 raise하지 않습니다.
 
         Args:
@@ -102,13 +257,16 @@ class TelemetryPublisher:
                 return False
 
             if len(self._queue) >= self.max_queue_size:
-                logger.warning(
-                    "Telemetry queue full, dropping event",
-                    extra={"event_id": str(event.event_id)},
-                )
+                self._count_drop()
+                return False
+
+            data = event.model_dump_json(by_alias=True, exclude_none=True).encode()
+            if self._queue_bytes + len(data) > self.max_queue_bytes:
+                self._count_drop()
                 return False
 
-            self._queue.append(event)
+            self._queue.append(data)
+            self._queue_bytes += len(data)
             return True
 
         except Exception as e:
@@ -118,6 +276,10 @@ class TelemetryPublisher:
             )
             return False
 
+    def _count_drop(self, count: int = 1) -> None:
+        self.dropped_count += count
+        get_metrics().add_error_count(LOG_TAG_TELEMETRY_DROPPED, count)
+
     async def start(self) -> None:
         """백그라운드 flush 태스크를 시작합니다."""
         if self._started:
@@ -132,21 +294,33 @@ class TelemetryPublisher:
             self._http_client = get_async_http_client()
             self._owns_client = False  # shared client는 직접 close 안 함
 
+        if self._spill is not None:
+            try:
+                await asyncio.to_thread(self._spill.restore_stale_claims)
+            except Exception as e:
+                logger.warning(
+                    "Failed to restore telemetry spill claims",
+                    extra={"error": str(e)},
+                )
+
         # 백그라운드 flush 루프 시작
         self._flush_task = asyncio.create_task(self._flush_loop())
         logger.info(
             "TelemetryPublisher started",
             extra={
                 "batch_size": self.batch_size,
+                "max_batch_size": self.max_batch_size,
                 "flush_sec": self.flush_sec,
                 "max_queue_size": self.max_queue_size,
+                "spill_dir": str(self._spill.directory) if self._spill else None,
             },
         )
 
     async def stop(self) -> None:
         """백그라운드 flush 태스크를 종료합니다.
 
-        남은 이벤트를 best-effort로 1회 flush 시도합니다.
+        남은 이벤트를 best-effort로 1회 flush 시도하고,
+        그래도 남은 이벤트는 spill 디렉터리에 보관합니다.
         """
         if not self._started:
             return
@@ -173,6 +347,16 @@ class TelemetryPublisher:
                     extra={"error": str(e), "remaining": len(self._queue)},
                 )
 
+        if len(self._queue) > 0:
+            remaining = len(self._queue)
+            while len(self._queue) > 0:
+                await self._spill_or_drop(self._take_batch(self.max_batch_size))
+            logger.info(
+                "Telemetry events left on shutdown",
+                extra={"remaining": remaining, "spilled": self._spill is not None},
+            )
+
+        self._report_drops()
         self._started = False
         logger.info("TelemetryPublisher stopped")
 
@@ -209,6 +393,8 @@ class TelemetryPublisher:
                         # 타임아웃 = flush 주기 도래
                         if len(self._queue) > 0:
                             await self._flush_batch()
+                        await self._replay_spilled()
+                        self._report_drops()
 
             except Exception as e:
                 logger.error(
@@ -217,56 +403,116 @@ class TelemetryPublisher:
                 )
                 await asyncio.sleep(1.0)  # 에러 시 짧은 대기 후 재시도
 
+    def _report_drops(self) -> None:
+        """지난 보고 이후 drop된 이벤트 수를 한 번에 경고합니다."""
+        dropped = self.dropped_count - self._dropped_reported
+        if dropped > 0:
+            self._dropped_reported = self.dropped_count
+            logger.warning(
+                "Telemetry events dropped",
+                extra={"dropped_count": dropped, "dropped_total": self.dropped_count},
+            )
+
+    def _take_batch(self, size: int) -> List[bytes]:
+        """큐 앞에서 최대 size개의 직렬화된 이벤트를 꺼냅니다."""
+        batch: List[bytes] = []
+        while len(self._queue) > 0 and len(batch) < size:
+            data = self._queue.popleft()
+            self._queue_bytes -= len(data)
+            batch.append(data)
+        return batch
+
     async def _flush_batch(self) -> int:
         """큐에서 배치를 꺼내 전송합니다.
 
         Returns:
             전송 시도한 이벤트 수
         """
-        if len(self._queue) == 0:
-            return 0
-
-        # 배치 추출
-        batch: list[TelemetryEvent] = []
-        while len(self._queue) > 0 and len(batch) < self.batch_size:
-            batch.append(self._queue.popleft())
-
+        batch = self._take_batch(self.batch_size)
         if not batch:
             return 0
 
-        # Envelope 생성
-        envelope = TelemetryEnvelope(
-            source=self.source,
-            sent_at=datetime.now(),
-            events=batch,
-        )
-
         # 전송 시도
-        success = await self._send_envelope(envelope)
+        success = await self._send_events(batch)
 
         if not success and self.retry_once:
             # 1회 재시도
             await asyncio.sleep(0.1)  # 짧은 대기
-            success = await self._send_envelope(envelope)
+            success = await self._send_events(batch)
 
         if not success:
-            # 재시도 후에도 실패 - drop (큐로 되돌리지 않음)
-            event_ids = [str(e.event_id) for e in batch[:3]]  # 처음 3개만 로깅
-            logger.error(
-                "Telemetry batch dropped after retry",
-                extra={
-                    "dropped_count": len(batch),
-                    "sample_event_ids": event_ids,
-                },
-            )
+            # 재시도 후에도 실패 - spill 디렉터리에 보관 (없으면 drop)
+            await self._spill_or_drop(batch)
 
         return len(batch)
 
-    async def _send_envelope(self, envelope: TelemetryEnvelope) -> bool:
-        """Envelope를 백엔드로 전송합니다.
+    async def _spill_or_drop(self, batch: List[bytes]) -> None:
+        """전송하지 못한 배치를 spill 디렉터리에 기록하고, 불가하면 drop합니다."""
+        if self._spill is not None:
+            try:
+                if await asyncio.to_thread(self._spill.write, batch):
+                    return
+                logger.warning(
+                    "Telemetry spill directory full",
+                    extra={"max_bytes": self._spill.max_bytes},
+                )
+            except Exception as e:
+                logger.warning(
+                    "Telemetry spill write failed",
+                    extra={"error": str(e)},
+                )
+
+        logger.error(
+            "Telemetry batch dropped after retry",
+            extra={"dropped_count": len(batch)},
+        )
+        self._count_drop(len(batch))
+
+    async def _replay_spilled(self) -> None:
+        """spill 파일을 오래된 순으로 재전송합니다 (실패하면 다음 주기로)."""
+        if self._spill is None:
+            return
+
+        for name in (await asyncio.to_thread(self._spill.pending))[:SPILL_REPLAY_PER_TICK]:
+            batch = await asyncio.to_thread(self._spill.claim, name)
+            if batch is None:
+                continue  # 다른 워커가 선점
+            if not batch:
+                await asyncio.to_thread(self._spill.remove, name)
+                continue
+            if not await self._send_events(batch):
+                await asyncio.to_thread(self._spill.release, name)
+                return
+            await asyncio.to_thread(self._spill.remove, name)
+            logger.info(
+                "Telemetry spilled batch resent",
+                extra={"event_count": len(batch)},
+            )
+
+    def _build_body(self, events: List[bytes]) -> bytes:
+        """직렬화된 이벤트를 이어 붙여 TelemetryEnvelope JSON 본문을 만듭니다."""
+        return b"".join(
+            (
+                self._envelope_prefix,
+                datetime.now().isoformat().encode(),
+                b'","events":[',
+                b",".join(events),
+                b"]}",
+            )
+        )
+
+    def _adjust_batch_size(self, success: bool, latency_ms: float) -> None:
+        """백엔드 응답 시간에 따라 다음 배치 크기를 조절합니다."""
+        if not success or latency_ms > self.target_latency_ms:
+            self.batch_size = max(self.min_batch_size, self.batch_size // 2)
+        elif latency_ms < self.target_latency_ms / 2:
+            self.batch_size = min(self.max_batch_size, self.batch_size * 2)
+
+    async def _send_events(self, events: List[bytes]) -> bool:
+        """직렬화된 이벤트 배치를 백엔드로 전송합니다.
 
         Args:
-            envelope: 전송할 TelemetryEnvelope
+            events: 직렬화된 TelemetryEvent JSON bytes 목록
 
         Returns:
             True: 전송 성공 (200)
@@ -282,44 +528,50 @@ class TelemetryPublisher:
             "Content-Type": "application/json",
         }
 
+        body = self._build_body(events)
+        if self.compress:
+            body = gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL, mtime=0)
+            headers["Content-Encoding"] = "gzip"
+
+        started = time.perf_counter()
+        success = False
         try:
-            body = envelope.model_dump(by_alias=True, exclude_none=True, mode="json")
             response = await self._http_client.post(
                 url,
-                json=body,
+                content=body,
                 headers=headers,
                 timeout=self.timeout_sec,
             )
 
             if response.status_code == 200:
+                success = True
                 logger.debug(
                     "Telemetry batch sent",
-                    extra={"event_count": len(envelope.events)},
+                    extra={"event_count": len(events), "body_bytes": len(body)},
                 )
-                return True
             else:
                 logger.warning(
                     "Telemetry send failed",
                     extra={
                         "status_code": response.status_code,
-                        "event_count": len(envelope.events),
+                        "event_count": len(events),
                     },
                 )
-                return False
 
         except httpx.TimeoutException:
             logger.warning(
                 "Telemetry send timeout",
                 extra={"timeout_sec": self.timeout_sec},
             )
-            return False
 
         except Exception as e:
             logger.error(
                 "Telemetry send error",
                 extra={"error": str(e)},
             )
-            return False
+
+        self._adjust_batch_size(success, (time.perf_counter() - started) * 1000)
+        return success
 
 
 def get_telemetry_publisher() -> Optional[TelemetryPublisher]:
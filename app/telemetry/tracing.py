@@ -0,0 +1,479 @@
+"""
+Tracing - 프로세스 내 요청 단위 span
+
+채팅 파이프라인 단계(금지질문, PII, 라우팅, 임베딩, Milvus 검색, 게이트, 프롬프트, LLM, AI 로그)의
+소요 시간을 span으로 남겨, 느린 턴이 어느 단계 때문이었는지 재실행 없이 확인합니다.
+
+- span은 contextvars로 부모-자식 관계를 잇습니다 (asyncio 태스크로 전파)
+- trace_id는 RequestContext.trace_id(X-Trace-Id)를 쓰고, 없으면 새로 만듭니다
+- 끝난 span은 링 버퍼(TRACE_BUFFER_SIZE)에 보관하고 GET /internal/ai/traces로 조회합니다
+- TRACE_EXPORT_DIR가 있으면 OTLP/JSON 형식으로 파일에도 기록합니다 (별도 writer 스레드)
+
+사용법:
+    from app.telemetry.tracing import span
+
+    # 컨텍스트 매니저
+    with span("pii.input") as current:
+        result = await pii.detect_and_mask(text, stage)
+        current.set_attribute("has_pii", result.has_pii)
+
+    # 데코레이터 (동기/비동기 함수 모두)
+    @span("prompt.build")
+    def build_messages(...): ...
+
+    # 이미 측정한 구간 (async generator 등)
+    record_span("llm.stream", start_ns, end_ns, total_tokens=n)
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import queue
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional, TypeVar
+
+from app.core.logging import get_logger
+from app.telemetry.context import get_request_context
+
+logger = get_logger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+# =============================================================================
+# Span
+# =============================================================================
+
+
+class Span:
+    """끝난(또는 진행 중인) 작업 구간 1개."""
+
+    __slots__ = (
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "name",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "error",
+    )
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str]) -> None:
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.name = name
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ms": self.start_ns // 1_000_000,
+            "duration_ms": None if self.duration_ms is None else round(self.duration_ms, 2),
+            "attributes": dict(self.attributes),
+            "error": self.error,
+        }
+
+
+class _NoopSpan:
+    """추적 비활성화 시 반환하는 span (기록하지 않음)."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+# 현재 실행 중인 span (자식 span의 부모)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    """현재 span을 반환합니다 (없으면 None)."""
+    return _current_span.get()
+
+
+class _SpanScope:
+    """span 컨텍스트 매니저 겸 데코레이터."""
+
+    __slots__ = ("_name", "_attributes", "_span", "_token")
+
+    def __init__(self, name: str, attributes: Dict[str, Any]) -> None:
+        self._name = name
+        self._attributes = attributes
+        self._span: Optional[Span] = None
+        self._token: Optional[Token] = None
+
+    def __enter__(self) -> Any:
+        buffer = get_span_buffer()
+        if not buffer.enabled:
+            return _NOOP_SPAN
+        parent = _current_span.get()
+        if parent is not None:
+            trace_id, parent_id = parent.trace_id, parent.span_id
+        else:
+            trace_id = get_request_context().trace_id or uuid.uuid4().hex
+            parent_id = None
+        current = Span(self._name, trace_id, parent_id)
+        if self._attributes:
+            current.attributes.update(self._attributes)
+        self._span = current
+        self._token = _current_span.set(current)
+        return current
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        current = self._span
+        if current is None:
+            return
+        current.end_ns = time.time_ns()
+        if exc_type is not None:
+            current.error = exc_type.__name__
+        _current_span.reset(self._token)
+        self._span = None
+        self._token = None
+        get_span_buffer().record(current)
+
+    def __call__(self, func: F) -> F:
+        name, attributes = self._name, self._attributes
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with _SpanScope(name, attributes):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with _SpanScope(name, attributes):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+
+def record_span(
+    name: str,
+    start_ns: int,
+    end_ns: int,
+    parent: Optional[Span] = None,
+    **attributes: Any,
+) -> Optional[Span]:
+    """이미 끝난 구간을 span으로 기록합니다 (현재 span으로 설정하지 않음).
+
+    async generator처럼 with 블록이 yield를 가로지르는 곳에서 측정한 시간을
+    나중에 남길 때 사용합니다.
+
+    Args:
+        name: span 이름
+        start_ns: 시작 시각 (epoch ns)
+        end_ns: 종료 시각 (epoch ns)
+        parent: 부모 span (None이면 현재 span)
+        **attributes: 속성
+
+    Returns:
+        기록한 Span (추적 비활성화 시 None)
+    """
+    buffer = get_span_buffer()
+    if not buffer.enabled:
+        return None
+    if parent is None:
+        parent = _current_span.get()
+    if parent is not None:
+        item = Span(name, parent.trace_id, parent.span_id)
+    else:
+        item = Span(name, get_request_context().trace_id or uuid.uuid4().hex, None)
+    item.start_ns = start_ns
+    item.end_ns = end_ns
+    item.attributes.update(attributes)
+    buffer.record(item)
+    return item
+
+
+def span(name: str, **attributes: Any) -> _SpanScope:
+    """span을 시작하는 컨텍스트 매니저/데코레이터를 반환합니다.
+
+    Args:
+        name: span 이름 (예: "pii.input", "milvus.search")
+        **attributes: 시작 시 붙일 속성
+
+    Returns:
+        with 블록 또는 함수 데코레이터로 사용 (with는 Span을 돌려줌)
+    """
+    return _SpanScope(name, attributes)
+
+
+# =============================================================================
+# OTLP/JSON 파일 내보내기
+# =============================================================================
+
+_HEX_ID = re.compile(r"^[0-9a-f]+$")
+
+
+def _otlp_id(value: Optional[str], length: int) -> str:
+    """OTLP id 형식(hex, trace 32자 / span 16자)으로 맞춥니다."""
+    if not value:
+        return ""
+    if len(value) == length and _HEX_ID.match(value):
+        return value
+    return hashlib.md5(value.encode("utf-8")).hexdigest()[:length]
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def span_to_otlp(item: Span) -> Dict[str, Any]:
+    """Span을 OTLP/JSON span 객체로 변환합니다."""
+    attributes = [{"key": key, "value": _otlp_value(value)} for key, value in item.attributes.items()]
+    if _otlp_id(item.trace_id, 32) != item.trace_id:
+        # 원래 trace_id(X-Trace-Id)는 속성으로 보존
+        attributes.append({"key": "ctrlf.trace_id", "value": {"stringValue": item.trace_id}})
+    return {
+        "traceId": _otlp_id(item.trace_id, 32),
+        "spanId": item.span_id,
+        "parentSpanId": item.parent_id or "",
+        "name": item.name,
+        "kind": 1,  # SPAN_KIND_INTERNAL
+        "startTimeUnixNano": str(item.start_ns),
+        "endTimeUnixNano": str(item.end_ns or item.start_ns),
+        "attributes": attributes,
+        "status": {"code": 2, "message": item.error} if item.error else {"code": 1},
+    }
+
+
+class OtlpJsonFileExporter:
+    """끝난 span을 OTLP/JSON(ExportTraceServiceRequest) 1라인씩 일자별 파일에 기록합니다.
+
+    파일 쓰기는 writer 스레드에서 하고, 이벤트 루프는 큐에 넣기만 합니다.
+    큐가 가득 차면 버립니다.
+
+    Args:
+        directory: 출력 디렉터리 (spans-YYYYMMDD.jsonl)
+        service_name: resource의 service.name
+        flush_interval_sec: 모아서 쓰는 최대 대기 시간
+        max_batch: 한 줄에 담는 최대 span 수
+        max_queue: 대기 span 상한
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        service_name: str,
+        flush_interval_sec: float = 2.0,
+        max_batch: int = 512,
+        max_queue: int = 10000,
+    ) -> None:
+        self._directory = directory
+        self._service_name = service_name
+        self._flush_interval_sec = flush_interval_sec
+        self._max_batch = max_batch
+        self._queue: "queue.Queue[Optional[Span]]" = queue.Queue(maxsize=max_queue)
+        self.dropped_count = 0
+        os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, item: Span) -> None:
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped_count += 1
+
+    def close(self) -> None:
+        """남은 span을 기록하고 writer 스레드를 종료합니다."""
+        self._queue.put(None)
+        self._thread.join(timeout=5.0)
+
+    def _run(self) -> None:
+        batch: List[Span] = []
+        deadline: Optional[float] = None
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = ...  # 대기 시간 만료 → 기록
+            if item is None:
+                self._write(batch)
+                return
+            if isinstance(item, Span):
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self._flush_interval_sec
+                if len(batch) < self._max_batch:
+                    continue
+            self._write(batch)
+            batch, deadline = [], None
+
+    def _write(self, batch: List[Span]) -> None:
+        if not batch:
+            return
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {"key": "service.name", "value": {"stringValue": self._service_name}}
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "app.telemetry.tracing"},
+                            "spans": [span_to_otlp(item) for item in batch],
+                        }
+                    ],
+                }
+            ]
+        }
+        day = datetime.now(timezone.utc).strftime("%Y%m%d")
+        path = os.path.join(self._directory, f"spans-{day}.jsonl")
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n")
+        except OSError as e:
+            logger.warning(f"Span export failed: path={path}, error={e}")
+
+
+# =============================================================================
+# 링 버퍼
+# =============================================================================
+
+
+class SpanBuffer:
+    """끝난 span을 최근 max_spans개까지 보관합니다.
+
+    Args:
+        max_spans: 보관 상한 (넘으면 오래된 것부터 밀려남)
+        enabled: False면 span을 만들지 않음
+        exporter: 끝난 span을 함께 넘길 내보내기 (선택)
+    """
+
+    def __init__(
+        self,
+        max_spans: int = 5000,
+        enabled: bool = True,
+        exporter: Optional[OtlpJsonFileExporter] = None,
+    ) -> None:
+        self.enabled = enabled
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+        self._exporter = exporter
+
+    def record(self, item: Span) -> None:
+        self._spans.append(item)
+        if self._exporter is not None:
+            self._exporter.export(item)
+
+    def get_trace(self, trace_id: str) -> List[Span]:
+        """trace의 span 목록 (시작 순)."""
+        return sorted(
+            (item for item in list(self._spans) if item.trace_id == trace_id),
+            key=lambda item: item.start_ns,
+        )
+
+    def recent_traces(self, limit: int = 50, min_duration_ms: float = 0.0) -> List[Dict[str, Any]]:
+        """최근 끝난 루트 span 요약 (최신 순).
+
+        Args:
+            limit: 최대 건수
+            min_duration_ms: 이 시간 이상 걸린 trace만
+
+        Returns:
+            [{trace_id, name, start_ms, duration_ms, span_count, error}]
+        """
+        spans = list(self._spans)
+        span_counts: Dict[str, int] = {}
+        for item in spans:
+            span_counts[item.trace_id] = span_counts.get(item.trace_id, 0) + 1
+
+        summaries: List[Dict[str, Any]] = []
+        for item in reversed(spans):
+            if item.parent_id is not None or (item.duration_ms or 0.0) < min_duration_ms:
+                continue
+            summary = item.to_dict()
+            summary["span_count"] = span_counts[item.trace_id]
+            summaries.append(summary)
+            if len(summaries) >= limit:
+                break
+        return summaries
+
+    def close(self) -> None:
+        if self._exporter is not None:
+            self._exporter.close()
+            self._exporter = None
+
+
+_span_buffer: Optional[SpanBuffer] = None
+_span_buffer_lock = threading.Lock()
+
+
+def get_span_buffer() -> SpanBuffer:
+    """span 링 버퍼 싱글톤 반환."""
+    global _span_buffer
+    if _span_buffer is None:
+        with _span_buffer_lock:
+            if _span_buffer is None:
+                from app.core.config import get_settings
+
+                settings = get_settings()
+                exporter = None
+                if settings.TRACING_ENABLED and settings.TRACE_EXPORT_DIR:
+                    exporter = OtlpJsonFileExporter(
+                        settings.TRACE_EXPORT_DIR,
+                        service_name=settings.APP_NAME,
+                        flush_interval_sec=settings.TRACE_EXPORT_FLUSH_INTERVAL_SEC,
+                    )
+                _span_buffer = SpanBuffer(
+                    max_spans=settings.TRACE_BUFFER_SIZE,
+                    enabled=settings.TRACING_ENABLED,
+                    exporter=exporter,
+                )
+    return _span_buffer
+
+
+def clear_span_buffer() -> None:
+    """span 버퍼 싱글톤 정리 (종료/테스트용, 내보내기 대기분 기록)."""
+    global _span_buffer
+    with _span_buffer_lock:
+        if _span_buffer is not None:
+            _span_buffer.close()
+        _span_buffer = None
@@ -0,0 +1,318 @@
+"""
+오디오 재생 시간 파서 (In-process)
+
+MP3 프레임 헤더 / WAV 헤더만 읽어 재생 시간을 계산합니다.
+문장 TTS 결과(TTSResult.audio_bytes)처럼 이미 메모리에 있는 바이트에 바로 사용할 수 있어,
+문장마다 ffprobe 프로세스를 띄우지 않아도 됩니다.
+
+지원 형식:
+- MP3 (MPEG 1/2/2.5, Layer I/II/III)
+  - Xing/Info, VBRI 헤더가 있으면 총 프레임 수로 계산
+  - 없으면 프레임 헤더를 따라가며 샘플 수 합산 (CBR/VBR 모두 정확)
+  - 앞쪽 ID3v2 태그 / 뒤쪽 ID3v1 태그 무시
+- WAV (RIFF/WAVE, data 청크 크기 / byte rate)
+
+알 수 없는 형식이나 손상된 데이터는 None을 반환하며, 호출자가 ffprobe로 폴백합니다.
+
+extract_mp3_frames()는 태그/Xing 헤더 프레임을 뗀 MPEG 프레임 구간만 반환합니다
+(ffmpeg 없이 여러 MP3를 이어 붙일 때 사용).
+
+Usage:
+    from app.utils.audio_duration import get_audio_duration_from_bytes
+
+    duration = get_audio_duration_from_bytes(tts_result.audio_bytes)
+    if duration is None:
+        duration = await probe_with_ffprobe(path)
+"""
+
+import struct
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+# =============================================================================
+# MPEG Audio Tables
+# =============================================================================
+
+# MPEG 버전 비트 → 버전 (1 = MPEG1, 2 = MPEG2, 25 = MPEG2.5, 예약값 제외)
+_MPEG_VERSIONS = {0: 25, 2: 2, 3: 1}
+
+# Layer 비트 → Layer (예약값 제외)
+_MPEG_LAYERS = {1: 3, 2: 2, 3: 1}
+
+# (버전 그룹, Layer) → 비트레이트 테이블 (kbps, index 0 = free, 15 = bad)
+_BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+# 버전 → 샘플레이트 테이블 (index 3 = 예약)
+_SAMPLE_RATES = {
+    1: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    25: (11025, 12000, 8000),
+}
+
+# 첫 프레임 탐색 범위 (ID3v2 태그 이후)
+_MAX_SYNC_SCAN_BYTES = 64 * 1024
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
+
+def get_audio_duration_from_bytes(data: bytes) -> Optional[float]:
+    """오디오 바이트의 재생 시간을 계산합니다.
+
+    Args:
+        data: MP3 또는 WAV 바이트
+
+    Returns:
+        재생 시간 (초), 알 수 없는 형식이면 None
+    """
+    if len(data) >= 12 and data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+        return _wav_duration(data)
+    return _mp3_duration(data)
+
+
+def get_audio_duration_from_file(path: Union[str, Path]) -> Optional[float]:
+    """오디오 파일의 재생 시간을 계산합니다.
+
+    Args:
+        path: 오디오 파일 경로
+
+    Returns:
+        재생 시간 (초), 읽기 실패 또는 알 수 없는 형식이면 None
+    """
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+    return get_audio_duration_from_bytes(data)
+
+
+def get_audio_stream_info(data: bytes) -> Optional[Tuple[int, int]]:
+    """오디오 바이트의 (샘플레이트, 채널 수)를 반환합니다.
+
+    여러 파일을 재인코딩 없이(-c copy) 이어 붙일 수 있는지 판단할 때 사용합니다.
+
+    Args:
+        data: MP3 또는 WAV 바이트 (앞부분만 있어도 됨)
+
+    Returns:
+        (sample_rate, channels) 또는 None
+    """
+    if len(data) >= 12 and data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+        pos = 12
+        while pos + 24 <= len(data):
+            (chunk_size,) = struct.unpack_from("<I", data, pos + 4)
+            if data[pos:pos + 4] == b"fmt ":
+                channels, sample_rate = struct.unpack_from("<HI", data, pos + 10)
+                return sample_rate, channels
+            pos += 8 + chunk_size + (chunk_size & 1)
+        return None
+
+    first = _find_first_frame(data, _skip_id3v2(data))
+    if first is None:
+        return None
+    _, _, sample_rate, _, channel_mode = _parse_frame_header(data, first)
+    return sample_rate, 1 if channel_mode == 3 else 2
+
+
+def extract_mp3_frames(data: bytes) -> bytes:
+    """MP3 바이트에서 오디오 프레임 구간만 잘라 반환합니다.
+
+    앞쪽 ID3v2 태그, 첫 프레임의 Xing/Info/VBRI 헤더 프레임(파일 전체 길이 정보),
+    마지막 온전한 프레임 뒤(ID3v1 태그 등)를 제외하므로, 결과를 이어 붙여도
+    디코더가 첫 파일의 길이 정보만 보고 재생 시간을 잘못 계산하지 않습니다.
+
+    Args:
+        data: MP3 바이트
+
+    Returns:
+        MPEG 프레임 바이트 (MP3가 아니면 입력 그대로)
+    """
+    first = _find_first_frame(data, _skip_id3v2(data))
+    if first is None:
+        return data
+
+    frame_length, _, _, version, channel_mode = _parse_frame_header(data, first)
+    start = first
+    if _has_vbr_header(data, first, version, channel_mode):
+        start = first + frame_length
+
+    end = start
+    while True:
+        header = _parse_frame_header(data, end)
+        if header is None or end + header[0] > len(data):
+            break
+        end += header[0]
+
+    return data[start:end]
+
+
+# =============================================================================
+# WAV
+# =============================================================================
+
+
+def _wav_duration(data: bytes) -> Optional[float]:
+    """RIFF 청크를 따라가며 fmt byte rate와 data 크기로 계산합니다."""
+    byte_rate = 0
+    pos = 12
+
+    while pos + 8 <= len(data):
+        chunk_id = data[pos:pos + 4]
+        (chunk_size,) = struct.unpack_from("<I", data, pos + 4)
+        body = pos + 8
+
+        if chunk_id == b"fmt " and chunk_size >= 16:
+            (byte_rate,) = struct.unpack_from("<I", data, body + 8)
+        elif chunk_id == b"data":
+            if not byte_rate:
+                return None
+            # 스트리밍 작성으로 크기가 비어 있거나 잘린 경우 실제 남은 바이트 사용
+            data_size = min(chunk_size, len(data) - body)
+            return data_size / byte_rate
+
+        pos = body + chunk_size + (chunk_size & 1)
+
+    return None
+
+
+# =============================================================================
+# MP3
+# =============================================================================
+
+
+def _parse_frame_header(data: bytes, pos: int) -> Optional[Tuple[int, int, int, int, int]]:
+    """MPEG 오디오 프레임 헤더를 파싱합니다.
+
+    Returns:
+        (프레임 길이, 프레임당 샘플 수, 샘플레이트, 버전, 채널 모드) 또는 None
+    """
+    if pos + 4 > len(data):
+        return None
+
+    b0, b1, b2, b3 = data[pos], data[pos + 1], data[pos + 2], data[pos + 3]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+
+    version = _MPEG_VERSIONS.get((b1 >> 3) & 0x03)
+    layer = _MPEG_LAYERS.get((b1 >> 1) & 0x03)
+    bitrate_index = b2 >> 4
+    sample_rate_index = (b2 >> 2) & 0x03
+    if version is None or layer is None:
+        return None
+    if bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    bitrate = _BITRATES[(1 if version == 1 else 2, layer)][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version][sample_rate_index]
+    padding = (b2 >> 1) & 0x01
+    channel_mode = b3 >> 6
+
+    if layer == 1:
+        samples = 384
+        frame_length = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples = 1152 if layer == 2 or version == 1 else 576
+        frame_length = samples // 8 * bitrate // sample_rate + padding
+
+    return frame_length, samples, sample_rate, version, channel_mode
+
+
+def _skip_id3v2(data: bytes) -> int:
+    """ID3v2 태그 크기만큼 건너뛴 위치를 반환합니다."""
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = 0
+    for byte in data[6:10]:
+        size = (size << 7) | (byte & 0x7F)  # syncsafe integer
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _find_first_frame(data: bytes, start: int) -> Optional[int]:
+    """첫 프레임 위치를 찾습니다 (다음 프레임 헤더까지 확인하여 오탐 방지)."""
+    end = min(len(data) - 3, start + _MAX_SYNC_SCAN_BYTES)
+    pos = data.find(b"\xff", start, end)
+
+    while pos != -1:
+        header = _parse_frame_header(data, pos)
+        if header is not None:
+            next_pos = pos + header[0]
+            if next_pos >= len(data) or _parse_frame_header(data, next_pos) is not None:
+                return pos
+        pos = data.find(b"\xff", pos + 1, end)
+
+    return None
+
+
+def _xing_offset(pos: int, version: int, channel_mode: int) -> int:
+    """프레임 안 Xing/Info 태그 위치 (헤더 4바이트 + side info 뒤)."""
+    mono = channel_mode == 3
+    if version == 1:
+        side_info = 17 if mono else 32
+    else:
+        side_info = 9 if mono else 17
+    return pos + 4 + side_info
+
+
+def _has_vbr_header(data: bytes, pos: int, version: int, channel_mode: int) -> bool:
+    """프레임이 오디오가 아닌 Xing/Info 또는 VBRI 헤더 프레임인지."""
+    xing = _xing_offset(pos, version, channel_mode)
+    return (
+        data[xing:xing + 4] in (b"Xing", b"Info")
+        or data[pos + 36:pos + 40] == b"VBRI"
+    )
+
+
+def _vbr_frame_count(data: bytes, pos: int, version: int, channel_mode: int) -> Optional[int]:
+    """첫 프레임의 Xing/Info 또는 VBRI 헤더에서 총 프레임 수를 읽습니다."""
+    xing = _xing_offset(pos, version, channel_mode)
+    if data[xing:xing + 4] in (b"Xing", b"Info") and xing + 12 <= len(data):
+        (flags,) = struct.unpack_from(">I", data, xing + 4)
+        if flags & 0x01:
+            (frames,) = struct.unpack_from(">I", data, xing + 8)
+            return frames
+
+    vbri = pos + 4 + 32
+    if data[vbri:vbri + 4] == b"VBRI" and vbri + 18 <= len(data):
+        (frames,) = struct.unpack_from(">I", data, vbri + 14)
+        return frames
+
+    return None
+
+
+def _mp3_duration(data: bytes) -> Optional[float]:
+    """MP3 프레임 헤더로 재생 시간을 계산합니다."""
+    first = _find_first_frame(data, _skip_id3v2(data))
+    if first is None:
+        return None
+
+    _, samples, sample_rate, version, channel_mode = _parse_frame_header(data, first)
+
+    frames = _vbr_frame_count(data, first, version, channel_mode)
+    if frames:
+        return frames * samples / sample_rate
+
+    total_samples = 0
+    pos = first
+    while True:
+        header = _parse_frame_header(data, pos)
+        if header is None:
+            break  # 데이터 끝, ID3v1 태그 또는 손상 구간
+        frame_length = header[0]
+        if pos + frame_length > len(data):
+            break  # 잘린 마지막 프레임 제외
+        total_samples += header[1]
+        pos += frame_length
+
+    if total_samples == 0:
+        return None
+    return total_samples / sample_rate
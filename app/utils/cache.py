@@ -9,6 +9,8 @@ asyncio 환경에서 안전하게 사용할 수 있는 TTL + LRU 캐시 구현
 - LRU(Least Recently Used) 기반 maxsize 제한
 - 비동기 Lock으로 thread-safe
 - 구조화 로그 지원 (cache_hit/cache_miss)
+- 항목별 TTL 지정 및 prefix 단위 무효화
+- SingleFlight: 동일 키 동시 요청 합치기 (request coalescing)
 
 사용 예시:
     from app.utils.cache import TTLCache
@@ -28,9 +30,10 @@ import json
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, Generic, Optional, TypeVar
+from typing import Any, Awaitable, Callable, Dict, Generic, Optional, TypeVar
 
 from app.core.logging import get_logger
+from app.core.metrics import get_metrics
 
 logger = get_logger(__name__)
 
@@ -84,6 +87,7 @@ class TTLCache(Generic[V]):
         # 통계
         self._hits = 0
         self._misses = 0
+        get_metrics().register_cache(name, self.stats)
 
         logger.info(
             f"TTLCache '{name}' initialized: maxsize={maxsize}, ttl={ttl_seconds}s"
@@ -125,7 +129,7 @@ class TTLCache(Generic[V]):
         if entry is None:
             self._misses += 1
             logger.debug(
-                f"Cache miss: name={self._name}, key={key[:32]}...",
+                "Cache miss: name=%s, key=%s...", self._name, key[:32],
                 extra={"event": "cache_miss", "cache_name": self._name}
             )
             return None
@@ -135,7 +139,7 @@ class TTLCache(Generic[V]):
             del self._cache[key]
             self._misses += 1
             logger.debug(
-                f"Cache expired: name={self._name}, key={key[:32]}...",
+                "Cache expired: name=%s, key=%s...", self._name, key[:32],
                 extra={"event": "cache_expired", "cache_name": self._name}
             )
             return None
@@ -144,18 +148,19 @@ class TTLCache(Generic[V]):
         self._cache.move_to_end(key)
         self._hits += 1
         logger.debug(
-            f"Cache hit: name={self._name}, key={key[:32]}...",
+            "Cache hit: name=%s, key=%s...", self._name, key[:32],
             extra={"event": "cache_hit", "cache_name": self._name}
         )
         return entry.value
 
-    def set(self, key: str, value: V) -> None:
+    def set(self, key: str, value: V, ttl_seconds: Optional[float] = None) -> None:
         """
         캐시에 값을 저장합니다.
 
         Args:
             key: 캐시 키
             value: 저장할 값
+            ttl_seconds: 항목별 TTL (초). None이면 캐시 기본 TTL 사용
         """
         # 만료된 항목 정리 (주기적)
         if len(self._cache) % 100 == 0:
@@ -171,11 +176,13 @@ class TTLCache(Generic[V]):
         # 새 항목 추가
         self._cache[key] = CacheEntry(
             value=value,
-            expires_at=time.time() + self._ttl_seconds,
+            expires_at=time.time() + (
+                self._ttl_seconds if ttl_seconds is None else ttl_seconds
+            ),
         )
 
         logger.debug(
-            f"Cache set: name={self._name}, key={key[:32]}..., size={len(self._cache)}",
+            "Cache set: name=%s, key=%s..., size=%d", self._name, key[:32], len(self._cache),
             extra={"event": "cache_set", "cache_name": self._name}
         )
 
@@ -192,16 +199,56 @@ class TTLCache(Generic[V]):
         async with self._lock:
             return self.get(key)
 
-    async def set_async(self, key: str, value: V) -> None:
+    async def set_async(
+        self, key: str, value: V, ttl_seconds: Optional[float] = None
+    ) -> None:
         """
         비동기 환경에서 캐시에 저장합니다 (Lock 사용).
 
         Args:
             key: 캐시 키
             value: 저장할 값
+            ttl_seconds: 항목별 TTL (초). None이면 캐시 기본 TTL 사용
         """
         async with self._lock:
-            self.set(key, value)
+            self.set(key, value, ttl_seconds=ttl_seconds)
+
+    def delete(self, key: str) -> bool:
+        """
+        캐시 항목을 삭제합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            bool: 삭제된 항목이 있으면 True
+        """
+        return self._cache.pop(key, None) is not None
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        prefix로 시작하는 캐시 항목을 모두 삭제합니다.
+
+        사용자 단위 무효화처럼 키 앞부분을 공유하는 항목을 한 번에 지울 때 사용합니다.
+
+        Args:
+            prefix: 키 prefix
+
+        Returns:
+            int: 삭제된 항목 수
+        """
+        keys = [key for key in self._cache if key.startswith(prefix)]
+        for key in keys:
+            del self._cache[key]
+        if keys:
+            logger.debug(
+                "Cache invalidated: name=%s, prefix=%s, count=%d",
+                self._name,
+                prefix[:32],
+                len(keys),
+                extra={"event": "cache_invalidate", "cache_name": self._name}
+            )
+        return len(keys)
 
     def clear(self) -> None:
         """캐시를 모두 비웁니다."""
@@ -227,6 +274,69 @@ class TTLCache(Generic[V]):
         }
 
 
+class SingleFlight(Generic[V]):
+    """
+    동일 키 동시 요청 합치기 (request coalescing).
+
+    같은 키로 동시에 들어온 요청 중 첫 요청만 loader를 실행하고,
+    나머지는 같은 결과(또는 예외)를 공유합니다. 캐시 미스 폭주(stampede) 방지용입니다.
+    첫 요청이 취소되면 대기자에게 취소를 전파하지 않고, 대기자 중 하나가 다시 실행합니다.
+
+    Example:
+        flight = SingleFlight[dict]()
+        result = await flight.do("user1:Q11", lambda: client.fetch(...))
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[str, "asyncio.Future[V]"] = {}
+
+    async def do(self, key: str, loader: Callable[[], Awaitable[V]]) -> V:
+        """
+        키에 대해 loader를 한 번만 실행하고 결과를 공유합니다.
+
+        Args:
+            key: 합치기 기준 키
+            loader: 실제 조회를 수행하는 코루틴 팩토리
+
+        Returns:
+            loader 결과
+        """
+        while True:
+            future = self._in_flight.get(key)
+            if future is None:
+                break
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 실행하던 요청만 취소된 경우 → 다시 시도 (이 요청이 실행을 맡을 수 있음)
+                if future.cancelled() and not asyncio.current_task().cancelling():
+                    continue
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+                # 대기자가 없어도 "exception never retrieved" 경고가 나지 않도록 소비
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._in_flight.pop(key, None)
+
+    def in_flight_count(self) -> int:
+        """현재 진행 중인 키 수를 반환합니다."""
+        return len(self._in_flight)
+
+
 def make_cache_key(data: Dict[str, Any]) -> str:
     """
     딕셔너리로부터 캐시 키를 생성합니다.
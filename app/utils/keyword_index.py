@@ -0,0 +1,194 @@
+"""
+BM25 키워드 인덱스 (In-memory)
+
+소스셋 청크, 퀴즈 후보 블록처럼 작업 단위로 모인 텍스트에 대해 인덱스를 한 번 만들고
+여러 번 검색하는 용도의 경량 역색인입니다. 외부 라이브러리 의존성 없이 순수 Python으로 구현했습니다.
+
+토큰화:
+- 형태소 분석 없이 단어(\\w+) 내부 문자 bigram 사용
+  (한국어 조사/어미가 붙어도 어간 bigram이 일치)
+- 1글자 단어는 unigram
+
+주요 기능:
+- search(): BM25 점수 상위 문서
+- contains(): 부분 문자열 포함 여부 (bigram posting 교집합으로 후보를 줄인 뒤 확인)
+- reciprocal_rank_fusion(): 벡터 검색 결과와 순위 결합 (RRF)
+
+사용 예시:
+    from app.utils.keyword_index import KeywordIndex
+
+    index = KeywordIndex(["개인정보 보호 수칙", "보안사고 신고 절차"])
+    index.search("보안사고", top_k=3)  # [(1, 0.98)]
+    index.contains("신고")  # True
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+# 단어 패턴 (한글/영문/숫자/밑줄)
+_WORD_PATTERN = re.compile(r"\w+")
+
+# BM25 기본 파라미터
+DEFAULT_K1 = 1.5
+DEFAULT_B = 0.75
+
+# RRF 기본 상수 (순위 차이 완화)
+DEFAULT_RRF_K = 60
+
+
+def tokenize(text: str) -> List[str]:
+    """텍스트를 문자 bigram 토큰으로 분리합니다.
+
+    Args:
+        text: 원본 텍스트
+
+    Returns:
+        토큰 리스트 (소문자, 단어 내부 bigram / 1글자 단어는 unigram)
+    """
+    tokens: List[str] = []
+    for word in _WORD_PATTERN.findall(text.lower()):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+class KeywordIndex:
+    """
+    BM25 역색인.
+
+    Attributes:
+        _keys: 문서 키 리스트 (기본값: 0부터 시작하는 위치)
+        _texts: 소문자로 변환한 문서 텍스트 (contains 확인용)
+        _postings: 토큰 → {문서 위치: 출현 빈도}
+    """
+
+    def __init__(
+        self,
+        texts: Sequence[str],
+        keys: Optional[Sequence[Hashable]] = None,
+        k1: float = DEFAULT_K1,
+        b: float = DEFAULT_B,
+    ) -> None:
+        """
+        인덱스를 생성합니다.
+
+        Args:
+            texts: 문서 텍스트 리스트
+            keys: 문서 키 리스트 (None이면 위치 사용, texts와 길이가 같아야 함)
+            k1: BM25 tf 포화 계수
+            b: BM25 문서 길이 정규화 계수
+        """
+        if keys is not None and len(keys) != len(texts):
+            raise ValueError("keys and texts must have the same length")
+
+        self._k1 = k1
+        self._b = b
+        self._keys: List[Hashable] = list(keys) if keys is not None else list(range(len(texts)))
+        self._positions: Dict[Hashable, int] = {key: i for i, key in enumerate(self._keys)}
+        self._texts: List[str] = [text.lower() for text in texts]
+        self._postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self._doc_lengths: List[int] = []
+
+        for position, text in enumerate(self._texts):
+            counts = Counter(tokenize(text))
+            self._doc_lengths.append(sum(counts.values()))
+            for token, tf in counts.items():
+                self._postings[token][position] = tf
+
+        doc_count = len(self._texts)
+        self._avg_length = sum(self._doc_lengths) / doc_count if doc_count else 0.0
+        self._idf: Dict[str, float] = {
+            token: math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for token, postings in self._postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[Hashable, float]]:
+        """
+        BM25 점수 상위 문서를 반환합니다.
+
+        Args:
+            query: 검색 쿼리
+            top_k: 반환할 최대 문서 수
+
+        Returns:
+            (문서 키, 점수) 리스트 (점수 내림차순, 점수 0 문서 제외)
+        """
+        scores: Dict[int, float] = defaultdict(float)
+
+        for token in set(tokenize(query)):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = self._idf[token]
+            for position, tf in postings.items():
+                length_norm = 1 - self._b + self._b * self._doc_lengths[position] / self._avg_length
+                scores[position] += idf * tf * (self._k1 + 1) / (tf + self._k1 * length_norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(self._keys[position], score) for position, score in ranked[:top_k]]
+
+    def contains(self, term: str, keys: Optional[Iterable[Hashable]] = None) -> bool:
+        """
+        문서 중 하나라도 term을 부분 문자열로 포함하는지 확인합니다.
+
+        `term in text.lower()`와 같은 결과를 반환하며, 단어 문자로만 이루어진 term은
+        bigram posting 교집합으로 후보 문서를 줄인 뒤 확인합니다.
+
+        Args:
+            term: 찾을 문자열
+            keys: 검사할 문서 키 (None이면 전체 문서, 없는 키는 무시)
+
+        Returns:
+            bool: 포함 여부
+        """
+        term = term.lower()
+
+        candidates: Optional[Set[int]] = None
+        if keys is not None:
+            candidates = {self._positions[key] for key in keys if key in self._positions}
+
+        if len(term) >= 2 and _WORD_PATTERN.fullmatch(term):
+            postings_list = [self._postings.get(token) for token in set(tokenize(term))]
+            if not all(postings_list):
+                return False
+            for postings in sorted(postings_list, key=len):
+                candidates = (
+                    set(postings) if candidates is None
+                    else candidates.intersection(postings)
+                )
+                if not candidates:
+                    return False
+
+        positions: Iterable[int] = range(len(self._texts)) if candidates is None else candidates
+        return any(term in self._texts[position] for position in positions)
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Hashable]],
+    k: int = DEFAULT_RRF_K,
+) -> List[Tuple[Hashable, float]]:
+    """
+    여러 순위 목록을 RRF(Reciprocal Rank Fusion)로 결합합니다.
+
+    점수 = Σ 1 / (k + rank), rank는 1부터 시작합니다.
+
+    Args:
+        rankings: 키 순위 목록 리스트 (예: [벡터 검색 순위, BM25 순위])
+        k: 순위 완화 상수
+
+    Returns:
+        (키, RRF 점수) 리스트 (점수 내림차순, 동점이면 먼저 등장한 키 우선)
+    """
+    scores: Dict[Hashable, float] = {}
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, start=1):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+
+    return sorted(scores.items(), key=lambda item: -item[1])
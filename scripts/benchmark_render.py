@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+렌더 파이프라인 벤치마크 (오프라인)
+
+합성 스크립트를 MockTTSProvider + LocalStorageProvider로 렌더링하고
+단계별(VALIDATE_SCRIPT ~ FINALIZE) wall/CPU 시간, 자식 프로세스 수, 쓰기량,
+최대 RSS를 출력합니다. 렌더 잡과 같은 RenderProfiler를 사용하므로
+/internal/ai/render-jobs/{job_id}의 metrics와 같은 기준으로 비교할 수 있습니다.
+
+외부 서비스(백엔드, TTS API, S3)는 호출하지 않습니다.
+ffmpeg가 없으면 영상 합성은 mock 파일로 대체되므로 COMPOSE_VIDEO 수치는 의미가 없습니다.
+
+Usage:
+    python scripts/benchmark_render.py --scenes 20 --chars 200
+    python scripts/benchmark_render.py --scenes 10 --style animated --runs 3
+    python scripts/benchmark_render.py --scenes 10 --runs 2 --warm-cache --json
+
+Exit codes:
+    0: 성공
+    1: 렌더 실패
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+
+# =============================================================================
+# argparse
+# =============================================================================
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="렌더 파이프라인 단계별 벤치마크")
+    parser.add_argument("--scenes", type=int, default=10, help="씬 수 (기본 10)")
+    parser.add_argument("--chars", type=int, default=120, help="씬별 나레이션 글자 수 (기본 120)")
+    parser.add_argument(
+        "--style", choices=["basic", "animated"], default="basic", help="영상 시각 스타일"
+    )
+    parser.add_argument("--runs", type=int, default=1, help="반복 횟수 (기본 1)")
+    parser.add_argument(
+        "--warm-cache",
+        action="store_true",
+        help="반복 실행 간 TTS/씬 에셋 캐시 유지 (기본: 매 실행 빈 캐시)",
+    )
+    parser.add_argument("--work-dir", type=Path, default=None, help="작업 디렉토리 (기본: 임시)")
+    parser.add_argument("--json", action="store_true", help="측정값을 JSON으로 출력")
+    return parser.parse_args()
+
+
+# =============================================================================
+# 합성 스크립트
+# =============================================================================
+
+
+def build_script(scene_count: int, chars: int) -> dict:
+    """씬 수/나레이션 길이를 지정한 합성 스크립트."""
+    sentence = "안전한 작업 환경을 위해 정해진 절차를 지켜야 합니다. "
+    narration = (sentence * (chars // len(sentence) + 1))[:chars]
+    return {
+        "video_id": "video-benchmark",
+        "script_id": "script-benchmark",
+        "scenes": [
+            {
+                "scene_id": i + 1,
+                "narration": f"{i + 1}번 장면. {narration}",
+                "on_screen_text": f"장면 {i + 1}",
+            }
+            for i in range(scene_count)
+        ],
+    }
+
+
+# =============================================================================
+# 실행
+# =============================================================================
+
+
+async def run_once(work_dir: Path, run_index: int, script: dict, style: str, cache_dir: Path) -> dict:
+    """파이프라인 1회 실행 후 단계별 측정값 반환."""
+    from app.clients.storage_adapter import LocalStorageProvider, StorageConfig
+    from app.clients.tts_provider import MockTTSProvider
+    from app.models.video_render import RenderStep
+    from app.services.render_profiler import RenderProfiler
+    from app.services.scene_asset_cache import SceneAssetCache
+    from app.services.tts_audio_cache import TTSAudioCache
+    from app.services.video_renderer_real import RealRendererConfig, RealVideoRenderer
+
+    renderer = RealVideoRenderer(
+        config=RealRendererConfig(output_dir=str(work_dir / "output"), visual_style=style),
+        tts_provider=MockTTSProvider(),
+        storage_provider=LocalStorageProvider(
+            StorageConfig(local_path=str(work_dir / "assets"), base_url="/assets")
+        ),
+        audio_cache=TTSAudioCache(cache_dir / "tts", max_bytes=1024 * 1024 * 1024),
+        asset_cache=SceneAssetCache(cache_dir / "scene", max_bytes=4 * 1024 * 1024 * 1024),
+    )
+
+    job_id = f"job-benchmark-{run_index}"
+    profiler = RenderProfiler()
+    for step in [
+        RenderStep.VALIDATE_SCRIPT,
+        RenderStep.GENERATE_TTS,
+        RenderStep.GENERATE_SUBTITLE,
+        RenderStep.RENDER_SLIDES,
+        RenderStep.COMPOSE_VIDEO,
+        RenderStep.UPLOAD_ASSETS,
+        RenderStep.FINALIZE,
+    ]:
+        with profiler.stage(step.value):
+            await renderer.execute_step(step, script, job_id)
+
+    print(f"\n[run {run_index}] scenes={len(script['scenes'])}, style={style}")
+    print(profiler.format_table())
+    return profiler.to_dict()
+
+
+async def main() -> int:
+    args = parse_args()
+
+    work_dir = args.work_dir or Path(tempfile.mkdtemp(prefix="render-benchmark-"))
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    # 벤치마크는 운영 캐시 디렉토리를 건드리지 않음 (합성 단계의 세그먼트 캐시 포함)
+    os.environ["RENDER_SCENE_CACHE_DIR"] = str(work_dir / "cache" / "scene")
+    os.environ["TTS_AUDIO_CACHE_DIR"] = str(work_dir / "cache" / "tts")
+
+    script = build_script(args.scenes, args.chars)
+    results = []
+    try:
+        for run_index in range(1, args.runs + 1):
+            cache_dir = work_dir / "cache"
+            if not args.warm_cache and cache_dir.exists():
+                shutil.rmtree(cache_dir)
+            results.append(await run_once(work_dir, run_index, script, args.style, cache_dir))
+    except Exception as e:
+        print(f"Render failed: {type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if args.work_dir is None:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps({"scenes": args.scenes, "style": args.style, "runs": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -28,10 +28,12 @@ def reset_singletons():
     yield
     # 테스트 후 정리
     from app.clients.llm_client import clear_llm_client
+    from app.core.state_store import clear_state_store
     from app.services.pii_service import clear_pii_service
 
     clear_llm_client()
     clear_pii_service()
+    clear_state_store()
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -10,12 +10,11 @@ Streaming Request Context Cleanup Tests (A8)
 """
 
 import asyncio
-from typing import AsyncIterator
+from typing import AsyncIterator, Awaitable, Callable, List
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from starlette.requests import Request
-from starlette.responses import StreamingResponse
+from starlette.responses import JSONResponse, StreamingResponse
 
 from app.telemetry.context import (
     RequestContext,
@@ -153,6 +152,58 @@ class TestStreamingContextRetention:
         reset_chat_turn_emitted()
 
 
+# =============================================================================
+# ASGI 헬퍼
+# =============================================================================
+
+
+def _http_scope(path: str, headers: dict) -> dict:
+    """테스트용 ASGI http scope (spec 2.4: 연결 끊김 감시 태스크 없이 전송)."""
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "method": "POST",
+        "path": path,
+        "headers": [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in headers.items()
+        ],
+    }
+
+
+def _streaming_app(body_factory) -> Callable[..., Awaitable[None]]:
+    """body_factory()의 청크를 StreamingResponse로 보내는 ASGI 앱."""
+
+    async def app(scope, receive, send) -> None:
+        response = StreamingResponse(body_factory(), media_type="application/x-ndjson")
+        await response(scope, receive, send)
+
+    return app
+
+
+async def _run_middleware(app, scope: dict) -> List[dict]:
+    """RequestContextMiddleware로 app을 호출하고 보낸 ASGI 메시지를 반환."""
+    from app.telemetry.middleware import RequestContextMiddleware
+
+    messages: List[dict] = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        messages.append(message)
+
+    await RequestContextMiddleware(app)(scope, receive, send)
+    return messages
+
+
+def _body_chunks(messages: List[dict]) -> List[bytes]:
+    """http.response.body 메시지 중 내용이 있는 청크만 추출."""
+    return [
+        m["body"] for m in messages if m["type"] == "http.response.body" and m.get("body")
+    ]
+
+
 # =============================================================================
 # TEST-2: 스트리밍 종료 후 cleanup
 # =============================================================================
@@ -163,80 +214,59 @@ class TestStreamingCleanup:
 
     @pytest.mark.asyncio
     async def test_cleanup_after_stream_completion(self):
-        """스트리밍 종료 후 cleanup이 실행된다."""
-        from app.telemetry.middleware import _wrap_streaming_body
+        """스트림 전송 중에는 컨텍스트가 유지되고, 종료 후 cleanup이 실행된다."""
+        seen_trace_ids = []
 
-        # Given: 컨텍스트 설정
-        ctx = RequestContext(
-            trace_id="trace-cleanup-001",
-            user_id="user-cleanup",
-            dept_id="dept-cleanup",
-            conversation_id="conv-cleanup",
-            turn_id=5,
-        )
-        set_request_context(ctx)
-
-        # Given: 스트리밍 생성기
+        # Given: 청크마다 현재 컨텍스트를 기록하는 스트리밍 생성기
         async def original_body() -> AsyncIterator[bytes]:
-            yield b"data1\n"
-            yield b"data2\n"
+            for data in (b"data1\n", b"data2\n"):
+                seen_trace_ids.append(get_request_context().trace_id)
+                yield data
 
-        # When: 래핑된 body 반복
-        wrapped = _wrap_streaming_body(original_body())
-        chunks = []
-        async for chunk in wrapped:
-            chunks.append(chunk)
+        scope = _http_scope(
+            "/ai/chat/stream",
+            {"X-Trace-Id": "trace-cleanup-001", "X-User-Id": "user-cleanup", "X-Turn-Id": "5"},
+        )
 
-        # Then: 모든 청크 수신
-        assert len(chunks) == 2
+        # When: 미들웨어를 거쳐 스트림 전송
+        messages = await _run_middleware(_streaming_app(original_body), scope)
+
+        # Then: 모든 청크 수신, 전송 중 컨텍스트 유지
+        assert _body_chunks(messages) == [b"data1\n", b"data2\n"]
+        assert seen_trace_ids == ["trace-cleanup-001", "trace-cleanup-001"]
 
         # Then: cleanup 후 컨텍스트 리셋됨
         assert _is_context_reset(), "Context should be reset after stream completion"
 
     @pytest.mark.asyncio
     async def test_no_state_leakage_between_requests(self):
-        """다음 요청에 상태가 누수되지 않는다."""
-        from app.telemetry.middleware import _wrap_streaming_body
-
-        # Given: 첫 번째 요청 컨텍스트
-        ctx1 = RequestContext(
-            trace_id="trace-req1",
-            user_id="user-req1",
-            conversation_id="conv-req1",
-            turn_id=1,
-        )
-        set_request_context(ctx1)
-        reset_all_metrics()
-        reset_chat_turn_emitted()
+        """스트림 중 발행 상태가 다음 요청에 누수되지 않는다."""
+        from app.telemetry.emitters import mark_chat_turn_emitted
 
-        # When: 첫 번째 스트림 완료
+        emitted_at_start = []
+
+        # Given: 첫 번째 요청은 스트림 중 CHAT_TURN 발행 표시
         async def stream1() -> AsyncIterator[bytes]:
+            emitted_at_start.append(is_chat_turn_emitted())
+            mark_chat_turn_emitted()
             yield b"req1-data\n"
 
-        wrapped1 = _wrap_streaming_body(stream1())
-        async for _ in wrapped1:
-            pass
+        async def stream2() -> AsyncIterator[bytes]:
+            emitted_at_start.append(is_chat_turn_emitted())
+            yield b"req2-data\n"
 
-        # Then: 첫 번째 요청 후 상태 리셋됨
-        assert _is_context_reset()
-        assert is_chat_turn_emitted() is False
-
-        # When: 두 번째 요청 컨텍스트 설정
-        ctx2 = RequestContext(
-            trace_id="trace-req2",
-            user_id="user-req2",
-            conversation_id="conv-req2",
-            turn_id=2,
+        # When: 같은 태스크에서 두 요청을 차례로 처리
+        await _run_middleware(
+            _streaming_app(stream1), _http_scope("/ai/chat/stream", {"X-Trace-Id": "trace-req1"})
+        )
+        await _run_middleware(
+            _streaming_app(stream2), _http_scope("/ai/chat/stream", {"X-Trace-Id": "trace-req2"})
         )
-        set_request_context(ctx2)
-
-        # Then: 두 번째 요청은 첫 번째 요청의 영향을 받지 않음
-        current_ctx = get_request_context()
-        assert current_ctx.trace_id == "trace-req2"
-        assert current_ctx.user_id == "user-req2"
 
-        # Cleanup
-        reset_request_context()
+        # Then: 두 요청 모두 발행 전 상태로 시작, 종료 후 리셋
+        assert emitted_at_start == [False, False]
+        assert is_chat_turn_emitted() is False
+        assert _is_context_reset()
 
 
 # =============================================================================
@@ -342,31 +372,32 @@ class TestStreamingExceptionHandling:
     @pytest.mark.asyncio
     async def test_cleanup_on_stream_exception(self):
         """스트리밍 중 예외 발생 시에도 cleanup이 실행된다."""
-        from app.telemetry.middleware import _wrap_streaming_body
-
-        # Given: 컨텍스트 설정
-        ctx = RequestContext(
-            trace_id="trace-exc-cleanup",
-            user_id="user-exc",
-            conversation_id="conv-exc",
-            turn_id=7,
-        )
-        set_request_context(ctx)
-
         # Given: 예외를 발생시키는 스트리밍 생성기
         async def error_stream() -> AsyncIterator[bytes]:
             yield b"data1\n"
             raise RuntimeError("Simulated stream error")
 
-        # When: 래핑된 body 반복 (예외 발생)
-        wrapped = _wrap_streaming_body(error_stream())
-        chunks = []
+        scope = _http_scope(
+            "/ai/chat/stream",
+            {"X-Trace-Id": "trace-exc-cleanup", "X-User-Id": "user-exc", "X-Turn-Id": "7"},
+        )
+        messages: List[dict] = []
+
+        async def receive() -> dict:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: dict) -> None:
+            messages.append(message)
+
+        from app.telemetry.middleware import RequestContextMiddleware
+
+        # When: 미들웨어를 거쳐 전송 (예외 전파)
+        middleware = RequestContextMiddleware(_streaming_app(error_stream))
         with pytest.raises(RuntimeError, match="Simulated stream error"):
-            async for chunk in wrapped:
-                chunks.append(chunk)
+            await middleware(scope, receive, send)
 
         # Then: 예외 전까지 청크 수신
-        assert len(chunks) == 1
+        assert _body_chunks(messages) == [b"data1\n"]
 
         # Then: cleanup 후 컨텍스트 리셋됨 (finally 블록에서)
         assert _is_context_reset(), "Context should be reset even after exception"
@@ -381,67 +412,55 @@ class TestMiddlewareStreamingIntegration:
     """RequestContextMiddleware와 스트리밍 통합 테스트."""
 
     @pytest.mark.asyncio
-    async def test_middleware_defers_cleanup_for_streaming(self):
-        """Middleware가 StreamingResponse에 대해 cleanup을 지연한다."""
-        from starlette.middleware.base import RequestResponseEndpoint
-        from starlette.responses import Response
-
-        from app.telemetry.middleware import RequestContextMiddleware
-
-        middleware = RequestContextMiddleware(app=MagicMock())
-
-        # Given: Mock request
-        mock_request = MagicMock(spec=Request)
-        mock_request.headers = {
-            "X-Trace-Id": "trace-middleware-001",
-            "X-User-Id": "user-middleware",
-        }
-        mock_request.url.path = "/ai/chat/stream"
-
-        # Given: StreamingResponse를 반환하는 핸들러
-        async def stream_body() -> AsyncIterator[bytes]:
-            yield b"streaming-data\n"
-
-        async def mock_call_next(request: Request) -> Response:
-            return StreamingResponse(stream_body(), media_type="application/x-ndjson")
-
-        # When: Middleware dispatch
-        response = await middleware.dispatch(mock_request, mock_call_next)
+    async def test_middleware_sets_context_from_headers(self):
+        """헤더 값이 하위 앱의 컨텍스트에 설정되고 turn_id/route도 채워진다."""
+        captured = []
+
+        async def app(scope, receive, send) -> None:
+            captured.append(get_request_context())
+            await JSONResponse({"status": "ok"})(scope, receive, send)
+
+        scope = _http_scope(
+            "/ai/chat",
+            {
+                "X-Trace-Id": "trace-middleware-001",
+                "X-User-Id": "user-middleware",
+                "X-Dept-Id": "dept-middleware",
+                "X-Conversation-Id": "conv-middleware",
+                "X-Turn-Id": "not-a-number",
+            },
+        )
 
-        # Then: StreamingResponse 반환
-        assert isinstance(response, StreamingResponse)
+        await _run_middleware(app, scope)
 
-        # Then: body_iterator가 래핑됨 (cleanup 지연)
-        # 래핑된 iterator는 _wrap_streaming_body에서 반환됨
-        assert response.body_iterator is not None
+        ctx = captured[0]
+        assert ctx.trace_id == "trace-middleware-001"
+        assert ctx.user_id == "user-middleware"
+        assert ctx.dept_id == "dept-middleware"
+        assert ctx.conversation_id == "conv-middleware"
+        assert ctx.turn_id is None
+        assert ctx.route == "POST /ai/chat"
 
     @pytest.mark.asyncio
     async def test_middleware_immediate_cleanup_for_non_streaming(self):
-        """Middleware가 비스트리밍 응답에 대해 즉시 cleanup한다."""
-        from starlette.middleware.base import RequestResponseEndpoint
-        from starlette.responses import JSONResponse, Response
-
-        from app.telemetry.middleware import RequestContextMiddleware
+        """비스트리밍 응답도 응답 전송 후 cleanup된다."""
+        app = JSONResponse({"status": "ok"})
+        scope = _http_scope("/ai/chat", {"X-Trace-Id": "trace-nonstream-001"})
 
-        middleware = RequestContextMiddleware(app=MagicMock())
+        messages = await _run_middleware(app, scope)
 
-        # Given: Mock request
-        mock_request = MagicMock(spec=Request)
-        mock_request.headers = {
-            "X-Trace-Id": "trace-nonstream-001",
-            "X-User-Id": "user-nonstream",
-        }
-        mock_request.url.path = "/ai/chat"
+        assert messages[0]["status"] == 200
+        assert _is_context_reset(), "Context should be reset immediately for non-streaming"
 
-        # Given: 일반 Response를 반환하는 핸들러
-        async def mock_call_next(request: Request) -> Response:
-            return JSONResponse({"status": "ok"})
+    @pytest.mark.asyncio
+    async def test_non_http_scope_passes_through(self):
+        """lifespan 등 http 이외의 scope는 컨텍스트를 건드리지 않는다."""
+        set_request_context(RequestContext(trace_id="trace-outer"))
+        inner = AsyncMock()
 
-        # When: Middleware dispatch
-        response = await middleware.dispatch(mock_request, mock_call_next)
+        from app.telemetry.middleware import RequestContextMiddleware
 
-        # Then: 일반 Response 반환
-        assert not isinstance(response, StreamingResponse)
+        await RequestContextMiddleware(inner)({"type": "lifespan"}, AsyncMock(), AsyncMock())
 
-        # Then: 즉시 cleanup됨 (컨텍스트 리셋됨)
-        assert _is_context_reset(), "Context should be reset immediately for non-streaming"
+        inner.assert_awaited_once()
+        assert get_request_context().trace_id == "trace-outer"
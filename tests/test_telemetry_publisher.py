@@ -9,8 +9,12 @@ TelemetryPublisher의 비동기 배치 전송 및 에러 핸들링을 검증합
 - TEST-3: queue 포화 시 drop
 - TEST-4: 전송 실패 시 retry_once=1회만 수행 후 drop
 - TEST-5: 전송 성공 시 반환값/큐 drain 검증
+- TEST-6: enqueue 시 1회 직렬화 (전송 JSON이 model_dump와 동일) + drop은 로그 없이 집계
+- TEST-7: 백엔드 응답 시간에 따른 배치 크기 조절
+- TEST-8: 전송 실패 배치 디스크 보관 후 재시작 시 재전송
 """
 
+import gzip
 import json
 from datetime import datetime
 from typing import Any
@@ -20,6 +24,7 @@ from uuid import uuid4
 import httpx
 import pytest
 
+from app.core.metrics import LOG_TAG_TELEMETRY_DROPPED, get_metrics
 from app.telemetry.models import (
     ChatTurnPayload,
     TelemetryEvent,
@@ -55,6 +60,14 @@ def create_test_event(
     )
 
 
+def posted_json(kwargs: dict) -> dict:
+    """post(content=..., headers=...) 호출 인자에서 envelope JSON 복원 (gzip 해제)."""
+    body = kwargs["content"]
+    if kwargs["headers"].get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    return json.loads(body)
+
+
 # =============================================================================
 # TEST-1: enabled=False면 enqueue가 False 반환 + 전송 호출 0회
 # =============================================================================
@@ -123,8 +136,8 @@ async def test_batch_size_triggers_batch_send():
     # Given: batch_size=3인 publisher
     post_calls: list[dict[str, Any]] = []
 
-    async def mock_post(url: str, json: dict, **kwargs) -> httpx.Response:
-        post_calls.append({"url": url, "json": json})
+    async def mock_post(url: str, **kwargs) -> httpx.Response:
+        post_calls.append({"url": url, "json": posted_json(kwargs)})
         return httpx.Response(200)
 
     mock_client = MagicMock(spec=httpx.AsyncClient)
@@ -246,7 +259,7 @@ async def test_retry_once_on_failure():
     # Given: 항상 500 응답 반환하는 mock
     call_count = 0
 
-    async def mock_post_fail(url: str, json: dict, **kwargs) -> httpx.Response:
+    async def mock_post_fail(url: str, **kwargs) -> httpx.Response:
         nonlocal call_count
         call_count += 1
         return httpx.Response(500)
@@ -281,7 +294,7 @@ async def test_retry_disabled_single_call():
     # Given: 항상 500 응답 반환하는 mock
     call_count = 0
 
-    async def mock_post_fail(url: str, json: dict, **kwargs) -> httpx.Response:
+    async def mock_post_fail(url: str, **kwargs) -> httpx.Response:
         nonlocal call_count
         call_count += 1
         return httpx.Response(500)
@@ -314,7 +327,7 @@ async def test_retry_disabled_single_call():
 async def test_failure_does_not_raise_exception():
     """전송 실패 시 예외가 밖으로 전파되지 않음."""
     # Given: 항상 500 응답 반환하는 mock
-    async def mock_post_fail(url: str, json: dict, **kwargs) -> httpx.Response:
+    async def mock_post_fail(url: str, **kwargs) -> httpx.Response:
         return httpx.Response(500)
 
     mock_client = MagicMock(spec=httpx.AsyncClient)
@@ -417,8 +430,8 @@ async def test_correct_url_and_headers():
     # Given
     captured_calls: list[dict] = []
 
-    async def mock_post(url: str, json: dict, headers: dict, **kwargs) -> httpx.Response:
-        captured_calls.append({"url": url, "headers": headers, "json": json})
+    async def mock_post(url: str, headers: dict, **kwargs) -> httpx.Response:
+        captured_calls.append({"url": url, "headers": headers})
         return httpx.Response(200)
 
     mock_client = MagicMock(spec=httpx.AsyncClient)
@@ -445,6 +458,7 @@ async def test_correct_url_and_headers():
         headers = captured_calls[0]["headers"]
         assert headers["X-Internal-Token"] == "secret-token-123"
         assert headers["Content-Type"] == "application/json"
+        assert headers["Content-Encoding"] == "gzip"
 
     finally:
         await publisher.stop()
@@ -461,8 +475,8 @@ async def test_stop_flushes_remaining_events():
     # Given
     flushed_events: list[dict] = []
 
-    async def mock_post(url: str, json: dict, **kwargs) -> httpx.Response:
-        flushed_events.append(json)
+    async def mock_post(url: str, **kwargs) -> httpx.Response:
+        flushed_events.append(posted_json(kwargs))
         return httpx.Response(200)
 
     mock_client = MagicMock(spec=httpx.AsyncClient)
@@ -488,3 +502,169 @@ async def test_stop_flushes_remaining_events():
     # Then: stop 시 남은 이벤트 전송됨
     assert len(flushed_events) == 1
     assert len(flushed_events[0]["events"]) == 3
+
+
+# =============================================================================
+# TEST-6: enqueue 시 1회 직렬화 + drop 집계
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_serialized_events_match_model_dump():
+    """이어 붙인 배치 본문의 이벤트가 model_dump(by_alias, exclude_none) 결과와 같다."""
+    post_calls: list[dict[str, Any]] = []
+
+    async def mock_post(url: str, **kwargs) -> httpx.Response:
+        post_calls.append(posted_json(kwargs))
+        return httpx.Response(200)
+
+    mock_client = MagicMock(spec=httpx.AsyncClient)
+    mock_client.post = mock_post
+
+    publisher = TelemetryPublisher(
+        backend_base_url="http://test.local",
+        internal_token="test-token",
+        http_client=mock_client,
+    )
+    events = [create_test_event(trace_id=f"trace-{i}") for i in range(2)]
+    for event in events:
+        publisher.enqueue(event)
+
+    await publisher.flush_now()
+
+    expected = [e.model_dump(by_alias=True, exclude_none=True, mode="json") for e in events]
+    assert post_calls[0]["events"] == expected
+    assert post_calls[0]["source"] == "ai-gateway"
+    datetime.fromisoformat(post_calls[0]["sentAt"])
+
+
+def test_overflow_counted_without_per_event_log(caplog):
+    """건수/bytes 상한 초과 drop은 로그 없이 dropped_count/에러 메트릭으로만 집계된다."""
+    metrics = get_metrics()
+    before = metrics.error_counts[LOG_TAG_TELEMETRY_DROPPED]
+    publisher = TelemetryPublisher(
+        backend_base_url="http://test.local",
+        internal_token="test-token",
+        max_queue_size=2,
+        http_client=MagicMock(spec=httpx.AsyncClient),
+    )
+
+    with caplog.at_level("INFO"):
+        for i in range(5):
+            publisher.enqueue(create_test_event(trace_id=f"trace-{i}"))
+
+    assert publisher.dropped_count == 3
+    assert metrics.error_counts[LOG_TAG_TELEMETRY_DROPPED] - before == 3
+    assert [r for r in caplog.records if "METRIC" in r.getMessage()] == []
+
+    small = TelemetryPublisher(
+        backend_base_url="http://test.local",
+        internal_token="test-token",
+        max_queue_bytes=10,  # 이벤트 1개보다 작음
+        http_client=MagicMock(spec=httpx.AsyncClient),
+    )
+    assert small.enqueue(create_test_event()) is False
+    assert small.dropped_count == 1
+
+
+# =============================================================================
+# TEST-7: 배치 크기 조절
+# =============================================================================
+
+
+def test_adaptive_batch_size():
+    """빠르면 2배(상한까지), 느리거나 실패하면 절반(하한까지)."""
+    publisher = TelemetryPublisher(
+        backend_base_url="http://test.local",
+        internal_token="test-token",
+        batch_size=20,
+        min_batch_size=10,
+        max_batch_size=50,
+        target_latency_ms=500,
+        http_client=MagicMock(spec=httpx.AsyncClient),
+    )
+
+    publisher._adjust_batch_size(True, 100)
+    assert publisher.batch_size == 40
+    publisher._adjust_batch_size(True, 100)
+    assert publisher.batch_size == 50
+    publisher._adjust_batch_size(True, 300)  # 목표의 절반~목표 사이: 유지
+    assert publisher.batch_size == 50
+    publisher._adjust_batch_size(True, 800)
+    assert publisher.batch_size == 25
+    publisher._adjust_batch_size(False, 10)
+    assert publisher.batch_size == 12
+    publisher._adjust_batch_size(False, 10)
+    assert publisher.batch_size == 10
+
+
+# =============================================================================
+# TEST-8: 디스크 spill 후 재전송
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_spilled_and_resent_after_restart(tmp_path):
+    """재시도 후 실패한 배치는 디스크에 남고, 새 Publisher가 재전송 후 삭제한다."""
+    down_client = MagicMock(spec=httpx.AsyncClient)
+    down_client.post = AsyncMock(return_value=httpx.Response(503))
+
+    publisher = TelemetryPublisher(
+        backend_base_url="http://test.local",
+        internal_token="test-token",
+        http_client=down_client,
+        spill_dir=str(tmp_path),
+    )
+    for i in range(3):
+        publisher.enqueue(create_test_event(trace_id=f"trace-{i}"))
+    await publisher.flush_now()
+
+    assert publisher.dropped_count == 0
+    assert len(list(tmp_path.glob("*.ndjson.gz"))) == 1
+
+    # 재시작: 백엔드 복구 후 flush 주기에 재전송
+    resent: list[dict] = []
+
+    async def mock_post(url: str, **kwargs) -> httpx.Response:
+        resent.append(posted_json(kwargs))
+        return httpx.Response(200)
+
+    up_client = MagicMock(spec=httpx.AsyncClient)
+    up_client.post = mock_post
+    restarted = TelemetryPublisher(
+        backend_base_url="http://test.local",
+        internal_token="test-token",
+        http_client=up_client,
+        spill_dir=str(tmp_path),
+    )
+    await restarted._replay_spilled()
+
+    assert [e["traceId"] for e in resent[0]["events"]] == ["trace-0", "trace-1", "trace-2"]
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_stop_spills_events_left_after_failed_flush(tmp_path):
+    """종료 시 마지막 flush가 실패하면 남은 이벤트 전부를 디스크에 보관한다."""
+    down_client = MagicMock(spec=httpx.AsyncClient)
+    down_client.post = AsyncMock(return_value=httpx.Response(500))
+
+    publisher = TelemetryPublisher(
+        backend_base_url="http://test.local",
+        internal_token="test-token",
+        batch_size=2,
+        flush_sec=999,
+        retry_once=False,
+        http_client=down_client,
+        spill_dir=str(tmp_path),
+    )
+    await publisher.start()
+    for i in range(5):
+        publisher.enqueue(create_test_event(trace_id=f"trace-{i}"))
+    await publisher.stop()
+
+    store_lines = sum(
+        len(gzip.decompress(p.read_bytes()).splitlines()) for p in tmp_path.glob("*.ndjson.gz")
+    )
+    assert store_lines == 5
+    assert publisher.dropped_count == 0
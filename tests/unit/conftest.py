@@ -20,6 +20,13 @@ os.environ["MILVUS_ENABLED"] = "false"
 os.environ["RETRIEVAL_BACKEND"] = "ragflow"
 os.environ["CHAT_RETRIEVER_BACKEND"] = "ragflow"
 
+# Disable TTS audio disk cache (테스트 간 디스크 상태 공유 방지)
+os.environ["TTS_AUDIO_CACHE_ENABLED"] = "false"
+os.environ["RENDER_SCENE_CACHE_ENABLED"] = "false"
+
+# 앱 시작 시 렌더 잡 큐 복원 비활성화 (로컬 SQLite 잡 재실행 방지)
+os.environ["RENDER_RESUME_ON_STARTUP"] = "false"
+
 # Remove direct URL env vars (HttpUrl type doesn't accept empty string)
 # So we need to unset them entirely
 for key in ["RAGFLOW_BASE_URL", "LLM_BASE_URL", "BACKEND_BASE_URL"]:
@@ -56,11 +63,31 @@ def reset_singletons():
     yield
 
     # 테스트 후 정리
+    from app.api.v1.ws_render_progress import clear_connection_manager
     from app.clients.llm_client import clear_llm_client
+    from app.clients.personalization_client import clear_personalization_facts_cache
+    from app.core.loop_monitor import clear_loop_monitor
+    from app.telemetry.tracing import clear_span_buffer
+    from app.core.state_store import clear_state_store
+    from app.services.chat.backend_handler import clear_backend_context_cache
     from app.services.pii_service import clear_pii_service
+    from app.services.scene_asset_cache import clear_scene_asset_cache
+    from app.services.scene_based_script_generator import clear_scene_search_cache
+    from app.services.tts_audio_cache import clear_tts_audio_cache
+    from app.services.video_progress_service import clear_video_progress_store
 
     clear_llm_client()
+    clear_personalization_facts_cache()
+    clear_backend_context_cache()
     clear_pii_service()
+    clear_scene_search_cache()
+    clear_tts_audio_cache()
+    clear_scene_asset_cache()
+    clear_connection_manager()
+    clear_video_progress_store()
+    clear_loop_monitor()
+    clear_span_buffer()
+    clear_state_store()
     clear_settings_cache()
 
 
@@ -0,0 +1,152 @@
+"""
+오디오 재생 시간 파서 테스트 (app/utils/audio_duration.py)
+
+테스트 목표:
+1. CBR MP3 프레임 합산 (ID3v2 / ID3v1 태그 무시)
+2. Xing/Info 헤더가 있으면 총 프레임 수 사용
+3. WAV data 청크 크기 / byte rate
+4. 알 수 없는 형식은 None (ffprobe 폴백 대상)
+5. 태그/Xing 헤더 프레임을 뗀 프레임 구간 추출, ffmpeg 없는 오디오 concat 길이 보존
+6. SceneAudioService는 메모리 바이트로 duration 계산 (ffprobe 미호출)
+"""
+
+import struct
+from unittest.mock import patch
+
+import pytest
+
+from app.clients.tts_provider import TTSResult
+from app.services.scene_audio_service import SceneAudioService
+from app.services.video_composer import VideoComposer
+from app.utils.audio_duration import (
+    extract_mp3_frames,
+    get_audio_duration_from_bytes,
+    get_audio_duration_from_file,
+)
+
+# MPEG2 Layer III, 32kbps, 24kHz, mono (gTTS 출력 형식)
+# 프레임 길이 = 72 * 32000 / 24000 = 96 bytes, 프레임당 576 샘플 (0.024초)
+_MPEG2_HEADER = bytes([0xFF, 0xF3, 0x44, 0xC4])
+_MPEG2_FRAME = _MPEG2_HEADER + b"\x00" * 92
+
+# MPEG1 Layer III, 128kbps, 44.1kHz, stereo (padding 없음)
+# 프레임 길이 = 144 * 128000 / 44100 = 417 bytes, 프레임당 1152 샘플
+_MPEG1_HEADER = bytes([0xFF, 0xFB, 0x90, 0x00])
+
+
+def _mp3(frame_count: int) -> bytes:
+    return _MPEG2_FRAME * frame_count
+
+
+def _wav(seconds: float, sample_rate: int = 22050, channels: int = 1) -> bytes:
+    byte_rate = sample_rate * channels * 2
+    data = b"\x00" * int(byte_rate * seconds)
+    fmt = struct.pack("<HHIIHH", 1, channels, sample_rate, byte_rate, channels * 2, 16)
+    body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    body += b"data" + struct.pack("<I", len(data)) + data
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+class TestMp3Duration:
+    """MP3 파싱 테스트."""
+
+    def test_cbr_frames_summed(self):
+        """100프레임 = 2.4초."""
+        assert get_audio_duration_from_bytes(_mp3(100)) == pytest.approx(2.4)
+
+    def test_id3_tags_ignored(self):
+        """앞 ID3v2 / 뒤 ID3v1 태그는 재생 시간에 포함하지 않음."""
+        id3v2 = b"ID3\x03\x00\x00" + bytes([0, 0, 0, 20]) + b"\xff" * 20
+        id3v1 = b"TAG" + b"\x00" * 125
+
+        data = id3v2 + _mp3(50) + id3v1
+
+        assert get_audio_duration_from_bytes(data) == pytest.approx(1.2)
+
+    def test_xing_frame_count(self):
+        """Info 헤더의 프레임 수로 계산 (프레임 순회 없음)."""
+        first = bytearray(_MPEG1_HEADER + b"\x00" * 413)
+        xing = 4 + 32  # MPEG1 stereo side info
+        first[xing:xing + 12] = b"Info" + struct.pack(">II", 0x01, 1000)
+        data = bytes(first) + _MPEG1_HEADER + b"\x00" * 413
+
+        assert get_audio_duration_from_bytes(data) == pytest.approx(1000 * 1152 / 44100)
+
+    def test_truncated_last_frame_excluded(self):
+        """잘린 마지막 프레임은 제외."""
+        assert get_audio_duration_from_bytes(_mp3(10) + _MPEG2_FRAME[:40]) == pytest.approx(0.24)
+
+
+class TestMp3FrameExtraction:
+    """MP3 프레임 구간 추출 / 이어 붙이기 테스트."""
+
+    @staticmethod
+    def _tagged_mp3_with_info(frame_count: int) -> bytes:
+        id3v2 = b"ID3\x03\x00\x00" + bytes([0, 0, 0, 20]) + b"\xff" * 20
+        info = bytearray(_MPEG2_FRAME)
+        xing = 4 + 9  # MPEG2 mono side info
+        info[xing:xing + 12] = b"Info" + struct.pack(">II", 0x01, frame_count)
+        return id3v2 + bytes(info) + _mp3(frame_count) + b"TAG" + b"\x00" * 125
+
+    def test_tags_and_info_frame_removed(self):
+        """ID3v2/ID3v1 태그와 Info 헤더 프레임을 제외한 오디오 프레임만 남음."""
+        assert extract_mp3_frames(self._tagged_mp3_with_info(10)) == _mp3(10)
+        assert extract_mp3_frames(b"not audio") == b"not audio"
+
+    def test_concat_without_ffmpeg_keeps_total_duration(self, tmp_path):
+        """ffmpeg 없이 이어 붙여도 첫 파일의 Info 프레임 수가 아닌 전체 길이."""
+        paths = []
+        for i, frames in enumerate((10, 20)):
+            path = tmp_path / f"scene_{i}.mp3"
+            path.write_bytes(self._tagged_mp3_with_info(frames))
+            paths.append(str(path))
+
+        with patch.object(VideoComposer, "_check_ffmpeg", return_value=False):
+            composer = VideoComposer(asset_cache=None)
+        output = tmp_path / "audio.mp3"
+        composer.concat_audio(paths + [str(tmp_path / "missing.mp3")], output)
+
+        assert get_audio_duration_from_file(output) == pytest.approx(30 * 0.024)
+
+
+class TestWavAndUnknown:
+    """WAV 및 알 수 없는 형식 테스트."""
+
+    def test_wav_duration(self):
+        """data 크기 / byte rate."""
+        assert get_audio_duration_from_bytes(_wav(1.5)) == pytest.approx(1.5)
+
+    def test_unknown_format_returns_none(self):
+        """placeholder 바이트나 빈 데이터는 None."""
+        assert get_audio_duration_from_bytes(b"\x00" * 1024) is None
+        assert get_audio_duration_from_bytes(b"") is None
+
+    def test_from_file(self, tmp_path):
+        """파일 경로 입력, 없는 파일은 None."""
+        path = tmp_path / "a.mp3"
+        path.write_bytes(_mp3(25))
+
+        assert get_audio_duration_from_file(path) == pytest.approx(0.6)
+        assert get_audio_duration_from_file(tmp_path / "missing.mp3") is None
+
+
+class TestSceneAudioServiceDuration:
+    """SceneAudioService 연동 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_sentence_duration_without_ffprobe(self, tmp_path):
+        """문장 오디오 duration은 TTS 바이트에서 계산 (subprocess 미호출)."""
+
+        class _TTS:
+            async def synthesize(self, text: str, language: str = "ko"):
+                return TTSResult(audio_bytes=_mp3(50), duration_sec=99.0)
+
+        service = SceneAudioService(tts_provider=_TTS(), silence_padding_sec=0.0)
+
+        with patch("app.services.scene_audio_service.subprocess.run") as run:
+            results = await service._generate_sentence_audios(
+                "scene-1", ["첫 문장.", "둘째 문장."], tmp_path
+            )
+
+        run.assert_not_called()
+        assert [r.duration_sec for r in results] == [pytest.approx(1.2)] * 2
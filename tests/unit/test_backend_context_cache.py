@@ -0,0 +1,198 @@
+"""
+백엔드 컨텍스트 캐시 테스트 (BackendHandler)
+
+테스트 목표:
+1. 동일 사용자 재조회 시 백엔드 호출 없이 캐시 사용
+2. 부서 통계는 부서 단위로 공유
+3. 실패 응답은 캐시하지 않음
+4. prefetch 이후 fetch_for_api는 캐시 사용, 차단 시 prefetch도 차단
+5. ChatService는 PII 마스킹/차단 게이트를 통과한 뒤에만 마스킹된 질문으로 prefetch
+"""
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.clients.backend_client import BackendDataResponse
+from app.core.backend_context import (
+    BackendBlockedError,
+    reset_backend_context,
+    set_backend_blocked,
+)
+from app.models.intent import IntentType, UserRole
+from app.services.backend_context_formatter import BackendContextFormatter
+from app.services.chat.backend_handler import BackendHandler
+
+
+@pytest.fixture(autouse=True)
+def reset_context_before_each_test():
+    """각 테스트 전후로 backend 컨텍스트를 리셋합니다."""
+    reset_backend_context()
+    yield
+    reset_backend_context()
+
+
+@pytest.fixture
+def backend_client():
+    """BackendDataClient Mock."""
+    client = MagicMock()
+    client.get_employee_edu_status = AsyncMock(return_value=BackendDataResponse(
+        success=True,
+        data={"total_required": 4, "completed": 3, "courses": []},
+    ))
+    client.get_department_edu_stats = AsyncMock(return_value=BackendDataResponse(
+        success=True,
+        data={"department": "개발팀", "total_employees": 10, "completion_rate": 80},
+    ))
+    return client
+
+
+@pytest.fixture
+def handler(backend_client):
+    """BackendHandler fixture."""
+    return BackendHandler(
+        backend_data_client=backend_client,
+        context_formatter=BackendContextFormatter(),
+    )
+
+
+class TestBackendContextCache:
+    """포맷된 백엔드 컨텍스트 캐시 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_edu_status_cached_per_user(self, handler, backend_client):
+        """같은 사용자 재조회 시 캐시 사용, 다른 사용자는 재조회."""
+        first = await handler.fetch_for_api(
+            UserRole.EMPLOYEE, "EDU", IntentType.EDU_STATUS, "emp1"
+        )
+        second = await handler.fetch_for_api(
+            UserRole.EMPLOYEE, "EDU", IntentType.EDU_STATUS, "emp1"
+        )
+        await handler.fetch_for_api(
+            UserRole.EMPLOYEE, "EDU", IntentType.EDU_STATUS, "emp2"
+        )
+
+        assert first and first == second
+        assert backend_client.get_employee_edu_status.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_dept_stats_shared_across_users(self, handler, backend_client):
+        """부서 통계는 같은 부서 관리자끼리 공유 (api/mixed 공통)."""
+        await handler.fetch_for_api(
+            UserRole.ADMIN, "EDU", IntentType.EDU_STATUS, "admin1", department="D1"
+        )
+        await handler.fetch_for_mixed(
+            UserRole.ADMIN, "EDU", IntentType.EDU_STATUS, "admin2", department="D1"
+        )
+
+        assert backend_client.get_department_edu_stats.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_response_not_cached(self, handler, backend_client):
+        """실패 응답은 빈 문자열 반환 후 다음 요청에서 재조회."""
+        backend_client.get_employee_edu_status = AsyncMock(
+            return_value=BackendDataResponse(success=False, error_message="HTTP 503")
+        )
+
+        result = await handler.fetch_for_api(
+            UserRole.EMPLOYEE, "EDU", IntentType.EDU_STATUS, "emp1"
+        )
+        await handler.fetch_for_api(
+            UserRole.EMPLOYEE, "EDU", IntentType.EDU_STATUS, "emp1"
+        )
+
+        assert result == ""
+        assert backend_client.get_employee_edu_status.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetch_coalesced(self, handler, backend_client):
+        """prefetch와 본 조회가 겹치면 백엔드 호출 1회."""
+        async def slow_status(user_id):
+            await asyncio.sleep(0.01)
+            return BackendDataResponse(success=True, data={"total_required": 1})
+
+        backend_client.get_employee_edu_status = AsyncMock(side_effect=slow_status)
+
+        prefetch = asyncio.create_task(
+            handler.prefetch(UserRole.EMPLOYEE, "EDU", "emp1")
+        )
+        result = await handler.fetch_for_api(
+            UserRole.EMPLOYEE, "EDU", IntentType.EDU_STATUS, "emp1"
+        )
+        await prefetch
+
+        assert result
+        assert backend_client.get_employee_edu_status.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_prefetch_raises_when_blocked(self, handler, backend_client):
+        """금지질문으로 backend 차단 시 prefetch도 차단."""
+        set_backend_blocked(True, "FORBIDDEN_BACKEND:rule_001")
+
+        with pytest.raises(BackendBlockedError):
+            await handler.prefetch(UserRole.EMPLOYEE, "EDU", "emp1")
+
+        backend_client.get_employee_edu_status.assert_not_called()
+
+
+class TestChatServicePrefetchGating:
+    """ChatService의 prefetch 시작 시점 테스트."""
+
+    @staticmethod
+    def _make_service(pii_service):
+        from app.clients.llm_client import LLMClient
+        from app.services.chat_service import ChatService
+
+        service = ChatService(llm_client=LLMClient(base_url=""), pii_service=pii_service)
+        service._start_backend_prefetch = MagicMock()
+        return service
+
+    @staticmethod
+    def _request():
+        from typing import Optional
+
+        from app.models.chat import ChatMessage, ChatRequest
+
+        class _ChatRequest(ChatRequest):
+            # handle_chat은 A/B 임베딩 선택용 req.model을 읽지만 ChatRequest에는 아직 없음
+            model: Optional[str] = None
+
+        return _ChatRequest(
+            session_id="s1",
+            user_id="emp1",
+            user_role="EMPLOYEE",
+            messages=[ChatMessage(role="user", content="홍길동 010-1234-5678 내 교육 이수 현황 알려줘")],
+        )
+
+    @pytest.mark.asyncio
+    async def test_no_prefetch_when_pii_detector_unavailable(self):
+        """PII 검출기 장애(fail-closed) 시 원문으로 백엔드 조회를 시작하지 않음."""
+        from app.models.intent import MaskingStage
+        from app.services.pii_service import PiiDetectorUnavailableError
+
+        pii = MagicMock()
+        pii.detect_and_mask = AsyncMock(
+            side_effect=PiiDetectorUnavailableError(MaskingStage.INPUT, "timeout")
+        )
+        service = self._make_service(pii)
+
+        await service.handle_chat(self._request())
+
+        service._start_backend_prefetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_prefetch_uses_masked_query(self):
+        """마스킹 통과 후 마스킹된 질문으로 prefetch 시작."""
+        from app.models.intent import PiiMaskResult
+
+        masked = "[NAME] [PHONE] 내 교육 이수 현황 알려줘"
+        pii = MagicMock()
+        pii.detect_and_mask = AsyncMock(side_effect=lambda text, stage: PiiMaskResult(
+            original_text=text, masked_text=masked, has_pii=True, tags=[],
+        ))
+        service = self._make_service(pii)
+
+        await service.handle_chat(self._request())
+
+        service._start_backend_prefetch.assert_called_once()
+        assert service._start_backend_prefetch.call_args.args[1] == masked
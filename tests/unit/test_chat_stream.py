@@ -6,8 +6,6 @@ POST /ai/chat/stream 엔드포인트 및 관련 서비스 테스트.
 
 import asyncio
 import json
-import time
-from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -156,75 +154,80 @@ class TestStreamModels:
 class TestInFlightTracker:
     """중복 요청 방지 트래커 테스트."""
 
-    def test_start_request_new(self):
+    @pytest.mark.asyncio
+    async def test_start_request_new(self):
         """새 요청 등록."""
         tracker = InFlightTracker()
-        result = tracker.start_request("req-001")
+        result = await tracker.start_request("req-001")
         assert result is True
 
-    def test_start_request_duplicate(self):
+    @pytest.mark.asyncio
+    async def test_start_request_duplicate(self):
         """중복 요청 거부."""
         tracker = InFlightTracker()
-        tracker.start_request("req-001")
-        result = tracker.start_request("req-001")
+        await tracker.start_request("req-001")
+        result = await tracker.start_request("req-001")
         assert result is False
 
-    def test_is_in_flight(self):
+    @pytest.mark.asyncio
+    async def test_is_in_flight(self):
         """진행 중 요청 확인."""
         tracker = InFlightTracker()
-        assert tracker.is_in_flight("req-001") is False
+        assert await tracker.is_in_flight("req-001") is False
 
-        tracker.start_request("req-001")
-        assert tracker.is_in_flight("req-001") is True
+        await tracker.start_request("req-001")
+        assert await tracker.is_in_flight("req-001") is True
 
-    def test_complete_request(self):
+    @pytest.mark.asyncio
+    async def test_complete_request(self):
         """요청 완료 처리."""
         tracker = InFlightTracker()
-        tracker.start_request("req-001")
-        assert tracker.is_in_flight("req-001") is True
+        await tracker.start_request("req-001")
+        assert await tracker.is_in_flight("req-001") is True
 
-        tracker.complete_request("req-001", "응답 결과")
-        assert tracker.is_in_flight("req-001") is False
+        await tracker.complete_request("req-001", "응답 결과")
+        assert await tracker.is_in_flight("req-001") is False
 
-    def test_cancel_request(self):
+    @pytest.mark.asyncio
+    async def test_cancel_request(self):
         """요청 취소."""
         tracker = InFlightTracker()
-        tracker.start_request("req-001")
-        tracker.cancel_request("req-001")
+        await tracker.start_request("req-001")
+        await tracker.cancel_request("req-001")
 
         # 취소 후 다시 등록 가능
-        result = tracker.start_request("req-001")
+        result = await tracker.start_request("req-001")
         assert result is True
 
-    def test_get_cached_response(self):
+    @pytest.mark.asyncio
+    async def test_get_cached_response(self):
         """캐시된 응답 조회."""
         tracker = InFlightTracker()
-        tracker.start_request("req-001")
-        tracker.complete_request("req-001", "캐시된 응답")
+        await tracker.start_request("req-001")
+        await tracker.complete_request("req-001", "캐시된 응답")
 
-        cached = tracker.get_cached_response("req-001")
+        cached = await tracker.get_cached_response("req-001")
         assert cached == "캐시된 응답"
 
-    def test_get_cached_response_not_found(self):
+    @pytest.mark.asyncio
+    async def test_get_cached_response_not_found(self):
         """캐시 없음."""
         tracker = InFlightTracker()
-        cached = tracker.get_cached_response("req-nonexistent")
+        cached = await tracker.get_cached_response("req-nonexistent")
         assert cached is None
 
-    def test_cleanup_expired(self):
+    @pytest.mark.asyncio
+    async def test_cleanup_expired(self):
         """만료된 요청 정리."""
         tracker = InFlightTracker()
-        tracker.CACHE_TTL_SECONDS = 1  # 테스트용 짧은 TTL
-
-        tracker.start_request("req-001")
-        tracker._requests["req-001"].started_at = datetime.now() - timedelta(seconds=10)
+        tracker.CACHE_TTL_SECONDS = 0.05  # 테스트용 짧은 TTL
 
-        # 정리 트리거
-        tracker._last_cleanup = 0
-        tracker.is_in_flight("req-002")
+        await tracker.start_request("req-001")
+        await asyncio.sleep(0.1)
 
         # 만료된 요청 제거됨
-        assert "req-001" not in tracker._requests
+        assert await tracker.is_in_flight("req-001") is False
+        assert await tracker.start_request("req-001") is True
 
 
 # =============================================================================
@@ -251,7 +254,7 @@ class TestChatStreamService:
     async def test_stream_chat_duplicate_inflight(self):
         """중복 요청 시 DUPLICATE_INFLIGHT 에러."""
         tracker = InFlightTracker()
-        tracker.start_request("req-001")
+        await tracker.start_request("req-001")
 
         service = ChatStreamService(tracker=tracker)
         request = self._create_request("req-001")
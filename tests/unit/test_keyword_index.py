@@ -0,0 +1,83 @@
+"""
+BM25 키워드 인덱스 테스트 (app/utils/keyword_index.py)
+
+테스트 목표:
+1. 문자 bigram 토큰화 (조사가 붙은 한국어도 어간 일치)
+2. BM25 검색 순위
+3. contains()는 부분 문자열 검사와 같은 결과
+4. RRF 결합 순위
+"""
+import pytest
+
+from app.utils.keyword_index import KeywordIndex, reciprocal_rank_fusion, tokenize
+
+
+CHUNKS = [
+    "개인정보는 수집 목적 범위 내에서만 이용해야 합니다.",
+    "보안사고 발생 시 즉시 정보보호팀에 신고합니다.",
+    "보안사고 예방을 위해 비밀번호를 주기적으로 변경합니다. 보안사고는 예방이 중요합니다.",
+    "VPN 접속 시 OTP 인증이 필요합니다.",
+]
+
+
+class TestTokenize:
+    """토큰화 테스트."""
+
+    def test_bigram_tokens(self):
+        assert tokenize("보안사고를") == ["보안", "안사", "사고", "고를"]
+        assert tokenize("A 보") == ["a", "보"]
+
+
+class TestKeywordIndexSearch:
+    """BM25 검색 테스트."""
+
+    def test_ranks_by_term_frequency(self):
+        index = KeywordIndex(CHUNKS)
+
+        hits = index.search("보안사고 예방", top_k=2)
+
+        assert [position for position, _ in hits] == [2, 1]
+
+    def test_no_match_returns_empty(self):
+        index = KeywordIndex(CHUNKS)
+
+        assert index.search("퇴직연금") == []
+
+    def test_custom_keys(self):
+        index = KeywordIndex(CHUNKS[:2], keys=["b1", "b2"])
+
+        assert index.search("신고")[0][0] == "b2"
+
+    def test_keys_length_mismatch(self):
+        with pytest.raises(ValueError):
+            KeywordIndex(CHUNKS, keys=["only-one"])
+
+
+class TestKeywordIndexContains:
+    """contains() 테스트 (부분 문자열 검사와 동일 결과)."""
+
+    @pytest.mark.parametrize(
+        "term", ["정보보호팀", "otp", "사고", "팀에", "비밀번호를", "없는단어", "호", "합니다."]
+    )
+    def test_matches_substring_semantics(self, term):
+        index = KeywordIndex(CHUNKS)
+
+        expected = any(term.lower() in chunk.lower() for chunk in CHUNKS)
+        assert index.contains(term) is expected
+
+    def test_restricted_to_keys(self):
+        index = KeywordIndex(CHUNKS, keys=["b0", "b1", "b2", "b3"])
+
+        assert index.contains("신고", ["b1"]) is True
+        assert index.contains("신고", ["b0", "b3"]) is False
+        assert index.contains("신고", ["missing"]) is False
+
+
+class TestReciprocalRankFusion:
+    """RRF 결합 테스트."""
+
+    def test_shared_items_ranked_first(self):
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d"]])
+
+        assert [key for key, _ in fused][:2] == ["c", "a"]
+        assert len(fused) == 4
@@ -0,0 +1,137 @@
+"""
+비동기 JSON 로깅 테스트 (QueueHandler / 샘플링 / JsonFormatter)
+
+테스트 목표:
+1. JsonFormatter 출력 필드/타임스탬프/한글/예외 형식 유지
+2. 로거 prefix별 샘플링은 DEBUG에만 적용
+3. RequestContext는 호출 스레드에서 주입, 출력은 writer 스레드
+4. 가변 인자는 호출 시점에 메시지 확정, 큐가 가득 차면 버림
+"""
+
+import io
+import json
+import logging
+import queue
+import sys
+
+import pytest
+
+from app.core.config import get_settings
+from app.core.logging import (
+    JsonFormatter,
+    LogSamplingFilter,
+    NonBlockingQueueHandler,
+    parse_sampling_rates,
+    setup_logging,
+    shutdown_logging,
+)
+from app.telemetry.context import RequestContext, reset_request_context, set_request_context
+
+
+def _record(name: str = "app.test", level: int = logging.INFO, msg: str = "hello", args=None):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+@pytest.fixture
+def restore_root_logger():
+    """setup_logging이 바꾼 루트 로거 핸들러/레벨 복원."""
+    root_logger = logging.getLogger()
+    handlers, level = root_logger.handlers[:], root_logger.level
+    yield
+    shutdown_logging()
+    root_logger.handlers[:] = handlers
+    root_logger.setLevel(level)
+
+
+class TestJsonFormatter:
+    """JsonFormatter 단위 테스트."""
+
+    def test_fields_and_timestamp(self):
+        """기본 필드, 밀리초 UTC 타임스탬프, 한글 유지."""
+        record = _record(msg="안녕 %s", args=("세계",))
+        record.created = 1737203696.789
+
+        data = json.loads(JsonFormatter().format(record))
+
+        assert data["@timestamp"] == "2025-01-18T12:34:56.789Z"
+        assert data["message"] == "안녕 세계"
+        assert data["trace_id"] is None
+        assert "안녕" in JsonFormatter().format(record)
+
+    def test_exception_stacktrace_single_line(self):
+        """예외 정보는 exception_type과 1라인 stacktrace."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(
+                "app.test", logging.ERROR, __file__, 1, "failed", None, sys.exc_info()
+            )
+
+        line = JsonFormatter().format(record)
+        data = json.loads(line)
+
+        assert "\n" not in line
+        assert data["exception_type"] == "ValueError"
+        assert "boom" in data["stacktrace"]
+
+
+class TestSampling:
+    """로거별 샘플링 테스트."""
+
+    def test_parse_rates_ignores_invalid(self):
+        """형식이 잘못된 항목은 무시, 비율은 0~1로 보정."""
+        rates = parse_sampling_rates("app.utils.cache=0.1, bad, app.x=abc, app.y=3")
+
+        assert rates == {"app.utils.cache": 0.1, "app.y": 1.0}
+
+    def test_debug_sampled_by_longest_prefix(self):
+        """가장 긴 prefix 규칙으로 DEBUG만 1/N 통과."""
+        sampling = LogSamplingFilter({"app.utils": 0.0, "app.utils.cache": 0.25})
+
+        passed = [
+            sampling.filter(_record("app.utils.cache", logging.DEBUG)) for _ in range(8)
+        ]
+
+        assert passed.count(True) == 2
+        assert sampling.filter(_record("app.utils.cache", logging.INFO)) is True
+        assert sampling.filter(_record("app.utils.other", logging.DEBUG)) is False
+        assert sampling.filter(_record("app.services.rag", logging.DEBUG)) is True
+
+
+class TestQueueHandler:
+    """비동기 출력 테스트."""
+
+    def test_context_injected_before_writer_thread(self, restore_root_logger):
+        """trace_id는 호출 시점 컨텍스트, 출력은 shutdown 시 모두 flush."""
+        stream = io.StringIO()
+        setup_logging(get_settings().model_copy(update={"LOG_ASYNC": True}), stream=stream)
+
+        set_request_context(RequestContext(trace_id="trace-123"))
+        logging.getLogger("app.test").info("queued %d", 7)
+        reset_request_context()
+        shutdown_logging()
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        queued = [line for line in lines if line["message"] == "queued 7"]
+        assert queued and queued[0]["trace_id"] == "trace-123"
+
+    def test_mutable_args_formatted_at_call_time(self):
+        """가변 인자는 큐에 넣을 때 메시지 확정, 불변 인자는 지연."""
+        handler = NonBlockingQueueHandler(queue.Queue())
+        items = ["a"]
+        mutable = handler.prepare(_record(msg="items=%s", args=(items,)))
+        lazy = handler.prepare(_record(msg="count=%d", args=(3,)))
+        items.append("b")
+
+        assert mutable.getMessage() == "items=['a']"
+        assert lazy.args == (3,)
+
+    def test_full_queue_drops_without_blocking(self):
+        """큐가 가득 차면 버리고 건수만 증가."""
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+
+        handler.handle(_record())
+        handler.handle(_record())
+
+        assert handler.queue.qsize() == 1
+        assert handler.dropped_count == 1
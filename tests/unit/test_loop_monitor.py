@@ -0,0 +1,91 @@
+"""
+이벤트 루프 감시 테스트 (LoopMonitor)
+
+테스트 목표:
+1. 루프를 막는 동기 호출은 정지로 기록되고 스택에 호출 위치가 남음
+2. 정지는 실행 중이던 태스크의 RequestContext(route, trace_id)로 귀속
+3. 지연 히스토그램/정지 카운터가 Prometheus 출력에 별도 family로 노출
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.loop_monitor import LOOP_LAG_METRIC, LoopMonitor, stall_route_label
+from app.core.metrics import MetricsCollector, get_metrics, render_prometheus, merge_snapshots
+from app.telemetry.context import RequestContext, set_request_context
+
+
+def _blocking_render() -> None:
+    time.sleep(0.3)
+
+
+class TestLoopMonitor:
+    """정지 감지 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_stall_attributed_to_request(self):
+        """요청 태스크의 동기 호출은 route/trace_id와 스택으로 기록."""
+        monitor = LoopMonitor(interval_sec=0.02, stall_threshold_ms=100, sample_interval_ms=20)
+        await monitor.start()
+        await asyncio.sleep(0.05)
+
+        async def handle_request():
+            set_request_context(
+                RequestContext(trace_id="trace-stall", route="POST /api/videos/12345/render")
+            )
+            _blocking_render()
+
+        await asyncio.create_task(handle_request())
+        await asyncio.sleep(0.1)
+        monitor.stop()
+
+        stalls = monitor.get_recent_stalls()
+        assert len(stalls) == 1
+        stall = stalls[0]
+        assert stall["route"] == "POST /api/videos/12345/render"
+        assert stall["trace_id"] == "trace-stall"
+        assert stall["duration_ms"] >= 200
+        assert any("_blocking_render" in frame for frame in stall["stacks"][0]["frames"])
+
+        stats = get_metrics().snapshot()
+        assert stats["counters"]["loop_stalls"] == {"POST /api/videos/{id}/render": 1}
+        assert sum(stats["histograms"][LOOP_LAG_METRIC]["counts"]) >= 1
+
+    @pytest.mark.asyncio
+    async def test_no_stall_when_loop_responsive(self):
+        """비동기 대기만 있으면 정지 없음, stop 후 task factory 복원."""
+        loop = asyncio.get_running_loop()
+        monitor = LoopMonitor(interval_sec=0.02, stall_threshold_ms=100)
+        await monitor.start()
+        await asyncio.sleep(0.15)
+        monitor.stop()
+
+        assert monitor.get_recent_stalls() == []
+        assert loop.get_task_factory() is None
+
+
+class TestExposition:
+    """라벨/노출 형식 테스트."""
+
+    def test_route_label_collapses_ids(self):
+        """ID로 보이는 경로 세그먼트는 {id}로 묶음 (v1 같은 짧은 세그먼트는 유지)."""
+        assert stall_route_label("GET /api/v1/videos/123") == "GET /api/v1/videos/{id}"
+        assert (
+            stall_route_label("GET /jobs/3f2b9c1e-8d4a-4b7e-9f00-1a2b3c4d5e6f")
+            == "GET /jobs/{id}"
+        )
+        assert stall_route_label(None) == "unknown"
+
+    def test_loop_metrics_in_own_family(self):
+        """loop lag은 upstream latency가 아닌 별도 히스토그램."""
+        collector = MetricsCollector()
+        collector.histogram(LOOP_LAG_METRIC).observe(3)
+        collector.increment_loop_stall("GET /health")
+
+        text = render_prometheus(merge_snapshots([collector.snapshot()]))
+
+        assert "ctrlf_event_loop_lag_seconds_count 1" in text
+        assert 'upstream="event_loop_lag"' not in text
+        assert 'ctrlf_event_loop_stalls_total{route="GET /health"} 1' in text
@@ -0,0 +1,187 @@
+"""
+지표 히스토그램/노출 테스트 (Histogram / GET /metrics)
+
+테스트 목표:
+1. 고정 버킷 히스토그램의 분위수 추정과 스레드 동시 기록
+2. 워커 스냅샷 합산 (히스토그램/카운터/게이지/캐시)
+3. Prometheus text 형식 (누적 버킷, 초 단위, 캐시 적중률)
+4. GET /metrics가 다른 워커의 발행 스냅샷까지 합산
+5. 종료/발행이 끊긴 워커의 누적 값은 retired로 옮겨 합계가 줄지 않음
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core.metrics import (
+    RETIRED_METRICS_KEY,
+    WORKER_METRICS_PREFIX,
+    Histogram,
+    MetricsCollector,
+    collect_cluster_metrics,
+    get_metrics,
+    merge_snapshots,
+    publish_worker_metrics,
+    render_prometheus,
+    withdraw_worker_metrics,
+)
+from app.core.state_store import InMemoryStateStore, get_state_store
+
+
+class TestHistogram:
+    """Histogram 단위 테스트."""
+
+    def test_quantiles_interpolated_within_bucket(self):
+        """균등 분포 1~1000ms의 분위수는 버킷 보간으로 근사."""
+        histogram = Histogram(buckets=(100, 250, 500, 1000))
+        for value in range(1, 1001):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+        assert snapshot.count == 1000
+        assert snapshot.max == 1000
+        assert snapshot.quantile(0.5) == pytest.approx(500, abs=1)
+        assert snapshot.quantile(0.95) == pytest.approx(950, abs=1)
+
+    def test_overflow_bucket_reports_max(self):
+        """가장 큰 버킷을 넘는 분위수는 관측 최댓값."""
+        histogram = Histogram(buckets=(10,))
+        histogram.observe(5)
+        histogram.observe(4200)
+
+        assert histogram.snapshot().quantile(0.99) == 4200
+
+    def test_concurrent_observations_not_lost(self):
+        """여러 스레드가 동시에 기록해도 합계 유지."""
+        histogram = Histogram()
+
+        def observe_many():
+            for _ in range(5000):
+                histogram.observe(12)
+
+        threads = [threading.Thread(target=observe_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = histogram.snapshot()
+        assert snapshot.count == 20000
+        assert snapshot.sum == 12 * 20000
+
+    def test_get_stats_reports_percentiles(self):
+        """get_stats는 min/avg/max와 분위수 포함."""
+        collector = MetricsCollector()
+        for value in (10, 20, 30, 40, 4000):
+            collector.record_latency("llm_completion", value)
+
+        stats = collector.get_stats()["latency_stats"]["llm_completion"]
+        assert stats["count"] == 5
+        assert stats["avg_ms"] == 820.0
+        assert stats["min_ms"] == 10
+        assert stats["max_ms"] == 4000
+        assert stats["p50_ms"] <= 50
+        assert stats["p99_ms"] > 2500
+
+
+class TestAggregationAndExposition:
+    """워커 합산/노출 형식 테스트."""
+
+    def _worker(self, latency_ms: float, queued: int, hits: int, misses: int) -> dict:
+        collector = MetricsCollector()
+        collector.record_latency("milvus_search", latency_ms)
+        collector.increment_request("RAG_INTERNAL")
+        collector.register_gauge("render_queued", lambda: queued)
+        collector.register_cache("tts_audio", lambda: {"hits": hits, "misses": misses})
+        return collector.snapshot()
+
+    def test_merge_sums_workers(self):
+        """히스토그램은 버킷별, 카운터/게이지/캐시는 합계."""
+        merged = merge_snapshots([self._worker(20, 2, 3, 1), self._worker(700, 1, 1, 3)])
+
+        assert merged["workers"] == 2
+        assert sum(merged["histograms"]["milvus_search"]["counts"]) == 2
+        assert merged["counters"]["requests"] == {"RAG_INTERNAL": 2}
+        assert merged["gauges"] == {"render_queued": 3.0}
+        assert merged["caches"] == {"tts_audio": {"hits": 4, "misses": 4}}
+
+    def test_prometheus_text_format(self):
+        """누적 버킷(le는 초), +Inf = count, 캐시 적중률."""
+        text = render_prometheus(merge_snapshots([self._worker(20, 2, 3, 1)]))
+
+        assert "# TYPE ctrlf_upstream_latency_seconds histogram" in text
+        assert 'ctrlf_upstream_latency_seconds_bucket{upstream="milvus_search",le="0.01"} 0' in text
+        assert 'ctrlf_upstream_latency_seconds_bucket{upstream="milvus_search",le="0.025"} 1' in text
+        assert 'ctrlf_upstream_latency_seconds_bucket{upstream="milvus_search",le="+Inf"} 1' in text
+        assert 'ctrlf_upstream_latency_seconds_sum{upstream="milvus_search"} 0.02' in text
+        assert 'ctrlf_queue_depth{queue="render_queued"} 2' in text
+        assert 'ctrlf_cache_hit_ratio{cache="tts_audio"} 0.75' in text
+        assert text.endswith("\n")
+
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint_includes_other_workers(self):
+        """GET /metrics는 이 워커 값과 다른 워커의 발행 스냅샷을 합산."""
+        from app.main import app
+
+        get_metrics().record_latency("pii", 30)
+        other = {**self._worker(20, 5, 0, 0), "published_at": time.time()}
+        get_state_store().set(f"{WORKER_METRICS_PREFIX}999999", other)
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "ctrlf_metrics_workers 2" in response.text
+        assert 'ctrlf_upstream_latency_seconds_count{upstream="pii"}' in response.text
+        assert 'ctrlf_upstream_latency_seconds_count{upstream="milvus_search"}' in response.text
+
+
+class TestRetiredWorkers:
+    """종료 워커 누적 값 보존 테스트."""
+
+    @pytest.fixture
+    def store(self):
+        instance = InMemoryStateStore()
+        with patch("app.core.state_store.get_state_store", return_value=instance):
+            yield instance
+        instance.close()
+
+    def _requests(self, count: int) -> dict:
+        collector = MetricsCollector()
+        for _ in range(count):
+            collector.increment_request("RAG_INTERNAL")
+        collector.record_latency("milvus_search", 20)
+        return collector.snapshot()
+
+    def _total(self) -> int:
+        return collect_cluster_metrics()["counters"]["requests"].get("RAG_INTERNAL", 0)
+
+    def test_stale_worker_moved_to_retired(self, store):
+        """발행이 끊긴 워커는 합계에서 빠지지 않고 retired로 옮겨짐."""
+        base = self._total()
+        store.set(f"{WORKER_METRICS_PREFIX}gone", {**self._requests(3), "published_at": 0.0})
+        store.set(f"{WORKER_METRICS_PREFIX}live", {**self._requests(2), "published_at": time.time()})
+
+        merged = collect_cluster_metrics()
+
+        assert merged["counters"]["requests"]["RAG_INTERNAL"] == base + 5
+        assert merged["workers"] == 2
+        assert store.get(f"{WORKER_METRICS_PREFIX}gone") is None
+        assert sum(store.get(RETIRED_METRICS_KEY)["histograms"]["milvus_search"]["counts"]) == 1
+        assert self._total() == base + 5
+
+    def test_withdrawn_worker_counts_kept(self, store):
+        """종료 시 withdraw한 워커의 누적 값은 이후 합계에도 남음."""
+        get_metrics().increment_request("RAG_INTERNAL")
+        publish_worker_metrics()
+        local = get_metrics().request_counts["RAG_INTERNAL"]
+
+        withdraw_worker_metrics()
+
+        assert store.keys(WORKER_METRICS_PREFIX) == []
+        assert store.get(RETIRED_METRICS_KEY)["counters"]["requests"] == {"RAG_INTERNAL": local}
@@ -15,6 +15,7 @@ from app.clients.milvus_client import (
     MilvusConnectionError,
     MilvusSearchError,
     EmbeddingError,
+    get_doc_id_filter_expr,
     get_milvus_client,
     clear_milvus_client,
 )
@@ -390,6 +391,71 @@ class TestVectorSearch:
         assert "embedding" in str(exc_info.value).lower()
 
 
+# =============================================================================
+# search_many (배치 검색) 테스트
+# =============================================================================
+
+
+class TestSearchMany:
+    """search_many / generate_embeddings 테스트."""
+
+    @pytest.mark.anyio
+    async def test_generate_embeddings_ordered_by_index(self, milvus_client):
+        """배치 임베딩 1회 요청, 응답은 index 순서로 정렬."""
+        response = {
+            "data": [
+                {"embedding": [0.2], "index": 1},
+                {"embedding": [0.1], "index": 0},
+            ],
+        }
+
+        with patch("httpx.AsyncClient") as MockClient:
+            mock_client = AsyncMock()
+            mock_client.post.return_value = httpx.Response(200, json=response)
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.__aexit__.return_value = None
+            MockClient.return_value = mock_client
+
+            embeddings = await milvus_client.generate_embeddings(["첫째", "둘째"])
+
+            assert embeddings == [[0.1], [0.2]]
+            assert mock_client.post.await_count == 1
+            assert mock_client.post.call_args.kwargs["json"]["input"] == ["첫째", "둘째"]
+
+    @pytest.mark.anyio
+    async def test_search_many_single_round_trip(self, milvus_client):
+        """쿼리 N개를 임베딩 1회 + 검색 1회로 처리."""
+        milvus_client.generate_embeddings = AsyncMock(return_value=[[0.1], [0.2]])
+        milvus_client._search_many_sync = MagicMock(return_value=[[{"id": "a"}], []])
+
+        results = await milvus_client.search_many(
+            ["쿼리1", "쿼리2"], filter_expr='doc_id in ["doc-1"]', top_k=3
+        )
+
+        assert results == [[{"id": "a"}], []]
+        milvus_client.generate_embeddings.assert_awaited_once_with(["쿼리1", "쿼리2"])
+        milvus_client._search_many_sync.assert_called_once_with(
+            [[0.1], [0.2]], 3, 'doc_id in ["doc-1"]'
+        )
+
+    @pytest.mark.anyio
+    async def test_search_many_embedding_failure(self, milvus_client):
+        """배치 임베딩 실패 시 MilvusSearchError."""
+        milvus_client.generate_embeddings = AsyncMock(
+            side_effect=EmbeddingError("Embedding failed")
+        )
+
+        with pytest.raises(MilvusSearchError):
+            await milvus_client.search_many(["쿼리"])
+
+    def test_doc_id_filter_expr(self):
+        """doc_id 필터는 중복 제거 + escape."""
+        assert get_doc_id_filter_expr([]) is None
+        assert get_doc_id_filter_expr(["a.pdf", "a.pdf", 'b"c']) == (
+            'doc_id in ["a.pdf", "b\\"c"]'
+        )
+
+
 # =============================================================================
 # search_as_sources 테스트
 # =============================================================================
@@ -228,6 +228,186 @@ class TestPersonalizationClient:
             assert facts.error is not None
             assert facts.error.type == "NOT_IMPLEMENTED"
 
+class TestPersonalizationFactsCache:
+    """개인화 facts 캐시 테스트."""
+
+    @staticmethod
+    def _make_client(fetch_mock):
+        from app.clients.personalization_client import PersonalizationClient
+
+        client = PersonalizationClient(base_url="http://backend:8080")
+        client._fetch_facts = fetch_mock
+        return client
+
+    @pytest.mark.asyncio
+    async def test_second_call_served_from_cache(self):
+        """같은 (user, Q, period) 재조회 시 백엔드 호출 없음."""
+        fetch = AsyncMock(return_value=PersonalizationFacts(
+            sub_intent_id="Q11", metrics={"remaining_days": 7},
+        ))
+        client = self._make_client(fetch)
+
+        first = await client.resolve_facts("Q11", user_id="emp1")
+        second = await client.resolve_facts("Q11", user_id="emp1")
+
+        assert fetch.await_count == 1
+        assert second.metrics == first.metrics
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_coalesced(self):
+        """동시 요청은 백엔드 호출 1회로 합쳐짐."""
+        import asyncio
+
+        async def slow_fetch(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return PersonalizationFacts(sub_intent_id="Q1", metrics={"remaining": 2})
+
+        fetch = AsyncMock(side_effect=slow_fetch)
+        client = self._make_client(fetch)
+
+        results = await asyncio.gather(*[
+            client.resolve_facts("Q1", user_id="emp1") for _ in range(5)
+        ])
+
+        assert fetch.await_count == 1
+        assert all(r.metrics == {"remaining": 2} for r in results)
+
+    @pytest.mark.asyncio
+    async def test_error_facts_not_cached(self):
+        """에러 응답은 캐시하지 않음."""
+        fetch = AsyncMock(return_value=PersonalizationFacts(
+            sub_intent_id="Q11",
+            error=PersonalizationError(type="TIMEOUT", message="HTTP 503"),
+        ))
+        client = self._make_client(fetch)
+
+        await client.resolve_facts("Q11", user_id="emp1")
+        await client.resolve_facts("Q11", user_id="emp1")
+
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_user(self):
+        """사용자 무효화 후 재조회 시 백엔드 호출."""
+        from app.clients.personalization_client import invalidate_personalization_facts
+
+        fetch = AsyncMock(return_value=PersonalizationFacts(sub_intent_id="Q1"))
+        client = self._make_client(fetch)
+
+        await client.resolve_facts("Q1", user_id="emp1")
+        await client.resolve_facts("Q1", user_id="emp10")
+
+        assert invalidate_personalization_facts("emp1") == 1
+
+        await client.resolve_facts("Q1", user_id="emp1")
+        await client.resolve_facts("Q1", user_id="emp10")
+        assert fetch.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_fetch_not_cached(self):
+        """조회 중 무효화되면 그 응답은 캐시하지 않고, 이후 요청은 새로 조회."""
+        import asyncio
+
+        from app.clients.personalization_client import invalidate_personalization_facts
+
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def fetch_facts(*args, **kwargs):
+            started.set()
+            await release.wait()
+            return PersonalizationFacts(sub_intent_id="Q1", metrics={"remaining": 2})
+
+        fetch = AsyncMock(side_effect=fetch_facts)
+        client = self._make_client(fetch)
+
+        stale = asyncio.create_task(client.resolve_facts("Q1", user_id="emp1"))
+        await started.wait()
+        invalidate_personalization_facts("emp1")
+        fresh = asyncio.create_task(client.resolve_facts("Q1", user_id="emp1"))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(stale, fresh)
+
+        assert fetch.await_count == 2
+        await client.resolve_facts("Q1", user_id="emp1")
+        assert fetch.await_count == 2
+
+    def test_invalidation_generations_bounded(self):
+        """무효화 세대 기록은 facts 캐시 maxsize를 넘지 않음."""
+        from app.clients import personalization_client
+        from app.clients.personalization_client import (
+            _get_facts_generations,
+            clear_personalization_facts_cache,
+            invalidate_personalization_facts,
+        )
+
+        clear_personalization_facts_cache()
+        with patch.object(personalization_client.settings, "PERSONALIZATION_CACHE_MAXSIZE", 2):
+            for i in range(10):
+                invalidate_personalization_facts(f"emp{i}")
+
+            assert _get_facts_generations().size() <= 2
+        clear_personalization_facts_cache()
+
+    @pytest.mark.asyncio
+    async def test_leader_cancel_not_propagated(self):
+        """먼저 조회하던 요청이 취소되어도 대기 중인 요청은 직접 조회해 결과를 받음."""
+        import asyncio
+
+        async def slow_fetch(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return PersonalizationFacts(sub_intent_id="Q1", metrics={"remaining": 2})
+
+        fetch = AsyncMock(side_effect=slow_fetch)
+        client = self._make_client(fetch)
+
+        leader = asyncio.create_task(client.resolve_facts("Q1", user_id="emp1"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(client.resolve_facts("Q1", user_id="emp1"))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        facts = await follower
+        assert facts.metrics == {"remaining": 2}
+        assert leader.cancelled()
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_endpoint(self):
+        """POST /internal/ai/personalization/invalidate 호출 시 캐시 삭제."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from app.api.v1.personalization import router
+
+        fetch = AsyncMock(return_value=PersonalizationFacts(sub_intent_id="Q9"))
+        client = self._make_client(fetch)
+        await client.resolve_facts("Q9", user_id="emp1")
+
+        app = FastAPI()
+        app.include_router(router)
+        response = TestClient(app).post(
+            "/internal/ai/personalization/invalidate",
+            json={"userId": "emp1", "subIntentId": "Q9"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"invalidated": 1}
+
+    def test_period_ttl_ordering(self):
+        """짧은 기간일수록 TTL이 짧음."""
+        from app.clients.personalization_client import PERIOD_CACHE_TTL_SECONDS
+
+        ttl = PERIOD_CACHE_TTL_SECONDS
+        assert (
+            ttl[PeriodType.THIS_WEEK.value]
+            < ttl[PeriodType.THIS_MONTH.value]
+            < ttl[PeriodType.THREE_MONTHS.value]
+            < ttl[PeriodType.THIS_YEAR.value]
+        )
+
+
 # =============================================================================
 # Rule Router Personalization Tests
 # =============================================================================
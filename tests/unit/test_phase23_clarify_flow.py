@@ -105,7 +105,8 @@ class TestPendingActionModel:
 class TestPendingActionStoreTTL:
     """Phase 23: TTL 기반 만료 처리 테스트."""
 
-    def test_store_get_returns_none_after_ttl_expired(self):
+    @pytest.mark.anyio
+    async def test_store_get_returns_none_after_ttl_expired(self):
         """TTL이 지난 pending은 get()에서 None 반환."""
         store = PendingActionStore()
 
@@ -116,13 +117,14 @@ class TestPendingActionStoreTTL:
             pending_intent=Tier0Intent.EDUCATION_QA,
             expires_at=datetime.now(timezone.utc) - timedelta(seconds=1),  # 1초 전 만료
         )
-        store.set("session-expired", expired_pending)
+        await store.set("session-expired", expired_pending)
 
         # get() 호출 시 만료됨 → None 반환
-        result = store.get("session-expired")
+        result = await store.get("session-expired")
         assert result is None
 
-    def test_store_get_returns_pending_before_ttl(self):
+    @pytest.mark.anyio
+    async def test_store_get_returns_pending_before_ttl(self):
         """TTL 이전에는 pending이 정상 반환."""
         store = PendingActionStore()
 
@@ -133,14 +135,15 @@ class TestPendingActionStoreTTL:
             pending_intent=Tier0Intent.EDUCATION_QA,
             expires_at=datetime.now(timezone.utc) + timedelta(seconds=300),  # 5분 후 만료
         )
-        store.set("session-valid", valid_pending)
+        await store.set("session-valid", valid_pending)
 
         # get() 호출 시 정상 반환
-        result = store.get("session-valid")
+        result = await store.get("session-valid")
         assert result is not None
         assert result.trace_id == "test-trace"
 
-    def test_store_ttl_deletes_expired_on_get(self):
+    @pytest.mark.anyio
+    async def test_store_ttl_deletes_expired_on_get(self):
         """만료된 pending은 get() 호출 시 삭제됨."""
         store = PendingActionStore()
 
@@ -150,13 +153,13 @@ class TestPendingActionStoreTTL:
             pending_intent=Tier0Intent.EDUCATION_QA,
             expires_at=datetime.now(timezone.utc) - timedelta(seconds=1),
         )
-        store.set("session-to-delete", expired_pending)
+        await store.set("session-to-delete", expired_pending)
 
         # get() 호출로 만료 확인 → 삭제됨
-        store.get("session-to-delete")
+        await store.get("session-to-delete")
 
         # 내부 저장소에서 삭제되었는지 확인
-        assert "session-to-delete" not in store._store
+        assert store._state.get("pending_action:session-to-delete") is None
 
 
 # =============================================================================
@@ -182,7 +185,7 @@ class TestClarifyFlowPendingCreation:
 
         # needs_clarify 확인
         if result.needs_user_response:
-            pending = store.get("session-001")
+            pending = await store.get("session-001")
             if pending and pending.action_type == PendingActionType.CLARIFY:
                 assert pending.original_query == "교육 알려줘"
 
@@ -199,7 +202,7 @@ class TestClarifyFlowPendingCreation:
         )
 
         if result.needs_user_response:
-            pending = store.get("session-002")
+            pending = await store.get("session-002")
             if pending and pending.action_type == PendingActionType.CLARIFY:
                 # clarify_group이 설정되어 있어야 함 (EDU 또는 UNKNOWN)
                 assert pending.clarify_group is not None
@@ -223,7 +226,7 @@ class TestClarifyFlowPendingCreation:
         after = datetime.now(timezone.utc)
 
         if result.needs_user_response:
-            pending = store.get("session-003")
+            pending = await store.get("session-003")
             if pending and pending.action_type == PendingActionType.CLARIFY:
                 assert pending.expires_at is not None
                 # expires_at은 now + TTL(300초) 범위 내
@@ -259,7 +262,7 @@ class TestClarifyAnswerHandler:
                 domain=RouterDomain.EDU,
             ),
         )
-        store.set("session-edu-001", pending)
+        await store.set("session-edu-001", pending)
 
         # "이수현황" 응답
         result = await orchestrator.route(
@@ -289,7 +292,7 @@ class TestClarifyAnswerHandler:
                 domain=RouterDomain.EDU,
             ),
         )
-        store.set("session-edu-002", pending)
+        await store.set("session-edu-002", pending)
 
         # "내용" 응답
         result = await orchestrator.route(
@@ -319,7 +322,7 @@ class TestClarifyAnswerHandler:
                 domain=RouterDomain.EDU,
             ),
         )
-        store.set("session-edu-003", pending)
+        await store.set("session-edu-003", pending)
 
         # "진도" 응답
         result = await orchestrator.route(
@@ -348,7 +351,7 @@ class TestClarifyAnswerHandler:
                 domain=RouterDomain.EDU,
             ),
         )
-        store.set("session-oneshot", pending)
+        await store.set("session-oneshot", pending)
 
         # 응답 처리
         await orchestrator.route(
@@ -357,7 +360,7 @@ class TestClarifyAnswerHandler:
         )
 
         # pending이 삭제되었는지 확인
-        assert store.get("session-oneshot") is None
+        assert await store.get("session-oneshot") is None
 
 
 # =============================================================================
@@ -384,7 +387,7 @@ class TestLongResponseHandling:
             clarify_group=ClarifyGroup.EDU,
             expires_at=datetime.now(timezone.utc) + timedelta(seconds=300),
         )
-        store.set("session-long", pending)
+        await store.set("session-long", pending)
 
         # 21자 이상의 긴 응답 (새 질문처럼 처리)
         long_response = "연차 휴가 규정이 어떻게 되는지 자세하게 알려주세요"  # 25자
@@ -400,7 +403,7 @@ class TestLongResponseHandling:
         # 원래 pending이 소비되었는지 확인:
         # - None이거나 (새 clarify 안 나온 경우)
         # - 새 pending으로 교체되었어야 함 (새 clarify 나온 경우)
-        current_pending = store.get("session-long")
+        current_pending = await store.get("session-long")
         if current_pending is not None:
             # 새 pending이면 원래 것과 달라야 함 (trace_id 또는 original_query)
             assert (
@@ -437,7 +440,7 @@ class TestCombinedQueryRouting:
             clarify_group=ClarifyGroup.EDU,
             expires_at=datetime.now(timezone.utc) + timedelta(seconds=300),
         )
-        store.set("session-unknown", pending)
+        await store.set("session-unknown", pending)
 
         # 알 수 없는 키워드 응답
         result = await orchestrator.route(
@@ -451,7 +454,7 @@ class TestCombinedQueryRouting:
         # 원래 pending이 소비되었는지 확인:
         # - None이거나 (새 clarify 안 나온 경우)
         # - 새 pending으로 교체되었어야 함 (새 clarify 나온 경우)
-        current_pending = store.get("session-unknown")
+        current_pending = await store.get("session-unknown")
         if current_pending is not None:
             # 새 pending이면 원래 것과 달라야 함 (trace_id 또는 original_query)
             assert (
@@ -476,11 +476,12 @@ class TestIntegration:
             SceneInfo(2, "테스트 나레이션 2"),
         ]
 
-        # TTS 생성
+        # TTS 생성 (씬 단위 합성 후 이어 붙임)
         await renderer._generate_tts(ctx)
 
-        assert mock_tts.synthesize_to_file.called
-        assert ctx.duration_sec == 10.0
+        assert mock_tts.synthesize_to_file.call_count == 2
+        assert ctx.duration_sec == 20.0
+        assert [s.duration_sec for s in ctx.scenes] == [10.0, 10.0]
 
     @pytest.mark.asyncio
     async def test_full_render_pipeline_mock(self, sample_script, temp_dir, mock_tts, mock_storage):
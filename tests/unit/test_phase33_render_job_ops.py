@@ -398,16 +398,17 @@ class TestWebSocketJobFilter:
 
         # Mock WebSockets
         ws1 = MagicMock()
+        ws1.accept = AsyncMock()
         ws1.send_json = AsyncMock()
         ws2 = MagicMock()
+        ws2.accept = AsyncMock()
         ws2.send_json = AsyncMock()
 
         # ws1은 job-001만 구독, ws2는 모든 이벤트 구독
-        manager._connections["video-001"] = {ws1, ws2}
-        manager._socket_videos[ws1] = {"video-001"}
-        manager._socket_videos[ws2] = {"video-001"}
-        manager._socket_job_filter[ws1] = "job-001"
-        manager._socket_job_filter[ws2] = None
+        await manager.connect(ws1, "video-001", job_id="job-001")
+        await manager.connect(ws2, "video-001")
+        ws1.send_json.reset_mock()
+        ws2.send_json.reset_mock()
 
         # job-001 이벤트 전송
         event1 = RenderProgressEvent(
@@ -419,6 +420,7 @@ class TestWebSocketJobFilter:
             timestamp=datetime.utcnow().isoformat(),
         )
         await manager.broadcast("video-001", event1)
+        await asyncio.sleep(0.01)  # 소켓별 전송 태스크
 
         # 둘 다 수신
         assert ws1.send_json.called
@@ -437,10 +439,12 @@ class TestWebSocketJobFilter:
             timestamp=datetime.utcnow().isoformat(),
         )
         await manager.broadcast("video-001", event2)
+        await asyncio.sleep(0.01)
 
         # ws1은 필터링되어 미수신, ws2는 수신
         assert not ws1.send_json.called
         assert ws2.send_json.called
+        manager.close()
 
     @pytest.mark.asyncio
     async def test_event_includes_job_id(self):
@@ -41,6 +41,13 @@ def mock_settings():
     settings.STORAGE_UPLOAD_RETRY_MAX = 3  # 최대 3회 재시도 (총 4번 시도)
     settings.STORAGE_UPLOAD_RETRY_BASE_SEC = 0.01  # 테스트용 짧은 대기시간
     settings.STORAGE_ETAG_OPTIONAL = False  # 기본: ETag 필수
+    # 스트리밍 / 멀티파트 설정
+    settings.STORAGE_UPLOAD_CHUNK_KB = 64
+    settings.STORAGE_MULTIPART_THRESHOLD_MB = 64
+    settings.STORAGE_MULTIPART_PART_MB = 16
+    settings.STORAGE_MULTIPART_CONCURRENCY = 4
+    settings.BACKEND_STORAGE_MULTIPART_PRESIGN_PATH = "/internal/storage/multipart/presign"
+    settings.BACKEND_STORAGE_MULTIPART_COMPLETE_PATH = "/internal/storage/multipart/complete"
     return settings
 
 
@@ -284,6 +284,67 @@ class TestImageAssetService:
         for path in paths:
             assert Path(path).exists()
 
+    def test_gradient_background_cached_and_matches_formula(self):
+        """그라데이션은 (크기, 색상)별 1회 생성, 행 색상은 수직 보간 공식과 동일."""
+        from app.services.image_asset_service import (
+            PILLOW_AVAILABLE,
+            ImageAssetService,
+            ImageConfig,
+        )
+
+        if not PILLOW_AVAILABLE:
+            pytest.skip("Pillow not installed")
+
+        config = ImageConfig(width=64, height=40)
+        service = ImageAssetService(config=config)
+
+        first = service._create_gradient_background()
+        first.putpixel((0, 0), (0, 0, 0))  # 호출자 수정이 캐시에 영향 없어야 함
+        second = service._create_gradient_background()
+
+        for y in (0, 13, 39):
+            ratio = y / config.height
+            expected = tuple(
+                int(s * (1 - ratio) + e * ratio)
+                for s, e in zip(config.background_color, config.gradient_end_color)
+            )
+            assert second.getpixel((0, y)) == expected
+            assert second.getpixel((63, y)) == expected
+
+    def test_font_cached_per_size(self):
+        """같은 크기 폰트는 같은 객체 재사용."""
+        from app.services.image_asset_service import PILLOW_AVAILABLE, ImageAssetService
+
+        if not PILLOW_AVAILABLE:
+            pytest.skip("Pillow not installed")
+
+        service = ImageAssetService()
+
+        assert service._get_font(36) is service._get_font(36)
+
+    @pytest.mark.asyncio
+    async def test_generate_all_scene_images_async_process_pool(self, temp_dir):
+        """프로세스 풀 병렬 생성 결과는 plans 순서."""
+        from app.services.image_asset_service import ImageAssetService, ImageConfig
+
+        service = ImageAssetService(
+            config=ImageConfig(width=320, height=180), render_workers=2
+        )
+        plans = [
+            VisualPlan(scene_id=i, title=f"Title {i}", body=f"Body {i}")
+            for i in range(3)
+        ]
+
+        try:
+            paths = await service.generate_all_scene_images_async(plans, temp_dir)
+        finally:
+            service.shutdown()
+
+        assert [Path(p).name for p in paths] == [
+            "scene_000.png", "scene_001.png", "scene_002.png"
+        ]
+        assert all(Path(p).exists() for p in paths)
+
     def test_singleton_instance(self):
         """싱글톤 인스턴스 테스트."""
         from app.services.image_asset_service import (
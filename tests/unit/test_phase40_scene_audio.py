@@ -432,6 +432,82 @@ class TestMockProviderIntegration:
             assert result.duration_sec > 0
 
 
+# =============================================================================
+# Test: Audio Timeline (단일 패스)
+# =============================================================================
+
+
+class TestAudioTimeline:
+    """generate_audio_timeline() 테스트."""
+
+    SCENES = [
+        {"scene_id": "scene-1", "narration": "첫 번째. 두 번째."},
+        {"scene_id": "scene-2", "narration": ""},
+        {"scene_id": "scene-3", "narration": "세 번째."},
+    ]
+
+    @pytest.fixture
+    def service(self):
+        provider = MagicMock()
+
+        async def mock_synth(text, language="ko"):
+            return MagicMock(audio_bytes=text.encode("utf-8"), duration_sec=1.0)
+
+        provider.synthesize = mock_synth
+        service = SceneAudioService(tts_provider=provider, silence_padding_sec=0.5)
+        service._has_ffmpeg = False
+        return service
+
+    @pytest.mark.asyncio
+    async def test_timeline_offsets_include_padding(self, service, tmp_path):
+        """씬 오프셋은 이전 씬 오디오 + 패딩 누적, 캡션/SRT 한 번에 생성."""
+        timeline = await service.generate_audio_timeline(self.SCENES, tmp_path)
+
+        assert [r.duration_sec for r in timeline.scene_results] == [2.5, 0.5, 1.5]
+        assert timeline.duration_sec == pytest.approx(4.5)
+        assert [(c.start, c.end) for c in timeline.captions] == [
+            (0.0, 1.0), (1.0, 2.0), (3.0, 4.0)
+        ]
+        assert timeline.get_srt().startswith("1\n00:00:00,000 --> 00:00:01,000\n첫 번째.")
+
+    @pytest.mark.asyncio
+    async def test_no_intermediate_scene_files(self, service, tmp_path):
+        """씬별 오디오 파일 없이 최종 트랙만 생성 (문장 + 패딩 순서)."""
+        timeline = await service.generate_audio_timeline(self.SCENES, tmp_path)
+
+        assert list(tmp_path.glob("*_audio.mp3")) == []
+        assert all(r.audio_path == "" for r in timeline.scene_results)
+        padding = (tmp_path / "_padding_silence.mp3").read_bytes()
+        assert Path(timeline.audio_path).read_bytes() == (
+            "첫 번째.".encode() + "두 번째.".encode() + padding
+            + padding
+            + "세 번째.".encode() + padding
+        )
+
+    @pytest.mark.asyncio
+    async def test_keep_scene_audio(self, service, tmp_path):
+        """부분 재렌더용으로 씬별 오디오 파일 유지 가능."""
+        timeline = await service.generate_audio_timeline(
+            self.SCENES, tmp_path, keep_scene_audio=True
+        )
+
+        assert Path(timeline.scene_results[0].audio_path).name == "scene-1_audio.mp3"
+        assert timeline.scene_results[1].audio_path == ""
+
+    @pytest.mark.asyncio
+    async def test_single_ffmpeg_invocation(self, service, tmp_path):
+        """FFmpeg 사용 시 전체 트랙은 concat 1회."""
+        service._has_ffmpeg = True
+        service._create_silence_audio = AsyncMock(return_value=tmp_path / "pad.mp3")
+        service._ffmpeg_concat = AsyncMock(return_value=True)
+
+        await service.generate_audio_timeline(self.SCENES, tmp_path)
+
+        service._ffmpeg_concat.assert_awaited_once()
+        entries = service._ffmpeg_concat.call_args.args[0]
+        assert len(entries) == 6  # 문장 3 + 씬 패딩 3
+
+
 # =============================================================================
 # Test: Edge Cases
 # =============================================================================
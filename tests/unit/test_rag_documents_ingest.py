@@ -37,7 +37,8 @@ from fastapi.testclient import TestClient
 
 from app.main import app
 from app.api.v1.rag_documents import (
-    _ingest_cache,
+    _cache_key,
+    _clear_ingest_cache,
     _mark_request_processing,
     _mark_request_completed,
     _get_cached_status,
@@ -61,6 +62,7 @@ from app.clients.ragflow_ingest_client import (
 from app.clients.backend_client import (
     RAGDocumentStatusUpdateError,
 )
+from app.core.state_store import get_state_store
 
 
 # =============================================================================
@@ -71,10 +73,10 @@ from app.clients.backend_client import (
 @pytest.fixture(autouse=True)
 def clear_cache():
     """테스트 전후 캐시 초기화."""
-    _ingest_cache.clear()
+    _clear_ingest_cache()
     clear_ragflow_ingest_client()
     yield
-    _ingest_cache.clear()
+    _clear_ingest_cache()
     clear_ragflow_ingest_client()
 
 
@@ -147,41 +149,46 @@ def sample_callback_request():
 class TestCacheHelpers:
     """캐시 헬퍼 함수 테스트."""
 
-    def test_mark_request_processing(self):
+    @pytest.mark.asyncio
+    async def test_mark_request_processing(self):
         """처리 중 상태 표시 테스트."""
-        _mark_request_processing("DOC-001", 1)
-        cached = _get_cached_status("DOC-001", 1)
+        await _mark_request_processing("DOC-001", 1)
+        cached = await _get_cached_status("DOC-001", 1)
         assert cached is not None
         assert cached["status"] == "PROCESSING"
 
-    def test_mark_request_completed(self):
+    @pytest.mark.asyncio
+    async def test_mark_request_completed(self):
         """완료 상태 표시 테스트."""
-        _mark_request_completed("DOC-001", 1, "COMPLETED")
-        cached = _get_cached_status("DOC-001", 1)
+        await _mark_request_completed("DOC-001", 1, "COMPLETED")
+        cached = await _get_cached_status("DOC-001", 1)
         assert cached is not None
         assert cached["status"] == "COMPLETED"
 
-    def test_mark_request_failed(self):
+    @pytest.mark.asyncio
+    async def test_mark_request_failed(self):
         """실패 상태 표시 테스트."""
-        _mark_request_completed("DOC-001", 1, "FAILED")
-        cached = _get_cached_status("DOC-001", 1)
+        await _mark_request_completed("DOC-001", 1, "FAILED")
+        cached = await _get_cached_status("DOC-001", 1)
         assert cached is not None
         assert cached["status"] == "FAILED"
 
-    def test_clear_request_cache(self):
+    @pytest.mark.asyncio
+    async def test_clear_request_cache(self):
         """캐시 삭제 테스트."""
-        _mark_request_processing("DOC-001", 1)
+        await _mark_request_processing("DOC-001", 1)
         _clear_request_cache("DOC-001", 1)
-        cached = _get_cached_status("DOC-001", 1)
+        cached = await _get_cached_status("DOC-001", 1)
         assert cached is None
 
-    def test_different_versions_separate_cache(self):
+    @pytest.mark.asyncio
+    async def test_different_versions_separate_cache(self):
         """다른 버전은 별도 캐시 테스트."""
-        _mark_request_processing("DOC-001", 1)
-        _mark_request_completed("DOC-001", 2, "COMPLETED")
+        await _mark_request_processing("DOC-001", 1)
+        await _mark_request_completed("DOC-001", 2, "COMPLETED")
 
-        cached_v1 = _get_cached_status("DOC-001", 1)
-        cached_v2 = _get_cached_status("DOC-001", 2)
+        cached_v1 = await _get_cached_status("DOC-001", 1)
+        cached_v2 = await _get_cached_status("DOC-001", 2)
 
         assert cached_v1["status"] == "PROCESSING"
         assert cached_v2["status"] == "COMPLETED"
@@ -213,41 +220,44 @@ class TestTwoTierTTLCache:
         assert ttl == 86400
         assert ttl == _CACHE_TTL_COMPLETED_SECONDS
 
-    def test_processing_expires_after_5_minutes(self):
+    @pytest.mark.asyncio
+    async def test_processing_expires_after_5_minutes(self):
         """PROCESSING 상태는 5분 후 만료."""
-        _mark_request_processing("DOC-TTL-001", 1)
+        await _mark_request_processing("DOC-TTL-001", 1)
 
         # 5분 전: 캐시 유효
         with patch("app.api.v1.rag_documents.time.time", return_value=time.time()):
-            cached = _get_cached_status("DOC-TTL-001", 1)
+            cached = await _get_cached_status("DOC-TTL-001", 1)
             assert cached is not None
 
         # 5분 후: 캐시 만료
         with patch("app.api.v1.rag_documents.time.time", return_value=time.time() + 301):
-            cached = _get_cached_status("DOC-TTL-001", 1)
+            cached = await _get_cached_status("DOC-TTL-001", 1)
             assert cached is None
 
-    def test_completed_persists_for_24_hours(self):
+    @pytest.mark.asyncio
+    async def test_completed_persists_for_24_hours(self):
         """COMPLETED 상태는 24시간 동안 유지."""
-        _mark_request_completed("DOC-TTL-002", 1, "COMPLETED")
+        await _mark_request_completed("DOC-TTL-002", 1, "COMPLETED")
 
         # 23시간 후: 캐시 유효
         with patch("app.api.v1.rag_documents.time.time", return_value=time.time() + 82800):
-            cached = _get_cached_status("DOC-TTL-002", 1)
+            cached = await _get_cached_status("DOC-TTL-002", 1)
             assert cached is not None
             assert cached["status"] == "COMPLETED"
 
         # 24시간 후: 캐시 만료
         with patch("app.api.v1.rag_documents.time.time", return_value=time.time() + 86401):
-            cached = _get_cached_status("DOC-TTL-002", 1)
+            cached = await _get_cached_status("DOC-TTL-002", 1)
             assert cached is None
 
-    def test_cache_stats(self):
+    @pytest.mark.asyncio
+    async def test_cache_stats(self):
         """캐시 통계 테스트."""
-        _mark_request_processing("DOC-STATS-001", 1)
-        _mark_request_processing("DOC-STATS-002", 1)
-        _mark_request_completed("DOC-STATS-003", 1, "COMPLETED")
-        _mark_request_completed("DOC-STATS-004", 1, "FAILED")
+        await _mark_request_processing("DOC-STATS-001", 1)
+        await _mark_request_processing("DOC-STATS-002", 1)
+        await _mark_request_completed("DOC-STATS-003", 1, "COMPLETED")
+        await _mark_request_completed("DOC-STATS-004", 1, "FAILED")
 
         stats = _get_cache_stats()
 
@@ -269,54 +279,70 @@ class TestLRUCacheSizeLimit:
         """최대 캐시 크기 상수 확인."""
         assert _CACHE_MAX_SIZE == 10000
 
-    def test_enforce_cache_size_limit_removes_oldest(self):
+    @pytest.mark.asyncio
+    async def test_enforce_cache_size_limit_removes_oldest(self):
         """캐시 크기 제한 시 가장 오래된 항목 삭제."""
         # 캐시 초기화
-        _ingest_cache.clear()
+        _clear_ingest_cache()
+        store = get_state_store()
 
         # 시간 순서대로 캐시 추가
         base_time = time.time()
         for i in range(5):
-            _ingest_cache[(f"DOC-LRU-{i}", 1)] = {
+            store.set(_cache_key(f"DOC-LRU-{i}", 1), {
                 "timestamp": base_time + i,
                 "status": "PROCESSING",
-            }
+            })
 
-        assert len(_ingest_cache) == 5
+        assert _get_cache_stats()["total"] == 5
 
         # 최대 크기를 3으로 임시 설정하여 테스트
         with patch("app.api.v1.rag_documents._CACHE_MAX_SIZE", 3):
             _enforce_cache_size_limit()
 
         # 가장 오래된 2개 삭제됨
-        assert len(_ingest_cache) == 3
-        assert ("DOC-LRU-0", 1) not in _ingest_cache
-        assert ("DOC-LRU-1", 1) not in _ingest_cache
-        assert ("DOC-LRU-2", 1) in _ingest_cache
-        assert ("DOC-LRU-3", 1) in _ingest_cache
-        assert ("DOC-LRU-4", 1) in _ingest_cache
+        assert _get_cache_stats()["total"] == 3
+        assert await _get_cached_status("DOC-LRU-0", 1) is None
+        assert await _get_cached_status("DOC-LRU-1", 1) is None
+        assert await _get_cached_status("DOC-LRU-2", 1) is not None
+        assert await _get_cached_status("DOC-LRU-3", 1) is not None
+        assert await _get_cached_status("DOC-LRU-4", 1) is not None
 
-    def test_mark_processing_enforces_size_limit(self):
-        """_mark_request_processing이 크기 제한을 적용."""
-        _ingest_cache.clear()
+    @pytest.mark.asyncio
+    async def test_mark_processing_enforces_size_limit(self):
+        """_mark_request_processing이 크기 제한을 적용 (점검 주기 0 = 매번)."""
+        _clear_ingest_cache()
 
         # 최대 크기를 2로 임시 설정
-        with patch("app.api.v1.rag_documents._CACHE_MAX_SIZE", 2):
+        with patch("app.api.v1.rag_documents._CACHE_MAX_SIZE", 2), \
+                patch("app.api.v1.rag_documents._CACHE_SWEEP_INTERVAL_SECONDS", 0):
             base_time = time.time()
 
             # 시간차를 두고 캐시 추가
             with patch("app.api.v1.rag_documents.time.time", return_value=base_time):
-                _mark_request_processing("DOC-SIZE-1", 1)
+                await _mark_request_processing("DOC-SIZE-1", 1)
 
             with patch("app.api.v1.rag_documents.time.time", return_value=base_time + 1):
-                _mark_request_processing("DOC-SIZE-2", 1)
+                await _mark_request_processing("DOC-SIZE-2", 1)
 
             with patch("app.api.v1.rag_documents.time.time", return_value=base_time + 2):
-                _mark_request_processing("DOC-SIZE-3", 1)
+                await _mark_request_processing("DOC-SIZE-3", 1)
 
             # 최대 2개만 유지 (가장 오래된 1개 삭제)
-            assert len(_ingest_cache) == 2
-            assert ("DOC-SIZE-1", 1) not in _ingest_cache
+            assert _get_cache_stats()["total"] == 2
+            assert await _get_cached_status("DOC-SIZE-1", 1) is None
+
+    @pytest.mark.asyncio
+    async def test_size_limit_scan_runs_once_per_interval(self):
+        """점검 주기 안에서는 ingest마다 prefix 전체를 조회하지 않음."""
+        _clear_ingest_cache()
+
+        with patch("app.api.v1.rag_documents._last_cache_sweep", 0.0), \
+                patch("app.api.v1.rag_documents._enforce_cache_size_limit") as enforce:
+            for i in range(5):
+                await _mark_request_processing(f"DOC-SWEEP-{i}", 1)
+
+        assert enforce.call_count == 1
 
 
 # =============================================================================
@@ -364,10 +390,11 @@ class TestIngestEndpointNoToken:
             assert data["documentId"] == "POL-TEST-001"
             assert data["version"] == 1
 
-    def test_ingest_duplicate_processing_202(self, client, sample_ingest_request):
+    @pytest.mark.asyncio
+    async def test_ingest_duplicate_processing_202(self, client, sample_ingest_request):
         """중복 요청 (처리 중) - 202 반환."""
         # 캐시에 처리 중으로 표시
-        _mark_request_processing("POL-TEST-001", 1)
+        await _mark_request_processing("POL-TEST-001", 1)
 
         with patch("app.api.v1.rag_documents.get_settings") as mock_get_settings:
             mock_get_settings.return_value.BACKEND_INTERNAL_TOKEN = None
@@ -381,10 +408,11 @@ class TestIngestEndpointNoToken:
             data = response.json()
             assert data["status"] == "PROCESSING"
 
-    def test_ingest_duplicate_completed_200(self, client, sample_ingest_request):
+    @pytest.mark.asyncio
+    async def test_ingest_duplicate_completed_200(self, client, sample_ingest_request):
         """중복 요청 (이미 완료) - 200 반환."""
         # 캐시에 완료로 표시
-        _mark_request_completed("POL-TEST-001", 1, "COMPLETED")
+        await _mark_request_completed("POL-TEST-001", 1, "COMPLETED")
 
         with patch("app.api.v1.rag_documents.get_settings") as mock_get_settings:
             mock_get_settings.return_value.BACKEND_INTERNAL_TOKEN = None
@@ -416,10 +444,11 @@ class TestIngestEndpointNoToken:
             assert "EDUCATION" in data["message"]
             assert data["traceId"] == "trace-001"
 
-    def test_ingest_new_version_separate(self, client, sample_ingest_request):
+    @pytest.mark.asyncio
+    async def test_ingest_new_version_separate(self, client, sample_ingest_request):
         """새 버전은 별도 처리."""
         # 버전 1 완료
-        _mark_request_completed("POL-TEST-001", 1, "COMPLETED")
+        await _mark_request_completed("POL-TEST-001", 1, "COMPLETED")
 
         # 버전 2 요청
         sample_ingest_request["version"] = 2
@@ -517,10 +546,11 @@ class TestCallbackEndpoint:
             data = response.json()
             assert data["received"] is True
 
-    def test_callback_updates_cache_to_completed(self, client, sample_callback_request):
+    @pytest.mark.asyncio
+    async def test_callback_updates_cache_to_completed(self, client, sample_callback_request):
         """콜백 수신 시 캐시 상태 COMPLETED로 업데이트."""
         # 초기 상태: 처리 중
-        _mark_request_processing("POL-TEST-001", 1)
+        await _mark_request_processing("POL-TEST-001", 1)
 
         with patch("app.api.v1.rag_documents.get_settings") as mock_get_settings, \
              patch("app.api.v1.rag_documents.get_backend_client") as mock_client:
@@ -535,11 +565,12 @@ class TestCallbackEndpoint:
             assert response.status_code == 200
 
             # 캐시 상태 확인
-            cached = _get_cached_status("POL-TEST-001", 1)
+            cached = await _get_cached_status("POL-TEST-001", 1)
             assert cached is not None
             assert cached["status"] == "COMPLETED"
 
-    def test_callback_updates_cache_to_failed(self, client, sample_callback_request):
+    @pytest.mark.asyncio
+    async def test_callback_updates_cache_to_failed(self, client, sample_callback_request):
         """콜백 수신 시 캐시 상태 FAILED로 업데이트."""
         sample_callback_request["status"] = "FAILED"
         sample_callback_request["failReason"] = "Parsing error"
@@ -557,7 +588,7 @@ class TestCallbackEndpoint:
             assert response.status_code == 200
 
             # 캐시 상태 확인
-            cached = _get_cached_status("POL-TEST-001", 1)
+            cached = await _get_cached_status("POL-TEST-001", 1)
             assert cached["status"] == "FAILED"
 
     def test_callback_calls_backend_client(self, client, sample_callback_request):
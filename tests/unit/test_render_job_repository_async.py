@@ -0,0 +1,137 @@
+"""
+렌더 잡 저장소 async 파사드 테스트 (AsyncRenderJobRepository)
+
+테스트 목표:
+1. WAL 모드로 연결
+2. 진행률 쓰기는 interval당 최대 1회, 마지막 값으로 병합
+3. 종료 상태를 지연 flush된 진행률이 덮어쓰지 않음
+4. 파이프라인 취소 확인은 DB 조회 없이 메모리 플래그 사용
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.video_render import RenderedAssets
+from app.repositories.render_job_repository import (
+    AsyncRenderJobRepository,
+    RenderJobEntity,
+    RenderJobRepository,
+)
+from app.services.render_job_runner import RenderJobRunner
+
+
+@pytest.fixture
+def repository(tmp_path):
+    repo = RenderJobRepository(db_path=str(tmp_path / "jobs.db"))
+    repo.save(RenderJobEntity("job-1", "video-1", "script-1", status="PROCESSING"))
+    yield repo
+    repo.close()
+
+
+def test_wal_mode(repository):
+    """연결은 WAL journal mode."""
+    mode = repository._get_connection().execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode.lower() == "wal"
+
+
+class TestProgressCoalescing:
+    """진행률 쓰기 병합 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_progress_coalesced_within_interval(self, repository):
+        """첫 쓰기는 즉시, interval 내 후속 쓰기는 마지막 값만 flush 시 기록."""
+        db = AsyncRenderJobRepository(repository, progress_interval_sec=60.0)
+
+        with patch.object(repository, "update_progress", wraps=repository.update_progress) as write:
+            await db.update_progress("job-1", step="GENERATE_TTS", progress=5)
+            await db.update_progress("job-1", step="GENERATE_SUBTITLE", progress=30)
+            await db.update_progress("job-1", step="RENDER_SLIDES", progress=40)
+
+            assert write.call_count == 1
+            assert (await db.get("job-1")).step == "GENERATE_TTS"
+
+            await db.flush_progress("job-1")
+
+            assert write.call_count == 2
+            job = await db.get("job-1")
+            assert (job.step, job.progress) == ("RENDER_SLIDES", 40)
+
+        await db.close()
+
+    @pytest.mark.asyncio
+    async def test_status_change_discards_pending_progress(self, repository):
+        """COMPLETED 전환 후에는 대기 중이던 진행률이 기록되지 않음."""
+        db = AsyncRenderJobRepository(repository, progress_interval_sec=60.0)
+
+        await db.update_progress("job-1", step="GENERATE_TTS", progress=5)
+        await db.update_progress("job-1", step="COMPOSE_VIDEO", progress=55)
+        await db.update_status("job-1", "COMPLETED", step="FINALIZE", progress=100)
+        await db.flush_progress()
+
+        assert repository.update_progress("job-1", progress=1) is False
+        job = await db.get("job-1")
+        assert (job.status, job.progress) == ("COMPLETED", 100)
+        await db.close()
+
+    @pytest.mark.asyncio
+    async def test_error_keeps_failed_step(self, repository):
+        """update_error는 대기 중인 진행률을 먼저 기록해 실패 단계를 남김."""
+        db = AsyncRenderJobRepository(repository, progress_interval_sec=60.0)
+
+        await db.update_progress("job-1", step="GENERATE_TTS", progress=5)
+        await db.update_progress("job-1", step="COMPOSE_VIDEO", progress=55)
+        await db.update_error("job-1", "RuntimeError", "boom")
+
+        job = await db.get("job-1")
+        assert (job.status, job.step) == ("FAILED", "COMPOSE_VIDEO")
+        await db.close()
+
+
+    @pytest.mark.asyncio
+    async def test_default_interval_from_settings(self, repository, monkeypatch):
+        """interval 미지정 시 RENDER_PROGRESS_FLUSH_INTERVAL_SEC 설정 사용."""
+        from app.core.config import get_settings
+
+        monkeypatch.setattr(get_settings(), "RENDER_PROGRESS_FLUSH_INTERVAL_SEC", 7.5)
+        db = AsyncRenderJobRepository(repository)
+
+        assert db._progress_interval == 7.5
+        await db.close()
+
+
+class TestCancelFlag:
+    """메모리 취소 플래그 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_pipeline_stops_without_db_polling(self, repository, tmp_path):
+        """단계 사이 취소 확인은 저장소 get을 호출하지 않음."""
+        repository.save(RenderJobEntity(
+            "job-2", "video-2", "script-2", status="QUEUED",
+            render_spec_json={"script_id": "script-2", "video_id": "video-2", "scenes": []},
+        ))
+
+        runner = RenderJobRunner(
+            renderer=MagicMock(),
+            repository=repository,
+            script_client=AsyncMock(),
+            output_dir=str(tmp_path / "out"),
+        )
+
+        async def execute_step(step, raw_json, job_id):
+            runner._canceled_jobs.add(job_id)
+
+        runner._renderer.execute_step = AsyncMock(side_effect=execute_step)
+        runner._renderer.get_rendered_assets = AsyncMock(return_value=RenderedAssets(
+            mp4_path="v.mp4", thumbnail_path="t.jpg", subtitle_path="s.srt", duration_sec=1.0,
+        ))
+
+        with patch.object(repository, "get", wraps=repository.get) as get, patch(
+            "app.services.render_job_runner.notify_render_progress", new=AsyncMock()
+        ):
+            await runner._execute_job_with_spec("job-2")
+
+        assert runner._renderer.execute_step.await_count == 1
+        assert get.call_count == 1
+        assert "job-2" not in runner._canceled_jobs
+        await runner.shutdown()
@@ -0,0 +1,145 @@
+"""
+렌더 단계별 측정 테스트 (RenderProfiler / render_metrics)
+
+테스트 목표:
+1. 단계별 wall 시간/자식 프로세스 수/최대 RSS 측정, 같은 단계는 누적
+2. render_metrics는 저장소에 저장되고 기존 DB에는 컬럼이 추가됨
+3. 렌더 잡 실행 후 단계별 측정값이 잡에 기록됨
+"""
+
+import sqlite3
+import subprocess
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.video_render import RenderedAssets
+from app.repositories.render_job_repository import RenderJobEntity, RenderJobRepository
+from app.services.render_job_runner import RenderJobRunner
+from app.services.render_profiler import RenderProfiler
+
+
+class TestRenderProfiler:
+    """RenderProfiler 단위 테스트."""
+
+    def test_stage_counts_subprocesses(self):
+        """단계 안에서 시작한 자식 프로세스만 해당 단계에 집계."""
+        profiler = RenderProfiler()
+
+        with profiler.stage("COMPOSE_VIDEO"):
+            subprocess.run([sys.executable, "-c", "pass"], check=True)
+        with profiler.stage("FINALIZE"):
+            pass
+
+        metrics = profiler.to_dict()
+        assert list(metrics["stages"]) == ["COMPOSE_VIDEO", "FINALIZE"]
+        assert metrics["stages"]["COMPOSE_VIDEO"]["subprocess_count"] == 1
+        assert metrics["stages"]["FINALIZE"]["subprocess_count"] == 0
+        assert metrics["subprocess_count"] == 1
+        assert metrics["peak_rss_mb"] > 0
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="/proc RSS 샘플링")
+    def test_peak_rss_measured_per_stage(self):
+        """최대 RSS는 단계 중 샘플링 값이라 앞 단계의 최대치를 물려받지 않음."""
+        profiler = RenderProfiler()
+
+        with profiler.stage("RENDER_SLIDES"):
+            buffer = bytearray(200 * 1024 * 1024)
+            buffer[::4096] = b"x" * len(buffer[::4096])
+            del buffer
+        with profiler.stage("FINALIZE"):
+            pass
+
+        stages = profiler.stages
+        assert stages["RENDER_SLIDES"].peak_rss_mb - stages["FINALIZE"].peak_rss_mb > 150
+
+    def test_repeated_stage_accumulates_and_survives_errors(self):
+        """같은 단계를 다시 실행하면 누적, 예외로 끝나도 기록."""
+        profiler = RenderProfiler()
+
+        with profiler.stage("GENERATE_TTS"):
+            pass
+        with pytest.raises(RuntimeError):
+            with profiler.stage("GENERATE_TTS"):
+                subprocess.run([sys.executable, "-c", "pass"], check=True)
+                raise RuntimeError("boom")
+
+        assert list(profiler.stages) == ["GENERATE_TTS"]
+        assert profiler.stages["GENERATE_TTS"].subprocess_count == 1
+        assert profiler.to_dict()["total_wall_sec"] >= 0
+        assert "GENERATE_TTS" in profiler.format_table()
+
+
+class TestRenderMetricsStorage:
+    """render_metrics 저장 테스트."""
+
+    def test_update_metrics_round_trip(self, tmp_path):
+        """저장한 측정값은 조회/to_dict에 포함."""
+        repo = RenderJobRepository(db_path=str(tmp_path / "jobs.db"))
+        repo.save(RenderJobEntity("job-1", "video-1", "script-1"))
+        metrics = {"stages": {"FINALIZE": {"wall_sec": 0.1}}, "total_wall_sec": 0.1}
+
+        assert repo.update_metrics("job-1", metrics) is True
+
+        job = repo.get("job-1")
+        assert job.render_metrics == metrics
+        assert job.to_dict()["render_metrics"] == metrics
+        repo.close()
+
+    def test_existing_db_migrated(self, tmp_path):
+        """render_metrics 컬럼이 없는 기존 DB에 컬럼 추가."""
+        db_path = tmp_path / "jobs.db"
+        repo = RenderJobRepository(db_path=str(db_path))
+        repo.save(RenderJobEntity("job-1", "video-1", "script-1"))
+        repo.close()
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("ALTER TABLE render_jobs DROP COLUMN render_metrics")
+        conn.commit()
+        conn.close()
+
+        repo = RenderJobRepository(db_path=str(db_path))
+        assert repo.get("job-1").render_metrics is None
+        assert repo.update_metrics("job-1", {"total_wall_sec": 1.0}) is True
+        repo.close()
+
+
+class TestRunnerMetrics:
+    """렌더 잡 실행 측정 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_saved_after_execution(self, tmp_path):
+        """실행한 단계별 측정값이 잡에 저장."""
+        repository = RenderJobRepository(db_path=str(tmp_path / "jobs.db"))
+        repository.save(RenderJobEntity(
+            "job-1", "video-1", "script-1", status="QUEUED",
+            render_spec_json={"script_id": "script-1", "video_id": "video-1", "scenes": []},
+        ))
+        runner = RenderJobRunner(
+            renderer=MagicMock(),
+            repository=repository,
+            script_client=AsyncMock(),
+            output_dir=str(tmp_path / "out"),
+        )
+        runner._renderer.execute_step = AsyncMock()
+        runner._renderer.get_rendered_assets = AsyncMock(return_value=RenderedAssets(
+            mp4_path="v.mp4", thumbnail_path="t.jpg", subtitle_path="s.srt", duration_sec=1.0,
+        ))
+
+        with patch("app.services.render_job_runner.notify_render_progress", new=AsyncMock()):
+            await runner._execute_job_with_spec("job-1")
+        await runner.shutdown()
+
+        metrics = repository.get("job-1").render_metrics
+        assert list(metrics["stages"]) == [
+            "VALIDATE_SCRIPT",
+            "GENERATE_TTS",
+            "GENERATE_SUBTITLE",
+            "RENDER_SLIDES",
+            "COMPOSE_VIDEO",
+            "UPLOAD_ASSETS",
+            "FINALIZE",
+        ]
+        assert set(metrics) >= {"total_wall_sec", "total_cpu_sec", "bytes_written", "peak_rss_mb"}
+        repository.close()
@@ -0,0 +1,160 @@
+"""
+렌더 진행률 전달 테스트 (RenderProgressBus / 소켓별 전송 대기열)
+
+테스트 목표:
+1. 느린 소켓은 다른 소켓의 전송을 막지 않음 (소켓별 동시 전송)
+2. 느린 소켓에 밀린 이벤트는 잡별 최신 것만 남음 (병합)
+3. 전송 제한 시간을 넘긴 소켓은 연결 종료
+4. 다른 워커(같은 SQLite 저장소)에서 발행한 이벤트도 전달
+5. 늦게 연결한 클라이언트는 잡별 최신 이벤트를 조회
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.api.v1.ws_render_progress import (
+    RenderProgressBus,
+    RenderProgressConnectionManager,
+    RenderProgressEvent,
+)
+from app.core.state_store import InMemoryStateStore, SQLiteStateStore
+from app.models.video_render import RenderJobStatus, RenderStep
+
+
+def _make_socket(send_delay: float = 0.0) -> MagicMock:
+    """전송마다 send_delay만큼 걸리는 mock WebSocket."""
+    websocket = MagicMock()
+    websocket.accept = AsyncMock()
+    websocket.close = AsyncMock()
+    websocket.sent = []
+
+    async def send_json(data):
+        if send_delay:
+            await asyncio.sleep(send_delay)
+        websocket.sent.append(data)
+
+    websocket.send_json = AsyncMock(side_effect=send_json)
+    return websocket
+
+
+def _event(progress: int, job_id: str = "job-1", video_id: str = "video-1") -> RenderProgressEvent:
+    return RenderProgressEvent.create(
+        job_id=job_id,
+        video_id=video_id,
+        status=RenderJobStatus.PROCESSING,
+        step=RenderStep.GENERATE_TTS,
+        progress=progress,
+        message="TTS 생성 중",
+    )
+
+
+def _progress_of(websocket) -> list:
+    return [m["progress"] for m in websocket.sent if m.get("type") != "connected"]
+
+
+class TestSocketSendQueue:
+    """소켓별 전송 대기열 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_slow_socket_does_not_block_and_is_coalesced(self):
+        """빠른 소켓은 모든 이벤트, 느린 소켓은 병합된 최신 이벤트 수신."""
+        manager = RenderProgressConnectionManager(max_pending=16, send_timeout_sec=5.0)
+        fast = _make_socket()
+        slow = _make_socket(send_delay=0.05)
+        await manager.connect(fast, "video-1")
+        await manager.connect(slow, "video-1")
+
+        for progress in range(10, 60, 10):
+            await manager.broadcast("video-1", _event(progress))
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.2)
+
+        assert _progress_of(fast) == [10, 20, 30, 40, 50]
+        assert _progress_of(slow)[0] == 10
+        assert _progress_of(slow)[-1] == 50
+        assert len(_progress_of(slow)) < 5
+        assert manager.get_stats()["coalesced"] > 0
+        manager.close()
+
+    @pytest.mark.asyncio
+    async def test_send_timeout_drops_socket(self):
+        """제한 시간 안에 전송하지 못한 소켓은 닫고 제거."""
+        manager = RenderProgressConnectionManager(max_pending=16, send_timeout_sec=0.05)
+        stuck = _make_socket(send_delay=1.0)
+        healthy = _make_socket()
+        await manager.connect(stuck, "video-1")
+        await manager.connect(healthy, "video-1")
+
+        await manager.broadcast("video-1", _event(10))
+        await asyncio.sleep(0.15)
+
+        stuck.close.assert_awaited_once_with(code=1013)
+        assert manager.get_connection_count("video-1") == 1
+        assert manager.get_stats()["dropped"] == 1
+        assert _progress_of(healthy) == [10]
+        manager.close()
+
+    @pytest.mark.asyncio
+    async def test_pending_limit_drops_socket(self):
+        """대기 중인 잡 수가 상한을 넘으면 연결 종료."""
+        manager = RenderProgressConnectionManager(max_pending=2, send_timeout_sec=5.0)
+        slow = _make_socket(send_delay=0.5)
+        await manager.connect(slow, "video-1")
+
+        for index in range(4):
+            await manager.broadcast("video-1", _event(10, job_id=f"job-{index}"))
+
+        assert manager.get_connection_count("video-1") == 0
+        manager.close()
+
+
+class TestRenderProgressBus:
+    """진행률 버스 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_event_from_other_worker_delivered(self, tmp_path):
+        """다른 워커가 발행한 이벤트를 이 워커의 소켓에 전달."""
+        path = str(tmp_path / "state.db")
+        worker_a = SQLiteStateStore(path, poll_interval_sec=0.01)
+        worker_b = SQLiteStateStore(path, poll_interval_sec=0.01)
+        manager_b = RenderProgressConnectionManager()
+        bus_a = RenderProgressBus(RenderProgressConnectionManager(), state_store=worker_a)
+        bus_b = RenderProgressBus(manager_b, state_store=worker_b)
+        try:
+            websocket = _make_socket()
+            bus_b.ensure_subscribed()
+            await manager_b.connect(websocket, "video-1")
+
+            await bus_a.publish(_event(40))
+            for _ in range(100):
+                if _progress_of(websocket):
+                    break
+                await asyncio.sleep(0.02)
+
+            assert _progress_of(websocket) == [40]
+        finally:
+            bus_a.close()
+            bus_b.close()
+            manager_b.close()
+            worker_a.close()
+            worker_b.close()
+
+    @pytest.mark.asyncio
+    async def test_latest_event_per_job_for_late_joiner(self):
+        """잡별 최신 이벤트만 보관, job_id로 필터링."""
+        bus = RenderProgressBus(RenderProgressConnectionManager(), state_store=InMemoryStateStore())
+
+        await bus.publish(_event(10, job_id="job-1"))
+        await bus.publish(_event(30, job_id="job-1"))
+        await bus.publish(_event(20, job_id="job-2"))
+        await bus.publish(_event(90, job_id="job-3", video_id="video-2"))
+
+        latest = await bus.latest_events("video-1")
+        assert sorted((e["job_id"], e["progress"]) for e in latest) == [
+            ("job-1", 30),
+            ("job-2", 20),
+        ]
+        assert [e["progress"] for e in await bus.latest_events("video-1", "job-1")] == [30]
+        bus.close()
@@ -0,0 +1,288 @@
+"""
+렌더 잡 스케줄러 테스트 (app/services/render_scheduler.py)
+
+테스트 목표:
+1. 동시 실행 수 제한 (max_workers 초과분은 대기)
+2. 생성자별 라운드로빈 (한 생성자가 큐를 독점하지 않음)
+3. 대기 순번 조회 / WebSocket queue_position 전송
+4. 대기 중 취소 시 대기열에서 제거
+5. 재시작 후 QUEUED/PROCESSING 잡 재개 (멀티 워커에서는 lease를 선점한 워커만)
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.state_store import SQLiteStateStore
+from app.repositories.render_job_repository import RenderJobEntity, RenderJobRepository
+from app.services.render_job_runner import RenderJobRunner
+from app.services.render_scheduler import RenderScheduler
+
+
+def _blocking_job(started: list, job_id: str, gate: asyncio.Event):
+    async def run():
+        started.append(job_id)
+        await gate.wait()
+
+    return run
+
+
+async def _drain(times: int = 5) -> None:
+    for _ in range(times):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture(autouse=True)
+def mute_progress():
+    """진행률 브로드캐스트는 호출 인자만 기록."""
+    with patch(
+        "app.services.render_scheduler.notify_render_progress", new=AsyncMock()
+    ) as notify:
+        yield notify
+
+
+class TestRenderScheduler:
+    """워커 풀 / 공정 분배 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limited(self):
+        """max_workers개만 동시에 실행되고 나머지는 대기."""
+        scheduler = RenderScheduler(max_workers=2)
+        started: list = []
+        gate = asyncio.Event()
+
+        for i in range(5):
+            await scheduler.enqueue(f"job-{i}", "video", f"user-{i}", _blocking_job(started, f"job-{i}", gate))
+        await _drain()
+
+        assert len(started) == 2
+        assert scheduler.stats()["queued"] == 3
+
+        gate.set()
+        await _drain(20)
+
+        assert len(started) == 5
+        assert scheduler.stats() == {"max_workers": 2, "running": 0, "queued": 0, "owners": 0}
+        await scheduler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_round_robin_per_owner(self):
+        """A가 먼저 3개를 넣어도 B의 잡이 A의 두 번째 잡보다 먼저 실행."""
+        scheduler = RenderScheduler(max_workers=1)
+        started: list = []
+        gate = asyncio.Event()
+
+        await scheduler.enqueue("blocker", "video", "x", _blocking_job(started, "blocker", gate))
+        await _drain()
+        for job_id, owner in [("a1", "A"), ("a2", "A"), ("a3", "A"), ("b1", "B")]:
+            await scheduler.enqueue(job_id, "video", owner, _blocking_job(started, job_id, gate))
+
+        assert [scheduler.get_queue_position(j) for j in ("a1", "b1", "a2", "a3")] == [1, 2, 3, 4]
+
+        gate.set()
+        await _drain(20)
+
+        assert started == ["blocker", "a1", "b1", "a2", "a3"]
+        await scheduler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_queue_position_broadcast(self, mute_progress):
+        """대기 잡에는 queue_position이 포함된 QUEUED 이벤트 전송."""
+        scheduler = RenderScheduler(max_workers=1)
+        gate = asyncio.Event()
+
+        await scheduler.enqueue("job-1", "video-1", "u", _blocking_job([], "job-1", gate))
+        await _drain()
+        await scheduler.enqueue("job-2", "video-2", "u", _blocking_job([], "job-2", gate))
+
+        kwargs = mute_progress.call_args.kwargs
+        assert kwargs["job_id"] == "job-2"
+        assert kwargs["video_id"] == "video-2"
+        assert kwargs["queue_position"] == 1
+        await scheduler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancel_queued_job(self):
+        """대기 중인 잡은 실행되지 않고 뒤 순번이 당겨짐."""
+        scheduler = RenderScheduler(max_workers=1)
+        started: list = []
+        gate = asyncio.Event()
+
+        for job_id in ("job-1", "job-2", "job-3"):
+            await scheduler.enqueue(job_id, "video", "u", _blocking_job(started, job_id, gate))
+            await _drain()
+
+        assert await scheduler.cancel("job-2") is True
+        assert scheduler.get_queue_position("job-3") == 1
+
+        gate.set()
+        await _drain(20)
+
+        assert started == ["job-1", "job-3"]
+        assert await scheduler.cancel("job-2") is False
+        await scheduler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_job_keeps_worker(self):
+        """실행 중인 잡을 취소해도 워커는 다음 잡을 처리."""
+        scheduler = RenderScheduler(max_workers=1)
+        started: list = []
+        gate = asyncio.Event()
+
+        await scheduler.enqueue("job-1", "video", "u", _blocking_job(started, "job-1", gate))
+        await _drain()
+        await scheduler.enqueue("job-2", "video", "u", _blocking_job(started, "job-2", asyncio.Event()))
+
+        assert await scheduler.cancel("job-1") is True
+        await _drain()
+
+        assert started == ["job-1", "job-2"]
+        assert scheduler.is_running("job-2")
+        await scheduler.shutdown()
+
+
+class TestResumePendingJobs:
+    """재시작 후 잡 재개 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_resume_pending_jobs(self, tmp_path):
+        """스냅샷 있는 QUEUED/PROCESSING 잡은 재실행, 스냅샷 없는 잡은 정책대로 처리."""
+        repository = RenderJobRepository(db_path=str(tmp_path / "jobs.db"))
+        spec = {"script_id": "s", "video_id": "v", "scenes": []}
+        repository.save(RenderJobEntity("job-q", "v1", "s", status="QUEUED", render_spec_json=spec))
+        repository.save(RenderJobEntity("job-p", "v2", "s", status="PROCESSING", step="COMPOSE_VIDEO", progress=60, render_spec_json=spec))
+        repository.save(RenderJobEntity("job-wait", "v3", "s", status="QUEUED", created_by="user-1"))
+        repository.save(RenderJobEntity("job-lost", "v4", "s", status="PROCESSING", created_by="user"))
+        repository.save(RenderJobEntity("job-done", "v5", "s", status="COMPLETED", render_spec_json=spec))
+
+        runner = RenderJobRunner(
+            renderer=MagicMock(),
+            repository=repository,
+            script_client=AsyncMock(),
+            output_dir=str(tmp_path / "out"),
+            scheduler=RenderScheduler(max_workers=1),
+        )
+        runner._execute_job_with_spec = AsyncMock()
+
+        resumed = await runner.resume_pending_jobs()
+        await _drain(10)
+
+        assert resumed == 2
+        executed = sorted(c.args[0] for c in runner._execute_job_with_spec.call_args_list)
+        assert executed == ["job-p", "job-q"]
+
+        reset = repository.get("job-p")
+        assert reset.status == "QUEUED"
+        assert reset.progress == 0
+        assert repository.get("job-wait").status == "QUEUED"
+        assert repository.get("job-lost").error_code == "RENDER_INTERRUPTED"
+        await runner.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_renderer_created_only_when_job_runs(self, tmp_path):
+        """대기 잡이 없으면 재개해도 렌더러를 만들지 않고, 잡 실행 시 한 번만 생성."""
+        repository = RenderJobRepository(db_path=str(tmp_path / "jobs.db"))
+        factory = MagicMock(return_value=MagicMock())
+        runner = RenderJobRunner(
+            repository=repository,
+            script_client=AsyncMock(),
+            output_dir=str(tmp_path / "out"),
+            scheduler=RenderScheduler(max_workers=1),
+            renderer_factory=factory,
+        )
+
+        assert await runner.resume_pending_jobs() == 0
+        factory.assert_not_called()
+
+        assert runner._get_renderer() is factory.return_value
+        assert runner._get_renderer() is factory.return_value
+        factory.assert_called_once()
+        await runner.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_resume_claims_each_job_once_across_workers(self, tmp_path):
+        """두 워커가 동시에 재개해도 잡은 한 워커만 실행, 끝나면 lease 반납."""
+        repository = RenderJobRepository(db_path=str(tmp_path / "jobs.db"))
+        spec = {"script_id": "s", "video_id": "v", "scenes": []}
+        repository.save(RenderJobEntity("job-p", "v1", "s", status="PROCESSING", progress=60, render_spec_json=spec))
+        state_path = str(tmp_path / "state.db")
+        stores = [SQLiteStateStore(state_path), SQLiteStateStore(state_path)]
+        gate = asyncio.Event()
+
+        async def run(_job_id):
+            await gate.wait()
+
+        runners = []
+        for store in stores:
+            runner = RenderJobRunner(
+                renderer=MagicMock(),
+                repository=repository,
+                script_client=AsyncMock(),
+                output_dir=str(tmp_path / "out"),
+                scheduler=RenderScheduler(max_workers=1),
+                state_store=store,
+            )
+            runner._execute_job_with_spec = AsyncMock(side_effect=run)
+            runners.append(runner)
+
+        first, second = runners
+        assert await first.resume_pending_jobs() == 1
+        await _drain()
+        repository.update_status("job-p", status="PROCESSING", progress=10)
+
+        assert await second.resume_pending_jobs() == 0
+        assert repository.get("job-p").progress == 10
+        second._execute_job_with_spec.assert_not_called()
+
+        gate.set()
+        lease_key = f"{RenderJobRunner.LEASE_KEY_PREFIX}job-p"
+        # lease 반납은 스레드에서 도는 저장소 호출을 거치므로 잠시 대기
+        for _ in range(100):
+            if stores[1].get(lease_key) is None:
+                break
+            await asyncio.sleep(0.01)
+        assert stores[1].get(lease_key) is None
+
+        for runner, store in zip(runners, stores):
+            await runner.shutdown()
+            store.close()
+
+
+class TestInternalRenderJobOwner:
+    """내부 렌더 잡 API의 공정 분배 기준(created_by) 테스트."""
+
+    @pytest.mark.parametrize(
+        "body_extra, headers, expected",
+        [
+            ({"requestedBy": "user-7"}, {"X-User-Id": "user-9"}, "user-7"),
+            ({}, {"X-User-Id": "user-9"}, "user-9"),
+            ({}, {}, "backend"),
+        ],
+    )
+    def test_requester_becomes_job_owner(self, tmp_path, body_extra, headers, expected):
+        """요청 사용자(requestedBy → X-User-Id 순)가 잡 생성자로 저장된다."""
+        from fastapi.testclient import TestClient
+
+        from app.main import app
+
+        repository = RenderJobRepository(db_path=str(tmp_path / "jobs.db"))
+        runner = RenderJobRunner(
+            renderer=MagicMock(),
+            repository=repository,
+            script_client=AsyncMock(),
+            output_dir=str(tmp_path / "out"),
+            scheduler=RenderScheduler(max_workers=1),
+        )
+        runner.start_job = AsyncMock()
+
+        with patch("app.api.v1.render_jobs.get_render_job_runner", return_value=runner):
+            response = TestClient(app).post(
+                "/internal/ai/render-jobs",
+                json={"jobId": "job-1", "videoId": "v1", "scriptId": "s1", **body_extra},
+                headers=headers,
+            )
+
+        assert response.status_code == 202
+        assert repository.get("job-1").created_by == expected
+        runner.start_job.assert_awaited_once_with("job-1")
@@ -539,7 +539,8 @@ class TestRouterOrchestrator:
 class TestPendingActionStore:
     """PendingActionStore 테스트."""
 
-    def test_set_and_get(self):
+    @pytest.mark.anyio
+    async def test_set_and_get(self):
         """저장 및 조회."""
         from app.services.router_orchestrator import PendingAction
 
@@ -551,14 +552,15 @@ class TestPendingActionStore:
             sub_intent_id="QUIZ_START",
         )
 
-        store.set("session-1", action)
-        retrieved = store.get("session-1")
+        await store.set("session-1", action)
+        retrieved = await store.get("session-1")
 
         assert retrieved is not None
         assert retrieved.trace_id == "test-trace"
         assert retrieved.sub_intent_id == "QUIZ_START"
 
-    def test_delete(self):
+    @pytest.mark.anyio
+    async def test_delete(self):
         """삭제."""
         from app.services.router_orchestrator import PendingAction
 
@@ -569,15 +571,16 @@ class TestPendingActionStore:
             pending_intent=Tier0Intent.UNKNOWN,
         )
 
-        store.set("session-2", action)
-        store.delete("session-2")
+        await store.set("session-2", action)
+        await store.delete("session-2")
 
-        assert store.get("session-2") is None
+        assert await store.get("session-2") is None
 
-    def test_nonexistent_session(self):
+    @pytest.mark.anyio
+    async def test_nonexistent_session(self):
         """존재하지 않는 세션 조회."""
         store = PendingActionStore()
-        assert store.get("nonexistent") is None
+        assert await store.get("nonexistent") is None
 
 
 # =============================================================================
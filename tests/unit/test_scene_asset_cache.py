@@ -0,0 +1,199 @@
+"""
+씬 에셋 캐시 / 증분 재렌더 테스트
+
+테스트 목표:
+1. SceneAssetCache put/get, LRU 삭제, 재시작 후 인덱스 복원
+2. 한 씬의 나레이션만 바뀐 재렌더는 그 씬만 TTS 재합성
+3. 시각 계획이 같은 씬 이미지는 재생성하지 않음 (바뀐 씬만 생성, 잡 디렉토리로 링크/복사)
+4. 씬 fingerprint는 바뀐 씬만 달라지고 RenderedAssets에 포함
+5. 캐시 파일 입출력은 이벤트 루프 밖 스레드에서 실행
+"""
+
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.clients.tts_provider import BaseTTSProvider
+from app.services.image_asset_service import ImageConfig
+from app.services.scene_asset_cache import SceneAssetCache, scene_fingerprint
+from app.services.tts_audio_cache import TTSAudioCache
+from app.services.video_composer import SceneInfo
+from app.services.video_renderer_real import (
+    RealRendererConfig,
+    RealRenderJobContext,
+    RealVideoRenderer,
+)
+from app.utils.audio_duration import get_audio_duration_from_file
+
+
+class TestSceneAssetCache:
+    """SceneAssetCache 단위 테스트."""
+
+    def test_put_and_get(self, tmp_path):
+        """저장한 파일은 같은 키/확장자로 조회."""
+        cache = SceneAssetCache(tmp_path / "cache", max_bytes=1024)
+        source = tmp_path / "a.png"
+        source.write_bytes(b"png-bytes")
+        key = scene_fingerprint("scene_image", {"title": "A"})
+
+        stored = cache.put_file(key, source, ".png")
+
+        assert cache.get(key, ".png") == stored
+        assert stored.read_bytes() == b"png-bytes"
+        assert cache.get(key, ".mp4") is None
+        assert cache.stats()["hits"] == 1
+
+    def test_lru_eviction_and_reload(self, tmp_path):
+        """용량 초과 시 가장 오래된 항목 삭제, 새 인스턴스는 디스크에서 복원."""
+        cache = SceneAssetCache(tmp_path / "cache", max_bytes=20)
+        source = tmp_path / "src"
+        source.write_bytes(b"x" * 8)
+
+        cache.put_file("k1", source, ".png")
+        cache.put_file("k2", source, ".png")
+        cache.get("k1", ".png")
+        cache.put_file("k3", source, ".png")
+
+        assert cache.get("k2", ".png") is None
+        assert cache.get("k1", ".png") is not None
+
+        reloaded = SceneAssetCache(tmp_path / "cache", max_bytes=20)
+        assert reloaded.get("k3", ".png") is not None
+        assert reloaded.stats()["entries"] == 2
+
+    def test_fingerprint_is_order_insensitive_for_dict_keys(self):
+        """dict 키 순서는 fingerprint에 영향 없음."""
+        assert scene_fingerprint({"a": 1, "b": 2}) == scene_fingerprint({"b": 2, "a": 1})
+        assert scene_fingerprint({"a": 1}) != scene_fingerprint({"a": 2})
+
+
+class TestIncrementalRerender:
+    """RealVideoRenderer 증분 재렌더 테스트."""
+
+    @pytest.fixture
+    def tts(self):
+        mock = MagicMock(spec=BaseTTSProvider)
+
+        async def synthesize_to_file(text, output_path, language="ko", **kwargs):
+            Path(output_path).write_bytes(text.encode("utf-8"))
+            return 2.0
+
+        mock.synthesize_to_file = AsyncMock(side_effect=synthesize_to_file)
+        return mock
+
+    @pytest.fixture
+    def image_service(self):
+        service = MagicMock()
+        service.config = ImageConfig(width=320, height=180)
+
+        async def generate(plans, output_dir):
+            paths = []
+            for plan in plans:
+                path = Path(output_dir) / f"gen_{plan.scene_id}.png"
+                path.write_bytes(plan.title.encode("utf-8"))
+                paths.append(str(path))
+            return paths
+
+        service.generate_all_scene_images_async = AsyncMock(side_effect=generate)
+        return service
+
+    def _renderer(self, tmp_path, tts, image_service):
+        return RealVideoRenderer(
+            config=RealRendererConfig(output_dir=str(tmp_path / "out"), visual_style="animated"),
+            tts_provider=tts,
+            image_service=image_service,
+            audio_cache=TTSAudioCache(tmp_path / "tts", max_bytes=10 * 1024 * 1024),
+            asset_cache=SceneAssetCache(tmp_path / "scene", max_bytes=10 * 1024 * 1024),
+        )
+
+    def _ctx(self, tmp_path, job_id, narrations):
+        output_dir = tmp_path / job_id
+        output_dir.mkdir()
+        return RealRenderJobContext(
+            job_id=job_id,
+            video_id="video-1",
+            script_id="script-1",
+            script_json={},
+            output_dir=output_dir,
+            scenes=[
+                SceneInfo(scene_id=i + 1, narration=text, on_screen_text=f"제목 {i + 1}")
+                for i, text in enumerate(narrations)
+            ],
+        )
+
+    @pytest.mark.asyncio
+    async def test_only_changed_scene_resynthesized(self, tmp_path, tts, image_service):
+        """두 번째 잡은 바뀐 씬만 TTS 합성 / 이미지 생성 (이미지 본문은 나레이션에서 추출)."""
+        renderer = self._renderer(tmp_path, tts, image_service)
+        composer = MagicMock()
+
+        first = self._ctx(tmp_path, "job-1", ["첫 씬.", "둘째 씬.", "셋째 씬."])
+        await renderer._generate_tts(first)
+        await renderer._render_slides(first)
+        first_fps = renderer._compute_scene_fingerprints(first, composer)
+
+        assert tts.synthesize_to_file.await_count == 3
+        assert image_service.generate_all_scene_images_async.await_count == 1
+
+        second = self._ctx(tmp_path, "job-2", ["첫 씬.", "둘째 씬 수정.", "셋째 씬."])
+        await renderer._generate_tts(second)
+        await renderer._render_slides(second)
+        second_fps = renderer._compute_scene_fingerprints(second, composer)
+
+        assert tts.synthesize_to_file.await_count == 4
+        assert tts.synthesize_to_file.await_args.kwargs["text"] == "둘째 씬 수정."
+        assert second.reused_audio_count == 2
+        assert second.reused_image_count == 2
+        regenerated = image_service.generate_all_scene_images_async.await_args.kwargs["plans"]
+        assert [plan.scene_id for plan in regenerated] == [2]
+        # 재사용 이미지도 캐시 디렉토리가 아닌 잡 작업 디렉토리 경로 (LRU 삭제와 무관)
+        assert all(Path(scene.image_path).parent == second.output_dir / "scene_images" for scene in second.scenes)
+
+        assert Path(second.tts_audio_path).read_bytes() == "첫 씬.둘째 씬 수정.셋째 씬.".encode("utf-8")
+        assert second.duration_sec == pytest.approx(6.0)
+
+        changed = [sid for sid in first_fps if first_fps[sid] != second_fps[sid]]
+        assert changed == ["2"]
+
+    @pytest.mark.asyncio
+    async def test_cache_file_io_runs_off_event_loop(self, tmp_path, tts, image_service):
+        """씬 캐시 조회/저장과 오디오 길이 측정은 이벤트 루프 스레드에서 실행하지 않음."""
+        renderer = self._renderer(tmp_path, tts, image_service)
+        loop_thread = threading.get_ident()
+        io_threads = []
+
+        def on_thread(fn):
+            def wrapper(*args, **kwargs):
+                io_threads.append(threading.get_ident())
+                return fn(*args, **kwargs)
+            return wrapper
+
+        cache = renderer._asset_cache
+        with patch.object(cache, "get", side_effect=on_thread(cache.get)), \
+                patch.object(cache, "put_file", side_effect=on_thread(cache.put_file)), \
+                patch(
+                    "app.services.video_renderer_real.get_audio_duration_from_file",
+                    side_effect=on_thread(get_audio_duration_from_file),
+                ):
+            for job_id in ("job-1", "job-2"):
+                ctx = self._ctx(tmp_path, job_id, ["첫 씬.", "둘째 씬."])
+                await renderer._generate_tts(ctx)
+                await renderer._render_slides(ctx)
+
+        # 오디오 길이 2회 + 이미지 캐시 조회 4회 + 저장 2회
+        assert len(io_threads) == 8
+        assert loop_thread not in io_threads
+
+    @pytest.mark.asyncio
+    async def test_fingerprints_in_rendered_assets(self, tmp_path, tts, image_service):
+        """compose 단계에서 계산한 fingerprint가 RenderedAssets에 포함."""
+        renderer = self._renderer(tmp_path, tts, image_service)
+        ctx = self._ctx(tmp_path, "job-1", ["첫 씬."])
+        renderer._contexts[ctx.job_id] = ctx
+        ctx.scene_fingerprints = renderer._compute_scene_fingerprints(ctx, MagicMock())
+
+        assets = await renderer.get_rendered_assets("job-1")
+
+        assert list(assets.scene_fingerprints) == ["1"]
@@ -0,0 +1,286 @@
+"""
+씬 병렬 생성 / 배치 검색 테스트 (SceneBasedScriptGenerator)
+
+테스트 목표:
+1. 병렬 모드에서 모든 씬을 아웃라인 순서대로 조립
+2. 콜백은 완료 순서와 무관하게 아웃라인 순서로 호출
+3. 동시 생성 수는 SCRIPT_SCENE_CONCURRENCY로 제한
+4. 연결 다듬기는 씬 첫 문장만 교체하고, 실패 시 원본 유지
+5. 씬 검색은 search_many 1회 + 소스셋 문서 범위 + 쿼리 캐시
+"""
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.scene_based_script_generator import (
+    ChapterOutline,
+    SceneBasedScriptGenerator,
+    SceneOutline,
+    ScriptOutline,
+)
+
+
+def _make_outline(scene_count: int) -> ScriptOutline:
+    scenes = [
+        SceneOutline(
+            scene_index=i,
+            title=f"씬{i}",
+            purpose="설명",
+            keywords=[f"키워드{i}"],
+        )
+        for i in range(scene_count)
+    ]
+    return ScriptOutline(
+        title="보안 교육",
+        chapters=[
+            ChapterOutline(chapter_index=0, title="1장", scenes=scenes[:2]),
+            ChapterOutline(chapter_index=1, title="2장", scenes=scenes[2:]),
+        ],
+        total_scenes=scene_count,
+    )
+
+
+def _scene_response(title: str) -> str:
+    return json.dumps({
+        "narration": f"{title} 내용을 설명합니다. 보안 수칙을 꼭 지켜야 합니다.",
+        "caption": title,
+        "duration_sec": 30,
+    }, ensure_ascii=False)
+
+
+class _FakeLLM:
+    """씬 제목에 따라 지연 시간이 다른 LLM (뒤 씬이 먼저 끝남)."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.prompts = []
+
+    async def generate_chat_completion(self, messages, **kwargs):
+        user_prompt = messages[-1]["content"]
+        self.prompts.append(user_prompt)
+        title = user_prompt.split("- 제목: ")[1].split("\n")[0]
+        index = int(title.replace("씬", ""))
+
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01 * (5 - index))
+        self.active -= 1
+        return _scene_response(title)
+
+
+@pytest.fixture
+def milvus_client():
+    client = MagicMock()
+
+    async def search_many(queries, filter_expr=None, top_k=None):
+        return [
+            [{"doc_id": "doc-1", "content": "보안 근거", "score": 0.9, "metadata": {"chunk_id": 0}}]
+            for _ in queries
+        ]
+
+    client.search_many = AsyncMock(side_effect=search_many)
+    return client
+
+
+class TestParallelSceneGeneration:
+    """병렬 씬 생성 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_scenes_assembled_and_callbacks_in_outline_order(self, milvus_client):
+        """완료 순서가 뒤집혀도 결과와 콜백은 아웃라인 순서."""
+        llm = _FakeLLM()
+        generator = SceneBasedScriptGenerator(
+            llm_client=llm,
+            milvus_client=milvus_client,
+            model="test-model",
+            scene_concurrency=3,
+            transition_smoothing=False,
+        )
+        callback_order = []
+
+        async def on_scene(script_id, ch_idx, ch_title, sc_idx, scene, current, total):
+            callback_order.append((sc_idx, current, total))
+
+        chapters, metrics = await generator._generate_scenes_parallel_with_metrics(
+            _make_outline(5), [], ["doc-1"],
+            script_id="script-1",
+            on_scene_generated=on_scene,
+        )
+
+        assert [len(ch.scenes) for ch in chapters] == [2, 3]
+        assert [s.scene_index for ch in chapters for s in ch.scenes] == [0, 1, 2, 3, 4]
+        assert callback_order == [(i, i + 1, 5) for i in range(5)]
+        assert metrics.scene_count == 5
+        assert metrics.failed_scene_count == 0
+        assert milvus_client.search_many.await_count == 1
+        assert llm.max_active == 3
+
+    @pytest.mark.asyncio
+    async def test_outline_flow_in_prompt(self, milvus_client):
+        """병렬 모드는 이전/다음 씬 제목을 프롬프트에 포함."""
+        llm = _FakeLLM()
+        generator = SceneBasedScriptGenerator(
+            llm_client=llm,
+            milvus_client=milvus_client,
+            model="test-model",
+            scene_concurrency=2,
+        )
+
+        await generator._generate_scenes_parallel_with_metrics(
+            _make_outline(3), [], ["doc-1"],
+        )
+
+        middle = next(p for p in llm.prompts if "- 제목: 씬1" in p)
+        assert "- 이전 씬: 씬0" in middle
+        assert "- 다음 씬: 씬2" in middle
+
+    @pytest.mark.asyncio
+    async def test_failed_scene_counted_and_skipped(self, milvus_client):
+        """한 씬이 실패해도 나머지는 순서대로 조립."""
+        llm = MagicMock()
+
+        async def generate(messages, **kwargs):
+            if "- 제목: 씬1" in messages[-1]["content"]:
+                return "I'd be happy to help with that."
+            title = messages[-1]["content"].split("- 제목: ")[1].split("\n")[0]
+            return _scene_response(title)
+
+        llm.generate_chat_completion = AsyncMock(side_effect=generate)
+        generator = SceneBasedScriptGenerator(
+            llm_client=llm,
+            milvus_client=milvus_client,
+            model="test-model",
+            scene_concurrency=4,
+        )
+
+        chapters, metrics = await generator._generate_scenes_parallel_with_metrics(
+            _make_outline(4), [], ["doc-1"],
+        )
+
+        assert [s.scene_index for ch in chapters for s in ch.scenes] == [0, 2, 3]
+        assert metrics.failed_scene_count == 1
+
+
+class TestTransitionSmoothing:
+    """씬 연결 다듬기 테스트."""
+
+    async def _generate(self, milvus_client, smoothing_response):
+        llm = _FakeLLM()
+        generator = SceneBasedScriptGenerator(
+            llm_client=llm,
+            milvus_client=milvus_client,
+            model="test-model",
+            scene_concurrency=2,
+            transition_smoothing=True,
+        )
+        chapters, _ = await generator._generate_scenes_parallel_with_metrics(
+            _make_outline(3), [], ["doc-1"],
+        )
+        llm.generate_chat_completion = AsyncMock(side_effect=smoothing_response)
+        await generator._smooth_transitions(chapters, "보안 교육")
+        return [s for ch in chapters for s in ch.scenes]
+
+    @pytest.mark.asyncio
+    async def test_replaces_first_sentence_only(self, milvus_client):
+        """유효한 한국어 도입 문장만 교체."""
+        response = json.dumps({"openings": [
+            {"index": 1, "opening": "이어서 씬1 내용을 살펴보겠습니다."},
+            {"index": 2, "opening": "Next, let's look at this scene."},
+        ]}, ensure_ascii=False)
+
+        scenes = await self._generate(milvus_client, [response])
+
+        assert scenes[1].narration == (
+            "이어서 씬1 내용을 살펴보겠습니다. 보안 수칙을 꼭 지켜야 합니다."
+        )
+        assert scenes[2].narration.startswith("씬2 내용을 설명합니다.")
+
+    @pytest.mark.asyncio
+    async def test_llm_failure_keeps_original(self, milvus_client):
+        """다듬기 LLM 실패 시 원본 유지."""
+        scenes = await self._generate(milvus_client, RuntimeError("timeout"))
+
+        assert scenes[1].narration.startswith("씬1 내용을 설명합니다.")
+
+
+class TestSceneBatchSearch:
+    """씬 배치 검색 테스트 (search_many + 캐시 + 문서 범위 제한)."""
+
+    @pytest.mark.asyncio
+    async def test_search_scoped_to_source_set_and_cached(self, milvus_client):
+        """문서 범위 필터 적용, 같은 씬 쿼리는 재검색하지 않음."""
+        generator = SceneBasedScriptGenerator(
+            llm_client=MagicMock(), milvus_client=milvus_client, model="test-model"
+        )
+        scenes = [sc for ch in _make_outline(3).chapters for sc in ch.scenes]
+
+        first = await generator._search_chunks_for_scenes(scenes, [], ["doc-1.pdf"])
+        second = await generator._search_chunks_for_scenes(scenes, [], ["doc-1.pdf"])
+
+        assert first == second
+        assert all(chunks[0]["text"] == "보안 근거" for chunks in first)
+        milvus_client.search_many.assert_awaited_once()
+        assert milvus_client.search_many.call_args.kwargs["filter_expr"] == (
+            'doc_id in ["doc-1.pdf"]'
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_failure_uses_keyword_fallback(self):
+        """배치 검색 실패 시 씬별 키워드 폴백."""
+        client = MagicMock()
+        client.search_many = AsyncMock(side_effect=RuntimeError("milvus down"))
+        generator = SceneBasedScriptGenerator(
+            llm_client=MagicMock(), milvus_client=client, model="test-model"
+        )
+        all_chunks = [
+            {"doc_id": "doc-1", "chunk_index": 0, "text": "키워드0 관련 내용"},
+            {"doc_id": "doc-1", "chunk_index": 1, "text": "키워드1 관련 내용"},
+        ]
+        scenes = [sc for ch in _make_outline(2).chapters for sc in ch.scenes]
+
+        result = await generator._search_chunks_for_scenes(scenes, all_chunks, [])
+
+        assert [chunks[0]["chunk_index"] for chunks in result] == [0, 1]
+        assert client.search_many.call_args.kwargs["filter_expr"] is None
+
+    def test_search_doc_ids_prefer_milvus_doc_id(self):
+        """Milvus 청크는 chunk_meta.milvus_doc_id를 검색 범위로 사용."""
+        generator = SceneBasedScriptGenerator(
+            llm_client=MagicMock(), milvus_client=MagicMock(), model="test-model"
+        )
+        document_chunks = {
+            "spring-1": [
+                {"chunk_text": "a", "chunk_meta": {"milvus_doc_id": "보안교육.pdf"}},
+                {"chunk_text": "b", "chunk_meta": {"milvus_doc_id": "보안교육.pdf"}},
+            ],
+        }
+
+        assert generator._collect_search_doc_ids(document_chunks, ["spring-1"]) == [
+            "보안교육.pdf"
+        ]
+        assert generator._collect_search_doc_ids(
+            {"spring-1": [{"chunk_text": "a"}]}, ["spring-1"]
+        ) == ["spring-1"]
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_fuses_vector_and_bm25(self, milvus_client):
+        """하이브리드 모드는 벡터 결과와 BM25 결과를 RRF로 결합."""
+        generator = SceneBasedScriptGenerator(
+            llm_client=MagicMock(),
+            milvus_client=milvus_client,
+            model="test-model",
+            top_k=2,
+            hybrid_search=True,
+        )
+        all_chunks = [
+            {"doc_id": "doc-1", "chunk_index": 0, "text": "키워드0 관련 내용"},
+            {"doc_id": "doc-1", "chunk_index": 1, "text": "보안 근거"},
+        ]
+        scenes = [sc for ch in _make_outline(1).chapters for sc in ch.scenes]
+
+        result = await generator._search_chunks_for_scenes(scenes, all_chunks, [])
+
+        assert [chunk["text"] for chunk in result[0]] == ["보안 근거", "키워드0 관련 내용"]
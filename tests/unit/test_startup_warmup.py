@@ -0,0 +1,177 @@
+"""
+기동 비용 테스트 (import 예산 / lifespan warm-up)
+
+테스트 목표:
+1. app.main import 시 무거운 의존성(pymilvus, pandas, numpy, rapidfuzz 등)을 로드하지 않고 예산 안에 끝남
+2. 드물게 쓰는 서브시스템(영상 렌더, 소스셋, 퀴즈) 서비스 모듈은 첫 사용 시 로드
+   (대기 중인 렌더 잡이 없으면 lifespan의 잡 복원도 렌더러를 로드하지 않음)
+3. warm-up 단계는 동시에 실행되고, 실패/시간 초과는 기동을 막지 않음
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from app.core.config import get_settings
+from app.core.warmup import build_warmup_steps, run_warmup
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# 새 인터프리터에서 `import app.main`에 허용하는 시간 (CI 편차를 감안한 상한)
+IMPORT_TIME_BUDGET_SEC = 2.0
+
+# 기동 시 import되면 안 되는 모듈 (첫 사용/warm-up 시 로드)
+LAZY_MODULES = [
+    "pymilvus",
+    "pandas",
+    "numpy",
+    "rapidfuzz",
+    "PIL",
+    "app.services.embedding_matcher",
+    "app.services.video_renderer_mvp",
+    "app.services.source_set_orchestrator",
+    "app.services.quiz_generate_service",
+    "app.clients.heygen_client",
+]
+
+_IMPORT_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+print(json.dumps({"elapsed": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+"""
+
+
+# 렌더러(TTS/영상 합성) 모듈: 렌더 잡을 실행할 때만 로드
+RENDERER_MODULES = [
+    "PIL",
+    "gtts",
+    "app.services.video_renderer_mvp",
+    "app.services.scene_audio_service",
+    "app.services.video_render_service",
+]
+
+_LIFESPAN_PROBE = """
+import asyncio, json, sys
+from app.main import app, lifespan
+
+async def main():
+    async with lifespan(app):
+        pass
+
+asyncio.run(main())
+print(json.dumps({"loaded": [m for m in %r if m in sys.modules]}))
+"""
+
+
+class TestImportBudget:
+    """app.main import 비용 테스트."""
+
+    def test_app_import_within_budget_without_heavy_modules(self):
+        """새 프로세스에서 app.main import가 예산 안에 끝나고 지연 대상 모듈을 로드하지 않는다."""
+        completed = subprocess.run(
+            [sys.executable, "-c", _IMPORT_PROBE % (LAZY_MODULES,)],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        assert completed.returncode == 0, completed.stderr
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+
+        assert result["loaded"] == []
+        assert result["elapsed"] < IMPORT_TIME_BUDGET_SEC, result
+
+    def test_lifespan_without_pending_jobs_keeps_renderer_unloaded(self, tmp_path):
+        """대기 중인 렌더 잡이 없으면 기동/종료(lifespan) 후에도 렌더러 모듈을 로드하지 않는다."""
+        env = {
+            **os.environ,
+            "PYTHONPATH": str(PROJECT_ROOT),
+            "RENDER_JOB_DB_PATH": str(tmp_path / "render_jobs.db"),
+            "RENDER_RESUME_ON_STARTUP": "true",
+            "WARMUP_ENABLED": "false",
+        }
+        completed = subprocess.run(
+            [sys.executable, "-c", _LIFESPAN_PROBE % (RENDERER_MODULES,)],
+            cwd=tmp_path,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        assert completed.returncode == 0, completed.stderr
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+
+        assert result["loaded"] == []
+
+    def test_routes_still_registered(self):
+        """지연 로드와 무관하게 영상/퀴즈 라우트는 등록되어 있다."""
+        from app.main import app
+
+        paths = app.openapi()["paths"]
+        assert "/ai/quiz/generate" in paths
+        assert "/internal/ai/source-sets/{source_set_id}/start" in paths
+        assert "/internal/ai/render-jobs/{job_id}" in paths
+
+
+class TestWarmup:
+    """lifespan warm-up 테스트."""
+
+    def test_steps_follow_settings(self, monkeypatch):
+        """MILVUS_ENABLED/FORBIDDEN_QUERY_FILTER_ENABLED에 따라 단계 구성."""
+        settings = get_settings()
+        monkeypatch.setattr(settings, "MILVUS_ENABLED", True)
+        monkeypatch.setattr(settings, "FORBIDDEN_QUERY_FILTER_ENABLED", True)
+        assert [name for name, _ in build_warmup_steps(settings)] == ["milvus", "forbidden_filter"]
+
+        monkeypatch.setattr(settings, "MILVUS_ENABLED", False)
+        assert [name for name, _ in build_warmup_steps(settings)] == ["forbidden_filter"]
+
+    @pytest.mark.asyncio
+    async def test_steps_run_concurrently_and_failures_do_not_raise(self, monkeypatch):
+        """단계는 동시에 실행되고, 예외/시간 초과는 결과로만 남는다."""
+        settings = get_settings()
+        monkeypatch.setattr(settings, "WARMUP_TIMEOUT_SEC", 0.3)
+
+        async def slow_ok():
+            await asyncio.sleep(0.1)
+
+        async def broken():
+            await asyncio.sleep(0.1)
+            raise ConnectionError("milvus down")
+
+        async def hangs():
+            await asyncio.sleep(10)
+
+        started = time.perf_counter()
+        results = await run_warmup(
+            settings,
+            steps=[("a", slow_ok), ("b", broken), ("c", hangs)],
+        )
+        elapsed = time.perf_counter() - started
+
+        assert [(r.name, r.ok) for r in results] == [("a", True), ("b", False), ("c", False)]
+        assert "ConnectionError" in results[1].error
+        assert results[2].error.startswith("timeout")
+        assert elapsed < 0.45  # 순차 실행이면 0.1 + 0.1 + 0.3 = 0.5초 이상
+
+    @pytest.mark.asyncio
+    async def test_forbidden_filter_step_loads_ruleset(self, monkeypatch):
+        """forbidden_filter 단계 후 기본 필터는 로드된 상태."""
+        from app.services.forbidden_query_filter import get_forbidden_query_filter
+
+        settings = get_settings()
+        monkeypatch.setattr(settings, "MILVUS_ENABLED", False)
+        monkeypatch.setattr(settings, "FORBIDDEN_QUERY_FILTER_ENABLED", True)
+
+        results = await run_warmup(settings)
+
+        assert [(r.name, r.ok) for r in results] == [("forbidden_filter", True)]
+        assert get_forbidden_query_filter()._loaded is True
@@ -0,0 +1,296 @@
+"""
+공유 상태 저장소 테스트 (StateStore)
+
+테스트 목표:
+1. memory/sqlite 구현 모두 get/set/TTL/CAS/prefix 연산이 같은 결과
+2. 같은 SQLite 파일을 쓰는 두 저장소(= 두 워커)가 상태와 메시지를 공유
+3. 동시에 CAS로 증가시켜도 갱신이 유실되지 않음
+4. pending action / in-flight 요청 / ingest 캐시가 워커 간 공유됨
+5. 소스셋 작업 선점은 종료 상태/lease 만료 후 다시 가능
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.state_store import InMemoryStateStore, SQLiteStateStore
+from app.models.router_types import RouterResult, Tier0Intent
+from app.services.chat_stream_service import InFlightTracker
+from app.services.education_catalog_service import EducationCatalogService
+from app.models.source_set import SourceSetStartRequest
+from app.services.router_orchestrator import (
+    PendingAction,
+    PendingActionStore,
+    PendingActionType,
+)
+from app.services.source_set_orchestrator import ProcessingStatus, SourceSetOrchestrator
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        instance = InMemoryStateStore()
+    else:
+        instance = SQLiteStateStore(str(tmp_path / "state.db"), poll_interval_sec=0.01)
+    yield instance
+    instance.close()
+
+
+@pytest.fixture
+def workers(tmp_path):
+    """같은 SQLite 파일을 쓰는 두 워커의 저장소."""
+    path = str(tmp_path / "shared.db")
+    first = SQLiteStateStore(path, poll_interval_sec=0.01)
+    second = SQLiteStateStore(path, poll_interval_sec=0.01)
+    yield first, second
+    first.close()
+    second.close()
+
+
+class TestStateStoreOperations:
+    """구현 공통 연산 테스트."""
+
+    def test_set_get_delete(self, store):
+        """저장한 값은 복사본으로 조회, 삭제 후 None."""
+        value = {"status": "PROCESSING", "ids": [1, 2]}
+        store.set("job:1", value)
+        value["status"] = "mutated"
+
+        assert store.get("job:1") == {"status": "PROCESSING", "ids": [1, 2]}
+        assert store.delete("job:1") is True
+        assert store.get("job:1") is None
+        assert store.delete("job:1") is False
+
+    def test_ttl_expiry(self, store):
+        """만료된 키는 없는 키로 취급되고 다시 선점 가능."""
+        store.set("lock:a", 1, ttl_sec=0.05)
+        assert store.set_if_absent("lock:a", 2) is False
+
+        time.sleep(0.1)
+
+        assert store.get("lock:a") is None
+        assert store.keys("lock:") == []
+        assert store.set_if_absent("lock:a", 3) is True
+        assert store.get("lock:a") == 3
+
+    def test_compare_and_set(self, store):
+        """현재 값이 expected일 때만 교체."""
+        store.set("counter", {"n": 1})
+
+        assert store.compare_and_set("counter", {"n": 2}, {"n": 3}) is False
+        assert store.compare_and_set("counter", {"n": 1}, {"n": 2}) is True
+        assert store.get("counter") == {"n": 2}
+        assert store.compare_and_set("missing", None, {"n": 0}) is True
+
+    def test_prefix_keys_items_clear(self, store):
+        """prefix 단위 조회/삭제."""
+        store.set("a:1", 1)
+        store.set("a:2", 2)
+        store.set("b:1", 3)
+
+        assert sorted(store.keys("a:")) == ["a:1", "a:2"]
+        assert store.items("a:") == {"a:1": 1, "a:2": 2}
+
+        store.clear("a:")
+        assert store.keys() == ["b:1"]
+
+    def test_publish_subscribe(self, store):
+        """구독자는 채널 메시지를 받고, 해제 후에는 받지 않음."""
+        received = []
+        delivered = threading.Event()
+
+        def on_message(channel, message):
+            received.append((channel, message))
+            delivered.set()
+
+        unsubscribe = store.subscribe("progress", on_message)
+        store.publish("other", {"skip": True})
+        store.publish("progress", {"job_id": "job-1", "progress": 40})
+
+        assert delivered.wait(timeout=2.0)
+        assert received == [("progress", {"job_id": "job-1", "progress": 40})]
+
+        unsubscribe()
+        store.publish("progress", {"job_id": "job-1", "progress": 50})
+        time.sleep(0.05)
+        assert len(received) == 1
+
+
+    @pytest.mark.asyncio
+    async def test_async_api_matches_sync(self, store):
+        """async API는 동기 연산과 같은 결과."""
+        await store.aset("job:1", {"status": "PROCESSING"}, ttl_sec=60)
+
+        assert await store.aget("job:1") == {"status": "PROCESSING"}
+        assert await store.aset_if_absent("job:1", {"status": "X"}) is False
+        assert await store.acompare_and_set(
+            "job:1", {"status": "PROCESSING"}, {"status": "COMPLETED"}
+        ) is True
+        assert await store.akeys("job:") == ["job:1"]
+        assert await store.aitems("job:") == {"job:1": {"status": "COMPLETED"}}
+        assert await store.adelete("job:1") is True
+        await store.aclear("job:")
+        assert store.get("job:1") is None
+
+
+class TestSQLiteSharing:
+    """워커 간 공유 테스트 (같은 SQLite 파일)."""
+
+    def test_state_visible_across_workers(self, workers):
+        """한 워커가 선점한 키는 다른 워커에서 선점 불가."""
+        first, second = workers
+
+        assert first.set_if_absent("ingest:DOC-1:1", {"status": "PROCESSING"}) is True
+        assert second.set_if_absent("ingest:DOC-1:1", {"status": "PROCESSING"}) is False
+        assert second.get("ingest:DOC-1:1") == {"status": "PROCESSING"}
+
+    def test_message_delivered_to_other_worker(self, workers):
+        """다른 워커가 발행한 메시지도 구독자에게 전달."""
+        first, second = workers
+        delivered = threading.Event()
+        received = []
+
+        second.subscribe("render-progress", lambda ch, msg: (received.append(msg), delivered.set()))
+        time.sleep(0.05)
+        first.publish("render-progress", {"progress": 10})
+
+        assert delivered.wait(timeout=2.0)
+        assert received == [{"progress": 10}]
+
+    def test_concurrent_cas_increments_not_lost(self, workers):
+        """두 워커가 CAS 재시도로 동시에 증가시켜도 합계 유지."""
+        first, second = workers
+        first.set("counter", 0)
+
+        def increment(store, times):
+            for _ in range(times):
+                while True:
+                    current = store.get("counter")
+                    if store.compare_and_set("counter", current, current + 1):
+                        break
+
+        threads = [
+            threading.Thread(target=increment, args=(first, 50)),
+            threading.Thread(target=increment, args=(second, 50)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert first.get("counter") == 100
+
+
+class TestSharedServices:
+    """공유 상태를 쓰는 서비스 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_pending_action_round_trip_across_workers(self, workers):
+        """한 워커에서 저장한 pending action을 다른 워커가 그대로 복원."""
+        first, second = workers
+        action = PendingAction(
+            action_type=PendingActionType.CONFIRM,
+            trace_id="trace-1",
+            pending_intent=Tier0Intent.EDUCATION_QA,
+            router_result=RouterResult(tier0_intent=Tier0Intent.EDUCATION_QA),
+            expires_at=datetime.now(timezone.utc) + timedelta(minutes=5),
+            original_query="교육 알려줘",
+        )
+
+        await PendingActionStore(first).set("session-1", action)
+        restored = await PendingActionStore(second).get("session-1")
+
+        assert restored == action
+
+    @pytest.mark.asyncio
+    async def test_in_flight_dedup_across_workers(self, workers):
+        """같은 request_id는 다른 워커에서도 중복으로 판정, 완료 응답 공유."""
+        first, second = workers
+        tracker_a = InFlightTracker(first)
+        tracker_b = InFlightTracker(second)
+
+        assert await tracker_a.start_request("req-1") is True
+        assert await tracker_b.start_request("req-1") is False
+
+        await tracker_a.complete_request("req-1", "응답")
+        assert await tracker_b.get_cached_response("req-1") == "응답"
+        assert await tracker_b.start_request("req-1") is True
+
+    def test_reissue_claims_target_once(self, workers):
+        """재발행 대상 ID는 한 워커만 생성."""
+        first, second = workers
+        catalog_a = EducationCatalogService(first)
+        catalog_b = EducationCatalogService(second)
+        catalog_a.register_education("EDU-SEC-2025-001", year=2025, is_mandatory_4type=True)
+
+        catalog_a.reissue("EDU-SEC-2025-001", 2026, datetime(2026, 12, 31).date())
+
+        assert catalog_b.is_mandatory_4type("EDU-SEC-2026-001") is True
+        with pytest.raises(ValueError):
+            catalog_b.reissue("EDU-SEC-2025-001", 2026, datetime(2026, 12, 31).date())
+
+
+def _source_set_orchestrator(store) -> SourceSetOrchestrator:
+    ragflow_client = MagicMock()
+    ragflow_client.is_configured = False
+    return SourceSetOrchestrator(
+        backend_client=MagicMock(),
+        ragflow_client=ragflow_client,
+        state_store=store,
+    )
+
+
+class TestSourceSetClaim:
+    """소스셋 작업 선점 (lease/종료 상태 재선점) 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_terminal_job_can_be_started_again(self, workers):
+        """처리 중에는 다른 워커가 선점 불가, 실패 기록은 다른 워커가 다시 선점."""
+        first, second = workers
+        orchestrator_a = _source_set_orchestrator(first)
+        orchestrator_b = _source_set_orchestrator(second)
+        request = SourceSetStartRequest(video_id="video-1")
+
+        with patch.object(orchestrator_a, "_process_source_set", AsyncMock()), \
+                patch.object(orchestrator_b, "_process_source_set", AsyncMock()) as process_b:
+            await orchestrator_a.start("ss-1", request)
+            await orchestrator_b.start("ss-1", request)
+            process_b.assert_not_called()
+
+            job = orchestrator_a._processing_jobs["ss-1"]
+            job.status = ProcessingStatus.FAILED
+            assert await orchestrator_a._save_job_state(job) is True
+            assert (await orchestrator_b.get_job_status("ss-1")).status == ProcessingStatus.FAILED
+
+            await orchestrator_b.start("ss-1", request)
+            await asyncio.sleep(0)
+            process_b.assert_called_once_with("ss-1")
+
+        assert second.get("source_set_job:ss-1")["status"] == "PROCESSING"
+
+    @pytest.mark.asyncio
+    async def test_stale_lease_is_reclaimed_and_not_overwritten(self, workers):
+        """lease가 만료된 작업은 다른 워커가 선점, 이전 워커의 저장은 거부."""
+        first, second = workers
+        orchestrator_a = _source_set_orchestrator(first)
+        orchestrator_b = _source_set_orchestrator(second)
+        orchestrator_a.JOB_LEASE_SEC = 0.05
+        request = SourceSetStartRequest(video_id="video-1")
+
+        with patch.object(orchestrator_a, "_process_source_set", AsyncMock()), \
+                patch.object(orchestrator_b, "_process_source_set", AsyncMock()):
+            await orchestrator_a.start("ss-2", request)
+            stale_job = orchestrator_a._processing_jobs["ss-2"]
+            time.sleep(0.1)  # 워커 A 중단 (lease 갱신 없음)
+
+            await orchestrator_b.start("ss-2", request)
+            assert "ss-2" in orchestrator_b._job_records
+
+        stale_job.status = ProcessingStatus.COMPLETED
+        assert await orchestrator_a._save_job_state(stale_job) is False
+        assert second.get("source_set_job:ss-2")["status"] == "PROCESSING"
+
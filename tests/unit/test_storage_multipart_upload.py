@@ -0,0 +1,267 @@
+"""
+Presigned 업로드 스트리밍 / 멀티파트 / 동시 업로드 테스트
+
+테스트 목표:
+1. 단일 PUT은 Content-Length를 명시한 스트리밍 전송 (chunked 아님)
+2. 임계값 이상 파일은 파트를 병렬 업로드하고 파트 ETag로 complete 호출
+3. 백엔드에 멀티파트 API가 없으면(404) 단일 PUT으로 폴백
+4. 파트 업로드가 실패하면 백엔드 멀티파트 abort 호출
+5. 렌더 에셋(비디오/자막/썸네일)은 동시에 업로드, 하나가 실패하면 나머지 취소
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from app.clients.storage_adapter import (
+    BackendPresignedStorageProvider,
+    StorageResult,
+    StorageUploadError,
+)
+from app.services.video_renderer_real import RealRenderJobContext, RealVideoRenderer
+
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def mock_settings():
+    settings = MagicMock()
+    settings.backend_base_url = "http://backend-mock:8081"
+    settings.BACKEND_SERVICE_TOKEN = "test-service-token"
+    settings.BACKEND_STORAGE_PRESIGN_PATH = "/internal/storage/presign-put"
+    settings.BACKEND_STORAGE_COMPLETE_PATH = "/internal/storage/complete"
+    settings.VIDEO_MAX_UPLOAD_BYTES = 100 * MB
+    settings.storage_public_base_url = "https://cdn.example.com"
+    settings.STORAGE_UPLOAD_RETRY_MAX = 1
+    settings.STORAGE_UPLOAD_RETRY_BASE_SEC = 0.01
+    settings.STORAGE_ETAG_OPTIONAL = False
+    settings.STORAGE_UPLOAD_CHUNK_KB = 256
+    settings.STORAGE_MULTIPART_THRESHOLD_MB = 1
+    settings.STORAGE_MULTIPART_PART_MB = 5
+    settings.STORAGE_MULTIPART_CONCURRENCY = 2
+    settings.BACKEND_STORAGE_MULTIPART_PRESIGN_PATH = "/internal/storage/multipart/presign"
+    settings.BACKEND_STORAGE_MULTIPART_COMPLETE_PATH = "/internal/storage/multipart/complete"
+    settings.BACKEND_STORAGE_MULTIPART_ABORT_PATH = "/internal/storage/multipart/abort"
+    return settings
+
+
+@pytest.fixture
+def provider(mock_settings):
+    with patch("app.core.config.get_settings", return_value=mock_settings):
+        return BackendPresignedStorageProvider()
+
+
+class FakeBackend:
+    """백엔드 Internal API + presigned S3 PUT 흉내 (httpx.MockTransport 핸들러)."""
+
+    def __init__(self, multipart: bool = True, failing_part: str = ""):
+        self.multipart = multipart
+        self.failing_part = failing_part
+        self.requests = []
+        self.uploaded = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        self.requests.append(request)
+        path = request.url.path
+
+        if request.method == "PUT":
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            if self.failing_part and path == self.failing_part:
+                return httpx.Response(500)
+            self.uploaded[str(request.url)] = body
+            return httpx.Response(200, headers={"ETag": f'"etag-{path}"'})
+
+        payload = json.loads(body)
+        if path == "/internal/storage/presign-put":
+            return httpx.Response(200, json={
+                "upload_url": "https://s3.example.com/single",
+                "public_url": "https://cdn.example.com/" + payload["object_key"],
+            })
+        if path == "/internal/storage/multipart/presign":
+            if not self.multipart:
+                return httpx.Response(404)
+            return httpx.Response(200, json={
+                "upload_id": "upload-1",
+                "public_url": "https://cdn.example.com/" + payload["object_key"],
+                "parts": [
+                    {"part_number": n, "upload_url": f"https://s3.example.com/part{n}"}
+                    for n in range(1, payload["part_count"] + 1)
+                ],
+            })
+        return httpx.Response(200, json={"status": "ok"})
+
+    def calls(self, path: str):
+        return [r for r in self.requests if r.url.path == path]
+
+
+def _use_backend(provider, backend):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(backend))
+    return patch.object(provider, "_get_client", return_value=client)
+
+
+class TestPresignedStreaming:
+    """단일 PUT 스트리밍 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_single_put_streams_with_content_length(self, provider, tmp_path):
+        """작은 파일은 Content-Length가 있는 단일 PUT."""
+        data = b"subtitle " * 1000
+        path = tmp_path / "subtitles.srt"
+        path.write_bytes(data)
+        backend = FakeBackend()
+
+        with _use_backend(provider, backend):
+            result = await provider.put_object(path, "videos/v/s/j/subtitles.srt")
+
+        put = backend.calls("/single")[0]
+        assert put.headers["Content-Length"] == str(len(data))
+        assert "Transfer-Encoding" not in put.headers
+        assert backend.uploaded["https://s3.example.com/single"] == data
+        assert result.url == "https://cdn.example.com/videos/v/s/j/subtitles.srt"
+        assert backend.calls("/internal/storage/multipart/presign") == []
+
+
+class TestMultipartUpload:
+    """멀티파트 업로드 테스트."""
+
+    @pytest.fixture
+    def large_file(self, tmp_path):
+        path = tmp_path / "video.mp4"
+        path.write_bytes(bytes(range(256)) * (11 * MB // 256))
+        return path
+
+    @pytest.mark.asyncio
+    async def test_parts_uploaded_in_parallel(self, provider, large_file):
+        """11MB 파일은 5MB 파트 3개를 최대 2개씩 동시에 업로드."""
+        backend = FakeBackend()
+
+        with _use_backend(provider, backend):
+            result = await provider.put_object(large_file, "videos/v/s/j/video.mp4", "video/mp4")
+
+        parts = [backend.uploaded[f"https://s3.example.com/part{n}"] for n in (1, 2, 3)]
+        assert [len(p) for p in parts] == [5 * MB, 5 * MB, 1 * MB]
+        assert b"".join(parts) == large_file.read_bytes()
+        assert backend.max_in_flight == 2
+
+        complete = json.loads(backend.calls("/internal/storage/multipart/complete")[0].content)
+        assert complete["upload_id"] == "upload-1"
+        assert [p["part_number"] for p in complete["parts"]] == [1, 2, 3]
+        assert complete["parts"][0]["etag"] == '"etag-/part1"'
+        assert backend.calls("/internal/storage/complete") == []
+        assert result.size_bytes == 11 * MB
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_backend_lacks_multipart(self, provider, large_file):
+        """멀티파트 API 404 → 단일 PUT, 이후 업로드는 멀티파트 시도 안 함."""
+        backend = FakeBackend(multipart=False)
+
+        with _use_backend(provider, backend):
+            await provider.put_object(large_file, "videos/v/s/j/video.mp4", "video/mp4")
+            await provider.put_object(large_file, "videos/v/s/j2/video.mp4", "video/mp4")
+
+        assert len(backend.calls("/internal/storage/multipart/presign")) == 1
+        assert len(backend.calls("/single")) == 2
+        assert backend.uploaded["https://s3.example.com/single"] == large_file.read_bytes()
+
+    @pytest.mark.asyncio
+    async def test_failed_part_aborts_upload(self, provider, large_file):
+        """파트 업로드 실패 → complete 대신 abort 호출 후 StorageUploadError."""
+        backend = FakeBackend(failing_part="/part2")
+
+        with _use_backend(provider, backend):
+            with pytest.raises(StorageUploadError):
+                await provider.put_object(large_file, "videos/v/s/j/video.mp4", "video/mp4")
+
+        assert backend.calls("/internal/storage/multipart/complete") == []
+        abort = json.loads(backend.calls("/internal/storage/multipart/abort")[0].content)
+        assert abort == {"object_key": "videos/v/s/j/video.mp4", "upload_id": "upload-1"}
+
+
+class TestConcurrentAssetUpload:
+    """렌더 에셋 동시 업로드 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_assets_uploaded_concurrently(self, tmp_path):
+        """세 에셋 업로드가 모두 시작된 뒤에야 하나가 끝남."""
+        paths = {}
+        for name in ("video.mp4", "subtitles.srt", "thumb.jpg"):
+            paths[name] = tmp_path / name
+            paths[name].write_bytes(b"x")
+
+        started = []
+        all_started = asyncio.Event()
+
+        async def put_file(file_path, key, content_type=None):
+            started.append(key)
+            if len(started) == 3:
+                all_started.set()
+            await asyncio.wait_for(all_started.wait(), timeout=1.0)
+            return StorageResult(key=key, url=f"https://cdn/{key}", size_bytes=1, content_type=content_type)
+
+        storage = MagicMock()
+        storage.put_file = AsyncMock(side_effect=put_file)
+        renderer = RealVideoRenderer(storage_provider=storage)
+        ctx = RealRenderJobContext(
+            job_id="job-1",
+            video_id="video-1",
+            script_id="script-1",
+            script_json={},
+            output_dir=tmp_path,
+            video_path=str(paths["video.mp4"]),
+            subtitle_path=str(paths["subtitles.srt"]),
+            thumbnail_path=str(paths["thumb.jpg"]),
+        )
+
+        await renderer._upload_assets(ctx)
+
+        assert len(started) == 3
+        assert ctx.video_url == "https://cdn/videos/video-1/script-1/job-1/video.mp4"
+        assert ctx.subtitle_url.endswith("/subtitles.srt")
+        assert ctx.thumbnail_url.endswith("/thumb.jpg")
+
+    @pytest.mark.asyncio
+    async def test_failed_asset_cancels_siblings(self, tmp_path):
+        """한 에셋 업로드가 실패하면 나머지 업로드는 취소되고 StorageUploadError 전달."""
+        paths = {}
+        for name in ("video.mp4", "subtitles.srt", "thumb.jpg"):
+            paths[name] = tmp_path / name
+            paths[name].write_bytes(b"x")
+
+        cancelled = []
+
+        async def put_file(file_path, key, content_type=None):
+            if key.endswith("subtitles.srt"):
+                raise StorageUploadError("presign failed", key)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(key)
+                raise
+
+        storage = MagicMock()
+        storage.put_file = AsyncMock(side_effect=put_file)
+        renderer = RealVideoRenderer(storage_provider=storage)
+        ctx = RealRenderJobContext(
+            job_id="job-1",
+            video_id="video-1",
+            script_id="script-1",
+            script_json={},
+            output_dir=tmp_path,
+            video_path=str(paths["video.mp4"]),
+            subtitle_path=str(paths["subtitles.srt"]),
+            thumbnail_path=str(paths["thumb.jpg"]),
+        )
+
+        with pytest.raises(StorageUploadError):
+            await asyncio.wait_for(renderer._upload_assets(ctx), timeout=1.0)
+
+        assert sorted(k.rsplit("/", 1)[-1] for k in cancelled) == ["thumb.jpg", "video.mp4"]
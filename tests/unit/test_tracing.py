@@ -0,0 +1,168 @@
+"""
+요청 단위 span 테스트 (app.telemetry.tracing / GET /internal/ai/traces)
+
+테스트 목표:
+1. with/데코레이터 span의 부모-자식 관계와 trace_id(X-Trace-Id) 전파
+2. 예외는 span error로 기록, 비활성화 시 기록하지 않음
+3. 끝난 구간 기록(record_span)과 OTLP/JSON 파일 내보내기
+4. 내부 API로 최근 trace 요약과 단계별 span 조회
+"""
+
+import asyncio
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.telemetry.context import RequestContext, reset_request_context, set_request_context
+from app.telemetry.tracing import (
+    OtlpJsonFileExporter,
+    SpanBuffer,
+    clear_span_buffer,
+    get_span_buffer,
+    record_span,
+    span,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_context():
+    # 다른 테스트(채팅/텔레메트리 등)가 남긴 span이 섞이지 않도록 버퍼를 비우고 시작
+    clear_span_buffer()
+    yield
+    reset_request_context()
+    clear_span_buffer()
+
+
+@span("prompt.build")
+def _build_prompt() -> str:
+    return "prompt"
+
+
+@span("llm.completion")
+async def _call_llm() -> str:
+    await asyncio.sleep(0)
+    return "answer"
+
+
+class TestSpans:
+    """span API 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_nested_spans_share_request_trace(self):
+        """자식 span은 부모의 trace_id/span_id를 잇고, 루트는 X-Trace-Id를 사용."""
+        set_request_context(RequestContext(trace_id="trace-abc"))
+
+        with span("chat.turn") as root:
+            with span("pii.input", text_length=5) as pii:
+                pii.set_attribute("has_pii", False)
+            _build_prompt()
+            await _call_llm()
+
+        spans = get_span_buffer().get_trace("trace-abc")
+        names = [item.name for item in spans]
+        assert names == ["chat.turn", "pii.input", "prompt.build", "llm.completion"]
+        assert all(item.parent_id == root.span_id for item in spans[1:])
+        assert spans[1].attributes == {"text_length": 5, "has_pii": False}
+        assert root.duration_ms >= 0
+
+    @pytest.mark.asyncio
+    async def test_child_task_inherits_span(self):
+        """create_task로 만든 태스크의 span도 같은 trace의 자식."""
+        with span("chat.turn") as root:
+            await asyncio.create_task(_call_llm())
+
+        child = get_span_buffer().get_trace(root.trace_id)[1]
+        assert child.name == "llm.completion"
+        assert child.parent_id == root.span_id
+
+    def test_exception_recorded_as_error(self):
+        """with 블록의 예외는 전파되고 span error에 타입 기록."""
+        with pytest.raises(ValueError):
+            with span("milvus.search") as current:
+                raise ValueError("boom")
+
+        assert current.error == "ValueError"
+        assert current.end_ns is not None
+
+    def test_record_span_under_parent(self):
+        """이미 측정한 구간은 현재 span의 자식으로 기록."""
+        with span("chat.stream") as root:
+            stream = record_span("llm.stream", 1_000_000, 5_000_000, total_tokens=3)
+            ttft = record_span("llm.ttft", 1_000_000, 2_000_000, parent=stream)
+
+        assert stream.parent_id == root.span_id
+        assert ttft.parent_id == stream.span_id
+        assert stream.duration_ms == 4.0
+
+    def test_disabled_buffer_records_nothing(self, monkeypatch):
+        """비활성화면 no-op span, 버퍼에 남지 않음."""
+        buffer = SpanBuffer(enabled=False)
+        monkeypatch.setattr("app.telemetry.tracing._span_buffer", buffer)
+
+        with span("pii.input") as current:
+            current.set_attribute("has_pii", True)
+        _build_prompt()
+
+        assert buffer.recent_traces() == []
+        assert record_span("llm.stream", 0, 1) is None
+
+
+class TestOtlpExport:
+    """OTLP/JSON 파일 내보내기 테스트."""
+
+    def test_exported_line_is_otlp_json(self, tmp_path, monkeypatch):
+        """resourceSpans 1줄, id는 hex로 정규화하고 원래 trace_id는 속성에 보존."""
+        exporter = OtlpJsonFileExporter(str(tmp_path), service_name="ctrlf-ai-gateway")
+        buffer = SpanBuffer(exporter=exporter)
+        monkeypatch.setattr("app.telemetry.tracing._span_buffer", buffer)
+
+        set_request_context(RequestContext(trace_id="trace-otlp"))
+        with span("chat.turn"):
+            pass
+        buffer.close()  # 대기분 기록 후 writer 스레드 종료
+
+        files = list(tmp_path.glob("spans-*.jsonl"))
+        assert len(files) == 1
+        payload = json.loads(files[0].read_text(encoding="utf-8").splitlines()[0])
+        resource = payload["resourceSpans"][0]
+        assert resource["resource"]["attributes"][0]["value"]["stringValue"] == "ctrlf-ai-gateway"
+        otlp_span = resource["scopeSpans"][0]["spans"][0]
+        assert len(otlp_span["traceId"]) == 32
+        assert len(otlp_span["spanId"]) == 16
+        assert {"key": "ctrlf.trace_id", "value": {"stringValue": "trace-otlp"}} in otlp_span[
+            "attributes"
+        ]
+        assert otlp_span["status"] == {"code": 1}
+
+
+class TestTracesApi:
+    """내부 API 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_list_and_detail(self):
+        """최근 trace 요약(최신 순)과 단계별 span(오프셋/깊이)."""
+        from app.main import app
+
+        set_request_context(RequestContext(trace_id="trace-api"))
+        with span("chat.turn"):
+            with span("route.rule"):
+                pass
+        set_request_context(RequestContext(trace_id="trace-fast"))
+        with span("chat.turn"):
+            pass
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            listed = await client.get("/internal/ai/traces")
+            detail = await client.get("/internal/ai/traces/trace-api")
+            missing = await client.get("/internal/ai/traces/nope")
+
+        assert listed.status_code == 200
+        assert [t["trace_id"] for t in listed.json()["traces"]] == ["trace-fast", "trace-api"]
+        assert listed.json()["traces"][1]["span_count"] == 2
+
+        spans = detail.json()["spans"]
+        assert [(s["name"], s["depth"]) for s in spans] == [("chat.turn", 0), ("route.rule", 1)]
+        assert spans[0]["offset_ms"] == 0
+        assert missing.status_code == 404
@@ -0,0 +1,166 @@
+"""
+TTS 오디오 캐시 / 동시 합성 테스트
+
+테스트 목표:
+1. 같은 (provider, voice, language, speed, 문장)은 같은 키
+2. 용량 초과 시 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+3. 재시작 후 디스크에서 인덱스 복원 (async API는 디스크 입출력을 스레드에서 실행)
+4. 캐시 hit 문장은 TTS 재합성 없음
+5. 작업 전체 문장 동시 합성 수 제한 + 결과/캡션은 씬 순서 유지
+"""
+
+import asyncio
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from app.clients.tts_provider import TTSResult
+from app.services.scene_audio_service import SceneAudioService
+from app.services.tts_audio_cache import TTSAudioCache
+
+
+def _result(size: int, duration: float = 1.0) -> TTSResult:
+    return TTSResult(audio_bytes=b"\x01" * size, duration_sec=duration)
+
+
+class TestTTSAudioCache:
+    """TTSAudioCache 테스트."""
+
+    def test_key_depends_on_all_inputs(self):
+        """입력 중 하나라도 다르면 다른 키."""
+        base = TTSAudioCache.make_key("GTTSProvider", None, "ko", 1.0, "안녕하세요.")
+
+        assert base == TTSAudioCache.make_key("GTTSProvider", "", "ko", 1.0, "안녕하세요.")
+        assert base != TTSAudioCache.make_key("PollyTTSProvider", None, "ko", 1.0, "안녕하세요.")
+        assert base != TTSAudioCache.make_key("GTTSProvider", None, "ko", 1.2, "안녕하세요.")
+        assert base != TTSAudioCache.make_key("GTTSProvider", None, "ko", 1.0, "안녕하세요!")
+
+    def test_put_and_get(self, tmp_path):
+        """저장한 오디오와 duration을 그대로 반환."""
+        cache = TTSAudioCache(tmp_path, max_bytes=10_000)
+
+        assert cache.get("k1") is None
+        cache.put("k1", _result(100, duration=2.5))
+        cached = cache.get("k1")
+
+        assert cached.audio_bytes == b"\x01" * 100
+        assert cached.duration_sec == 2.5
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction(self, tmp_path):
+        """용량 초과 시 최근 사용하지 않은 항목 삭제."""
+        cache = TTSAudioCache(tmp_path, max_bytes=700)
+        cache.put("k1", _result(200))
+        cache.put("k2", _result(200))
+        cache.get("k1")  # k1을 최근 사용으로 갱신
+        cache.put("k3", _result(200))
+
+        assert cache.get("k2") is None
+        assert cache.get("k1") is not None
+        assert cache.get("k3") is not None
+        assert not (tmp_path / "k2.mp3").exists()
+        assert cache.stats()["total_bytes"] <= 700
+
+    def test_index_restored_from_disk(self, tmp_path):
+        """새 인스턴스는 디스크 파일 mtime 순서로 LRU 복원."""
+        cache = TTSAudioCache(tmp_path, max_bytes=10_000)
+        cache.put("old", _result(200))
+        cache.put("new", _result(200))
+        os.utime(tmp_path / "old.mp3", (1, 1))
+
+        restored = TTSAudioCache(tmp_path, max_bytes=500)
+
+        assert restored.get("old") is None
+        assert restored.get("new").audio_bytes == b"\x01" * 200
+
+    @pytest.mark.asyncio
+    async def test_async_api_runs_disk_io_off_loop(self, tmp_path):
+        """aget/aput는 디렉토리 스캔과 파일 입출력을 이벤트 루프 밖 스레드에서 실행."""
+        cache = TTSAudioCache(tmp_path, max_bytes=10_000)
+        loop_thread = threading.get_ident()
+        io_threads = []
+        ensure_loaded = cache._ensure_loaded
+
+        def record_thread():
+            io_threads.append(threading.get_ident())
+            ensure_loaded()
+
+        cache._ensure_loaded = record_thread
+
+        await cache.aput("k1", _result(100, duration=2.5))
+        cached = await cache.aget("k1")
+
+        assert cached.audio_bytes == b"\x01" * 100
+        assert len(io_threads) == 2
+        assert loop_thread not in io_threads
+
+
+class _CountingTTS:
+    """동시 호출 수와 합성 문장을 기록하는 TTS Provider."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.texts = []
+
+    async def synthesize(self, text: str, language: str = "ko"):
+        self.texts.append(text)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return TTSResult(audio_bytes=text.encode("utf-8"), duration_sec=len(text) * 0.1)
+
+
+class TestConcurrentSentenceSynthesis:
+    """SceneAudioService 동시 합성 + 캐시 연동 테스트."""
+
+    SCENES = [
+        {"scene_id": "scene-1", "narration": "첫 번째 문장. 두 번째 문장. 세 번째 문장."},
+        {"scene_id": "scene-2", "narration": ""},
+        {"scene_id": "scene-3", "narration": "네 번째 문장. 다섯 번째 문장."},
+    ]
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency_and_ordered_offsets(self, tmp_path):
+        """전체 문장 동시 합성은 제한 수 이하, 오프셋은 씬 순서대로 누적."""
+        tts = _CountingTTS()
+        service = SceneAudioService(
+            tts_provider=tts, silence_padding_sec=0.5, tts_concurrency=2
+        )
+
+        results = await service.generate_scene_audios(self.SCENES, tmp_path)
+
+        assert tts.max_active == 2
+        assert len(tts.texts) == 5
+        assert [r.scene_id for r in results] == ["scene-1", "scene-2", "scene-3"]
+        assert [c.text for c in results[0].captions] == [
+            "첫 번째 문장.", "두 번째 문장.", "세 번째 문장."
+        ]
+        assert results[1].sentence_count == 0
+        expected_offset = results[0].duration_sec + results[1].duration_sec
+        assert abs(results[2].captions[0].start - expected_offset) < 0.01
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_synthesis(self, tmp_path):
+        """재렌더 시 변경되지 않은 문장은 재합성하지 않음."""
+        tts = _CountingTTS()
+        cache = TTSAudioCache(tmp_path / "cache", max_bytes=1_000_000)
+        service = SceneAudioService(tts_provider=tts, audio_cache=cache)
+
+        first = await service.generate_scene_audio(
+            "scene-1", "첫 번째 문장. 두 번째 문장.", tmp_path / "run1"
+        )
+        tts.texts.clear()
+        second = await service.generate_scene_audio(
+            "scene-1", "첫 번째 문장. 바뀐 문장.", tmp_path / "run2"
+        )
+
+        assert tts.texts == ["바뀐 문장."]
+        assert second.captions[0].end == first.captions[0].end
+        assert Path(tmp_path / "run2" / "scene-1_sent_000.mp3").read_bytes() == (
+            "첫 번째 문장.".encode("utf-8")
+        )
@@ -0,0 +1,191 @@
+"""
+세그먼트 병렬 인코딩 테스트 (VideoComposer segmented=True)
+
+테스트 목표:
+1. Animated 클립 명세의 총 프레임 수가 단일 패스 xfade 체인과 같음
+2. 긴 씬은 segment_max_sec 이하 클립으로 나뉘고, 클립은 zoompan을 구간 시작 프레임만큼 오프셋
+3. 클립 인코딩 후 concat은 -c:v copy로 실행, 오디오는 한 번만 mux
+4. 입력이 같은 클립은 씬 에셋 캐시에서 재사용
+5. 클립 인코딩 실패 시 단일 패스로 폴백
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.scene_asset_cache import SceneAssetCache
+from app.services.video_composer import ComposerConfig, SceneInfo, VideoComposer
+
+
+class FakeFFmpeg:
+    """subprocess.run 대체: 명령을 기록하고 출력 파일(마지막 인자)을 만듭니다."""
+
+    def __init__(self, fail_segments: bool = False):
+        self.commands = []
+        self.fail_segments = fail_segments
+
+    def __call__(self, cmd, **kwargs):
+        self.commands.append(cmd)
+        if self.fail_segments and "-an" in cmd:
+            return subprocess.CompletedProcess(cmd, 1, "", "encode error")
+        Path(cmd[-1]).write_bytes(" ".join(cmd).encode("utf-8"))
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    def segment_commands(self):
+        return [cmd for cmd in self.commands if "-an" in cmd]
+
+    def concat_commands(self):
+        return [cmd for cmd in self.commands if "concat" in cmd]
+
+
+@pytest.fixture
+def images(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"scene_{i}.png"
+        path.write_bytes(f"image-{i}".encode("utf-8"))
+        paths.append(str(path))
+    return paths
+
+
+def _composer(tmp_path, **overrides):
+    config = ComposerConfig(
+        visual_style="animated",
+        fps=10,
+        fade_duration=0.5,
+        segmented=True,
+        segment_workers=2,
+        segment_max_sec=4.0,
+        **overrides,
+    )
+    with patch.object(VideoComposer, "_check_ffmpeg", return_value=True):
+        composer = VideoComposer(
+            config=config,
+            asset_cache=SceneAssetCache(tmp_path / "cache", max_bytes=10 * 1024 * 1024),
+        )
+    composer.get_audio_duration = AsyncMock(return_value=20.0)
+    return composer
+
+
+def _scenes(images, durations=(5.0, 10.0, 5.0)):
+    return [
+        SceneInfo(scene_id=i + 1, narration="n", image_path=images[i], duration_sec=d)
+        for i, d in enumerate(durations)
+    ]
+
+
+class TestSegmentSpecs:
+    """클립 명세 테스트."""
+
+    def test_animated_frames_match_xfade_chain(self, tmp_path, images):
+        """총 프레임 = 씬 프레임 합 - 전환 수 × fade 프레임, 전환 클립은 fade 구간만."""
+        composer = _composer(tmp_path)
+        specs = composer._build_animated_segment_specs(_scenes(images))
+
+        assert sum(spec.frames for spec in specs) == (50 + 100 + 50) - 2 * 5
+        transitions = [spec for spec in specs if "xfade" in spec.filter_complex]
+        assert [spec.frames for spec in transitions] == [5, 5]
+        assert all(spec.frames <= 40 for spec in specs)
+        # 단독 구간 45/90/45프레임은 40프레임 이하 2/3/2개로 분할
+        assert len(specs) == 2 + 1 + 3 + 1 + 2
+
+    def test_chunks_offset_zoompan_instead_of_trimming(self, tmp_path, images):
+        """클립은 자기 구간 프레임만 만들고, 줌은 구간 시작 프레임부터 이어짐."""
+        composer = _composer(tmp_path)
+        specs = composer._build_animated_segment_specs(_scenes(images))
+
+        assert all("trim=" not in spec.filter_complex for spec in specs)
+        # 씬 2(100프레임, 줌아웃) 단독 구간 [5, 95)는 5/45/85에서 시작하는 클립 3개
+        middle = specs[3:6]
+        assert [spec.frames for spec in middle] == [40, 40, 10]
+        for spec, start in zip(middle, (5, 45, 85)):
+            assert f"*(on+{start})" in spec.filter_complex
+            assert f"d={spec.frames}:" in spec.filter_complex
+
+    def test_frame_boundaries_use_one_rounding_rule(self, tmp_path, images):
+        """씬 프레임 수는 animated/basic 모두 반올림 (2.96초 × 10fps = 30프레임)."""
+        composer = _composer(tmp_path)
+        scenes = _scenes(images, (2.96, 2.96, 2.96))
+
+        animated = composer._build_animated_segment_specs(scenes)
+        basic = composer._build_basic_segment_specs(scenes, 0.0)
+
+        assert sum(spec.frames for spec in animated) == 3 * 30 - 2 * 5
+        assert sum(spec.frames for spec in basic) == 3 * 30
+
+    def test_asset_cache_resolved_lazily(self):
+        """캐시를 주입하지 않으면 생성 시점이 아니라 사용 시점에 싱글톤 조회."""
+        with patch("app.services.video_composer.get_scene_asset_cache") as get_cache, \
+                patch.object(VideoComposer, "_check_ffmpeg", return_value=True):
+            composer = VideoComposer(config=ComposerConfig())
+            get_cache.assert_not_called()
+
+            assert composer._asset_cache is get_cache.return_value
+
+    def test_scene_shorter_than_fades_falls_back(self, tmp_path, images):
+        """양쪽 fade보다 짧은 중간 씬이 있으면 None."""
+        composer = _composer(tmp_path)
+        assert composer._build_animated_segment_specs(_scenes(images, (5.0, 0.5, 5.0))) is None
+
+    def test_basic_pads_to_audio_duration(self, tmp_path, images):
+        """Basic 모드는 씬 합이 오디오보다 짧으면 배경 클립으로 채움."""
+        composer = _composer(tmp_path)
+        specs = composer._build_basic_segment_specs(_scenes(images, (5.0, 5.0, 5.0)), 20.0)
+
+        assert sum(spec.frames for spec in specs) == 200
+        assert "drawtext" not in specs[-1].filter_complex
+
+
+class TestSegmentedCompose:
+    """세그먼트 합성 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_segments_concatenated_with_stream_copy(self, tmp_path, images):
+        """클립은 오디오 없이 인코딩하고 concat 단계에서만 오디오 mux."""
+        composer = _composer(tmp_path)
+        fake = FakeFFmpeg()
+
+        with patch("app.services.video_composer.subprocess.run", side_effect=fake):
+            result = await composer.compose(_scenes(images), "audio.mp3", tmp_path / "out", "job-1")
+
+        assert len(fake.segment_commands()) == 9
+        concat = fake.concat_commands()
+        assert len(concat) == 1
+        assert concat[0][concat[0].index("-c:v") + 1] == "copy"
+        assert concat[0][concat[0].index("-i", concat[0].index("-i") + 1) + 1] == "audio.mp3"
+        assert Path(result.video_path).exists()
+        assert not (tmp_path / "out" / "job-1_segments").exists()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_segments_reused(self, tmp_path, images):
+        """같은 입력으로 다시 합성하면 클립을 인코딩하지 않고, 바뀐 씬 클립만 인코딩."""
+        composer = _composer(tmp_path)
+        fake = FakeFFmpeg()
+
+        with patch("app.services.video_composer.subprocess.run", side_effect=fake):
+            await composer.compose(_scenes(images), "audio.mp3", tmp_path / "out", "job-1")
+            first = len(fake.segment_commands())
+
+            await composer.compose(_scenes(images), "audio.mp3", tmp_path / "out", "job-2")
+            assert len(fake.segment_commands()) == first
+
+            Path(images[2]).write_bytes(b"edited")
+            await composer.compose(_scenes(images), "audio.mp3", tmp_path / "out", "job-3")
+
+        # 마지막 씬 단독 클립 2개 + 씬 2→3 전환 클립 1개
+        assert len(fake.segment_commands()) == first + 3
+
+    @pytest.mark.asyncio
+    async def test_segment_failure_falls_back_to_single_pass(self, tmp_path, images):
+        """클립 인코딩이 실패하면 기존 단일 패스 animated 합성 사용."""
+        composer = _composer(tmp_path)
+        fake = FakeFFmpeg(fail_segments=True)
+        composer._compose_animated = AsyncMock()
+
+        with patch("app.services.video_composer.subprocess.run", side_effect=fake):
+            await composer.compose(_scenes(images), "audio.mp3", tmp_path / "out", "job-1")
+
+        composer._compose_animated.assert_awaited_once()
+        assert fake.concat_commands() == []
@@ -0,0 +1,317 @@
+"""
+교육영상 진행률 heartbeat 테스트 (VideoSession / 기록 병합 / 일괄 API)
+
+테스트 목표:
+1. heartbeat는 메모리 세션만 갱신, 상태 저장소 기록은 flush 주기마다 한 번
+2. 완료 같은 상태 전이는 즉시 기록, 다른 워커의 완료 레코드를 덮어쓰지 않음
+   (메모리 세션은 저장된 rev로 재검증, 병합 기록/flush는 rev가 그대로일 때만)
+3. flush한 진행률은 새 프로세스(같은 SQLite 저장소)에서 복원
+4. 메모리 세션 상한 초과 시 밀려난 세션의 변경도 기록
+5. 일괄 heartbeat API는 요청 순서대로 응답
+6. 한 세션의 상태 저장소 입출력이 다른 세션 요청을 막지 않음 (세션별 락)
+"""
+
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core.config import clear_settings_cache
+from app.core.state_store import InMemoryStateStore, SQLiteStateStore
+from app.models.video_progress import (
+    VideoCompleteRequest,
+    VideoPlayStartRequest,
+    VideoProgressState,
+    VideoProgressUpdateRequest,
+    VideoRejectionReason,
+)
+from app.services.video_progress_service import VideoProgressService, VideoProgressStore
+
+
+def _start(service: VideoProgressService, user_id: str = "user-1", training_id: str = "edu-1"):
+    return service.start_video(
+        VideoPlayStartRequest(user_id=user_id, training_id=training_id, total_duration=100)
+    )
+
+
+def _heartbeat(position: int, user_id: str = "user-1", training_id: str = "edu-1"):
+    return VideoProgressUpdateRequest(
+        user_id=user_id,
+        training_id=training_id,
+        current_position=position,
+        watched_seconds=position,
+    )
+
+
+class TestHeartbeatCoalescing:
+    """heartbeat 기록 병합 테스트."""
+
+    def test_heartbeats_written_once_per_flush(self):
+        """flush 주기 안의 heartbeat는 기록하지 않고, flush 시 최신 상태만 기록."""
+        state = InMemoryStateStore()
+        store = VideoProgressStore(state_store=state, flush_interval_sec=60.0)
+        service = VideoProgressService(store=store)
+        _start(service)
+
+        with patch.object(state, "set", wraps=state.set) as state_set:
+            for position in (1, 2, 3, 4):
+                assert service.update_progress(_heartbeat(position)).accepted is True
+            assert state_set.call_count == 0
+
+            assert store.flush() == 1
+            assert state_set.call_count == 1
+            assert store.flush() == 0
+
+        assert state.get("video_progress:user-1:edu-1")["last_position"] == 4
+
+    def test_validation_rules_apply_to_session(self):
+        """메모리 세션 기준으로 역행은 거부하고 상태는 유지."""
+        service = VideoProgressService(
+            store=VideoProgressStore(state_store=InMemoryStateStore(), flush_interval_sec=60.0)
+        )
+        _start(service)
+        service.update_progress(_heartbeat(4))
+
+        response = service.update_progress(_heartbeat(2))
+
+        assert response.accepted is False
+        assert response.rejection_reason == VideoRejectionReason.PROGRESS_REGRESSION.value
+        assert response.last_position == 4
+        assert response.progress_percent == 4.0
+
+    def test_completion_written_immediately(self):
+        """완료는 flush 주기와 무관하게 즉시 기록."""
+        state = InMemoryStateStore()
+        service = VideoProgressService(
+            store=VideoProgressStore(state_store=state, flush_interval_sec=60.0)
+        )
+        _start(service)
+        service.update_progress(_heartbeat(3))
+
+        service.complete_video(
+            VideoCompleteRequest(
+                user_id="user-1", training_id="edu-1", final_position=100, total_watched_seconds=100
+            )
+        )
+
+        restored = VideoProgressStore(state_store=state).get("user-1", "edu-1")
+        assert restored.state == VideoProgressState.COMPLETED
+        assert restored.seek_allowed is True
+
+    def test_evicted_session_is_written(self):
+        """메모리 상한을 넘어 밀려난 세션의 변경도 유실되지 않음."""
+        state = InMemoryStateStore()
+        store = VideoProgressStore(state_store=state, flush_interval_sec=60.0, max_cached_sessions=1)
+        service = VideoProgressService(store=store)
+        _start(service, user_id="user-1")
+        service.update_progress(_heartbeat(3, user_id="user-1"))
+
+        _start(service, user_id="user-2")
+
+        assert state.get("video_progress:user-1:edu-1")["last_position"] == 3
+
+
+class TestHeartbeatDurability:
+    """재시작/멀티 워커 테스트 (같은 SQLite 저장소)."""
+
+    def test_flushed_progress_survives_restart(self, tmp_path):
+        """flush한 진행률은 새 프로세스에서 이어서 검증."""
+        path = str(tmp_path / "state.db")
+        before = SQLiteStateStore(path)
+        service = VideoProgressService(
+            store=VideoProgressStore(state_store=before, flush_interval_sec=60.0)
+        )
+        _start(service)
+        service.update_progress(_heartbeat(4))
+        service._store.flush()
+        before.close()
+
+        after = SQLiteStateStore(path)
+        restarted = VideoProgressService(store=VideoProgressStore(state_store=after))
+        response = restarted.update_progress(_heartbeat(2))
+        after.close()
+
+        assert response.rejection_reason == VideoRejectionReason.PROGRESS_REGRESSION.value
+        assert response.last_position == 4
+
+    def test_stale_worker_does_not_overwrite_completion(self, tmp_path):
+        """다른 워커가 완료 처리한 레코드를 진행 중 세션으로 덮어쓰지 않음."""
+        path = str(tmp_path / "state.db")
+        worker_a = SQLiteStateStore(path)
+        worker_b = SQLiteStateStore(path)
+        service_a = VideoProgressService(
+            store=VideoProgressStore(state_store=worker_a, flush_interval_sec=0.0)
+        )
+        service_b = VideoProgressService(store=VideoProgressStore(state_store=worker_b))
+        _start(service_a)
+        service_a.update_progress(_heartbeat(3))
+
+        service_b.complete_video(
+            VideoCompleteRequest(
+                user_id="user-1", training_id="edu-1", final_position=100, total_watched_seconds=100
+            )
+        )
+        service_a.update_progress(_heartbeat(5))
+
+        assert worker_b.get("video_progress:user-1:edu-1")["state"] == "COMPLETED"
+        assert service_a.update_progress(_heartbeat(6)).state == VideoProgressState.COMPLETED
+        worker_a.close()
+        worker_b.close()
+
+    def test_cached_session_revalidated_across_workers(self, tmp_path):
+        """다른 워커가 기록한 진행률/완료를 캐시된 세션이 놓치지 않고, flush로 덮어쓰지 않음."""
+        path = str(tmp_path / "state.db")
+        worker_a = SQLiteStateStore(path)
+        worker_b = SQLiteStateStore(path)
+        service_a = VideoProgressService(
+            store=VideoProgressStore(state_store=worker_a, flush_interval_sec=60.0)
+        )
+        service_b = VideoProgressService(
+            store=VideoProgressStore(state_store=worker_b, flush_interval_sec=60.0)
+        )
+        _start(service_a)
+        service_a.update_progress(_heartbeat(2))  # 워커 A: 기록 대기 중
+
+        service_b.update_progress(_heartbeat(4))
+        service_b._store.flush()
+
+        # 워커 A의 캐시(위치 2)가 아니라 워커 B가 기록한 위치 4 기준으로 검증
+        regressed = service_a.update_progress(_heartbeat(3))
+        assert regressed.rejection_reason == VideoRejectionReason.PROGRESS_REGRESSION.value
+        assert regressed.last_position == 4
+
+        completed = service_b.complete_video(
+            VideoCompleteRequest(
+                user_id="user-1", training_id="edu-1", final_position=100, total_watched_seconds=100
+            )
+        )
+        assert completed.completed is True
+
+        service_a._store.get_session("user-1", "edu-1")
+        assert service_a._store.flush() == 0
+        assert worker_a.get("video_progress:user-1:edu-1")["state"] == "COMPLETED"
+        worker_a.close()
+        worker_b.close()
+
+    def test_complete_not_rejected_by_unflushed_heartbeats(self, tmp_path):
+        """다른 워커의 heartbeat가 아직 기록되지 않았어도 완료 요청은 수락."""
+        path = str(tmp_path / "state.db")
+        worker_a = SQLiteStateStore(path)
+        worker_b = SQLiteStateStore(path)
+        service_a = VideoProgressService(
+            store=VideoProgressStore(state_store=worker_a, flush_interval_sec=60.0)
+        )
+        service_b = VideoProgressService(store=VideoProgressStore(state_store=worker_b))
+        _start(service_a)
+        for position in (2, 4, 6):
+            service_a.update_progress(_heartbeat(position))
+
+        response = service_b.complete_video(
+            VideoCompleteRequest(
+                user_id="user-1", training_id="edu-1", final_position=100, total_watched_seconds=100
+            )
+        )
+
+        assert response.completed is True
+        assert service_a._store.flush() == 0
+        assert service_a.get_status("user-1", "edu-1").state == VideoProgressState.COMPLETED
+        worker_a.close()
+        worker_b.close()
+
+
+class TestSessionLocking:
+    """세션별 락 테스트."""
+
+    def test_slow_store_read_does_not_block_other_sessions(self, tmp_path):
+        """한 세션의 상태 저장소 조회가 지연되어도 다른 세션 heartbeat는 진행."""
+        state = SQLiteStateStore(str(tmp_path / "state.db"))
+        store = VideoProgressStore(state_store=state, flush_interval_sec=60.0)
+        service = VideoProgressService(store=store)
+        # 분할 락이 겹치지 않는 두 번째 사용자 선택 (해시는 프로세스마다 다름)
+        other_user = next(
+            f"user-{i}"
+            for i in range(2, 200)
+            if store.session_lock(f"user-{i}", "edu-1") is not store.session_lock("user-1", "edu-1")
+        )
+        _start(service, user_id="user-1")
+        _start(service, user_id=other_user)
+
+        slow_key = "video_progress:user-1:edu-1"
+        entered = threading.Event()
+        release = threading.Event()
+        original_get = state.get
+
+        def slow_get(key):
+            if key == slow_key:
+                entered.set()
+                release.wait(5)
+            return original_get(key)
+
+        results = {}
+
+        def heartbeat(user_id):
+            results[user_id] = service.update_progress(_heartbeat(1, user_id=user_id))
+
+        with patch.object(state, "get", side_effect=slow_get):
+            slow = threading.Thread(target=heartbeat, args=("user-1",))
+            slow.start()
+            try:
+                assert entered.wait(5)
+                other = threading.Thread(target=heartbeat, args=(other_user,))
+                other.start()
+                other.join(2)
+                assert not other.is_alive()
+                assert "user-1" not in results
+            finally:
+                release.set()
+                slow.join(5)
+
+        assert results["user-1"].accepted is True
+        assert results[other_user].accepted is True
+        state.close()
+
+
+class TestBatchHeartbeatApi:
+    """일괄 heartbeat API 테스트."""
+
+    @pytest.fixture
+    def internal_token(self):
+        os.environ["BACKEND_INTERNAL_TOKEN"] = "test-token"
+        clear_settings_cache()
+        yield "test-token"
+        os.environ.pop("BACKEND_INTERNAL_TOKEN", None)
+        clear_settings_cache()
+
+    @pytest.mark.asyncio
+    async def test_batch_results_in_request_order(self, internal_token):
+        """세션별 결과를 요청 순서대로 반환하고 수락 건수 집계."""
+        from app.main import app
+
+        _start(VideoProgressService(), user_id="user-1")
+        _start(VideoProgressService(), user_id="user-2")
+        payload = {
+            "updates": [
+                _heartbeat(3, user_id="user-1").model_dump(),
+                _heartbeat(2, user_id="missing").model_dump(),
+                _heartbeat(4, user_id="user-2").model_dump(),
+            ]
+        }
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            unauthorized = await client.post("/internal/ai/video-progress/batch", json=payload)
+            response = await client.post(
+                "/internal/ai/video-progress/batch",
+                json=payload,
+                headers={"X-Internal-Token": internal_token},
+            )
+
+        assert unauthorized.status_code == 401
+        assert response.status_code == 200
+        body = response.json()
+        assert [r["user_id"] for r in body["results"]] == ["user-1", "missing", "user-2"]
+        assert [r["accepted"] for r in body["results"]] == [True, False, True]
+        assert body["results"][1]["rejection_reason"] == "SESSION_NOT_FOUND"
+        assert body["accepted_count"] == 2